@@ -0,0 +1,167 @@
+"""
+Benchmarks the parsing of the prometheus data retrieved by the system monitor,
+comparing prometheus_client's parser (which builds every sample of every metric
+family) with the filter-first parser used by get_prometheus_metrics_data.
+
+Run it from the alerter directory, optionally passing the paths of files
+holding recorded node_exporter payloads. If no paths are given, a payload
+shaped like the output of node_exporter on a 64 CPU machine is generated:
+
+    python -m benchmarks.prometheus_parsing [<payload_path> ...]
+"""
+import io
+import json
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.utils.data import parse_prometheus_metrics
+
+# The metrics requested by the system monitor
+REQUESTED_METRICS = [
+    'process_cpu_seconds_total', 'go_memstats_alloc_bytes',
+    'go_memstats_alloc_bytes_total', 'process_virtual_memory_bytes',
+    'process_max_fds', 'process_open_fds', 'node_cpu_seconds_total',
+    'node_filesystem_avail_bytes', 'node_filesystem_size_bytes',
+    'node_memory_MemTotal_bytes', 'node_memory_MemAvailable_bytes',
+    'node_network_transmit_bytes_total', 'node_network_receive_bytes_total',
+    'node_disk_io_time_seconds_total',
+]
+REPETITIONS = 20
+
+
+def generate_node_exporter_payload(cpus: int = 64, devices: int = 16,
+                                   interfaces: int = 8) -> bytes:
+    lines = []
+
+    def add_family(name: str, metric_type: str, samples: List[str]) -> None:
+        lines.append('# HELP {} Generated metric {}.'.format(name, name))
+        lines.append('# TYPE {} {}'.format(name, metric_type))
+        lines.extend(samples)
+
+    for name, metric_type in [
+        ('process_cpu_seconds_total', 'counter'),
+        ('process_virtual_memory_bytes', 'gauge'),
+        ('process_max_fds', 'gauge'), ('process_open_fds', 'gauge'),
+        ('go_memstats_alloc_bytes', 'gauge'),
+        ('go_memstats_alloc_bytes_total', 'counter'),
+        ('node_memory_MemTotal_bytes', 'gauge'),
+        ('node_memory_MemAvailable_bytes', 'gauge'),
+    ]:
+        add_family(name, metric_type, ['{} 1.2345e+09'.format(name)])
+
+    # Unrequested families such as the go runtime and memory statistics
+    for i in range(150):
+        add_family('node_memory_Unrequested{}_bytes'.format(i), 'gauge',
+                   ['node_memory_Unrequested{}_bytes 1.2345e+09'.format(i)])
+    add_family('go_gc_duration_seconds', 'summary', [
+        'go_gc_duration_seconds{{quantile="{}"}} 4.1e-05'.format(quantile)
+        for quantile in ['0', '0.25', '0.5', '0.75', '1']
+    ] + ['go_gc_duration_seconds_sum 1.5', 'go_gc_duration_seconds_count 99'])
+
+    cpu_modes = ['idle', 'iowait', 'irq', 'nice', 'softirq', 'steal',
+                 'system', 'user']
+    add_family('node_cpu_seconds_total', 'counter', [
+        'node_cpu_seconds_total{{cpu="{}",mode="{}"}} 123456.78'.format(
+            cpu, mode) for cpu in range(cpus) for mode in cpu_modes
+    ])
+    add_family('node_cpu_guest_seconds_total', 'counter', [
+        'node_cpu_guest_seconds_total{{cpu="{}",mode="{}"}} 0'.format(
+            cpu, mode) for cpu in range(cpus) for mode in ['nice', 'user']
+    ])
+    for name in ['node_softnet_dropped_total', 'node_softnet_processed_total',
+                 'node_softnet_times_squeezed_total']:
+        add_family(name, 'counter', ['{}{{cpu="{}"}} 42'.format(name, cpu)
+                                     for cpu in range(cpus)])
+    add_family('node_schedstat_running_seconds_total', 'counter', [
+        'node_schedstat_running_seconds_total{{cpu="{}"}} 42'.format(cpu)
+        for cpu in range(cpus)
+    ])
+
+    for name in ['node_disk_io_time_seconds_total',
+                 'node_disk_read_bytes_total', 'node_disk_written_bytes_total',
+                 'node_disk_reads_completed_total',
+                 'node_disk_writes_completed_total',
+                 'node_disk_read_time_seconds_total',
+                 'node_disk_write_time_seconds_total']:
+        add_family(name, 'counter', [
+            '{}{{device="sd{}"}} 98765.4'.format(name, device)
+            for device in range(devices)
+        ])
+    for name in ['node_filesystem_avail_bytes', 'node_filesystem_size_bytes',
+                 'node_filesystem_free_bytes', 'node_filesystem_files',
+                 'node_filesystem_files_free', 'node_filesystem_readonly']:
+        add_family(name, 'gauge', [
+            '{}{{device="/dev/sd{}",fstype="ext4",mountpoint="/mnt/{}"}} '
+            '1.073741824e+11'.format(name, device, device)
+            for device in range(devices)
+        ])
+    for direction in ['receive', 'transmit']:
+        for stat in ['bytes', 'packets', 'errs', 'drop', 'fifo',
+                     'compressed', 'multicast']:
+            name = 'node_network_{}_{}_total'.format(direction, stat)
+            add_family(name, 'counter', [
+                '{}{{device="eth{}"}} 5.4321e+08'.format(name, interface)
+                for interface in range(interfaces)
+            ])
+
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def parse_with_prometheus_client(payload: bytes) -> Dict:
+    # The parsing done by get_prometheus_metrics_data before it was streamed
+    response = {}
+    requested_metrics = set(REQUESTED_METRICS)
+    for family in text_string_to_metric_families(payload.decode('utf-8')):
+        for sample in family.samples:
+            if sample.name in requested_metrics:
+                if sample.labels != {}:
+                    response.setdefault(sample.name, {})[
+                        json.dumps(sample.labels)] = sample.value
+                else:
+                    response[sample.name] = sample.value + response.get(
+                        sample.name, 0)
+    return response
+
+
+def parse_filter_first(payload: bytes) -> Dict:
+    # Iterating over a file object yields the lines as iter_lines does
+    return parse_prometheus_metrics(io.BytesIO(payload), REQUESTED_METRICS)
+
+
+def _measure(parse: Callable[[bytes], Dict], payload: bytes) -> None:
+    seconds = min(timeit.repeat(lambda: parse(payload), number=1,
+                                repeat=REPETITIONS))
+    tracemalloc.start()
+    parse(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("  {:<30} {:>9.2f} ms {:>11.1f} KiB peak".format(
+        parse.__name__, seconds * 1000, peak / 1024))
+
+
+def run_benchmark(payloads: Dict[str, bytes]) -> None:
+    for payload_name, payload in payloads.items():
+        if parse_with_prometheus_client(payload) \
+                != parse_filter_first(payload):
+            raise ValueError("The parsers disagree on " + payload_name)
+
+        print("{} ({:.1f} KiB, {} lines)".format(
+            payload_name, len(payload) / 1024, payload.count(b'\n')))
+        _measure(parse_with_prometheus_client, payload)
+        _measure(parse_filter_first, payload)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        recorded_payloads = {}
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as payload_file:
+                recorded_payloads[path] = payload_file.read()
+        run_benchmark(recorded_payloads)
+    else:
+        run_benchmark({'generated node_exporter payload':
+                       generate_node_exporter_payload()})
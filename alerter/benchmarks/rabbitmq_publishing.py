@@ -0,0 +1,97 @@
+"""
+Benchmarks the publishing done by QueuingPublisherSubscriberComponent,
+comparing the publishing of one message at a time on a channel in confirm mode
+with the publishing of the messages in batches.
+
+Run it from the alerter directory with RabbitMQ reachable at RABBIT_IP,
+optionally passing the number of messages and the batch sizes to try:
+
+    python -m benchmarks.rabbitmq_publishing [<messages> [<size> ...]]
+"""
+import logging
+import sys
+import time
+from types import FrameType
+from typing import List
+
+import pika
+
+from src.abstract.publisher_subscriber import (
+    QueuingPublisherSubscriberComponent)
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
+
+BENCHMARK_EXCHANGE = 'benchmark_publishing'
+BENCHMARK_QUEUE = 'benchmark_publishing_queue'
+BENCHMARK_ROUTING_KEY = 'benchmark.publishing'
+
+
+class BenchmarkPublisher(QueuingPublisherSubscriberComponent):
+    def _initialise_rabbitmq(self) -> None:
+        self.rabbitmq.connect_till_successful()
+        self.rabbitmq.confirm_delivery()
+        self.rabbitmq.exchange_declare(BENCHMARK_EXCHANGE, 'topic', False,
+                                       False, True, False)
+        self.rabbitmq.queue_declare(BENCHMARK_QUEUE, False, False, False,
+                                    True)
+        self.rabbitmq.queue_bind(BENCHMARK_QUEUE, BENCHMARK_EXCHANGE,
+                                 BENCHMARK_ROUTING_KEY)
+        self.rabbitmq.queue_purge(BENCHMARK_QUEUE)
+
+    def _listen_for_data(self) -> None:
+        pass
+
+    def _send_heartbeat(self, data_to_send: dict) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        pass
+
+
+def _measure(messages: int, batch_size: int) -> float:
+    logger = logging.getLogger('benchmark')
+    logger.disabled = True
+    publisher = BenchmarkPublisher(logger, RabbitMQApi(logger, env.RABBIT_IP),
+                                   messages)
+    publisher._publishing_batch_size = batch_size
+    publisher._initialise_rabbitmq()
+    try:
+        # An alert as routed by the alert router
+        for index in range(messages):
+            publisher._push_to_queue(
+                {'alert_code': {'name': 'benchmark_alert', 'code': 'test'},
+                 'message': 'Benchmark alert {}'.format(index),
+                 'severity': 'INFO', 'parent_id': 'chain_1',
+                 'origin_id': 'node_1', 'timestamp': time.time(),
+                 'metric': 'benchmark', 'destination_id': 'channel_1'},
+                BENCHMARK_EXCHANGE, BENCHMARK_ROUTING_KEY,
+                pika.BasicProperties(delivery_mode=2), True)
+
+        start = time.perf_counter()
+        publisher._send_data()
+        seconds = time.perf_counter() - start
+    finally:
+        publisher.rabbitmq.queue_delete(BENCHMARK_QUEUE)
+        publisher.rabbitmq.exchange_delete(BENCHMARK_EXCHANGE)
+        publisher.disconnect_from_rabbit()
+
+    return messages / seconds
+
+
+def run_benchmark(messages: int, batch_sizes: List[int]) -> None:
+    print("Publishing {} messages to RabbitMQ at {}".format(
+        messages, env.RABBIT_IP))
+    print("  {:<30} {:>9.0f} msgs/s".format(
+        "one at a time", _measure(messages, 0)))
+    for batch_size in batch_sizes:
+        print("  {:<30} {:>9.0f} msgs/s".format(
+            "batches of {}".format(batch_size),
+            _measure(messages, batch_size)))
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+                  [int(size) for size in sys.argv[2:]] or [10, 100, 500])
@@ -4,7 +4,7 @@ import signal
 import sys
 import time
 from types import FrameType
-from typing import Tuple
+from typing import Tuple, Optional
 
 import pika.exceptions
 
@@ -21,7 +21,7 @@ from src.channels_manager.manager import ChannelsManager
 from src.config_manager.change_stream.config_manager import ConfigsManager
 from src.data_store.stores.manager import StoreManager
 from src.data_transformers.manager import DataTransformersManager
-from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq import RabbitMQApi, SharedRabbitMQApi
 from src.monitors.managers.contracts import ContractMonitorsManager
 from src.monitors.managers.dockerhub import DockerHubMonitorsManager
 from src.monitors.managers.github import GitHubMonitorsManager
@@ -29,6 +29,7 @@ from src.monitors.managers.manager import MonitorsManager
 from src.monitors.managers.network import NetworkMonitorsManager
 from src.monitors.managers.node import NodeMonitorsManager
 from src.monitors.managers.system import SystemMonitorsManager
+from src.monitors.runtime import MonitorsRuntime
 from src.utils import env
 from src.utils.constants.names import (
     SYSTEM_ALERTERS_MANAGER_NAME, GITHUB_ALERTER_MANAGER_NAME,
@@ -102,6 +103,21 @@ def _initialise_logger(component_display_name: str, component_module_name: str,
     return new_logger
 
 
+def _initialise_monitors_runtime(
+        manager_logger: logging.Logger) -> Optional[MonitorsRuntime]:
+    # The monitors of a manager are run by a shared runtime only if enabled,
+    # otherwise each monitor is run in its own process.
+    if not env.ENABLE_SHARED_MONITORS_RUNTIME:
+        return None
+
+    runtime_logger = manager_logger.getChild(MonitorsRuntime.__name__)
+    rabbitmq = SharedRabbitMQApi(
+        logger=runtime_logger.getChild(SharedRabbitMQApi.__name__),
+        host=env.RABBIT_IP)
+    return MonitorsRuntime(runtime_logger, rabbitmq,
+                           env.SHARED_MONITORS_RUNTIME_WORKERS)
+
+
 def _initialise_system_alerters_manager() -> SystemAlertersManager:
     manager_display_name = SYSTEM_ALERTERS_MANAGER_NAME
 
@@ -318,8 +334,11 @@ def _initialise_system_monitors_manager() -> SystemMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=system_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                system_monitors_manager_logger)
             system_monitors_manager = SystemMonitorsManager(
-                system_monitors_manager_logger, manager_display_name, rabbitmq)
+                system_monitors_manager_logger, manager_display_name, rabbitmq,
+                monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -347,8 +366,11 @@ def _initialise_github_monitors_manager() -> GitHubMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=github_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                github_monitors_manager_logger)
             github_monitors_manager = GitHubMonitorsManager(
-                github_monitors_manager_logger, manager_display_name, rabbitmq)
+                github_monitors_manager_logger, manager_display_name, rabbitmq,
+                monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -376,9 +398,11 @@ def _initialise_dockerhub_monitors_manager() -> DockerHubMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=dockerhub_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                dockerhub_monitors_manager_logger)
             dockerhub_monitors_manager = DockerHubMonitorsManager(
                 dockerhub_monitors_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -406,8 +430,11 @@ def _initialise_node_monitors_manager() -> NodeMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=node_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                node_monitors_manager_logger)
             node_monitors_manager = NodeMonitorsManager(
-                node_monitors_manager_logger, manager_display_name, rabbitmq)
+                node_monitors_manager_logger, manager_display_name, rabbitmq,
+                monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -435,9 +462,11 @@ def _initialise_contract_monitors_manager() -> ContractMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=contract_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                contract_monitors_manager_logger)
             contract_monitors_manager = ContractMonitorsManager(
                 contract_monitors_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -465,9 +494,11 @@ def _initialise_network_monitors_manager() -> NetworkMonitorsManager:
             rabbitmq = RabbitMQApi(
                 logger=network_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
+            monitors_runtime = _initialise_monitors_runtime(
+                network_monitors_manager_logger)
             network_monitors_manager = NetworkMonitorsManager(
                 network_monitors_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, monitors_runtime)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -1,13 +1,16 @@
 import copy
+import json
 import logging
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Dict
+from typing import Dict, List
 
 from pika import BasicProperties
 
 from src.abstract import Component
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
+from src.utils.exceptions import MessageWasNotDeliveredException
 
 
 class PublisherSubscriberComponent(Component, ABC):
@@ -74,12 +77,22 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         """
         self._publishing_queue = Queue(max_queue_size)
 
+        # If batched publishing is enabled, the data is serialised once queued
+        # and published in batches of at most this many messages. Otherwise it
+        # is published one message at a time.
+        self._publishing_batch_size = (env.PUBLISHING_BATCH_SIZE
+                                       if env.ENABLE_BATCHED_PUBLISHING else 0)
+
         super().__init__(logger, rabbitmq)
 
     @property
     def publishing_queue(self) -> Queue:
         return self._publishing_queue
 
+    @property
+    def publishing_batch_size(self) -> int:
+        return self._publishing_batch_size
+
     def _push_to_queue(self, data: Dict, exchange: str, routing_key: str,
                        properties: BasicProperties = BasicProperties(
                            delivery_mode=2), mandatory: bool = True) -> None:
@@ -101,9 +114,13 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         if self._publishing_queue.full():
             self._logger.debug("The queue is full, clearing the first item.")
             self._publishing_queue.get()
+        # When publishing in batches the data is serialised straight away,
+        # which also keeps it from being changed once queued.
         data_dict = {'exchange': exchange, 'routing_key': routing_key,
-                     'data': copy.deepcopy(data), 'properties': properties,
-                     'mandatory': mandatory}
+                     'data': (json.dumps(data).encode('utf-8')
+                              if self._publishing_batch_size > 0
+                              else copy.deepcopy(data)),
+                     'properties': properties, 'mandatory': mandatory}
         self._logger.debug("Adding %s to the queue", data_dict)
         self._publishing_queue.put(data_dict)
 
@@ -116,6 +133,10 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
             self._logger.debug("Attempting to send all data waiting in the "
                                "publishing queue ...")
 
+        if self._publishing_batch_size > 0:
+            self._send_data_in_batches()
+            return
+
         # Try sending the data in the publishing queue one by one. Important,
         # remove an item from the queue only if the sending was successful, so
         # that if an exception is raised, that message is not popped
@@ -141,3 +162,72 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         if not empty:
             self._logger.debug("Successfully sent all data from the publishing "
                                "queue")
+
+    def _requeue_data(self, data_list: List[Dict]) -> None:
+        # Places the data back at the front of the publishing queue, in the
+        # same order
+        with self._publishing_queue.mutex:
+            self._publishing_queue.queue.extendleft(reversed(data_list))
+
+    def _send_data_in_batches(self) -> None:
+        """
+        Sends the data in the publishing queue in batches, waiting for RabbitMQ
+        to accept every batch as a whole. Data is removed from the queue only
+        once it is sent, therefore if an exception is raised the batch remains
+        at the front of the queue. Data which could not be routed is also kept
+        at the front of the queue, and a MessageWasNotDeliveredException is
+        raised as when publishing one message at a time.
+        :return: None
+        """
+        if self._publishing_queue.empty():
+            return
+
+        while not self._publishing_queue.empty():
+            batch = [self._publishing_queue.get() for _ in range(min(
+                self._publishing_batch_size, self._publishing_queue.qsize()))]
+            messages = []
+            batch_to_send = []
+            for data in batch:
+                try:
+                    body = data['data']
+                    messages.append({
+                        'exchange': data['exchange'],
+                        'routing_key': data['routing_key'],
+                        'body': (body if isinstance(body, bytes)
+                                 else json.dumps(body)),
+                        'properties': data['properties'],
+                        'mandatory': data['mandatory']})
+                    batch_to_send.append(data)
+                except KeyError as ke:
+                    self._logger.error("Enqueued datum %s was incomplete",
+                                       data)
+                    self._logger.exception(ke)
+                    self._logger.warning("Discarding this datum")
+                    self._publishing_queue.task_done()
+
+            try:
+                returned = self._rabbitmq.basic_publish_batch(messages)
+            except Exception:
+                self._requeue_data(batch_to_send)
+                raise
+
+            if returned == -1:
+                # RabbitMQ is temporarily unusable, so try again later
+                self._requeue_data(batch_to_send)
+                return
+
+            for index, data in enumerate(batch_to_send):
+                if index not in returned:
+                    self._logger.debug("Sent %s to '%s' exchange",
+                                       data['data'], data['exchange'])
+                    self._publishing_queue.task_done()
+
+            if returned:
+                self._requeue_data([batch_to_send[index]
+                                    for index in returned])
+                raise MessageWasNotDeliveredException(
+                    "{} of the {} messages published could not be "
+                    "routed".format(len(returned), len(messages)))
+
+        self._logger.debug("Successfully sent all data from the publishing "
+                           "queue")
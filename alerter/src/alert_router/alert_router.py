@@ -1,12 +1,13 @@
 import json
 import sys
+import time
 from configparser import (ConfigParser, NoOptionError, NoSectionError,
                           SectionProxy)
 from datetime import datetime
 from json import JSONDecodeError
 from logging import Logger
 from types import FrameType
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -19,6 +20,7 @@ from src.alerter.alert_severities import Severity
 from src.data_store.redis import Keys, RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
+from src.utils.constants.data import MUTE_STATE_CACHE_PERIOD
 from src.utils.constants.rabbitmq import (
     ALERT_ROUTER_CONFIGS_QUEUE_NAME, ALERT_ROUTER_CONFIGS_ROUTING_KEY,
     CONFIG_EXCHANGE, TOPIC, ALERT_EXCHANGE, ALERT_ROUTER_INPUT_QUEUE_NAME,
@@ -49,6 +51,17 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
         self._config = {}
 
+        # (parent_id, severity) -> the ids of the channels the alerts should be
+        # routed to. An entry is computed the first time an alert of that
+        # parent and severity is routed, and the index is cleared whenever a
+        # configuration is received.
+        self._routing_index = {}
+        self._routing_index_config = self._config
+
+        # (redis key, hash field) -> (time of read, severities muted), so that
+        # the mute state is not read from Redis for every alert.
+        self._mute_states = {}
+
         super().__init__(logger, RabbitMQApi(
             logger=logger.getChild(RabbitMQApi.__name__), host=rabbit_ip),
                          env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE)
@@ -174,6 +187,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                 self._config[config_filename] = previous_config
             self._logger.debug(self._config)
 
+        self._routing_index.clear()
+
         self._rabbitmq.basic_ack(method.delivery_tag, False)
 
     def _process_alert(self, ch: BlockingChannel,
@@ -203,20 +218,10 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                         "is_all_muted=%s, is_chain_severity_muted=%s",
                         is_all_muted, is_chain_severity_muted)
                 else:
-                    self._logger.info("Obtaining list of channels to alert")
-                    self._logger.info([
-                        channel.get('id') for channel_type in
-                        self._config.values() for channel in
-                        channel_type.values()
-                    ])
-                    send_to_ids = [
-                        channel.get('id') for channel_type in
-                        self._config.values()
-                        for channel in channel_type.values()
-                        if channel.get(recv_alert.get('severity').lower()) and
-                           recv_alert.get('parent_id') in channel.get(
-                            'parent_ids')
-                    ]
+                    self._logger.debug("Obtaining list of channels to alert")
+                    send_to_ids = self._get_channel_ids(
+                        recv_alert.get('parent_id'),
+                        recv_alert.get('severity'))
 
                     self._logger.debug("send_to_ids = %s", send_to_ids)
         except JSONDecodeError as json_e:
@@ -342,14 +347,63 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         log_and_print("{} terminated.".format(self), self._logger)
         sys.exit()
 
+    def _get_channel_ids(self, parent_id: str, severity: str) -> List[str]:
+        """
+        Given the parent and severity of an alert, this function returns the
+        ids of the channels the alert should be routed to, in the order of the
+        configurations.
+        :param parent_id: The id of the parent of the alert
+        :param severity: The severity of the alert
+        :return: The ids of the channels enabled for the parent and severity
+        """
+        # The index is also cleared if the configurations were replaced
+        # altogether rather than received.
+        if self._routing_index_config is not self._config:
+            self._routing_index.clear()
+            self._routing_index_config = self._config
+
+        index_key = (parent_id, severity.lower())
+        if index_key not in self._routing_index:
+            self._routing_index[index_key] = [
+                channel.get('id') for channel_type in self._config.values()
+                for channel in channel_type.values()
+                if channel.get(severity.lower()) and
+                parent_id in channel.get('parent_ids')
+            ]
+
+        return self._routing_index[index_key]
+
+    def _get_severities_muted(self, key: str,
+                              field: Optional[str] = None) -> Dict:
+        """
+        This function returns the severities muted stored at the given Redis
+        key (or hash field). The stored value is re-used for
+        MUTE_STATE_CACHE_PERIOD seconds after being read.
+        :param key: The Redis key (or hash) of the mute state
+        :param field: The field of the hash, or None if the key is not a hash
+        :return: The severities muted
+        """
+        cache_key: Tuple[str, Optional[str]] = (key, field)
+        if cache_key in self._mute_states:
+            read_time, severities_muted = self._mute_states[cache_key]
+            if time.time() - read_time < MUTE_STATE_CACHE_PERIOD:
+                return severities_muted
+
+        if field is None:
+            severities_muted = json.loads(self._redis.get(key, default=b"{}"))
+        else:
+            severities_muted = json.loads(
+                self._redis.hget(key, field, default=b"{}"))
+        self._mute_states[cache_key] = (time.time(), severities_muted)
+
+        return severities_muted
+
     def is_all_muted(self, severity: str) -> bool:
         self._logger.debug("Getting mute_all key")
         alerter_mute_key = Keys.get_alerter_mute()
 
         self._logger.debug("Getting severities mute status")
-        severities_muted = json.loads(
-            self._redis.get(alerter_mute_key, default=b"{}")
-        )
+        severities_muted = self._get_severities_muted(alerter_mute_key)
         return bool(severities_muted.get(severity, False))
 
     def is_chain_severity_muted(self, parent_id: str, severity: str) -> bool:
@@ -364,9 +418,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         chain_hash = Keys.get_hash_parent(parent_id)
 
         self._logger.debug("Getting severities mute status")
-        severities_muted = json.loads(
-            self._redis.hget(chain_hash, mute_alerts_key, default=b"{}")
-        )
+        severities_muted = self._get_severities_muted(chain_hash,
+                                                      mute_alerts_key)
 
         return bool(severities_muted.get(severity, False))
 
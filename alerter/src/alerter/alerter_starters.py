@@ -1,5 +1,6 @@
 import logging
 import time
+from typing import Optional
 
 import pika.exceptions
 
@@ -35,6 +36,7 @@ from src.utils.env import (
     ALERTERS_LOG_FILE_TEMPLATE, LOGGING_LEVEL, RABBIT_IP,
     ALERTER_PUBLISHING_QUEUE_SIZE)
 from src.utils.logging import create_logger, log_and_print
+from src.utils.sharding import get_shard_name
 from src.utils.starters import (
     get_initialisation_error_message, get_stopped_message)
 
@@ -62,10 +64,10 @@ def _initialise_alerter_logger(alerter_display_name: str,
 
 
 def _initialise_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory
-) -> SystemAlerter:
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        shard: Optional[int] = None) -> SystemAlerter:
     # Alerter display name based on system
-    alerter_display_name = SYSTEM_ALERTER_NAME
+    alerter_display_name = get_shard_name(SYSTEM_ALERTER_NAME, shard)
 
     system_alerter_logger = _initialise_alerter_logger(alerter_display_name,
                                                        SystemAlerter.__name__)
@@ -79,8 +81,7 @@ def _initialise_system_alerter(
             system_alerter = SystemAlerter(
                 alerter_display_name, system_alerter_logger,
                 system_alerts_configs_factory, rabbitmq,
-                ALERTER_PUBLISHING_QUEUE_SIZE
-            )
+                ALERTER_PUBLISHING_QUEUE_SIZE, shard)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), system_alerter_logger)
             break
@@ -150,9 +151,9 @@ def _initialise_dockerhub_alerter() -> DockerhubAlerter:
 
 
 def _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
-) -> ChainlinkNodeAlerter:
-    alerter_display_name = CHAINLINK_NODE_ALERTER_NAME
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> ChainlinkNodeAlerter:
+    alerter_display_name = get_shard_name(CHAINLINK_NODE_ALERTER_NAME, shard)
 
     chainlink_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, ChainlinkNodeAlerter.__name__)
@@ -166,8 +167,7 @@ def _initialise_chainlink_node_alerter(
             chainlink_alerter = ChainlinkNodeAlerter(
                 alerter_display_name, chainlink_alerter_logger,
                 rabbitmq, chainlink_alerts_configs_factory,
-                ALERTER_PUBLISHING_QUEUE_SIZE
-            )
+                ALERTER_PUBLISHING_QUEUE_SIZE, shard)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), chainlink_alerter_logger)
             break
@@ -211,9 +211,9 @@ def _initialise_chainlink_contract_alerter(
 
 
 def _initialise_evm_node_alerter(
-        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory
-) -> EVMNodeAlerter:
-    alerter_display_name = EVM_NODE_ALERTER_NAME
+        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> EVMNodeAlerter:
+    alerter_display_name = get_shard_name(EVM_NODE_ALERTER_NAME, shard)
 
     evm_node_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, EVMNodeAlerter.__name__)
@@ -227,8 +227,7 @@ def _initialise_evm_node_alerter(
             evm_node_alerter = EVMNodeAlerter(
                 alerter_display_name, evm_node_alerter_logger,
                 evm_alerts_configs_factory, rabbitmq,
-                ALERTER_PUBLISHING_QUEUE_SIZE
-            )
+                ALERTER_PUBLISHING_QUEUE_SIZE, shard)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), evm_node_alerter_logger)
             break
@@ -242,9 +241,9 @@ def _initialise_evm_node_alerter(
 
 
 def _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory
-) -> CosmosNodeAlerter:
-    alerter_display_name = COSMOS_NODE_ALERTER_NAME
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> CosmosNodeAlerter:
+    alerter_display_name = get_shard_name(COSMOS_NODE_ALERTER_NAME, shard)
 
     cosmos_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, CosmosNodeAlerter.__name__)
@@ -257,8 +256,8 @@ def _initialise_cosmos_node_alerter(
                 host=RABBIT_IP)
             cosmos_alerter = CosmosNodeAlerter(
                 alerter_display_name, cosmos_alerter_logger, rabbitmq,
-                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
-            )
+                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                shard)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), cosmos_alerter_logger)
             break
@@ -302,9 +301,9 @@ def _initialise_cosmos_network_alerter(
 
 
 def _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
-) -> SubstrateNodeAlerter:
-    alerter_display_name = SUBSTRATE_NODE_ALERTER_NAME
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> SubstrateNodeAlerter:
+    alerter_display_name = get_shard_name(SUBSTRATE_NODE_ALERTER_NAME, shard)
 
     substrate_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, SubstrateNodeAlerter.__name__)
@@ -317,8 +316,8 @@ def _initialise_substrate_node_alerter(
                 host=RABBIT_IP)
             substrate_alerter = SubstrateNodeAlerter(
                 alerter_display_name, substrate_alerter_logger, rabbitmq,
-                substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
-            )
+                substrate_alerts_configs_factory,
+                ALERTER_PUBLISHING_QUEUE_SIZE, shard)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), substrate_alerter_logger)
             break
@@ -362,8 +361,10 @@ def _initialise_substrate_network_alerter(
 
 
 def start_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory) -> None:
-    system_alerter = _initialise_system_alerter(system_alerts_configs_factory)
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        shard: Optional[int] = None) -> None:
+    system_alerter = _initialise_system_alerter(system_alerts_configs_factory,
+                                                shard)
     start_alerter(system_alerter)
 
 
@@ -378,10 +379,10 @@ def start_dockerhub_alerter() -> None:
 
 
 def start_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
-) -> None:
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> None:
     chainlink_alerter = _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory)
+        chainlink_alerts_configs_factory, shard)
     start_alerter(chainlink_alerter)
 
 
@@ -394,15 +395,18 @@ def start_chainlink_contract_alerter(
 
 
 def start_evm_node_alerter(
-        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory) -> None:
-    evm_alerter = _initialise_evm_node_alerter(evm_alerts_configs_factory)
+        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> None:
+    evm_alerter = _initialise_evm_node_alerter(evm_alerts_configs_factory,
+                                               shard)
     start_alerter(evm_alerter)
 
 
 def start_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory) -> None:
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> None:
     cosmos_alerter = _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory)
+        cosmos_alerts_configs_factory, shard)
     start_alerter(cosmos_alerter)
 
 
@@ -415,10 +419,10 @@ def start_cosmos_network_alerter(
 
 
 def start_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
-) -> None:
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        shard: Optional[int] = None) -> None:
     substrate_alerter = _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory)
+        substrate_alerts_configs_factory, shard)
     start_alerter(substrate_alerter)
 
 
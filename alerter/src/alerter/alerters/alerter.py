@@ -2,7 +2,7 @@ import logging
 import sys
 from abc import abstractmethod
 from types import FrameType
-from typing import Any
+from typing import Any, Optional
 
 import pika.exceptions
 
@@ -18,11 +18,16 @@ from src.utils.logging import log_and_print
 class Alerter(QueuingPublisherSubscriberComponent):
 
     def __init__(self, alerter_name: str, logger: logging.Logger,
-                 rabbitmq: RabbitMQApi, max_queue_size: int = 0) -> None:
+                 rabbitmq: RabbitMQApi, max_queue_size: int = 0,
+                 shard: Optional[int] = None) -> None:
         super().__init__(logger, rabbitmq, max_queue_size)
 
         self._alerter_name = alerter_name
 
+        # If the alerter is sharded, it only consumes the transformed data of
+        # the chains mapped to its shard, from a queue of its own.
+        self._shard = shard
+
     def __str__(self) -> str:
         return self.alerter_name
 
@@ -30,6 +35,10 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def alerter_name(self) -> str:
         return self._alerter_name
 
+    @property
+    def shard(self) -> Optional[int]:
+        return self._shard
+
     @staticmethod
     def _greater_than_condition_function(current: Any, previous: Any) -> bool:
         return current > previous
@@ -28,6 +28,7 @@ from src.utils.data import transformed_data_processing_helper
 from src.utils.exceptions import (MessageWasNotDeliveredException,
                                   MetricNotFoundException, InvalidUrlException,
                                   NodeIsDownException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool
 
 
@@ -35,18 +36,25 @@ class ChainlinkNodeAlerter(Alerter):
     """
     We will have one alerter for all chainlink nodes. The chainlink alerter
     doesn't have to restart if the configurations change, as it will be
-    listening for both data and configs in the same queue.
+    listening for both data and configs in the same queue. If the alerter is
+    sharded, every shard receives all the configs but only the data of the
+    chains mapped to it.
     """
 
     def __init__(
             self, alerter_name: str, logger: logging.Logger,
             rabbitmq: RabbitMQApi,
             cl_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0, shard: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         shard)
 
         self._alerts_configs_factory = cl_alerts_configs_factory
         self._alerting_factory = ChainlinkNodeAlertingFactory(logger)
+        self._input_queue = add_shard_suffix(
+            CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, shard)
+        self._transformed_data_routing_key = add_shard_suffix(
+            CL_NODE_TRANSFORMED_DATA_ROUTING_KEY, shard)
 
     @property
     def alerts_configs_factory(self) -> ChainlinkNodeAlertsConfigsFactory:
@@ -66,27 +74,25 @@ class ChainlinkNodeAlerter(Alerter):
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
-        self.rabbitmq.queue_declare(CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue,
                                     passive=False, durable=True,
                                     exclusive=False, auto_delete=False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         ALERT_EXCHANGE, CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue,
+                         ALERT_EXCHANGE, self._transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            queue=self._input_queue, exchange=ALERT_EXCHANGE,
+            routing_key=self._transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", self._input_queue,
                          CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
-        self.rabbitmq.queue_bind(CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        self.rabbitmq.queue_bind(self._input_queue,
                                  CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
@@ -94,7 +100,7 @@ class ChainlinkNodeAlerter(Alerter):
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=self._input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -118,7 +124,7 @@ class ChainlinkNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == CL_NODE_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._transformed_data_routing_key:
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
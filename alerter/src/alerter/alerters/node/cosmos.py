@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -31,6 +31,7 @@ from src.utils.exceptions import (
     MetricNotFoundException, NoSyncedDataSourceWasAccessibleException,
     CosmosRestServerDataCouldNotBeObtained, TendermintRPCDataCouldNotBeObtained,
     NodeIsDownException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool
 
 
@@ -38,18 +39,25 @@ class CosmosNodeAlerter(Alerter):
     """
     We will have one alerter for all cosmos nodes. The cosmos alerter doesn't
     have to restart if the configurations change, as it will be listening for
-    both data and configs in the same queue.
+    both data and configs in the same queue. If the alerter is sharded, every
+    shard receives all the configs but only the data of the chains mapped to
+    it.
     """
 
     def __init__(
             self, alerter_name: str, logger: logging.Logger,
             rabbitmq: RabbitMQApi,
             cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0, shard: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         shard)
 
         self._alerts_configs_factory = cosmos_alerts_configs_factory
         self._alerting_factory = CosmosNodeAlertingFactory(logger)
+        self._input_queue = add_shard_suffix(
+            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, shard)
+        self._transformed_data_routing_key = add_shard_suffix(
+            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY, shard)
 
     @property
     def alerts_configs_factory(self) -> CosmosNodeAlertsConfigsFactory:
@@ -69,39 +77,35 @@ class CosmosNodeAlerter(Alerter):
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        self.logger.info("Creating queue '%s'", self._input_queue)
         self.rabbitmq.queue_declare(
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, passive=False,
-            durable=True, exclusive=False, auto_delete=False)
+            self._input_queue, passive=False, durable=True, exclusive=False,
+            auto_delete=False)
         self.logger.info(
             "Binding queue '%s' to exchange '%s' with routing key '%s'",
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, ALERT_EXCHANGE,
-            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            self._input_queue, ALERT_EXCHANGE,
+            self._transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            queue=self._input_queue, exchange=ALERT_EXCHANGE,
+            routing_key=self._transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         CONFIG_EXCHANGE, COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
-            COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
+                         "%s'", self._input_queue, CONFIG_EXCHANGE,
+                         COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
+        self.rabbitmq.queue_bind(self._input_queue, CONFIG_EXCHANGE,
+                                 COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            on_message_callback=self._process_data, auto_ack=False,
-            exclusive=False, consumer_tag=None)
+            queue=self._input_queue, on_message_callback=self._process_data,
+            auto_ack=False, exclusive=False, consumer_tag=None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -123,7 +127,7 @@ class CosmosNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._transformed_data_routing_key:
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
@@ -193,18 +197,13 @@ class CosmosNodeAlerter(Alerter):
                 if current is not None:
                     # The only data we need is the highest node block height,
                     # we then return the difference between the current
-                    # node's height and the maximum height found in the list.
-                    # The number can never be negative and the list can never be
-                    # empty as we are including our own node.
-                    self.alerting_factory.alerting_state[parent_id][node_id][
-                        'current_height'] = current
-                    node_heights = [
-                        state['current_height']
-                        for _, state in self.alerting_factory.alerting_state[
-                            parent_id].items()
-                        if state['current_height'] is not None
-                    ]
-                    difference = max(node_heights) - current
+                    # node's height and the maximum height of the chain. The
+                    # number can never be negative as we are including our own
+                    # node.
+                    self.alerting_factory.update_current_height(
+                        parent_id, node_id, current)
+                    difference = self.alerting_factory.get_max_current_height(
+                        parent_id) - current
                     self.alerting_factory.classify_thresholded_alert(
                         difference, height_difference_configs,
                         cosmos_alerts
@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -22,6 +22,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (MessageWasNotDeliveredException,
                                   ReceivedUnexpectedDataException,
                                   InvalidUrlException, NodeIsDownException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool
 
 
@@ -29,17 +30,25 @@ class EVMNodeAlerter(Alerter):
     """
     We will have one alerter for all evm nodes. The evm alerter
     doesn't have to restart if the configurations change, as it will be
-    listening for both data and configs in the same queue.
+    listening for both data and configs in the same queue. If the alerter is
+    sharded, every shard receives all the configs but only the data of the
+    chains mapped to it.
     """
 
     def __init__(
             self, alerter_name: str, logger: logging.Logger,
             evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
-            rabbitmq: RabbitMQApi, max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            rabbitmq: RabbitMQApi, max_queue_size: int = 0,
+            shard: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         shard)
 
         self._alerts_configs_factory = evm_alerts_configs_factory
         self._alerting_factory = EVMNodeAlertingFactory(logger)
+        self._input_queue = add_shard_suffix(
+            EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, shard)
+        self._transformed_data_routing_key = add_shard_suffix(
+            EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY, shard)
 
     @property
     def alerts_configs_factory(self) -> EVMNodeAlertsConfigsFactory:
@@ -59,27 +68,25 @@ class EVMNodeAlerter(Alerter):
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
-        self.rabbitmq.queue_declare(EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue,
                                     passive=False, durable=True,
                                     exclusive=False, auto_delete=False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         ALERT_EXCHANGE, EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue,
+                         ALERT_EXCHANGE, self._transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            queue=self._input_queue, exchange=ALERT_EXCHANGE,
+            routing_key=self._transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", self._input_queue,
                          CONFIG_EXCHANGE, EVM_ALERTS_CONFIGS_ROUTING_KEY)
-        self.rabbitmq.queue_bind(EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        self.rabbitmq.queue_bind(self._input_queue,
                                  CONFIG_EXCHANGE,
                                  EVM_ALERTS_CONFIGS_ROUTING_KEY)
 
@@ -88,7 +95,7 @@ class EVMNodeAlerter(Alerter):
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=self._input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -112,7 +119,7 @@ class EVMNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._transformed_data_routing_key:
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
@@ -181,22 +188,17 @@ class EVMNodeAlerter(Alerter):
                 current = data['current_height']['current']
                 sub_config = configs.evm_block_syncing_block_height_difference
                 if None not in [current, syncing] and not syncing:
-                    self.alerting_factory.alerting_state[meta_data[
-                        'node_parent_id']][meta_data['node_id']][
-                        'current_height'] = current
+                    self.alerting_factory.update_current_height(
+                        meta_data['node_parent_id'], meta_data['node_id'],
+                        current)
 
                     # The only data we need is the highest node block height,
                     # we then return the difference between the current
-                    # node's height and the maximum height found in the list.
-                    # The number can never be negative as we are including
-                    # our own node.
-                    node_heights = []
-                    for key, value in self.alerting_factory.alerting_state[
-                        meta_data['node_parent_id']].items():
-                        node_heights.append(value['current_height'])
-                    node_heights = list(filter(lambda a: a is not None,
-                                               node_heights))
-                    difference = max(node_heights) - current
+                    # node's height and the maximum height of the chain. The
+                    # number can never be negative as we are including our
+                    # own node.
+                    difference = self.alerting_factory.get_max_current_height(
+                        meta_data['node_parent_id']) - current
                     self.alerting_factory. \
                         classify_thresholded_alert(
                         difference, sub_config,
@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -29,6 +29,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException, NoSyncedDataSourceWasAccessibleException,
     SubstrateWebSocketDataCouldNotBeObtained, NodeIsDownException,
     SubstrateApiIsNotReachableException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool
 
 
@@ -36,18 +37,25 @@ class SubstrateNodeAlerter(Alerter):
     """
     We will have one alerter for all substrate nodes. The substrate alerter 
     doesn't have to restart if the configurations change, as it will be 
-    listening for both data and configs in the same queue.
+    listening for both data and configs in the same queue. If the alerter is
+    sharded, every shard receives all the configs but only the data of the
+    chains mapped to it.
     """
 
     def __init__(
             self, alerter_name: str, logger: logging.Logger,
             rabbitmq: RabbitMQApi,
             substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0, shard: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         shard)
 
         self._alerts_configs_factory = substrate_alerts_configs_factory
         self._alerting_factory = SubstrateNodeAlertingFactory(logger)
+        self._input_queue = add_shard_suffix(
+            SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, shard)
+        self._transformed_data_routing_key = add_shard_suffix(
+            SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY, shard)
 
     @property
     def alerts_configs_factory(self) -> SubstrateNodeAlertsConfigsFactory:
@@ -67,29 +75,27 @@ class SubstrateNodeAlerter(Alerter):
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        self.logger.info("Creating queue '%s'", self._input_queue)
         self.rabbitmq.queue_declare(
-            SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, passive=False,
-            durable=True, exclusive=False, auto_delete=False)
+            self._input_queue, passive=False, durable=True, exclusive=False,
+            auto_delete=False)
         self.logger.info(
             "Binding queue '%s' to exchange '%s' with routing key '%s'",
-            SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, ALERT_EXCHANGE,
-            SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            self._input_queue, ALERT_EXCHANGE,
+            self._transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            queue=self._input_queue, exchange=ALERT_EXCHANGE,
+            routing_key=self._transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", self._input_queue,
                          CONFIG_EXCHANGE, SUBSTRATE_ALERTS_CONFIGS_ROUTING_KEY)
         self.rabbitmq.queue_bind(
-            SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
+            self._input_queue, CONFIG_EXCHANGE,
             SUBSTRATE_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
@@ -97,7 +103,7 @@ class SubstrateNodeAlerter(Alerter):
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=self._input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -121,7 +127,7 @@ class SubstrateNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._transformed_data_routing_key:
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -23,6 +23,7 @@ from src.utils.exceptions import (MessageWasNotDeliveredException,
                                   ReceivedUnexpectedDataException,
                                   MetricNotFoundException,
                                   SystemIsDownException, InvalidUrlException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool
 
 
@@ -30,17 +31,25 @@ class SystemAlerter(Alerter):
     """
     We will have one alerter for all systems. The system alerter doesn't
     have to restart if the configurations change, as it will be listening
-    for both data and configs in the same queue.
+    for both data and configs in the same queue. If the alerter is sharded,
+    every shard receives all the configs but only the data of the systems
+    whose parent is mapped to it.
     """
 
     def __init__(self, alerter_name: str, logger: logging.Logger,
                  system_alerts_configs_factory: SystemAlertsConfigsFactory,
                  rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+                 max_queue_size: int = 0,
+                 shard: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         shard)
 
         self._alerts_configs_factory = system_alerts_configs_factory
         self._alerting_factory = SystemAlertingFactory(logger)
+        self._input_queue = add_shard_suffix(
+            SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME, shard)
+        self._transformed_data_routing_key = add_shard_suffix(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, shard)
 
     @property
     def alerts_configs_factory(self) -> SystemAlertsConfigsFactory:
@@ -60,34 +69,32 @@ class SystemAlerter(Alerter):
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
-        self.rabbitmq.queue_declare(SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue,
                                     passive=False, durable=True,
                                     exclusive=False, auto_delete=False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         ALERT_EXCHANGE, SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue,
+                         ALERT_EXCHANGE, self._transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)
+            queue=self._input_queue, exchange=ALERT_EXCHANGE,
+            routing_key=self._transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", self._input_queue,
                          CONFIG_EXCHANGE, ALERTS_CONFIGS_ROUTING_KEY_CHAIN)
         self.rabbitmq.queue_bind(
-            SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
+            self._input_queue, CONFIG_EXCHANGE,
             ALERTS_CONFIGS_ROUTING_KEY_CHAIN)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", self._input_queue,
                          CONFIG_EXCHANGE, ALERTS_CONFIGS_ROUTING_KEY_GEN)
         self.rabbitmq.queue_bind(
-            SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
+            self._input_queue, CONFIG_EXCHANGE,
             ALERTS_CONFIGS_ROUTING_KEY_GEN)
 
         # Pre-fetch count is 5 times less the maximum queue size
@@ -95,7 +102,7 @@ class SystemAlerter(Alerter):
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=self._input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -119,7 +126,7 @@ class SystemAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == SYSTEM_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._transformed_data_routing_key:
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
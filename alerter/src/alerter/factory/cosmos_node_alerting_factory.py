@@ -1,5 +1,6 @@
 import logging
 from datetime import timedelta
+from typing import Dict, Optional
 
 from src.alerter.factory.alerting_factory import AlertingFactory
 from src.alerter.grouped_alerts_metric_code.node. \
@@ -7,6 +8,7 @@ from src.alerter.grouped_alerts_metric_code.node. \
     GroupedCosmosNodeAlertsMetricCode as AlertsMetricCode
 from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.utils.configs import parse_alert_time_thresholds
+from src.utils.heights import ChainHeightIndex
 from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
                               OccurrencesInTimePeriodTracker)
 
@@ -58,6 +60,10 @@ class CosmosNodeAlertingFactory(AlertingFactory):
     def __init__(self, component_logger: logging.Logger) -> None:
         super().__init__(component_logger)
 
+        # The current heights of the nodes of each chain, indexed so that the
+        # highest height of a chain is found without going through its nodes
+        self._height_indexes: Dict[str, ChainHeightIndex] = {}
+
     def create_alerting_state(
             self, parent_id: str, node_id: str,
             alerts_config: CosmosNodeAlertsConfig, is_validator: bool) -> None:
@@ -352,3 +358,35 @@ class CosmosNodeAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+
+        self._height_indexes.pop(parent_id, None)
+
+    def update_current_height(self, parent_id: str, node_id: str,
+                              current_height: int) -> None:
+        """
+        This function stores the current height of a node in its alerting
+        state and in the height index of its chain.
+        :param parent_id: The id of the chain
+        :param node_id: The id of the node
+        :param current_height: The current height of the node
+        :return: None
+        """
+        self.alerting_state[parent_id][node_id][
+            'current_height'] = current_height
+
+        if parent_id not in self._height_indexes:
+            self._height_indexes[parent_id] = ChainHeightIndex()
+        self._height_indexes[parent_id].update(node_id, current_height)
+
+    def get_max_current_height(self, parent_id: str) -> Optional[int]:
+        """
+        This function returns the highest current height stored for the nodes
+        of a chain.
+        :param parent_id: The id of the chain
+        :return: The highest current height if one was stored for the chain
+               : None otherwise
+        """
+        if parent_id not in self._height_indexes:
+            return None
+
+        return self._height_indexes[parent_id].get_max_height()
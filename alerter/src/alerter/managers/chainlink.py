@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -22,15 +21,18 @@ from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkNodeAlertsConfigsFactory, ChainlinkContractAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import (CHAINLINK_NODE_ALERTER_NAME,
                                        CHAINLINK_CONTRACT_ALERTER_NAME)
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE, CL_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
     CL_ALERTERS_MAN_HB_QUEUE_NAME, PING_ROUTING_KEY,
     CL_ALERTS_CONFIGS_ROUTING_KEY, ALERT_EXCHANGE, TOPIC,
-    CL_NODE_ALERT_ROUTING_KEY, CL_CONTRACT_ALERT_ROUTING_KEY)
+    CL_NODE_ALERT_ROUTING_KEY, CL_CONTRACT_ALERT_ROUTING_KEY,
+    CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import remove_stale_shard_queues
 
 
 class ChainlinkAlertersManager(AlertersManager):
@@ -40,7 +42,6 @@ class ChainlinkAlertersManager(AlertersManager):
         self._node_alerts_config_factory = ChainlinkNodeAlertsConfigsFactory()
         self._contracts_alerts_config_factory = \
             ChainlinkContractAlertsConfigsFactory()
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             CHAINLINK_NODE_ALERTER_NAME: {
                 'alerterClass': ChainlinkNodeAlerter,
@@ -48,6 +49,7 @@ class ChainlinkAlertersManager(AlertersManager):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': CL_NODE_ALERT_ROUTING_KEY,
                 'starter': start_chainlink_node_alerter,
+                'shards': env.CHAINLINK_NODE_ALERTER_SHARDS,
             },
             CHAINLINK_CONTRACT_ALERTER_NAME: {
                 'alerterClass': ChainlinkContractAlerter,
@@ -58,10 +60,6 @@ class ChainlinkAlertersManager(AlertersManager):
             },
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def contracts_alerts_config_factory(
             self) -> ChainlinkContractAlertsConfigsFactory:
@@ -114,6 +112,13 @@ class ChainlinkAlertersManager(AlertersManager):
         self.rabbitmq.basic_consume(CL_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
                                     self._process_configs, False, False, None)
 
+        # Delete the queues of the node alerter shards which are no longer
+        # started, so that they do not keep on receiving data and configs which
+        # are never consumed.
+        remove_stale_shard_queues(self.rabbitmq, self.logger,
+                                  CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                                  env.CHAINLINK_NODE_ALERTER_SHARDS)
+
         # Declare publishing intentions
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
 
@@ -170,37 +175,11 @@ class ChainlinkAlertersManager(AlertersManager):
         """
         Start the Chainlink Alerters in a separate process if they are not yet
         started or they are not alive. This must be done in case of a restart of
-        the manager.
+        the manager. A sharded alerter is started in a process per shard.
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
-                """
-                We must clear out all the metrics which are found in Redis.
-                Sending this alert to the alert router and then the data store 
-                will achieve this. This is sent on startup of the manager and if
-                the alerter process is deemed to be dead.
-                """
-                alert = ComponentResetAlert(
-                    alerter_name, datetime.now().timestamp(),
-                    alerter_details['alerterClass'].__name__)
-                self._push_latest_data_to_queue_and_send(
-                    alert.alert_data, alerter_details['routing_key'])
-
-                """
-                Start the Alerter process with the factory being updated by this
-                manager. This factory should hold all the configurations, if 
-                any.
-                """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+            self._create_and_start_alerter(alerter_name, alerter_details)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -22,15 +21,18 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory, CosmosNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import (
     COSMOS_NODE_ALERTER_NAME, COSMOS_NETWORK_ALERTER_NAME)
 from src.utils.constants.rabbitmq import (
     COSMOS_NODE_ALERT_ROUTING_KEY, HEALTH_CHECK_EXCHANGE, TOPIC,
     COSMOS_ALERTERS_MAN_HB_QUEUE_NAME, PING_ROUTING_KEY, CONFIG_EXCHANGE,
     COSMOS_ALERTERS_MAN_CONFIGS_QUEUE_NAME, COSMOS_ALERTS_CONFIGS_ROUTING_KEY,
-    ALERT_EXCHANGE, COSMOS_NETWORK_ALERT_ROUTING_KEY)
+    ALERT_EXCHANGE, COSMOS_NETWORK_ALERT_ROUTING_KEY,
+    COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import remove_stale_shard_queues
 
 
 class CosmosAlertersManager(AlertersManager):
@@ -40,7 +42,6 @@ class CosmosAlertersManager(AlertersManager):
         self._node_alerts_config_factory = CosmosNodeAlertsConfigsFactory()
         self._network_alerts_config_factory = \
             CosmosNetworkAlertsConfigsFactory()
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             COSMOS_NODE_ALERTER_NAME: {
                 'alerterClass': CosmosNodeAlerter,
@@ -48,6 +49,7 @@ class CosmosAlertersManager(AlertersManager):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
                 'starter': start_cosmos_node_alerter,
+                'shards': env.COSMOS_NODE_ALERTER_SHARDS,
             },
             COSMOS_NETWORK_ALERTER_NAME: {
                 'alerterClass': CosmosNetworkAlerter,
@@ -58,10 +60,6 @@ class CosmosAlertersManager(AlertersManager):
             }
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def node_alerts_config_factory(self) -> CosmosNodeAlertsConfigsFactory:
         return self._node_alerts_config_factory
@@ -116,6 +114,13 @@ class CosmosAlertersManager(AlertersManager):
         self.rabbitmq.basic_consume(COSMOS_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
                                     self._process_configs, False, False, None)
 
+        # Delete the queues of the node alerter shards which are no longer
+        # started, so that they do not keep on receiving data and configs which
+        # are never consumed.
+        remove_stale_shard_queues(self.rabbitmq, self.logger,
+                                  COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                                  env.COSMOS_NODE_ALERTER_SHARDS)
+
         # Declare publishing intentions
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
 
@@ -172,37 +177,12 @@ class CosmosAlertersManager(AlertersManager):
         """
         Start the Cosmos Alerters in a separate process if they are not yet
         started, or they are not alive. This must be done in case of a restart
-        of the manager.
+        of the manager. A sharded alerter is started in a process per shard,
+        each of which is given its shard.
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
-                """
-                We must clear out all the metrics which are found in Redis.
-                Sending this alert to the alert router and then the data store
-                will achieve this. This is sent on startup of the manager and if
-                the alerter process is deemed to be dead.
-                """
-                alert = ComponentResetAlert(
-                    alerter_name, datetime.now().timestamp(),
-                    alerter_details['alerterClass'].__name__)
-                self._push_latest_data_to_queue_and_send(
-                    alert.alert_data, alerter_details['routing_key'])
-
-                """
-                Start the Alerter process with the factory being updated by this
-                manager. This factory should hold all the configurations, if
-                any.
-                """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+            self._create_and_start_alerter(alerter_name, alerter_details)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -16,14 +15,17 @@ from src.alerter.alerts.internal_alerts import ComponentResetAlert
 from src.alerter.managers.manager import AlertersManager
 from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import EVM_NODE_ALERTER_NAME
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE, PING_ROUTING_KEY,
     CL_ALERTS_CONFIGS_ROUTING_KEY, ALERT_EXCHANGE, TOPIC,
     EVM_NODE_ALERTER_MAN_HEARTBEAT_QUEUE_NAME,
-    EVM_NODE_ALERTER_MAN_CONFIGS_QUEUE_NAME, EVM_NODE_ALERT_ROUTING_KEY)
+    EVM_NODE_ALERTER_MAN_CONFIGS_QUEUE_NAME, EVM_NODE_ALERT_ROUTING_KEY,
+    EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import remove_stale_shard_queues
 
 
 class EVMNodeAlerterManager(AlertersManager):
@@ -31,11 +33,6 @@ class EVMNodeAlerterManager(AlertersManager):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, manager_name, rabbitmq)
         self._alerts_config_factory = EVMNodeAlertsConfigsFactory()
-        self._alerter_process_dict = {}
-
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
 
     @property
     def alerts_config_factory(self) -> EVMNodeAlertsConfigsFactory:
@@ -81,6 +78,13 @@ class EVMNodeAlerterManager(AlertersManager):
         self.rabbitmq.basic_consume(EVM_NODE_ALERTER_MAN_CONFIGS_QUEUE_NAME,
                                     self._process_configs, False, False, None)
 
+        # Delete the queues of the node alerter shards which are no longer
+        # started, so that they do not keep on receiving data and configs which
+        # are never consumed.
+        remove_stale_shard_queues(self.rabbitmq, self.logger,
+                                  EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                                  env.EVM_NODE_ALERTER_SHARDS)
+
         # Declare publishing intentions
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
         # Declare exchange to send data to
@@ -137,36 +141,15 @@ class EVMNodeAlerterManager(AlertersManager):
         """
         Start the EVM Node Alerter in a separate process if it is not yet
         started or it is not alive. This must be done in case of a restart of
-        the manager.
+        the manager. If sharded, the alerter is started in a process per shard.
         """
-        if (EVM_NODE_ALERTER_NAME not in self.alerter_process_dict or
-                not self.alerter_process_dict[
-                    EVM_NODE_ALERTER_NAME].is_alive()):
-            """
-            We must clear out all the metrics which are found in Redis.
-            Sending this alert to the alert router and then the data store will
-            achieve this. This is sent on startup of the manager and if the
-            alerter process is deemed to be dead.
-            """
-            alert = ComponentResetAlert(EVM_NODE_ALERTER_NAME,
-                                        datetime.now().timestamp(),
-                                        EVMNodeAlerter.__name__)
-            self._push_latest_data_to_queue_and_send(alert.alert_data)
-
-            """
-            Start the EVM Node Alerter process with the factory being updated by
-            this manager. This factory should hold all the configurations, if 
-            any.
-            """
-            log_and_print("Attempting to start the {}.".format(
-                EVM_NODE_ALERTER_NAME), self.logger)
-            evm_alerter_process = Process(target=start_evm_node_alerter,
-                                          args=(self.alerts_config_factory,))
-            evm_alerter_process.daemon = True
-            evm_alerter_process.start()
-
-            self._alerter_process_dict[EVM_NODE_ALERTER_NAME] = \
-                evm_alerter_process
+        self._create_and_start_alerter(EVM_NODE_ALERTER_NAME, {
+            'alerterClass': EVMNodeAlerter,
+            'factory': self.alerts_config_factory,
+            'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
+            'starter': start_evm_node_alerter,
+            'shards': env.EVM_NODE_ALERTER_SHARDS,
+        })
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -249,10 +232,12 @@ class EVMNodeAlerterManager(AlertersManager):
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
 
-    def _push_latest_data_to_queue_and_send(self, alert: Dict) -> None:
+    def _push_latest_data_to_queue_and_send(
+            self, alert: Dict,
+            routing_key: str = EVM_NODE_ALERT_ROUTING_KEY) -> None:
         self._push_to_queue(
             data=copy.deepcopy(alert), exchange=ALERT_EXCHANGE,
-            routing_key=EVM_NODE_ALERT_ROUTING_KEY,
+            routing_key=routing_key,
             properties=pika.BasicProperties(delivery_mode=2), mandatory=True
         )
         self._send_data()
@@ -28,11 +28,6 @@ class GithubAlerterManager(AlertersManager):
     def __init__(self, logger: logging.Logger, name: str,
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, name, rabbitmq)
-        self._alerter_process_dict = {}
-
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
 
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
@@ -1,16 +1,21 @@
 import logging
 from abc import abstractmethod
+from datetime import datetime
+from multiprocessing import Process
 from types import FrameType
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
+from src.alerter.alerts.internal_alerts import ComponentResetAlert
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY)
+from src.utils.logging import log_and_print
+from src.utils.sharding import get_shard, get_shard_name, get_shards
 
 
 class AlertersManager(QueuingPublisherSubscriberComponent):
@@ -18,6 +23,7 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, rabbitmq)
         self._name = name
+        self._alerter_process_dict = {}
 
     def __str__(self) -> str:
         return self.name
@@ -26,6 +32,10 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
     def name(self) -> str:
         return self._name
 
+    @property
+    def alerter_process_dict(self) -> Dict:
+        return self._alerter_process_dict
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -38,6 +48,83 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
+    def _create_and_start_alerter(self, alerter_name: str,
+                                  alerter_details: Dict) -> None:
+        """
+        Start the alerter in a separate process if it is not yet started, or it
+        is not alive. This must be done in case of a restart of the manager. A
+        sharded alerter is started in a process per shard, each of which is
+        given its shard.
+        :param alerter_name: The name of the alerter
+        :param alerter_details: The alerter's class, configs factory, alerts
+                              : routing key, starter and optionally its number
+                              : of shards
+        :return: None
+        """
+        shards = alerter_details.get('shards', 1)
+        for shard in get_shards(shards):
+            shard_name = get_shard_name(alerter_name, shard)
+            if (shard_name in self.alerter_process_dict and
+                    self.alerter_process_dict[shard_name].is_alive()):
+                continue
+
+            """
+            We must clear out all the metrics which are found in Redis.
+            Sending this alert to the alert router and then the data store will
+            achieve this. This is sent on startup of the manager and if the
+            alerter process is deemed to be dead.
+            """
+            self._send_reset_alerts(alerter_name, alerter_details, shard,
+                                    shards)
+
+            """
+            Start the Alerter process with the factory being updated by this
+            manager. This factory should hold all the configurations, if any.
+            """
+            log_and_print("Attempting to start the {}.".format(shard_name),
+                          self.logger)
+            args = (alerter_details['factory'],)
+            alerter_process = Process(
+                target=alerter_details['starter'],
+                args=args if shard is None else (*args, shard))
+            alerter_process.daemon = True
+            alerter_process.start()
+
+            self._alerter_process_dict[shard_name] = alerter_process
+
+    def _send_reset_alerts(self, alerter_name: str, alerter_details: Dict,
+                           shard: Optional[int], shards: int) -> None:
+        """
+        If an alerter shard is restarted once the chains are configured, only
+        the metrics of the chains mapped to that shard are cleared, as the other
+        shards keep on alerting on the rest of the chains. Otherwise, all the
+        metrics of the alerter are cleared.
+        :param alerter_name: The name of the alerter
+        :param alerter_details: The alerter's class, configs factory, alerts
+                              : routing key, starter and optionally its number
+                              : of shards
+        :param shard: The shard being started, or None if not sharded
+        :param shards: The number of shards of the alerter
+        :return: None
+        """
+        alerter_class = alerter_details['alerterClass']
+        configs_factory = alerter_details['factory']
+        if shard is None or not configs_factory.configs:
+            alert = ComponentResetAlert(
+                alerter_name, datetime.now().timestamp(),
+                alerter_class.__name__)
+            self._push_latest_data_to_queue_and_send(
+                alert.alert_data, alerter_details['routing_key'])
+            return
+
+        for chain_name, config in configs_factory.configs.items():
+            if get_shard(config.parent_id, shards) == shard:
+                alert = ComponentResetAlert(
+                    alerter_name, datetime.now().timestamp(),
+                    alerter_class.__name__, config.parent_id, chain_name)
+                self._push_latest_data_to_queue_and_send(
+                    alert.alert_data, alerter_details['routing_key'])
+
     @abstractmethod
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -22,6 +21,7 @@ from src.configs.alerts.node.substrate import SubstrateNodeAlertsConfig
 from src.configs.factory.alerts.substrate_alerts import (
     SubstrateNodeAlertsConfigsFactory, SubstrateNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import (
     SUBSTRATE_NODE_ALERTER_NAME, SUBSTRATE_NETWORK_ALERTER_NAME)
 from src.utils.constants.rabbitmq import (
@@ -29,9 +29,11 @@ from src.utils.constants.rabbitmq import (
     PING_ROUTING_KEY, CONFIG_EXCHANGE, SUBSTRATE_NODE_ALERT_ROUTING_KEY,
     SUBSTRATE_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
     SUBSTRATE_ALERTS_CONFIGS_ROUTING_KEY,
-    ALERT_EXCHANGE, SUBSTRATE_NETWORK_ALERT_ROUTING_KEY)
+    ALERT_EXCHANGE, SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
+    SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import remove_stale_shard_queues
 
 
 class SubstrateAlertersManager(AlertersManager):
@@ -42,7 +44,6 @@ class SubstrateAlertersManager(AlertersManager):
             SubstrateNodeAlertsConfigsFactory())
         self._network_alerts_config_factory = (
             SubstrateNetworkAlertsConfigsFactory())
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             SUBSTRATE_NODE_ALERTER_NAME: {
                 'alerterClass': SubstrateNodeAlerter,
@@ -50,6 +51,7 @@ class SubstrateAlertersManager(AlertersManager):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': SUBSTRATE_NODE_ALERT_ROUTING_KEY,
                 'starter': start_substrate_node_alerter,
+                'shards': env.SUBSTRATE_NODE_ALERTER_SHARDS,
             },
             SUBSTRATE_NETWORK_ALERTER_NAME: {
                 'alerterClass': SubstrateNetworkAlerter,
@@ -60,10 +62,6 @@ class SubstrateAlertersManager(AlertersManager):
             }
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def node_alerts_config_factory(self) -> SubstrateNodeAlertsConfigsFactory:
         return self._node_alerts_config_factory
@@ -119,6 +117,14 @@ class SubstrateAlertersManager(AlertersManager):
         self.rabbitmq.basic_consume(SUBSTRATE_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
                                     self._process_configs, False, False, None)
 
+        # Delete the queues of the node alerter shards which are no longer
+        # started, so that they do not keep on receiving data and configs which
+        # are never consumed.
+        remove_stale_shard_queues(
+            self.rabbitmq, self.logger,
+            SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            env.SUBSTRATE_NODE_ALERTER_SHARDS)
+
         # Declare publishing intentions
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
 
@@ -175,37 +181,11 @@ class SubstrateAlertersManager(AlertersManager):
         """
         Start the Substrate Alerters in a separate process if they are not yet
         started, or they are not alive. This must be done in case of a restart
-        of the manager.
+        of the manager. A sharded alerter is started in a process per shard.
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
-                """
-                We must clear out all the metrics which are found in Redis.
-                Sending this alert to the alert router and then the data store
-                will achieve this. This is sent on startup of the manager and if
-                the alerter process is deemed to be dead.
-                """
-                alert = ComponentResetAlert(
-                    alerter_name, datetime.now().timestamp(),
-                    alerter_details['alerterClass'].__name__)
-                self._push_latest_data_to_queue_and_send(
-                    alert.alert_data, alerter_details['routing_key'])
-
-                """
-                Start the Alerter process with the factory being updated by this
-                manager. This factory should hold all the configurations, if
-                any.
-                """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+            self._create_and_start_alerter(alerter_name, alerter_details)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -16,15 +15,18 @@ from src.alerter.alerts.internal_alerts import ComponentResetAlert
 from src.alerter.managers.manager import AlertersManager
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import SYSTEM_ALERTER_NAME
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE,
     SYS_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
     SYS_ALERTERS_MAN_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY,
     ALERTS_CONFIGS_ROUTING_KEY_CHAIN, ALERTS_CONFIGS_ROUTING_KEY_GEN,
-    ALERT_EXCHANGE, SYSTEM_ALERT_ROUTING_KEY, TOPIC)
+    ALERT_EXCHANGE, SYSTEM_ALERT_ROUTING_KEY, TOPIC,
+    SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import remove_stale_shard_queues
 
 
 class SystemAlertersManager(AlertersManager):
@@ -33,20 +35,16 @@ class SystemAlertersManager(AlertersManager):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, manager_name, rabbitmq)
         self._system_alerts_config_factory = SystemAlertsConfigsFactory()
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             SYSTEM_ALERTER_NAME: {
                 'alerterClass': SystemAlerter,
                 'factory': self.system_alerts_config_factory,
                 'routing_key': SYSTEM_ALERT_ROUTING_KEY,
                 'starter': start_system_alerter,
+                'shards': env.SYSTEM_ALERTER_SHARDS,
             }
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def system_alerts_config_factory(self) -> SystemAlertsConfigsFactory:
         return self._system_alerts_config_factory
@@ -102,6 +100,13 @@ class SystemAlertersManager(AlertersManager):
         self.rabbitmq.basic_consume(SYS_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
                                     self._process_configs, False, False, None)
 
+        # Delete the queues of the system alerter shards which are no longer
+        # started, so that they do not keep on receiving data and configs which
+        # are never consumed.
+        remove_stale_shard_queues(self.rabbitmq, self.logger,
+                                  SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                                  env.SYSTEM_ALERTER_SHARDS)
+
         # Declare publishing intentions
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
 
@@ -159,37 +164,11 @@ class SystemAlertersManager(AlertersManager):
         """
         Start the System Alerters in a separate process if they are not yet
         started, or they are not alive. This must be done in case of a restart
-        of the manager.
+        of the manager. A sharded alerter is started in a process per shard.
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
-                """
-                We must clear out all the metrics which are found in Redis.
-                Sending this alert to the alert router and then the data store
-                will achieve this. This is sent on startup of the manager 
-                and if the alerter process is deemed to be dead.
-                """
-                alert = ComponentResetAlert(
-                    alerter_name, datetime.now().timestamp(),
-                    alerter_details['alerterClass'].__name__)
-                self._push_latest_data_to_queue_and_send(
-                    alert.alert_data, alerter_details['routing_key'])
-
-                """
-                Start the Alerter process with the factory being updated by 
-                this manager. This factory should hold all the configurations,
-                if any.
-                """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+            self._create_and_start_alerter(alerter_name, alerter_details)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -12,6 +12,10 @@ _SUBSTRATE_API_NODE_CONNECTION_ERROR_CODES = [
     _SUBSTRATE_API_LOST_NODE_CONNECTION_ERROR_CODE
 ]
 
+# The maximum number of blocks which the Substrate API returns per request to
+# the '/api/custom/blocks/getSlashedAndOffline' endpoint
+MAX_BLOCKS_PER_BATCH_QUERY = 100
+
 
 class SubstrateApiWrapper(ApiWrapper):
     """
@@ -66,6 +70,32 @@ class SubstrateApiWrapper(ApiWrapper):
         return get_json(endpoint=endpoint, logger=self.logger, params=params,
                         verify=self.verify, timeout=self.timeout)
 
+    def get_blocks_slashed_and_offline(self, node_ws_url: str, from_block: int,
+                                       to_block: int,
+                                       account_ids: List[str]) -> Dict:
+        """
+        This function uses the '/api/custom/blocks/getSlashedAndOffline'
+        endpoint of the Substrate-API to get, in one request, the hash of each
+        block from height from_block to height to_block (inclusive), and
+        whether each of the given validators was slashed or deemed offline at
+        that block. At most MAX_BLOCKS_PER_BATCH_QUERY blocks can be queried
+        per request.
+        :param node_ws_url: The websocket url of the data source
+        :param from_block: The height of the first block to query
+        :param to_block: The height of the last block to query
+        :param account_ids: The stashes of the validators
+        :return: Retrieves data from the
+                 '/api/custom/blocks/getSlashedAndOffline' endpoint of the
+                 Substrate API, keyed by height.
+        """
+        endpoint = self.api_url + '/api/custom/blocks/getSlashedAndOffline'
+        params = {'websocket': node_ws_url,
+                  'fromBlock': from_block,
+                  'toBlock': to_block,
+                  'accountIds': ','.join(account_ids)}
+        return get_json(endpoint=endpoint, logger=self.logger, params=params,
+                        verify=self.verify, timeout=self.timeout)
+
     def get_system_health(self, node_ws_url: str) -> Dict:
         """
         This function uses the '/api/rpc/system/health' endpoint of the
@@ -1,4 +1,5 @@
 import smtplib
+import time
 from datetime import datetime
 from email.message import EmailMessage, Message
 from email.mime.multipart import MIMEMultipart
@@ -9,7 +10,8 @@ from typing import Optional
 class EmailApi:
 
     def __init__(self, smtp: str, sender: str, username: Optional[str],
-                 password: Optional[str], port: int = 0) -> None:
+                 password: Optional[str], port: int = 0,
+                 idle_timeout: float = 0) -> None:
         super().__init__()
 
         # If blank/None username or None password, EmailSender assumes
@@ -21,6 +23,13 @@ class EmailApi:
         self._password = password
         self._port = port
 
+        # If idle_timeout > 0, the authenticated SMTP connection is kept open
+        # and re-used for the emails sent within idle_timeout seconds of each
+        # other. Otherwise, a new connection is opened for every email.
+        self._idle_timeout = idle_timeout
+        self._connection = None
+        self._connection_last_used = None
+
     def send_email(self, subject: str, message: str, to: str) -> None:
         msg = EmailMessage()
         msg.set_content("{}\nDate - {}".format(message, datetime.now()))
@@ -67,12 +76,61 @@ class EmailApi:
 
         self._send_smtp(msg)
 
-    def _send_smtp(self, msg: Message) -> None:
-        # Send the message via the specified SMTP server.
+    def _connect(self) -> smtplib.SMTP:
         s = smtplib.SMTP(self._smtp, self._port)
         if None not in [self._username, self._password] \
                 and len(self._username) != 0:
             s.starttls()
             s.login(self._username, self._password)
-        s.send_message(msg)
-        s.quit()
+        return s
+
+    def close(self) -> None:
+        """
+        This function closes the open SMTP connection, if any. Errors are
+        ignored as the connection may have already been closed by the server.
+        """
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._connection = None
+        self._connection_last_used = None
+
+    def _send_smtp(self, msg: Message) -> None:
+        # Send the message via the specified SMTP server.
+        if self._idle_timeout <= 0:
+            s = self._connect()
+            s.send_message(msg)
+            s.quit()
+            return
+
+        # Servers close connections which are idle for too long, therefore a
+        # connection is only re-used if it was used recently.
+        if self._connection is not None \
+                and time.monotonic() - self._connection_last_used \
+                > self._idle_timeout:
+            self.close()
+
+        reused_connection = self._connection is not None
+        if not reused_connection:
+            self._connection = self._connect()
+
+        try:
+            self._connection.send_message(msg)
+        except (smtplib.SMTPException, OSError):
+            # The connection may have been dropped by the server, therefore
+            # re-connect and try again once if it was re-used.
+            self.close()
+            if not reused_connection:
+                raise
+            self._connection = self._connect()
+            try:
+                self._connection.send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                self.close()
+                raise
+
+        self._connection_last_used = time.monotonic()
@@ -1,6 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import List
 
+from src.alerter.alerts.alert import Alert
+from src.utils.constants.channels import DIGEST_MAX_ALERT_MESSAGES
 from src.utils.data import RequestStatus
 
 
@@ -29,3 +32,22 @@ class Channel(ABC):
     @abstractmethod
     def alert(self, *args) -> RequestStatus:
         pass
+
+    @staticmethod
+    def _format_digest(alerts: List[Alert]) -> str:
+        """
+        This function formats alerts which have the same parent_id, severity
+        and alert code into a single chat message. Only the messages of the
+        first DIGEST_MAX_ALERT_MESSAGES alerts are listed.
+        :param alerts: The alerts to be formatted
+        :return: The digest message
+        """
+        subject = "PANIC {}".format(alerts[0].severity.upper())
+        lines = ['*{}*: {} `{}` alerts'.format(
+            subject, len(alerts), alerts[0].alert_code.name)]
+        lines.extend('`{}`'.format(alert.message)
+                     for alert in alerts[:DIGEST_MAX_ALERT_MESSAGES])
+        if len(alerts) > DIGEST_MAX_ALERT_MESSAGES:
+            lines.append('... and {} more'.format(
+                len(alerts) - DIGEST_MAX_ALERT_MESSAGES))
+        return '\n'.join(lines)
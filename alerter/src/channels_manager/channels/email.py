@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.email_api import EmailApi
@@ -19,8 +19,12 @@ class EmailChannel(Channel):
         self._emails_to = emails_to
         self._email_api = email_api
 
-    def alert(self, alert: Alert) -> RequestStatus:
-        subject = "PANIC {}".format(alert.severity)
+    @property
+    def email_api(self) -> EmailApi:
+        return self._email_api
+
+    @staticmethod
+    def _format_alert(alert: Alert) -> Tuple[str, str]:
         html_email_message = EMAIL_HTML_TEMPLATE.format(
             alert_code=alert.alert_code.value, severity=alert.severity,
             message=alert.message,
@@ -33,21 +37,57 @@ class EmailChannel(Channel):
             date_time=datetime.fromtimestamp(alert.timestamp),
             parent_id=alert.parent_id, origin_id=alert.origin_id
         )
-        self._logger.debug("Formatted email template")
+        return html_email_message, plain_email_message
+
+    def _send_to_all_emails(self, subject: str, html_email_message: str,
+                            plain_email_message: str) -> None:
         self._logger.debug("Sending alert to the channel's destination emails")
         self._logger.debug("Destination Emails: %s",
                            self._emails_to)
+        for to_address in self._emails_to:
+            self._logger.debug("Sending alert to %s", to_address)
+            self._email_api.send_email_with_html(
+                subject, html_email_message, plain_email_message,
+                to_address)
+            self._logger.debug("Sent alert to %s", to_address)
+        self._logger.debug("Sent alert to all the emails in the channel")
+
+    def alert(self, alert: Alert) -> RequestStatus:
+        subject = "PANIC {}".format(alert.severity)
+        html_email_message, plain_email_message = self._format_alert(alert)
+        self._logger.debug("Formatted email template")
         try:
-            for to_address in self._emails_to:
-                self._logger.debug("Sending alert to %s", to_address)
-                self._email_api.send_email_with_html(
-                    subject, html_email_message, plain_email_message,
-                    to_address)
-                self._logger.debug("Sent alert to %s", to_address)
-            self._logger.debug("Sent alert to all the emails in the channel")
+            self._send_to_all_emails(subject, html_email_message,
+                                     plain_email_message)
             return RequestStatus.SUCCESS
         except Exception as e:
             self._logger.error("Error when sending %s to Email channel %s",
                                alert.alert_code.name, self.__str__())
             self._logger.exception(e)
             return RequestStatus.FAILED
+
+    def alert_batch(self, alerts: List[Alert]) -> RequestStatus:
+        """
+        This function sends the given alerts in a single email to each of the
+        channel's destination emails, rather than one email per alert.
+        :param alerts: The alerts to be sent
+        :return: RequestStatus.SUCCESS if the alerts were sent to all emails
+               : RequestStatus.FAILED otherwise
+        """
+        subject = "PANIC {} alerts".format(len(alerts))
+        formatted_alerts = [self._format_alert(alert) for alert in alerts]
+        html_email_message = "<hr>".join(
+            html_message for html_message, _ in formatted_alerts)
+        plain_email_message = "".join(
+            plain_message for _, plain_message in formatted_alerts)
+        self._logger.debug("Formatted email template for %s alerts",
+                           len(alerts))
+        try:
+            self._send_to_all_emails(subject, html_email_message,
+                                     plain_email_message)
+            return RequestStatus.SUCCESS
+        except Exception as e:
+            self._logger.error("Error when sending %s alerts to Email channel "
+                               "%s", len(alerts), self.__str__())
+            self._logger.exception(e)
+            return RequestStatus.FAILED
@@ -1,4 +1,5 @@
 import logging
+from typing import List
 
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
@@ -38,3 +39,32 @@ class TelegramChannel(Channel):
                               alert.alert_code.name, self.__str__())
             self.logger.exception(e)
             return RequestStatus.FAILED
+
+    def alert_digest(self, alerts: List[Alert]) -> RequestStatus:
+        """
+        This function sends alerts which have the same parent_id, severity and
+        alert code in a single message, rather than one message per alert.
+        :param alerts: The alerts to be sent
+        :return: RequestStatus.SUCCESS if the message was sent
+               : RequestStatus.FAILED otherwise
+        """
+        alert_code_name = alerts[0].alert_code.name
+        try:
+            ret = self._telegram_bot.send_message(self._format_digest(alerts))
+            self.logger.debug("alert_digest: telegram_ret: %s", ret)
+            if ret['ok']:
+                self.logger.info("Sent %s %s alerts to Telegram channel %s.",
+                                 len(alerts), alert_code_name, self.__str__())
+                return RequestStatus.SUCCESS
+            else:
+                self.logger.error(
+                    "Error when sending %s %s alerts to Telegram channel %s: "
+                    "%s.", len(alerts), alert_code_name, self.__str__(),
+                    ret['description'])
+                return RequestStatus.FAILED
+        except Exception as e:
+            self.logger.error("Error when sending %s %s alerts to Telegram "
+                              "channel %s.", len(alerts), alert_code_name,
+                              self.__str__())
+            self.logger.exception(e)
+            return RequestStatus.FAILED
@@ -4,6 +4,7 @@ import sys
 from datetime import datetime
 from queue import Queue
 from types import FrameType
+from typing import List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -14,6 +15,7 @@ from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.email import EmailChannel
 from src.channels_manager.handlers.handler import ChannelHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -29,13 +31,26 @@ class EmailAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, email_channel: EmailChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600):
+                 alert_validity_threshold: int = 600,
+                 batch_window: float = 0,
+                 retry_scheduler: Optional[AlertRetryScheduler] = None):
         super().__init__(handler_name, logger, rabbitmq)
 
         self._email_channel = email_channel
         self._alerts_queue = Queue(queue_size)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+
+        # If batch_window > 0, the alerts received within batch_window seconds
+        # of the first alert waiting in the queue are sent together in one
+        # email per recipient once the window ends.
+        self._batch_window = batch_window
+
+        # If given, alerts which cannot be sent are re-tried later without
+        # blocking the alerts behind them. Batched alerts are re-tried
+        # together.
+        self._retry_scheduler = retry_scheduler
+
         self._email_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.email_channel.channel_id)
@@ -94,22 +109,24 @@ class EmailAlertsHandler(ChannelHandler):
         if not processing_error:
             self._place_alert_on_queue(alert)
 
-        # Send any alerts waiting in the queue, if any
+        # Send any alerts waiting in the queue, if any. If alerts are batched
+        # they are sent when the batching window ends instead.
+        if self._batch_window > 0:
+            if not self.alerts_queue.empty():
+                self._schedule_alerts_sending(self._batch_window)
+            return
+
         try:
             self._send_alerts()
         except Exception as e:
             raise e
 
         # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
+        # processing errors and when all alerts have been sent successfully,
+        # or are waiting to be re-tried.
+        if self._are_alerts_sent() and not processing_error:
             try:
-                heartbeat = {
-                    'component_name': self.handler_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+                self._send_heartbeat(self._create_heartbeat())
             except MessageWasNotDeliveredException as e:
                 # Log the message and do not raise it as heartbeats must be
                 # real-time.
@@ -129,7 +146,33 @@ class EmailAlertsHandler(ChannelHandler):
 
         self.logger.debug("%s added to the alerts queue", alert.alert_code.name)
 
+    def _is_alert_expired(self, alert: Alert) -> bool:
+        return (datetime.now().timestamp() - alert.timestamp) \
+               > self._alert_validity_threshold
+
+    def _get_alerts_to_send(self, alert: Alert) -> List[Alert]:
+        if self._batch_window <= 0:
+            return [alert]
+
+        # If alerts are batched, all the alerts waiting in the queue are sent
+        # together, discarding the expired ones.
+        return [queued_alert for queued_alert in self.alerts_queue.queue
+                if not self._is_alert_expired(queued_alert)]
+
+    def _send_alerts_to_channel(self, alerts: List[Alert]) -> RequestStatus:
+        if len(alerts) == 1:
+            return self.email_channel.alert(alerts[0])
+
+        return self.email_channel.alert_batch(alerts)
+
     def _send_alerts(self) -> None:
+        # If alerts are batched, each batch is sent and re-tried as one
+        if self._retry_scheduler is not None:
+            self._schedule_alerts_sending(self._retry_scheduler.send_alerts(
+                self.alerts_queue, self._send_alerts_to_channel,
+                self._alert_validity_threshold, self._get_alerts_to_send))
+            return
+
         empty = True
         if not self.alerts_queue.empty():
             empty = False
@@ -148,26 +191,33 @@ class EmailAlertsHandler(ChannelHandler):
 
             # Discard alert if alert_validity_threshold seconds passed since it
             # was last raised
-            if (datetime.now().timestamp() - alert.timestamp) \
-                    > self._alert_validity_threshold:
+            if self._is_alert_expired(alert):
                 self.alerts_queue.get()
                 self.alerts_queue.task_done()
                 continue
 
+            # If alerts are batched, all the alerts waiting in the queue are
+            # sent together, discarding the expired ones.
+            queued_alerts = list(self.alerts_queue.queue) \
+                if self._batch_window > 0 else [alert]
+            alerts = [queued_alert for queued_alert in queued_alerts
+                      if not self._is_alert_expired(queued_alert)]
+
             attempts = 1
-            status = self.email_channel.alert(alert)
+            status = self._send_alerts_to_channel(alerts)
             while status != RequestStatus.SUCCESS \
                     and attempts < self._max_attempts:
                 self.logger.debug("Will re-try sending in 10 seconds. "
                                   "Attempts left: %s",
                                   self._max_attempts - attempts)
                 self.rabbitmq.connection.sleep(10)
-                status = self.email_channel.alert(alert)
+                status = self._send_alerts_to_channel(alerts)
                 attempts += 1
 
             if status == RequestStatus.SUCCESS:
-                self.alerts_queue.get()
-                self.alerts_queue.task_done()
+                for _ in queued_alerts:
+                    self.alerts_queue.get()
+                    self.alerts_queue.task_done()
             else:
                 self.logger.debug("Stopped sending alerts.")
                 return
@@ -227,9 +277,10 @@ class EmailAlertsHandler(ChannelHandler):
                 raise e
 
     def _on_terminate(self, signum: int, stack: FrameType) -> None:
-        log_and_print("{} is terminating. Connections with RabbitMQ will be "
-                      "closed, and afterwards the process will "
-                      "exit.".format(self), self.logger)
+        log_and_print("{} is terminating. The connections with the SMTP "
+                      "server and RabbitMQ will be closed, and afterwards the "
+                      "process will exit.".format(self), self.logger)
+        self.email_channel.email_api.close()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
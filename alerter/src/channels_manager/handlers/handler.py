@@ -1,8 +1,13 @@
 import logging
 from abc import ABC
+from datetime import datetime
+from typing import Dict, Optional
 
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
+from src.alerter.alerts.alert import Alert
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.exceptions import MessageWasNotDeliveredException
 
 
 class ChannelHandler(PublisherSubscriberComponent, ABC):
@@ -12,6 +17,14 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
 
         self._handler_name = handler_name
 
+        # The time at which the alerts waiting in the alerts queue of an alerts
+        # handler are next scheduled to be sent, if they are scheduled
+        self._alerts_sending_scheduled_at = None
+
+        # If set by an alerts handler, the alerts which cannot be sent are
+        # re-tried later without blocking the alerts behind them
+        self._retry_scheduler = None
+
     def __str__(self) -> str:
         return self.handler_name
 
@@ -19,5 +32,92 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
     def handler_name(self) -> str:
         return self._handler_name
 
+    @property
+    def retry_scheduler(self) -> Optional[AlertRetryScheduler]:
+        return self._retry_scheduler
+
+    @property
+    def alert_retries(self) -> int:
+        return 0 if self.retry_scheduler is None \
+            else self.retry_scheduler.retries
+
+    @property
+    def alerts_given_up(self) -> int:
+        return 0 if self.retry_scheduler is None \
+            else self.retry_scheduler.given_up
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
+
+    @staticmethod
+    def _is_coalescable(alert: Alert, other_alert: Alert) -> bool:
+        """
+        Alerts which have the same parent_id, severity and alert code can be
+        sent together in a single digest message.
+        """
+        return (alert.parent_id, alert.severity, alert.alert_code) == (
+            other_alert.parent_id, other_alert.severity,
+            other_alert.alert_code)
+
+    def _schedule_alerts_sending(self, delay: Optional[float]) -> None:
+        """
+        This function is used by the alerts handlers to send the alerts waiting
+        in their alerts queue after delay seconds, while consuming, unless they
+        are already scheduled to be sent before then. A schedule which is
+        overdue is assumed to have been lost with a previous connection.
+        :param delay: The number of seconds after which the alerts should be
+                    : sent, or None if there are no alerts to send
+        :return: None
+        """
+        if delay is None:
+            return
+
+        now = datetime.now().timestamp()
+        scheduled_at = self._alerts_sending_scheduled_at
+        if scheduled_at is not None and now <= scheduled_at <= now + delay:
+            return
+
+        self.rabbitmq.call_later(delay, self._on_alerts_sending_timer)
+        self._alerts_sending_scheduled_at = now + delay
+
+    def _are_alerts_sent(self) -> bool:
+        """
+        Heartbeats are sent only when the alerts waiting in the alerts queue
+        have been sent. The alerts which are waiting to be re-tried by the
+        retry scheduler are not due yet, therefore they do not hold back the
+        heartbeats, otherwise the handler would be reported as dead for as
+        long as an alert is being re-tried.
+        :return: True if no alert is waiting to be sent, False otherwise
+        """
+        if self.retry_scheduler is None:
+            return self.alerts_queue.empty()
+
+        return self.retry_scheduler.is_only_retrying(self.alerts_queue)
+
+    def _create_heartbeat(self) -> Dict:
+        heartbeat = {
+            'component_name': self.handler_name,
+            'is_alive': True,
+            'timestamp': datetime.now().timestamp()
+        }
+
+        # Expose the retry metrics of the handler together with its heartbeat
+        if self.retry_scheduler is not None:
+            heartbeat['alert_retries'] = self.retry_scheduler.retries
+            heartbeat['alerts_given_up'] = self.retry_scheduler.given_up
+            heartbeat['pending_alert_retries'] = \
+                self.retry_scheduler.pending_retries
+
+        return heartbeat
+
+    def _on_alerts_sending_timer(self) -> None:
+        self._alerts_sending_scheduled_at = None
+        self._send_alerts()
+
+        if self._are_alerts_sent():
+            try:
+                self._send_heartbeat(self._create_heartbeat())
+            except MessageWasNotDeliveredException as e:
+                # Log the message and do not raise it as heartbeats must be
+                # real-time.
+                self.logger.exception(e)
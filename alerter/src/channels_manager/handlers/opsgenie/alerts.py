@@ -4,6 +4,7 @@ import sys
 from datetime import datetime
 from queue import Queue
 from types import FrameType
+from typing import Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -14,6 +15,7 @@ from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.opsgenie import OpsgenieChannel
 from src.channels_manager.handlers import ChannelHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
@@ -28,13 +30,19 @@ class OpsgenieAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, opsgenie_channel: OpsgenieChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600):
+                 alert_validity_threshold: int = 600,
+                 retry_scheduler: Optional[AlertRetryScheduler] = None):
         super().__init__(handler_name, logger, rabbitmq)
 
         self._opsgenie_channel = opsgenie_channel
         self._alerts_queue = Queue(queue_size)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+
+        # If given, alerts which cannot be sent are re-tried later without
+        # blocking the alerts behind them
+        self._retry_scheduler = retry_scheduler
+
         self._opsgenie_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self._opsgenie_channel.channel_id)
@@ -100,15 +108,11 @@ class OpsgenieAlertsHandler(ChannelHandler):
             raise e
 
         # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
+        # processing errors and when all alerts have been sent successfully,
+        # or are waiting to be re-tried.
+        if self._are_alerts_sent() and not processing_error:
             try:
-                heartbeat = {
-                    'component_name': self.handler_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+                self._send_heartbeat(self._create_heartbeat())
             except MessageWasNotDeliveredException as e:
                 # Log the message and do not raise it as heartbeats must be
                 # real-time.
@@ -129,6 +133,12 @@ class OpsgenieAlertsHandler(ChannelHandler):
         self.logger.debug("%s added to the alerts queue", alert.alert_code.name)
 
     def _send_alerts(self) -> None:
+        if self._retry_scheduler is not None:
+            self._schedule_alerts_sending(self._retry_scheduler.send_alerts(
+                self.alerts_queue, self._opsgenie_channel.alert,
+                self._alert_validity_threshold))
+            return
+
         empty = True
         if not self._alerts_queue.empty():
             empty = False
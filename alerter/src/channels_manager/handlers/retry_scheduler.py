@@ -0,0 +1,201 @@
+import logging
+import random
+from datetime import datetime
+from queue import Queue
+from typing import Callable, Dict, List, Optional
+
+from src.alerter.alerts.alert import Alert
+from src.utils.data import RequestStatus
+
+
+class AlertRetryScheduler:
+    """
+    This class is used by the alerts handlers to send the alerts waiting in
+    their alerts queue without blocking. An alert which cannot be sent is kept
+    in the queue and re-tried after a delay which doubles with every failed
+    attempt (with jitter, so that the alerts of a flaky channel are not all
+    re-tried at once), while the alerts behind it are sent. After max_attempts
+    failed attempts the alert is given up on. Sending is also spaced out by at
+    least min_send_interval seconds so that the rate limits of the channel are
+    respected.
+
+    Rather than waiting, send_alerts returns the number of seconds after which
+    it should be called again, which the handlers schedule on their RabbitMQ
+    connection.
+    """
+
+    def __init__(self, logger: logging.Logger, max_attempts: int = 6,
+                 base_delay: float = 10, max_delay: float = 300,
+                 min_send_interval: float = 0) -> None:
+        self._logger = logger
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._min_send_interval = min_send_interval
+
+        # The number of failed attempts and the time of the next attempt of the
+        # alerts waiting to be re-tried, keyed by the id of the alert object
+        self._failed_attempts: Dict[int, int] = {}
+        self._next_attempt_at: Dict[int, float] = {}
+        self._last_sent_at = None
+
+        # Metrics
+        self._retries = 0
+        self._given_up = 0
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def min_send_interval(self) -> float:
+        return self._min_send_interval
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def given_up(self) -> int:
+        return self._given_up
+
+    @property
+    def pending_retries(self) -> int:
+        return len(self._next_attempt_at)
+
+    def is_only_retrying(self, alerts_queue: Queue) -> bool:
+        """
+        :param alerts_queue: The alerts queue of the handler
+        :return: True if all the alerts left in the alerts queue are waiting to
+               : be re-tried after a failed attempt, False otherwise
+        """
+        return all(id(alert) in self._next_attempt_at
+                   for alert in alerts_queue.queue)
+
+    def _get_retry_delay(self, failed_attempts: int) -> float:
+        delay = min(self._max_delay,
+                    self._base_delay * 2 ** (failed_attempts - 1))
+        return random.uniform(delay / 2, delay)
+
+    def _forget(self, alert: Alert) -> None:
+        self._failed_attempts.pop(id(alert), None)
+        self._next_attempt_at.pop(id(alert), None)
+
+    def _get_seconds_until_sendable(self, alert: Alert, now: float) -> float:
+        seconds = self._next_attempt_at.get(id(alert), now) - now
+        if self._last_sent_at is not None:
+            seconds = max(seconds,
+                          self._last_sent_at + self.min_send_interval - now)
+        return seconds
+
+    def _remove_from_queue(self, alerts_queue: Queue, alert: Alert) -> None:
+        alerts_queue.queue.remove(alert)
+        alerts_queue.task_done()
+        self._forget(alert)
+
+    def send_alerts(
+            self, alerts_queue: Queue,
+            send_alert: Callable[..., RequestStatus],
+            alert_validity_threshold: int,
+            get_alerts_to_send: Callable[[Alert], List[Alert]] = None) \
+            -> Optional[float]:
+        """
+        This function sends the alerts in the alerts queue which are due, in
+        order, leaving the alerts which must be re-tried in the queue. If
+        alert_validity_threshold seconds pass since an alert was raised, the
+        alert is discarded. An alert is removed from the queue only once it is
+        sent or discarded, so that if an exception is raised it is not lost.
+
+        If get_alerts_to_send is given, the alerts it returns for the first due
+        alert (for example the alerts coalesced into a digest) are sent, and
+        re-tried, together as a single item.
+        :param alerts_queue: The alerts queue of the handler
+        :param send_alert: The function which sends an alert to the channel,
+                         : or the list of alerts returned by
+                         : get_alerts_to_send if given
+        :param alert_validity_threshold: The number of seconds after which an
+                                       : alert is discarded
+        :param get_alerts_to_send: The function which returns the alerts to
+                                 : send together with a due alert
+        :return: The number of seconds after which the alerts left in the queue
+               : should be sent, or None if the queue is empty
+        """
+        # Forget the alerts which were removed from the queue by the handler,
+        # for example because the queue was full
+        queued_alerts = list(alerts_queue.queue)
+        queued_alert_ids = {id(alert) for alert in queued_alerts}
+        for alert_id in set(self._next_attempt_at) - queued_alert_ids:
+            self._failed_attempts.pop(alert_id, None)
+            self._next_attempt_at.pop(alert_id, None)
+
+        seconds_until_next_send = None
+        sent_alert_ids = set()
+        for alert in queued_alerts:
+            # Skip the alerts which were already sent together with another
+            # alert in this round
+            if id(alert) in sent_alert_ids:
+                continue
+
+            now = datetime.now().timestamp()
+
+            # Discard alert if alert_validity_threshold seconds passed since it
+            # was last raised
+            if (now - alert.timestamp) > alert_validity_threshold:
+                self._remove_from_queue(alerts_queue, alert)
+                continue
+
+            seconds_until_sendable = self._get_seconds_until_sendable(alert,
+                                                                      now)
+            if seconds_until_sendable <= 0:
+                self._last_sent_at = now
+                if get_alerts_to_send is None:
+                    alerts = [alert]
+                    status = send_alert(alert)
+                else:
+                    alerts = get_alerts_to_send(alert)
+                    status = send_alert(alerts)
+                sent_alert_ids.update(id(sent_alert) for sent_alert in alerts)
+
+                if status == RequestStatus.SUCCESS:
+                    for sent_alert in alerts:
+                        self._remove_from_queue(alerts_queue, sent_alert)
+                    continue
+
+                # The alerts sent together are re-tried together, as many
+                # times as the alert which was attempted the most
+                failed_attempts = max(
+                    self._failed_attempts.get(id(failed_alert), 0)
+                    for failed_alert in alerts) + 1
+                if failed_attempts >= self.max_attempts:
+                    self.logger.error("Could not send %s after %s attempts, "
+                                      "it will not be re-tried.",
+                                      alert.alert_code.name, failed_attempts)
+                    for failed_alert in alerts:
+                        self._remove_from_queue(alerts_queue, failed_alert)
+                    self._given_up += 1
+                    continue
+
+                seconds_until_sendable = self._get_retry_delay(failed_attempts)
+                self.logger.debug("Will re-try sending %s in %.1f seconds. "
+                                  "Attempts left: %s", alert.alert_code.name,
+                                  seconds_until_sendable,
+                                  self.max_attempts - failed_attempts)
+                for failed_alert in alerts:
+                    self._failed_attempts[id(failed_alert)] = failed_attempts
+                    self._next_attempt_at[id(failed_alert)] = \
+                        now + seconds_until_sendable
+                self._retries += 1
+
+            if seconds_until_next_send is None \
+                    or seconds_until_sendable < seconds_until_next_send:
+                seconds_until_next_send = seconds_until_sendable
+
+        self.logger.debug("Alerts queue size: %s, alerts waiting to be "
+                          "re-tried: %s, retries: %s, alerts given up on: %s",
+                          alerts_queue.qsize(), self.pending_retries,
+                          self.retries, self.given_up)
+        return seconds_until_next_send
@@ -29,6 +29,7 @@ from src.channels_manager.handlers.log.alerts import LogAlertsHandler
 from src.channels_manager.handlers.opsgenie.alerts import OpsgenieAlertsHandler
 from src.channels_manager.handlers.pagerduty.alerts import (
     PagerDutyAlertsHandler)
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.channels_manager.handlers.slack.alerts import SlackAlertsHandler
 from src.channels_manager.handlers.slack.commands import SlackCommandsHandler
 from src.channels_manager.handlers.telegram.alerts import TelegramAlertsHandler
@@ -39,6 +40,8 @@ from src.data_store.mongo import MongoApi
 from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
+from src.utils.constants.channels import (TELEGRAM_MIN_SEND_INTERVAL,
+                                          SLACK_MIN_SEND_INTERVAL)
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.names import (TELEGRAM_ALERTS_HANDLER_NAME_TEMPLATE,
                                        TELEGRAM_COMMANDS_HANDLER_NAME_TEMPLATE,
@@ -82,6 +85,19 @@ def _initialise_channel_handler_logger(
     return handler_logger
 
 
+def _initialise_alert_retry_scheduler(
+        handler_logger: logging.Logger,
+        min_send_interval: float = 0) -> Optional[AlertRetryScheduler]:
+    # Alerts are re-tried without blocking only if enabled, otherwise the
+    # handlers keep on re-trying the first alert in the queue
+    if not env.ENABLE_NON_BLOCKING_ALERT_RETRIES:
+        return None
+
+    return AlertRetryScheduler(
+        handler_logger.getChild(AlertRetryScheduler.__name__),
+        min_send_interval=min_send_interval)
+
+
 def _initialise_alerts_logger() -> logging.Logger:
     # Try initialising the logger until successful. This had to be done
     # separately to avoid instances when the logger creation failed and we
@@ -126,7 +142,10 @@ def _initialise_telegram_alerts_handler(
 
             telegram_alerts_handler = TelegramAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                digest_window=env.CHAT_ALERTS_DIGEST_WINDOW_SECONDS,
+                retry_scheduler=_initialise_alert_retry_scheduler(
+                    handler_logger, TELEGRAM_MIN_SEND_INTERVAL))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -233,7 +252,10 @@ def _initialise_slack_alerts_handler(
 
             slack_alerts_handler = SlackAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                digest_window=env.CHAT_ALERTS_DIGEST_WINDOW_SECONDS,
+                retry_scheduler=_initialise_alert_retry_scheduler(
+                    handler_logger, SLACK_MIN_SEND_INTERVAL))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -392,7 +414,9 @@ def _initialise_pagerduty_alerts_handler(
 
             pagerduty_alerts_handler = PagerDutyAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                retry_scheduler=_initialise_alert_retry_scheduler(
+                    handler_logger))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -425,7 +449,8 @@ def _initialise_email_alerts_handler(
     # Try initialising handler until successful
     while True:
         try:
-            email_api = EmailApi(smtp, email_from, username, password, port)
+            email_api = EmailApi(smtp, email_from, username, password, port,
+                                 env.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS)
 
             email_channel = EmailChannel(
                 channel_name, channel_id, handler_logger.getChild(
@@ -437,7 +462,10 @@ def _initialise_email_alerts_handler(
 
             email_alerts_handler = EmailAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq, email_channel,
-                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                batch_window=env.EMAIL_ALERTS_BATCH_WINDOW_SECONDS,
+                retry_scheduler=_initialise_alert_retry_scheduler(
+                    handler_logger))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -484,7 +512,9 @@ def _initialise_opsgenie_alerts_handler(
 
             opsgenie_alerts_handler = OpsgenieAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                retry_scheduler=_initialise_alert_retry_scheduler(
+                    handler_logger))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
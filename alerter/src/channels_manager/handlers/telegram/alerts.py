@@ -4,6 +4,7 @@ import sys
 from datetime import datetime
 from queue import Queue
 from types import FrameType
+from typing import List, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -13,6 +14,7 @@ from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.telegram import TelegramChannel
 from src.channels_manager.handlers.handler import ChannelHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -28,13 +30,27 @@ class TelegramAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, telegram_channel: TelegramChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600) -> None:
+                 alert_validity_threshold: int = 600,
+                 digest_window: float = 0,
+                 retry_scheduler: Optional[AlertRetryScheduler] = None) \
+            -> None:
         super().__init__(handler_name, logger, rabbitmq)
 
         self._telegram_channel = telegram_channel
         self._alerts_queue = Queue(queue_size)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+
+        # If digest_window > 0, the alerts received within digest_window
+        # seconds of the first alert waiting in the queue are sent once the
+        # window ends, and the alerts which have the same parent_id, severity
+        # and alert code are sent together in one digest message.
+        self._digest_window = digest_window
+
+        # If given, alerts which cannot be sent are re-tried later without
+        # blocking the alerts behind them
+        self._retry_scheduler = retry_scheduler
+
         self._telegram_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.telegram_channel.channel_id)
@@ -126,22 +142,24 @@ class TelegramAlertsHandler(ChannelHandler):
         if not processing_error:
             self._place_alert_on_queue(alert)
 
-        # Send any alerts waiting in the queue, if any
+        # Send any alerts waiting in the queue, if any. If alerts are
+        # coalesced they are sent when the digest window ends instead.
+        if self._digest_window > 0:
+            if not self.alerts_queue.empty():
+                self._schedule_alerts_sending(self._digest_window)
+            return
+
         try:
             self._send_alerts()
         except Exception as e:
             raise e
 
         # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
+        # processing errors and when all alerts have been sent successfully,
+        # or are waiting to be re-tried.
+        if self._are_alerts_sent() and not processing_error:
             try:
-                heartbeat = {
-                    'component_name': self.handler_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+                self._send_heartbeat(self._create_heartbeat())
             except MessageWasNotDeliveredException as e:
                 # Log the message and do not raise it as heartbeats must be
                 # real-time.
@@ -162,7 +180,34 @@ class TelegramAlertsHandler(ChannelHandler):
         self.logger.debug("%s added to the alerts queue",
                           alert.alert_code.name)
 
+    def _is_alert_expired(self, alert: Alert) -> bool:
+        return (datetime.now().timestamp() - alert.timestamp) \
+               > self._alert_validity_threshold
+
+    def _get_alerts_to_send(self, alert: Alert) -> List[Alert]:
+        if self._digest_window <= 0:
+            return [alert]
+
+        # The alerts waiting in the queue which can be coalesced with alert
+        # are sent together, discarding the expired ones.
+        return [queued_alert for queued_alert in self.alerts_queue.queue
+                if self._is_coalescable(alert, queued_alert)
+                and not self._is_alert_expired(queued_alert)]
+
+    def _send_alerts_to_channel(self, alerts: List[Alert]) -> RequestStatus:
+        if len(alerts) == 1:
+            return self.telegram_channel.alert(alerts[0])
+
+        return self.telegram_channel.alert_digest(alerts)
+
     def _send_alerts(self) -> None:
+        # If alerts are coalesced, each digest is sent and re-tried as one
+        if self._retry_scheduler is not None:
+            self._schedule_alerts_sending(self._retry_scheduler.send_alerts(
+                self.alerts_queue, self._send_alerts_to_channel,
+                self._alert_validity_threshold, self._get_alerts_to_send))
+            return
+
         empty = True
         if not self.alerts_queue.empty():
             empty = False
@@ -181,26 +226,28 @@ class TelegramAlertsHandler(ChannelHandler):
 
             # Discard alert if alert_validity_threshold seconds passed since it
             # was last raised
-            if (datetime.now().timestamp() - alert.timestamp) \
-                    > self._alert_validity_threshold:
+            if self._is_alert_expired(alert):
                 self.alerts_queue.get()
                 self.alerts_queue.task_done()
                 continue
 
+            alerts = self._get_alerts_to_send(alert)
+
             attempts = 1
-            ret = self.telegram_channel.alert(alert)
+            ret = self._send_alerts_to_channel(alerts)
             while ret != RequestStatus.SUCCESS and \
                     attempts < self._max_attempts:
                 self.logger.debug("Will re-try sending in 10 seconds. "
                                   "Attempts left: %s",
                                   self._max_attempts - attempts)
                 self.rabbitmq.connection.sleep(10)
-                ret = self.telegram_channel.alert(alert)
+                ret = self._send_alerts_to_channel(alerts)
                 attempts += 1
 
             if ret == RequestStatus.SUCCESS:
-                self.alerts_queue.get()
-                self.alerts_queue.task_done()
+                for sent_alert in alerts:
+                    self.alerts_queue.queue.remove(sent_alert)
+                    self.alerts_queue.task_done()
             else:
                 self.logger.debug("Not all alerts could be sent in a timely "
                                   "manner. The alerts which could not be sent "
@@ -605,6 +605,8 @@ class QueueDataSelectorHelper:
                 'monitor_cosmos_rest':
                     'true' if node.monitor_cosmos_rest else 'false',
                 'tendermint_rpc_url': str(node.tendermint_rpc_url or ''),
+                'tendermint_rpc_max_concurrent_requests':
+                    str(node.tendermint_rpc_max_concurrent_requests or ''),
                 'monitor_tendermint_rpc':
                     'true' if node.monitor_tendermint_rpc else 'false',
                 'operator_address': str(node.operator_address or ''),
@@ -23,6 +23,7 @@ class NodeSubconfigModel(BaseModel):
     operator_address: str = None
     monitor_tendermint_rpc: bool = None
     tendermint_rpc_url: str = None
+    tendermint_rpc_max_concurrent_requests: int = None
     node_ws_url: str = None
     stash_address: str = None
     governance_addresses: str = None
@@ -49,6 +50,8 @@ class NodeSubconfigModel(BaseModel):
         self.operator_address = tuple.operator_address
         self.monitor_tendermint_rpc = tuple.monitor_tendermint_rpc
         self.tendermint_rpc_url = tuple.tendermint_rpc_url
+        self.tendermint_rpc_max_concurrent_requests = getattr(
+            tuple, 'tendermint_rpc_max_concurrent_requests', None)
         self.node_ws_url = tuple.node_ws_url
         self.stash_address = tuple.stash_address
         self.governance_addresses = tuple.governance_addresses
\ No newline at end of file
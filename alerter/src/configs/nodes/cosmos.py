@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.configs.nodes.node import NodeConfig
 
 
@@ -8,7 +10,9 @@ class CosmosNodeConfig(NodeConfig):
             monitor_cosmos_rest: bool, cosmos_rest_url: str,
             monitor_tendermint_rpc: bool, tendermint_rpc_url: str,
             is_validator: bool, is_archive_node: bool, use_as_data_source: bool,
-            operator_address: str) -> None:
+            operator_address: str,
+            tendermint_rpc_max_concurrent_requests: Optional[int] = None) \
+            -> None:
         super().__init__(node_id, parent_id, node_name, monitor_node)
 
         self._monitor_prometheus = monitor_prometheus
@@ -22,6 +26,12 @@ class CosmosNodeConfig(NodeConfig):
         self._use_as_data_source = use_as_data_source
         self._operator_address = operator_address
 
+        # The maximum number of requests which the monitors send concurrently
+        # to the Tendermint RPC of this node when it is used as a data source.
+        # If None, the default set in the environment is used.
+        self._tendermint_rpc_max_concurrent_requests = \
+            tendermint_rpc_max_concurrent_requests
+
     @property
     def monitor_prometheus(self) -> bool:
         return self._monitor_prometheus
@@ -46,6 +56,10 @@ class CosmosNodeConfig(NodeConfig):
     def tendermint_rpc_url(self) -> str:
         return self._tendermint_rpc_url
 
+    @property
+    def tendermint_rpc_max_concurrent_requests(self) -> Optional[int]:
+        return self._tendermint_rpc_max_concurrent_requests
+
     @property
     def is_validator(self) -> bool:
         return self._is_validator
@@ -80,6 +94,12 @@ class CosmosNodeConfig(NodeConfig):
     def set_tendermint_rpc_url(self, tendermint_rpc_url: str) -> None:
         self._tendermint_rpc_url = tendermint_rpc_url
 
+    def set_tendermint_rpc_max_concurrent_requests(
+            self, tendermint_rpc_max_concurrent_requests: Optional[int]) \
+            -> None:
+        self._tendermint_rpc_max_concurrent_requests = \
+            tendermint_rpc_max_concurrent_requests
+
     def set_is_validator(self, is_validator: bool) -> None:
         self._is_validator = is_validator
 
@@ -1,10 +1,11 @@
 import logging
 from datetime import timedelta
-from typing import Dict, List, Mapping, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Union, Tuple
 
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne, UpdateOne, ReplaceOne
 from pymongo.collection import CollectionChangeStream
-from pymongo.results import InsertOneResult, InsertManyResult, UpdateResult
+from pymongo.results import (InsertOneResult, InsertManyResult, UpdateResult,
+                             BulkWriteResult)
 
 from src.utils.timing import TimedTaskLimiter
 
@@ -140,6 +141,30 @@ class MongoApi:
             lambda col, q, doc: self._db[col].replace_one(q, doc, upsert=True),
             [collection, query, document], None)
 
+    def bulk_write(self, collection: str,
+                   requests: List[Union[InsertOne, UpdateOne, ReplaceOne]]) \
+            -> Optional[BulkWriteResult]:
+        return self._safe(
+            lambda col, reqs: self._db[col].bulk_write(reqs, ordered=False),
+            [collection, requests], None)
+
+    def create_index(self, collection: str, keys: List[Tuple[str, int]],
+                     options: Dict) -> Optional[str]:
+        return self._safe(
+            lambda col, k, opts: self._db[col].create_index(k, **opts),
+            [collection, keys, options], None)
+
+    def get_index_information(self, collection: str) -> Optional[Dict]:
+        return self._safe(
+            lambda col: self._db[col].index_information(),
+            [collection], None)
+
+    def modify_collection(self, collection: str,
+                          options: Dict) -> Optional[Dict]:
+        return self._safe(
+            lambda col, opts: self._db.command('collMod', col, **opts),
+            [collection, options], None)
+
     def get_one(self, collection: str, query: Dict) -> Optional[Dict]:
         return self._safe(
             lambda col, q: self._db[col].find_one(q),
@@ -155,6 +180,11 @@ class MongoApi:
             lambda col: list(self._db[col].find({})),
             [collection], None)
 
+    def get_collection_names(self) -> Optional[List[str]]:
+        return self._safe(
+            lambda: self._db.list_collection_names(),
+            [], None)
+
     def drop_collection(self, collection: str) -> Optional[Dict]:
         return self._safe(
             lambda col: self._db.drop_collection(col),
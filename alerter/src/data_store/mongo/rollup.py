@@ -0,0 +1,305 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Union
+
+from bson.decimal128 import Decimal128
+from pymongo import ReplaceOne, UpdateOne
+
+from src.data_store.mongo.mongo_api import MongoApi
+
+# The fields which hold the time at which an entry was measured
+_TIMESTAMP_FIELDS = ('timestamp', 'last_monitored')
+
+# The rollups computed from the raw entries, and their period in seconds. The
+# daily rollup is computed from the hourly rollups.
+RAW_ROLLUP_PERIODS = {'5m': 300, '1h': 3600}
+HOURLY_ROLLUP = '1h'
+DAILY_ROLLUP = '1d'
+
+# The key of the index which expires the raw buckets
+_RAW_DATA_RETENTION_INDEX_KEY = [('t', 1)]
+
+
+def get_rollup_doc_type(doc_type: str) -> str:
+    # The rollups have a type of their own so that they are not mistaken for
+    # raw buckets by the queries of the raw data.
+    return '{}_rollup'.format(doc_type)
+
+
+def _get_entry_timestamp(entry: Dict) -> float:
+    for field in _TIMESTAMP_FIELDS:
+        if field in entry:
+            return entry[field]
+    return 0
+
+
+def _to_number(value: object) -> Optional[Union[int, float]]:
+    if isinstance(value, bool):
+        return None
+    elif isinstance(value, (int, float)):
+        return value
+    elif isinstance(value, Decimal128):
+        return float(value.to_decimal())
+
+    return None
+
+
+def merge_summaries(summaries: List[Dict]) -> Dict:
+    """
+    This function merges summaries of metrics into one. A summary holds the
+    last value of every metric, and the min, max, avg and number of values (n)
+    of every numeric metric.
+    :param summaries: The summaries to be merged, in the order of time
+    :return: The merged summary
+    """
+    merged = {}
+    for summary in summaries:
+        for metric, metric_summary in summary.items():
+            merged_metric = merged.setdefault(metric, {})
+            merged_metric['last'] = metric_summary['last']
+            if 'n' not in metric_summary:
+                continue
+            elif 'n' not in merged_metric:
+                merged_metric.update(min=metric_summary['min'],
+                                     max=metric_summary['max'], avg=0, n=0)
+
+            n = merged_metric['n'] + metric_summary['n']
+            merged_metric['min'] = min(merged_metric['min'],
+                                       metric_summary['min'])
+            merged_metric['max'] = max(merged_metric['max'],
+                                       metric_summary['max'])
+            merged_metric['avg'] = (
+                merged_metric['avg'] * merged_metric['n']
+                + metric_summary['avg'] * metric_summary['n']) / n
+            merged_metric['n'] = n
+
+    return merged
+
+
+def summarise_entries(entries: List[Dict]) -> Dict:
+    """
+    :param entries: The raw entries of a source
+    :return: The summary of the metrics of the entries, see merge_summaries
+    """
+    summaries = []
+    for entry in sorted(entries, key=_get_entry_timestamp):
+        summary = {}
+        for metric, value in entry.items():
+            if metric in _TIMESTAMP_FIELDS:
+                continue
+            summary[metric] = {'last': value}
+            number = _to_number(value)
+            if number is not None:
+                summary[metric].update(min=number, max=number, avg=number,
+                                       n=1)
+        summaries.append(summary)
+
+    return merge_summaries(summaries)
+
+
+def rollup_bucket(bucket: Dict) -> List[Dict]:
+    """
+    This function computes the rollups of a raw time-series bucket, which holds
+    the entries of every source measured in an hour.
+    :param bucket: The raw bucket
+    :return: The rollup documents, with a document per rollup period holding
+           : the summary of every source in that period
+    """
+    rollups = {}
+    for source_id, entries in bucket.items():
+        if not isinstance(entries, list):
+            continue
+
+        for rollup, period in RAW_ROLLUP_PERIODS.items():
+            period_entries = {}
+            for entry in entries:
+                timestamp = _get_entry_timestamp(entry)
+                period_start = timestamp - timestamp % period
+                period_entries.setdefault(period_start, []).append(entry)
+
+            for period_start, entries_in_period in period_entries.items():
+                document = rollups.setdefault((rollup, period_start), {
+                    'doc_type': get_rollup_doc_type(bucket['doc_type']),
+                    'r': rollup,
+                    't': datetime.fromtimestamp(period_start, tz=timezone.utc),
+                })
+                document[source_id] = summarise_entries(entries_in_period)
+
+    return [rollups[key] for key in sorted(rollups)]
+
+
+class TimeSeriesRollup:
+    """
+    This class rolls up the raw time-series buckets written by a data store
+    into 5 minute, hourly and daily summaries of the metrics, and expires the
+    raw buckets once they are older than the raw data retention period.
+
+    A raw bucket is rolled up once its hour is over by more than delay seconds
+    (to give time for the buffered entries to be written). It is then marked as
+    rolled up, unless it received new entries in the meantime, in which case
+    it is rolled up again the next time round. Rollups are idempotent, as every
+    rollup document is replaced by its re-computed version.
+    """
+
+    def __init__(self, mongo: MongoApi, logger: logging.Logger,
+                 raw_data_retention_days: int, delay: float) -> None:
+        self._mongo = mongo
+        self._logger = logger
+        self._raw_data_retention_days = raw_data_retention_days
+        self._delay = delay
+
+        # The collections whose raw data retention was already set
+        self._retention_set = set()
+
+    @property
+    def mongo(self) -> MongoApi:
+        return self._mongo
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def raw_data_retention_days(self) -> int:
+        return self._raw_data_retention_days
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    def get_raw_data_collections(self) -> List[str]:
+        """
+        This function looks up the collections which hold raw buckets in Mongo,
+        so that the buckets written before a restart, or by any store, are
+        rolled up as well.
+        :return: The collections of the raw buckets, sorted by name
+        """
+        collections = self.mongo.get_collection_names()
+        if collections is None:
+            self.logger.warning("Could not get the collections of the raw "
+                                "time-series data. Retrying on the next "
+                                "rollup.")
+            return []
+
+        return [collection for collection in sorted(collections)
+                if self.mongo.get_one(collection,
+                                      {'h': {'$exists': True}}) is not None]
+
+    def set_raw_data_retention(self, collection: str) -> None:
+        """
+        This function creates a TTL index which expires the raw buckets of the
+        collection once raw_data_retention_days have passed since their hour
+        started. Only the raw buckets have an hour (h), therefore the rollups
+        are kept. If the retention is 0 the raw buckets are kept forever.
+
+        If the index already exists with a different retention, its expiry is
+        modified in place, as creating it again with different options fails.
+        :param collection: The collection of the raw buckets
+        :return: None
+        """
+        if (self.raw_data_retention_days <= 0
+                or collection in self._retention_set):
+            return
+
+        expire_after_seconds = int(timedelta(
+            days=self.raw_data_retention_days).total_seconds())
+        indexes = self.mongo.get_index_information(collection)
+        index = next((index for index in (indexes or {}).values()
+                      if list(index['key']) == _RAW_DATA_RETENTION_INDEX_KEY),
+                     None)
+        if indexes is None:
+            ret = None
+        elif index is None:
+            ret = self.mongo.create_index(
+                collection, _RAW_DATA_RETENTION_INDEX_KEY, {
+                    'expireAfterSeconds': expire_after_seconds,
+                    'partialFilterExpression': {'h': {'$exists': True}},
+                })
+        elif index.get('expireAfterSeconds') != expire_after_seconds:
+            ret = self.mongo.modify_collection(collection, {'index': {
+                'keyPattern': dict(_RAW_DATA_RETENTION_INDEX_KEY),
+                'expireAfterSeconds': expire_after_seconds,
+            }})
+        else:
+            ret = index
+
+        if ret is None:
+            self.logger.warning("Could not set the raw data retention of %s "
+                                "to %s days. Retrying on the next rollup.",
+                                collection, self.raw_data_retention_days)
+            return
+
+        self._retention_set.add(collection)
+
+    def rollup(self, collection: str) -> None:
+        """
+        This function rolls up the raw buckets of the collection which are due.
+        :param collection: The collection of the raw buckets
+        :return: None
+        """
+        hour_start = datetime.now(timezone.utc) - timedelta(
+            hours=1, seconds=self.delay)
+        buckets = self.mongo.get_by(collection, {
+            'h': {'$exists': True},
+            'rolled_up': {'$ne': True},
+            't': {'$lte': hour_start},
+        })
+        if buckets is None:
+            return
+
+        for bucket in buckets:
+            documents = rollup_bucket(bucket)
+            documents.append(self._rollup_day(
+                collection, bucket['doc_type'], bucket['t'],
+                [document for document in documents
+                 if document['r'] == HOURLY_ROLLUP]))
+            requests = [
+                ReplaceOne({'doc_type': document['doc_type'],
+                            'r': document['r'], 't': document['t']},
+                           document, upsert=True)
+                for document in documents
+            ]
+
+            # The bucket is marked as rolled up only if it was not written to
+            # since it was read.
+            requests.append(UpdateOne(
+                {'_id': bucket['_id'], 'n_writes': bucket['n_writes']},
+                {'$set': {'rolled_up': True}}))
+
+            if self.mongo.bulk_write(collection, requests) is None:
+                self.logger.warning("Could not roll up the raw bucket of %s "
+                                    "at %s.", collection, bucket['t'])
+                return
+
+    def _rollup_day(self, collection: str, doc_type: str,
+                    bucket_start: datetime,
+                    bucket_hourly_rollups: List[Dict]) -> Dict:
+        # The daily rollup is computed from the stored hourly rollups of the
+        # day, and from the hourly rollups of the bucket being rolled up which
+        # were not stored yet.
+        day_start = bucket_start.replace(hour=0, minute=0, second=0,
+                                         microsecond=0, tzinfo=timezone.utc)
+        hourly_rollups = {}
+        rollup_doc_type = get_rollup_doc_type(doc_type)
+        stored_hourly_rollups = self.mongo.get_by(collection, {
+            'doc_type': rollup_doc_type, 'r': HOURLY_ROLLUP,
+            't': {'$gte': day_start, '$lt': day_start + timedelta(days=1)},
+        })
+        for document in stored_hourly_rollups or []:
+            hourly_rollups[document['t'].replace(tzinfo=timezone.utc)] = \
+                document
+        for document in bucket_hourly_rollups:
+            hourly_rollups[document['t']] = document
+
+        source_summaries = {}
+        for hour in sorted(hourly_rollups):
+            for source_id, summary in hourly_rollups[hour].items():
+                if isinstance(summary, dict):
+                    source_summaries.setdefault(source_id, []).append(summary)
+
+        day_rollup = {'doc_type': rollup_doc_type, 'r': DAILY_ROLLUP,
+                      't': day_start}
+        for source_id, summaries in source_summaries.items():
+            day_rollup[source_id] = merge_summaries(summaries)
+
+        return day_rollup
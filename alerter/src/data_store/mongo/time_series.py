@@ -0,0 +1,158 @@
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Any
+
+from bson.decimal128 import Decimal128
+from pymongo import UpdateOne
+
+# The range of the integers which can be stored as BSON 64-bit integers, and
+# the maximum number of digits of a BSON 128-bit decimal
+_MIN_INT64 = -2 ** 63
+_MAX_INT64 = 2 ** 63 - 1
+_MAX_DECIMAL128_DIGITS = 34
+
+
+def get_time_series_bucket(doc_type: str, timestamp: float) -> Dict:
+    """
+    Given the type of an entry and the time at which it was measured, this
+    function returns the query of the document (bucket) the entry belongs to.
+    There is a bucket per type, per UTC date and per hour of the day.
+    :param doc_type: The type of the entry, for example node
+    :param timestamp: The time at which the entry was measured
+    :return: The query of the bucket of the entry
+    """
+    date_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return {
+        'doc_type': doc_type,
+        'd': date_time.strftime('%Y-%m-%d'),
+        'h': date_time.hour,
+    }
+
+
+def to_bson_value(value: Any) -> Any:
+    """
+    This function converts a metric value so that it can be stored by Mongo
+    without losing its type. Integers which do not fit in 64 bits, such as
+    balances in the smallest denomination, are stored as 128-bit decimals, or
+    as strings if they are too big even for that.
+    :param value: The value to be converted
+    :return: The value as it should be stored in Mongo
+    """
+    if isinstance(value, dict):
+        return {key: to_bson_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [to_bson_value(item) for item in value]
+    elif (isinstance(value, int) and not isinstance(value, bool)
+          and not _MIN_INT64 <= value <= _MAX_INT64):
+        if len(str(abs(value))) <= _MAX_DECIMAL128_DIGITS:
+            return Decimal128(str(value))
+        return str(value)
+
+    return value
+
+
+class TimeSeriesBuffer:
+    """
+    This class buffers time-series entries so that a data store writes them to
+    Mongo in bulk rather than one at a time. The entries are grouped by
+    collection and bucket, so that every bucket costs a single update per flush
+    no matter how many entries were buffered for it.
+
+    A flush is due once flush_size entries are buffered or flush_interval
+    seconds have passed since the last flush.
+
+    The writes are idempotent, as entries are added to their bucket only if
+    the bucket does not already hold them. This way the entries of data which
+    is re-delivered after a partial flush are not stored twice.
+    """
+
+    def __init__(self, flush_size: int, flush_interval: float) -> None:
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+
+        # collection -> (doc_type, date, hour) -> source id -> entries
+        self._entries = {}
+        self._size = 0
+        self._last_flush_time = time.time()
+
+    @property
+    def flush_size(self) -> int:
+        return self._flush_size
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def add(self, collection: str, doc_type: str, source_id: str,
+            timestamp: float, entry: Dict) -> None:
+        """
+        This function buffers the entry of a source.
+        :param collection: The collection the entry is written to
+        :param doc_type: The type of the entry, for example node
+        :param source_id: The id of the source (system, node, network) which
+                        : the entry belongs to
+        :param timestamp: The time at which the entry was measured, which
+                        : determines its bucket
+        :param entry: The metrics of the source
+        :return: None
+        """
+        bucket = get_time_series_bucket(doc_type, timestamp)
+        bucket_key = (bucket['doc_type'], bucket['d'], bucket['h'])
+        collection_buckets = self._entries.setdefault(collection, {})
+        source_entries = collection_buckets.setdefault(bucket_key, {})
+        source_entries.setdefault(source_id, []).append(to_bson_value(entry))
+        self._size += 1
+
+    def is_flush_due(self) -> bool:
+        return (self.size >= self.flush_size
+                or time.time() - self._last_flush_time >= self.flush_interval)
+
+    def get_requests(self) -> Dict[str, List[UpdateOne]]:
+        """
+        :return: The bulk write requests of the buffered entries, keyed by the
+               : collection they should be written to
+        """
+        requests = {}
+        for collection, buckets in self._entries.items():
+            requests[collection] = []
+            for (doc_type, date, hour), source_entries in buckets.items():
+                # The bucket start is kept as a date so that the bucket can
+                # be expired by a TTL index. Every write marks the bucket as
+                # not rolled up and counts towards n_writes, so that its
+                # rollups are re-computed.
+                bucket_start = datetime.strptime(date, '%Y-%m-%d').replace(
+                    hour=hour, tzinfo=timezone.utc)
+                requests[collection].append(UpdateOne(
+                    {'doc_type': doc_type, 'd': date, 'h': hour},
+                    {
+                        '$addToSet': {
+                            source_id: {'$each': entries}
+                            for source_id, entries in source_entries.items()
+                        },
+                        '$inc': {'n_writes': 1},
+                        '$setOnInsert': {'t': bucket_start},
+                        '$unset': {'rolled_up': ''},
+                    },
+                    upsert=True))
+
+        return requests
+
+    def discard(self, collection: str) -> None:
+        """
+        This function removes the buffered entries of a collection, for
+        example once they were written.
+        :param collection: The collection whose entries should be removed
+        :return: None
+        """
+        buckets = self._entries.pop(collection, {})
+        self._size -= sum(len(entries) for source_entries in buckets.values()
+                          for entries in source_entries.values())
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._size = 0
+        self._last_flush_time = time.time()
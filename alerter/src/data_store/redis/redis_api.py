@@ -128,6 +128,15 @@ class RedisApi:
         exec_ret = pipe.execute()
         return exec_ret
 
+    def set_for_if_not_exists_unsafe(self, key: str, value: RedisType,
+                                     time: timedelta) -> bool:
+        # The key is only set if it does not exist, atomically, so that it can
+        # be used as a lock which expires after the given time.
+        key = self._add_namespace(key)
+
+        set_ret = self._redis.set(key, value, ex=time, nx=True)
+        return bool(set_ret)
+
     def time_to_live_unsafe(self, key: str):
         key = self._add_namespace(key)
         time_to_live = self._redis.ttl(key)
@@ -229,6 +238,28 @@ class RedisApi:
 
         return keys_list
 
+    def scan_keys_unsafe(self, pattern: str = "*", count: int = 1000) \
+            -> List[str]:
+        # Unlike get_keys, the keys are iterated using SCAN, which does not
+        # block Redis for the whole iteration
+        pattern = self._add_namespace(pattern)
+
+        # Decode and remove namespace
+        keys_list = self._redis.scan_iter(match=pattern, count=count)
+        keys_list = [k.decode('utf8') for k in keys_list]
+        keys_list = [self._remove_namespace(k) for k in keys_list]
+
+        return keys_list
+
+    def hscan_keys_unsafe(self, name: str, pattern: str = "*",
+                          count: int = 1000) -> List[str]:
+        name = self._add_namespace(name)
+
+        keys_list = self._redis.hscan_iter(name, match=pattern, count=count)
+        keys_list = [k.decode('utf8') for k, _ in keys_list]
+
+        return keys_list
+
     def remove_unsafe(self, *keys):
         keys = [self._add_namespace(k) for k in keys]
         return self._redis.delete(*keys)
@@ -240,6 +271,72 @@ class RedisApi:
     def hremove(self, name: str, *keys):
         return self._safe(self.hremove_unsafe, [name, *keys], None)
 
+    def hremove_multiple_unsafe(self, name_keys: Dict[str, List[str]]):
+        # Remove the keys of every hash, with a single HDEL per hash
+        pipe = self._redis.pipeline()
+        for name, keys in name_keys.items():
+            if keys:
+                pipe.hdel(self._add_namespace(name), *keys)
+        exec_ret = pipe.execute()
+        return exec_ret
+
+    def hremove_multiple(self, name_keys: Dict[str, List[str]]):
+        return self._safe(self.hremove_multiple_unsafe, [name_keys], None)
+
+    def sadd_multiple_unsafe(self, name_members: Dict[str, List[str]]):
+        # Add the members to every set, with a single SADD per set
+        pipe = self._redis.pipeline()
+        for name, members in name_members.items():
+            if members:
+                pipe.sadd(self._add_namespace(name), *members)
+        exec_ret = pipe.execute()
+        return exec_ret
+
+    def sadd_multiple(self, name_members: Dict[str, List[str]]):
+        return self._safe(self.sadd_multiple_unsafe, [name_members], None)
+
+    def hset_and_sadd_multiple_unsafe(self, name: str, key: str,
+                                      value: RedisType,
+                                      name_members: Dict[str, List[str]]):
+        # Set the hash key and add the members to every set, all in the same
+        # pipeline
+        pipe = self._redis.pipeline()
+        pipe.hset(self._add_namespace(name), key,
+                  value if value is not None else 'None')
+        for set_name, members in name_members.items():
+            if members:
+                pipe.sadd(self._add_namespace(set_name), *members)
+        exec_ret = pipe.execute()
+        return exec_ret
+
+    def hset_and_sadd_multiple(self, name: str, key: str, value: RedisType,
+                               name_members: Dict[str, List[str]]):
+        return self._safe(self.hset_and_sadd_multiple_unsafe,
+                          [name, key, value, name_members], None)
+
+    def sremove_multiple_unsafe(self, name_members: Dict[str, List[str]]):
+        # Remove the members from every set, with a single SREM per set
+        pipe = self._redis.pipeline()
+        for name, members in name_members.items():
+            if members:
+                pipe.srem(self._add_namespace(name), *members)
+        exec_ret = pipe.execute()
+        return exec_ret
+
+    def sremove_multiple(self, name_members: Dict[str, List[str]]):
+        return self._safe(self.sremove_multiple_unsafe, [name_members], None)
+
+    def smembers_unsafe(self, name: str) -> List[str]:
+        name = self._add_namespace(name)
+
+        members_list = self._redis.smembers(name)
+        members_list = [m.decode('utf8') for m in members_list]
+
+        return members_list
+
+    def smembers(self, name: str) -> List[str]:
+        return self._safe(self.smembers_unsafe, [name], None)
+
     def hkeys_unsafe(self, name: str):
         name = self._add_namespace(name)
 
@@ -252,6 +349,16 @@ class RedisApi:
     def hkeys(self, name: str):
         return self._safe(self.hkeys_unsafe, [name], None)
 
+    def hgetall_unsafe(self, name: str) -> Dict[str, bytes]:
+        name = self._add_namespace(name)
+
+        # Decode the keys only, the values are returned as bytes as in hget
+        ret = self._redis.hgetall(name)
+        return {k.decode('utf8'): v for k, v in ret.items()}
+
+    def hgetall(self, name: str) -> Dict[str, bytes]:
+        return self._safe(self.hgetall_unsafe, [name], {})
+
     def delete_all_unsafe(self):
         return self._redis.flushdb()
 
@@ -270,6 +377,11 @@ class RedisApi:
     def set_for(self, key: str, value: RedisType, time: timedelta):
         return self._safe(self.set_for_unsafe, [key, value, time], None)
 
+    def set_for_if_not_exists(self, key: str, value: RedisType,
+                              time: timedelta) -> bool:
+        return self._safe(self.set_for_if_not_exists_unsafe,
+                          [key, value, time], False)
+
     def time_to_live(self, key: str):
         return self._safe(self.time_to_live_unsafe, [key], None)
 
@@ -304,6 +416,14 @@ class RedisApi:
     def get_keys(self, pattern: str = "*") -> List[str]:
         return self._safe(self.get_keys_unsafe, [pattern], [])
 
+    def scan_keys(self, pattern: str = "*", count: int = 1000) -> List[str]:
+        return self._safe(self.scan_keys_unsafe, [pattern, count], None)
+
+    def hscan_keys(self, name: str, pattern: str = "*",
+                   count: int = 1000) -> List[str]:
+        return self._safe(self.hscan_keys_unsafe, [name, pattern, count],
+                          None)
+
     def remove(self, *keys):
         return self._safe(self.remove_unsafe, [*keys], None)
 
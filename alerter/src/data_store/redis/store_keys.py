@@ -1,9 +1,17 @@
+from typing import Iterable, List
+
 # Hashes
 _hash_parent = 'hash_p1'
 
 # Unique keys
 _key_alerter_mute = "a1"
 
+# Sets
+# alert_indexX_<alert_keys_prefix>_<parent_id>
+_set_alert_keys = 'alert_index1'
+# alert_indexX_<alert_keys_prefix>
+_set_alert_parents = 'alert_index2'
+
 # sX_<system_id>
 _key_system_process_cpu_seconds_total = 's1'
 _key_system_process_memory_usage = 's2'
@@ -62,6 +70,16 @@ _key_cosmos_node_is_peered = 'CosmosNode14'
 _key_cosmos_network_proposals = 'CosmosNetwork1'
 _key_cosmos_network_last_monitored_cosmos_rest = 'CosmosNetwork2'
 
+# CosmosCacheX_<parent_id>
+_key_cosmos_tendermint_block_cache = 'CosmosCache1'
+_key_cosmos_tendermint_block_cache_subscribers = 'CosmosCache2'
+_key_cosmos_validators_snapshot_cache = 'CosmosCache3'
+_key_cosmos_proposals_cache = 'CosmosCache4'
+_key_cosmos_validators_snapshot_fetch_lock = 'CosmosCache5'
+
+# SubstrateCacheX_<parent_id>
+_key_substrate_era_cache = 'SubstrateCache1'
+
 # SubstrateNodeX_<substrate_node_id>
 _key_substrate_node_best_height = 'SubstrateNode1'
 _key_substrate_node_target_height = 'SubstrateNode2'
@@ -175,6 +193,7 @@ _key_alert_cosmos_node_no_synced_tendermint_rpc_source = 'alert_cosmos_node16'
 _key_alert_cosmos_node_cosmos_rest_data_not_obtained = 'alert_cosmos_node17'
 _key_alert_cosmos_node_tendermint_rpc_data_not_obtained = 'alert_cosmos_node18'
 _key_alert_cosmos_node_metric_not_found = 'alert_cosmos_node19'
+_key_alert_cosmos_node_is_not_peered_with_sentinel = 'alert_cosmos_node20'
 
 # alert_cosmos_networkX
 _key_alert_cosmos_network_proposals_submitted = 'alert_cosmos_network1'
@@ -254,6 +273,15 @@ class Keys:
     def get_alerter_mute() -> str:
         return _key_alerter_mute
 
+    @staticmethod
+    def get_set_alert_keys(alert_keys_prefix: str, parent_id: str) -> str:
+        return Keys._as_prefix(_set_alert_keys) + Keys._as_prefix(
+            alert_keys_prefix) + parent_id
+
+    @staticmethod
+    def get_set_alert_parents(alert_keys_prefix: str) -> str:
+        return Keys._as_prefix(_set_alert_parents) + alert_keys_prefix
+
     @staticmethod
     def get_system_process_cpu_seconds_total(system_id: str) -> str:
         return Keys._as_prefix(_key_system_process_cpu_seconds_total) + (
@@ -468,6 +496,33 @@ class Keys:
         return Keys._as_prefix(
             _key_cosmos_network_last_monitored_cosmos_rest) + parent_id
 
+    @staticmethod
+    def get_cosmos_tendermint_block_cache(parent_id: str) -> str:
+        return Keys._as_prefix(_key_cosmos_tendermint_block_cache) + parent_id
+
+    @staticmethod
+    def get_cosmos_tendermint_block_cache_subscribers(parent_id: str) -> str:
+        return Keys._as_prefix(
+            _key_cosmos_tendermint_block_cache_subscribers) + parent_id
+
+    @staticmethod
+    def get_cosmos_validators_snapshot_cache(parent_id: str) -> str:
+        return Keys._as_prefix(
+            _key_cosmos_validators_snapshot_cache) + parent_id
+
+    @staticmethod
+    def get_cosmos_proposals_cache(parent_id: str) -> str:
+        return Keys._as_prefix(_key_cosmos_proposals_cache) + parent_id
+
+    @staticmethod
+    def get_cosmos_validators_snapshot_fetch_lock(parent_id: str) -> str:
+        return Keys._as_prefix(
+            _key_cosmos_validators_snapshot_fetch_lock) + parent_id
+
+    @staticmethod
+    def get_substrate_era_cache(parent_id: str) -> str:
+        return Keys._as_prefix(_key_substrate_era_cache) + parent_id
+
     @staticmethod
     def get_substrate_node_went_down_at_websocket(
             substrate_node_id: str) -> str:
@@ -912,6 +967,12 @@ class Keys:
         return Keys._as_prefix(
             _key_alert_cosmos_node_metric_not_found) + origin_id
 
+    @staticmethod
+    def get_alert_cosmos_node_is_not_peered_with_sentinel(
+            origin_id: str) -> str:
+        return Keys._as_prefix(
+            _key_alert_cosmos_node_is_not_peered_with_sentinel) + origin_id
+
     @staticmethod
     def get_alert_cosmos_network_proposals_submitted() -> str:
         return _key_alert_cosmos_network_proposals_submitted
@@ -1094,3 +1155,34 @@ class Keys:
     def get_alert_substrate_network_referendum_info(referendum_id: int) -> str:
         return Keys._as_prefix(
             _key_alert_substrate_network_referendum_info) + str(referendum_id)
+
+
+# The functions of Keys which build the key of the alert of a metric, keyed by
+# the metric. These are collected once at import, so that the key of an alert
+# is built with a dict lookup rather than by compiling its name per alert.
+_ALERT_KEY_FUNCTION_PREFIX = 'get_alert_'
+_ALERT_KEY_FUNCTIONS = {
+    name[len(_ALERT_KEY_FUNCTION_PREFIX):]: getattr(Keys, name)
+    for name in dir(Keys) if name.startswith(_ALERT_KEY_FUNCTION_PREFIX)
+}
+
+
+def get_alert_key(metric: str, metric_state_args: List) -> str:
+    """
+    :param metric: The metric of the alert, i.e. a GroupedAlertsMetricCode
+                 : value
+    :param metric_state_args: The arguments identifying the alert's metric
+                            : state, for example the origin_id
+    :return: The key of the alert in the hash of its chain
+    :raises KeyError: If there is no key for the metric
+    """
+    return _ALERT_KEY_FUNCTIONS[metric](*metric_state_args)
+
+
+def get_metrics_without_alert_key(metrics: Iterable[str]) -> List[str]:
+    """
+    :param metrics: The metrics to be checked
+    :return: The metrics for which get_alert_key has no key
+    """
+    return [metric for metric in metrics
+            if metric not in _ALERT_KEY_FUNCTIONS]
@@ -1,7 +1,7 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pika.exceptions
 
@@ -17,8 +17,11 @@ from src.alerter.alerters.node.cosmos import CosmosNodeAlerter
 from src.alerter.alerters.node.evm import EVMNodeAlerter
 from src.alerter.alerters.node.substrate import SubstrateNodeAlerter
 from src.alerter.alerters.system import SystemAlerter
+from src.alerter.grouped_alerts_metric_code import (
+    GroupedAlertsMetricCode, GroupedInternalAlertsMetricCode)
 from src.data_store.mongo.mongo_api import MongoApi
-from src.data_store.redis.store_keys import Keys
+from src.data_store.redis.store_keys import (
+    Keys, get_alert_key, get_metrics_without_alert_key)
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.data import EXPIRE_METRICS
@@ -39,6 +42,61 @@ _LIST_OF_ALERTERS = [SystemAlerter.__name__,
                      SubstrateNodeAlerter.__name__,
                      SubstrateNetworkAlerter.__name__]
 
+# For every alerter, the alerts stored in Redis are those whose keys contain
+# the redis_key_index, except the ones containing any of the ignore_metrics.
+_ALERTERS_CONFIGURATION = {
+    SystemAlerter.__name__: {
+        'metrics_type': 'system',
+        'redis_key_index': 'alert_system',
+        'ignore_metrics': []
+    },
+    ChainlinkNodeAlerter.__name__: {
+        'metrics_type': 'chainlink node metrics',
+        'redis_key_index': 'alert_cl_node',
+        'ignore_metrics': []
+    },
+    CosmosNodeAlerter.__name__: {
+        'metrics_type': 'cosmos node metrics',
+        'redis_key_index': 'alert_cosmos_node',
+        'ignore_metrics': []
+    },
+    CosmosNetworkAlerter.__name__: {
+        'metrics_type': 'cosmos network metrics',
+        'redis_key_index': 'alert_cosmos_network',
+        'ignore_metrics': []
+    },
+    GithubAlerter.__name__: {
+        'metrics_type': 'github',
+        'redis_key_index': 'alert_github',
+        'ignore_metrics': ['alert_github1']
+    },
+    DockerhubAlerter.__name__: {
+        'metrics_type': 'dockerhub',
+        'redis_key_index': 'alert_dockerhub',
+        'ignore_metrics': []
+    },
+    EVMNodeAlerter.__name__: {
+        'metrics_type': 'evm node metrics',
+        'redis_key_index': 'alert_evm_node',
+        'ignore_metrics': []
+    },
+    ChainlinkContractAlerter.__name__: {
+        'metrics_type': 'chainlink contract',
+        'redis_key_index': 'alert_cl_contract',
+        'ignore_metrics': []
+    },
+    SubstrateNodeAlerter.__name__: {
+        'metrics_type': 'substrate node metrics',
+        'redis_key_index': 'alert_substrate_node',
+        'ignore_metrics': []
+    },
+    SubstrateNetworkAlerter.__name__: {
+        'metrics_type': 'substrate network metrics',
+        'redis_key_index': 'alert_substrate_network',
+        'ignore_metrics': []
+    },
+}
+
 
 class AlertStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
@@ -48,6 +106,23 @@ class AlertStore(Store):
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
 
+        # Whether the keys of the alerts stored in Redis were indexed. The
+        # index is built before the first reset, and kept up to date as alerts
+        # are stored.
+        self._alert_keys_indexed = False
+
+        # Internal alerts are not stored in Redis, therefore every other
+        # metric must have a key.
+        metrics_without_key = get_metrics_without_alert_key(
+            metric_code.value
+            for metric_code_class in GroupedAlertsMetricCode.__subclasses__()
+            if metric_code_class is not GroupedInternalAlertsMetricCode
+            for metric_code in metric_code_class)
+        if metrics_without_key:
+            self.logger.error("There are no Redis keys for the alerts of %s, "
+                              "therefore these will not be stored in Redis.",
+                              metrics_without_key)
+
     def _initialise_rabbitmq(self) -> None:
         """
         Initialise the necessary data for rabbitmq to be able to reach the data
@@ -182,105 +257,16 @@ class AlertStore(Store):
                 particular chain, depending on whether the parent_id is None or
                 not.
                 """
-                configuration = {
-                    SystemAlerter.__name__: {
-                        'metrics_type': 'system',
-                        'redis_key_index': 'alert_system',
-                        'ignore_metrics': []
-                    },
-                    ChainlinkNodeAlerter.__name__: {
-                        'metrics_type': 'chainlink node metrics',
-                        'redis_key_index': 'alert_cl_node',
-                        'ignore_metrics': []
-                    },
-                    CosmosNodeAlerter.__name__: {
-                        'metrics_type': 'cosmos node metrics',
-                        'redis_key_index': 'alert_cosmos_node',
-                        'ignore_metrics': []
-                    },
-                    CosmosNetworkAlerter.__name__: {
-                        'metrics_type': 'cosmos network metrics',
-                        'redis_key_index': 'alert_cosmos_network',
-                        'ignore_metrics': []
-                    },
-                    GithubAlerter.__name__: {
-                        'metrics_type': 'github',
-                        'redis_key_index': 'alert_github',
-                        'ignore_metrics': ['alert_github1']
-                    },
-                    DockerhubAlerter.__name__: {
-                        'metrics_type': 'dockerhub',
-                        'redis_key_index': 'alert_dockerhub',
-                        'ignore_metrics': []
-                    },
-                    EVMNodeAlerter.__name__: {
-                        'metrics_type': 'evm node metrics',
-                        'redis_key_index': 'alert_evm_node',
-                        'ignore_metrics': []
-                    },
-                    ChainlinkContractAlerter.__name__: {
-                        'metrics_type': 'chainlink contract',
-                        'redis_key_index': 'alert_cl_contract',
-                        'ignore_metrics': []
-                    },
-                    SubstrateNodeAlerter.__name__: {
-                        'metrics_type': 'substrate node metrics',
-                        'redis_key_index': 'alert_substrate_node',
-                        'ignore_metrics': []
-                    },
-                    SubstrateNetworkAlerter.__name__: {
-                        'metrics_type': 'substrate network metrics',
-                        'redis_key_index': 'alert_substrate_network',
-                        'ignore_metrics': []
-                    },
-                }
                 alerter_type = alert['origin_id']
-                metrics_type = configuration[alerter_type]['metrics_type']
-                redis_key_index = configuration[alerter_type]['redis_key_index']
-                ignore_metrics = configuration[alerter_type]['ignore_metrics']
+                metrics_type = _ALERTERS_CONFIGURATION[alerter_type][
+                    'metrics_type']
                 if alert['parent_id'] is None:
                     self.logger.debug("Resetting the %s metrics for all "
                                       "chains.", metrics_type)
-                    parent_hash = Keys.get_hash_parent_raw()
-                    chain_hashes_list = self.redis.get_keys_unsafe(
-                        '*' + parent_hash + '*')
-
-                    # Go through all the chains that are in REDIS
-                    for chain in chain_hashes_list:
-                        # For each chain we need to load all the keys and only
-                        # delete the ones that match the pattern `alert_system*`
-                        # or `alert_cl_node*`, depending on the alerter_type.
-                        # Note, REDIS doesn't support this natively
-                        chain_keys = self.redis.hkeys(chain)
-                        for key in chain_keys:
-                            ignore_metric = False
-                            for ignored_metric in ignore_metrics:
-                                if ignored_metric in key:
-                                    ignore_metric = True
-                                    break
-                            # We only want to delete alert keys
-                            if redis_key_index in key and not ignore_metric:
-                                self.redis.hremove(chain, key)
                 else:
                     self.logger.debug("Resetting %s metrics for chain %s.",
                                       metrics_type, alert['parent_id'])
-                    """
-                    For the specified chain we need to load all the keys and
-                    only delete the ones that match the pattern `alert_system*`
-                    or `alert_cl_node*`, depending on the alerter_type.
-                    Note, REDIS doesn't support this natively.
-                    """
-                    chain_hash = Keys.get_hash_parent(alert['parent_id'])
-                    chain_keys = self.redis.hkeys(chain_hash)
-                    for key in chain_keys:
-                        ignore_metric = False
-                        for ignored_metric in ignore_metrics:
-                            if ignored_metric in key:
-                                ignore_metric = True
-                                break
-                        # We only want to delete alert keys
-                        if redis_key_index in key and not ignore_metric:
-                            self.redis.hremove(chain_hash, key)
+                self._reset_alert_keys(alerter_type, alert['parent_id'])
         else:
             """
             If the alert is not of severity Internal, the metric needs to be
@@ -300,7 +286,113 @@ class AlertStore(Store):
 
             name = Keys.get_hash_parent(alert['parent_id'])
             value = json.dumps(metric_data)
-            metric_state_args = alert['metric_state_args']
-            key = eval('Keys.get_alert_{}(*metric_state_args)'.format(metric))
+            key = get_alert_key(metric, alert['metric_state_args'])
+
+            # The alert and its entry in the index of the alert keys are
+            # written in a single round trip
+            index = self._get_alert_key_index(alert['parent_id'], key)
+            if self.redis.hset_and_sadd_multiple(
+                    name, key, value, index) is None and index:
+                # The index is rebuilt before the next reset as it may now be
+                # missing this key
+                self._alert_keys_indexed = False
+
+    @staticmethod
+    def _get_alert_keys_prefix(key: str) -> Optional[str]:
+        for configuration in _ALERTERS_CONFIGURATION.values():
+            if configuration['redis_key_index'] in key:
+                return configuration['redis_key_index']
+
+        return None
+
+    def _get_alert_key_index(self, parent_id: str,
+                             key: str) -> Dict[str, List[str]]:
+        """
+        Returns the members to add to the index of the alert keys for the key
+        of an alert stored in the hash of the chain, so that the alerts of an
+        alerter are reset without going through all the keys of the chain.
+        :param parent_id: The id of the chain
+        :param key: The key of the alert in the hash of the chain
+        :return: The members to add to each set of the index, or an empty dict
+               : if the key does not belong to an alerter
+        """
+        alert_keys_prefix = self._get_alert_keys_prefix(key)
+        if alert_keys_prefix is None:
+            return {}
+
+        return {
+            Keys.get_set_alert_keys(alert_keys_prefix, parent_id): [key],
+            Keys.get_set_alert_parents(alert_keys_prefix): [parent_id],
+        }
+
+    def _build_alert_keys_index(self) -> None:
+        """
+        Indexes the keys of the alerts stored in the hashes of all chains,
+        including those stored before this store started. The chains and their
+        keys are iterated using SCAN and HSCAN so that Redis is not blocked
+        meanwhile.
+        :return: None
+        """
+        chain_hashes = self.redis.scan_keys(Keys.get_hash_parent('*'))
+        if chain_hashes is None:
+            return
+
+        index = {}
+        for chain_hash in chain_hashes:
+            parent_id = chain_hash[len(Keys.get_hash_parent('')):]
+            keys = self.redis.hscan_keys(chain_hash, 'alert_*')
+            if keys is None:
+                return
+
+            for key in keys:
+                alert_keys_prefix = self._get_alert_keys_prefix(key)
+                if alert_keys_prefix is not None:
+                    index.setdefault(Keys.get_set_alert_keys(
+                        alert_keys_prefix, parent_id), []).append(key)
+                    index.setdefault(Keys.get_set_alert_parents(
+                        alert_keys_prefix), []).append(parent_id)
+
+        self._alert_keys_indexed = self.redis.sadd_multiple(index) is not None
+
+    def _reset_alert_keys(self, alerter_type: str,
+                          parent_id: Optional[str]) -> None:
+        """
+        Removes the alerts of an alerter from the hash of a chain, or from the
+        hashes of all chains if parent_id is None. Only the indexed keys are
+        read, and they are removed with a single HDEL per chain.
+        :param alerter_type: The name of the alerter
+        :param parent_id: The id of the chain, or None for all chains
+        :return: None
+        """
+        if not self._alert_keys_indexed:
+            self._build_alert_keys_index()
+            if not self._alert_keys_indexed:
+                self.logger.error("Could not index the alert keys, therefore "
+                                  "the %s alerts were not reset.",
+                                  alerter_type)
+                return
+
+        alert_keys_prefix = _ALERTERS_CONFIGURATION[alerter_type][
+            'redis_key_index']
+        ignore_metrics = _ALERTERS_CONFIGURATION[alerter_type][
+            'ignore_metrics']
+        if parent_id is None:
+            parent_ids = self.redis.smembers(
+                Keys.get_set_alert_parents(alert_keys_prefix)) or []
+        else:
+            parent_ids = [parent_id]
+
+        chain_keys = {}
+        index_keys = {}
+        for chain_id in parent_ids:
+            index_key = Keys.get_set_alert_keys(alert_keys_prefix, chain_id)
+            keys = [
+                key for key in self.redis.smembers(index_key) or []
+                if not any(ignored_metric in key
+                           for ignored_metric in ignore_metrics)
+            ]
+            chain_keys[Keys.get_hash_parent(chain_id)] = keys
+            index_keys[index_key] = keys
 
-            self.redis.hset(name, key, value)
+        self.redis.hremove_multiple(chain_keys)
+        self.redis.sremove_multiple(index_keys)
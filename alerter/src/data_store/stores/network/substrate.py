@@ -89,7 +89,7 @@ class SubstrateNetworkStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -179,20 +179,12 @@ class SubstrateNetworkStore(Store):
 
         meta_data = data['meta_data']
         parent_id = meta_data['parent_id']
-        time_now = datetime.now()
 
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'network', 'd': time_now.hour},
-            {
-                '$push': {
-                    parent_id: {
-                        'last_monitored': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'last_monitored': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'network', parent_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_websocket_error_store(self, data: Dict) -> None:
         pass
\ No newline at end of file
@@ -89,7 +89,7 @@ class ChainlinkNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -235,41 +235,26 @@ class ChainlinkNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'current_height': str(metrics['current_height']),
-                        'total_block_headers_received': str(
-                            metrics['total_block_headers_received']),
-                        'max_pending_tx_delay': str(
-                            metrics['max_pending_tx_delay']),
-                        'process_start_time_seconds': str(
-                            metrics['process_start_time_seconds']),
-                        'total_gas_bumps': str(metrics['total_gas_bumps']),
-                        'total_gas_bumps_exceeds_limit': str(
-                            metrics['total_gas_bumps_exceeds_limit']),
-                        'no_of_unconfirmed_txs': str(
-                            metrics['no_of_unconfirmed_txs']),
-                        'total_errored_job_runs': str(
-                            metrics['total_errored_job_runs']),
-                        'current_gas_price_info':
-                            'None' if metrics['current_gas_price_info'] is None
-                            else json.dumps(metrics['current_gas_price_info']),
-                        'balance_info':
-                            json.dumps(metrics['balance_info']),
-                        'went_down_at_prometheus': str(metrics['went_down_at']),
-                        'last_prometheus_source_used':
-                            str(meta_data['last_source_used']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'current_height': metrics['current_height'],
+            'total_block_headers_received':
+                metrics['total_block_headers_received'],
+            'max_pending_tx_delay': metrics['max_pending_tx_delay'],
+            'process_start_time_seconds':
+                metrics['process_start_time_seconds'],
+            'total_gas_bumps': metrics['total_gas_bumps'],
+            'total_gas_bumps_exceeds_limit':
+                metrics['total_gas_bumps_exceeds_limit'],
+            'no_of_unconfirmed_txs': metrics['no_of_unconfirmed_txs'],
+            'total_errored_job_runs': metrics['total_errored_job_runs'],
+            'current_gas_price_info': metrics['current_gas_price_info'],
+            'balance_info': metrics['balance_info'],
+            'went_down_at_prometheus': metrics['went_down_at'],
+            'last_prometheus_source_used': meta_data['last_source_used'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_prometheus_error_store(self, data: Dict) -> None:
         """
@@ -294,39 +279,21 @@ class ChainlinkNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at_prometheus':
-                                str(metrics['went_down_at']),
-                            'last_prometheus_source_used':
-                                str(meta_data['last_source_used']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at_prometheus': metrics['went_down_at'],
+                'last_prometheus_source_used': meta_data['last_source_used'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
         else:
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'last_prometheus_source_used':
-                                str(meta_data['last_source_used']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
\ No newline at end of file
+            entry = {
+                'last_prometheus_source_used': meta_data['last_source_used'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
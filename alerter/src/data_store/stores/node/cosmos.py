@@ -87,7 +87,7 @@ class CosmosNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -310,22 +310,14 @@ class CosmosNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'current_height': str(metrics['current_height']),
-                        'went_down_at_prometheus': str(metrics['went_down_at']),
-                        'voting_power': str(metrics['voting_power']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'current_height': metrics['current_height'],
+            'went_down_at_prometheus': metrics['went_down_at'],
+            'voting_power': metrics['voting_power'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_prometheus_error_store(self, data: Dict) -> None:
         """
@@ -350,25 +342,16 @@ class CosmosNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at_prometheus':
-                                str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at_prometheus': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
 
     def _process_mongo_tendermint_rpc_result_store(self, data: Dict) -> None:
         """
@@ -392,25 +375,17 @@ class CosmosNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'went_down_at_tendermint_rpc': str(
-                            metrics['went_down_at']),
-                        'is_syncing': str(metrics['is_syncing']),
-                        'is_peered_with_sentinel': "" if ('is_peered_with_sentinel' not in metrics) else str(metrics['is_peered_with_sentinel']),
-                        'slashed': json.dumps(metrics['slashed']),
-                        'missed_blocks': json.dumps(metrics['missed_blocks']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'went_down_at_tendermint_rpc': metrics['went_down_at'],
+            'is_syncing': metrics['is_syncing'],
+            'is_peered_with_sentinel':
+                metrics.get('is_peered_with_sentinel', ""),
+            'slashed': metrics['slashed'],
+            'missed_blocks': metrics['missed_blocks'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_tendermint_rpc_error_store(self, data: Dict) -> None:
         """
@@ -435,25 +410,16 @@ class CosmosNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at_tendermint_rpc':
-                                str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at_tendermint_rpc': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
 
     def _process_mongo_cosmos_rest_result_store(self, data: Dict) -> None:
         """
@@ -477,23 +443,14 @@ class CosmosNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'went_down_at_cosmos_rest': str(
-                            metrics['went_down_at']),
-                        'bond_status': str(metrics['bond_status']),
-                        'jailed': str(metrics['jailed']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'went_down_at_cosmos_rest': metrics['went_down_at'],
+            'bond_status': metrics['bond_status'],
+            'jailed': metrics['jailed'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_cosmos_rest_error_store(self, data: Dict) -> None:
         """
@@ -518,22 +475,13 @@ class CosmosNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at_cosmos_rest':
-                                str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at_cosmos_rest': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
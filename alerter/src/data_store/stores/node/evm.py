@@ -89,7 +89,7 @@ class EVMNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -191,22 +191,14 @@ class EVMNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'current_height': str(metrics['current_height']),
-                        'syncing': str(metrics['syncing']),
-                        'went_down_at': str(metrics['went_down_at']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'current_height': metrics['current_height'],
+            'syncing': metrics['syncing'],
+            'went_down_at': metrics['went_down_at'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_error_store(self, data: Dict) -> None:
         """
@@ -231,21 +223,13 @@ class EVMNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at': str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
@@ -91,7 +91,7 @@ class SubstrateNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -242,37 +242,28 @@ class SubstrateNodeStore(Store):
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'node', 'd': time_now.hour},
-            {
-                '$push': {
-                    node_id: {
-                        'went_down_at_websocket': str(metrics['went_down_at']),
-                        'best_height': str(metrics['best_height']),
-                        'target_height': str(metrics['target_height']),
-                        'finalized_height': str(metrics['finalized_height']),
-                        'current_session': str(metrics['current_session']),
-                        'current_era': str(metrics['current_era']),
-                        'authored_blocks': str(metrics['authored_blocks']),
-                        'active': str(metrics['active']),
-                        'elected': str(metrics['elected']),
-                        'disabled': str(metrics['disabled']),
-                        'sent_heartbeat': str(metrics['sent_heartbeat']),
-                        'controller_address': str(
-                            metrics['controller_address']),
-                        'claimed_rewards': json.dumps(
-                            metrics['claimed_rewards']),
-                        'previous_era_rewards': str(
-                            metrics['previous_era_rewards']),
-                        'timestamp': str(meta_data['last_monitored']),
-                        'token_symbol': str(meta_data['token_symbol']),
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'went_down_at_websocket': metrics['went_down_at'],
+            'best_height': metrics['best_height'],
+            'target_height': metrics['target_height'],
+            'finalized_height': metrics['finalized_height'],
+            'current_session': metrics['current_session'],
+            'current_era': metrics['current_era'],
+            'authored_blocks': metrics['authored_blocks'],
+            'active': metrics['active'],
+            'elected': metrics['elected'],
+            'disabled': metrics['disabled'],
+            'sent_heartbeat': metrics['sent_heartbeat'],
+            'controller_address': metrics['controller_address'],
+            'claimed_rewards': metrics['claimed_rewards'],
+            'previous_era_rewards': metrics['previous_era_rewards'],
+            'timestamp': meta_data['last_monitored'],
+            'token_symbol': meta_data['token_symbol'],
+        }
+        # The legacy entries of Substrate nodes store the timestamp as a string
+        self._store_mongo_entry(parent_id, 'node', node_id,
+                                meta_data['last_monitored'], entry,
+                                legacy_raw_fields=())
 
     def _process_mongo_websocket_error_store(self, data: Dict) -> None:
         """
@@ -297,22 +288,13 @@ class SubstrateNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
-        time_now = datetime.now()
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'node', 'd': time_now.hour},
-                {
-                    '$push': {
-                        node_id: {
-                            'went_down_at_websocket':
-                                str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at_websocket': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'node', node_id,
+                                    meta_data['time'], entry)
@@ -1,13 +1,18 @@
+import json
 import logging
 import sys
 from abc import abstractmethod
+from datetime import datetime
 from types import FrameType
+from typing import Dict, Iterable
 
 import pika
 import pika.exceptions
 
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.rollup import TimeSeriesRollup
+from src.data_store.mongo.time_series import TimeSeriesBuffer
 from src.data_store.redis.redis_api import RedisApi
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils import env
@@ -15,6 +20,9 @@ from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
 from src.utils.logging import log_and_print
 
+# The fields of the legacy Mongo entries which are not stored as strings
+_LEGACY_MONGO_RAW_FIELDS = ('timestamp', 'last_monitored')
+
 
 class Store(PublisherSubscriberComponent):
     def __init__(self, name: str, logger: logging.Logger,
@@ -34,6 +42,21 @@ class Store(PublisherSubscriberComponent):
                                db=redis_db, host=redis_ip, port=redis_port,
                                namespace=unique_alerter_identifier)
 
+        self._mongo_time_series_storage = env.ENABLE_MONGO_TIME_SERIES_STORAGE
+        self._mongo_time_series_buffer = TimeSeriesBuffer(
+            env.MONGO_TIME_SERIES_FLUSH_SIZE,
+            env.MONGO_TIME_SERIES_FLUSH_INTERVAL)
+
+        # The delivery tag of the last received message which was not yet
+        # acknowledged because its Mongo entries are still buffered
+        self._unacknowledged_delivery_tag = None
+
+        # The raw data of the collections holding raw buckets is rolled up
+        # every rollup interval by the rollup owner
+        self._mongo_time_series_rollup_interval = \
+            env.MONGO_TIME_SERIES_ROLLUP_INTERVAL
+        self._mongo_time_series_rollup = None
+
     def __str__(self) -> str:
         return self.name
 
@@ -57,6 +80,17 @@ class Store(PublisherSubscriberComponent):
     def mongo(self) -> MongoApi:
         return self._mongo
 
+    @property
+    def mongo_time_series_storage(self) -> bool:
+        return self._mongo_time_series_storage
+
+    @property
+    def mongo_time_series_rollup_owner(self) -> bool:
+        # The raw data of every collection is rolled up by one store only, so
+        # that the stores writing to the same collection do not roll up the
+        # same buckets at the same time.
+        return False
+
     def _process_redis_store(self, *args) -> None:
         pass
 
@@ -71,6 +105,118 @@ class Store(PublisherSubscriberComponent):
                       body: bytes) -> None:
         pass
 
+    def _store_mongo_entry(
+            self, collection: str, doc_type: str, source_id: str,
+            timestamp: float, entry: Dict,
+            legacy_raw_fields: Iterable[str] = _LEGACY_MONGO_RAW_FIELDS) \
+            -> None:
+        """
+        This function stores an entry of metrics of a source in Mongo.
+
+        By default the entry is pushed to the document of the current hour, and
+        every value except the legacy_raw_fields is stored as a string.
+
+        If time-series storage is enabled, the entry keeps the types of its
+        values and is buffered, to be written to the date/hour bucket of its
+        timestamp by the next flush.
+        :param collection: The collection the entry is written to
+        :param doc_type: The type of the entry, for example node
+        :param source_id: The id of the source the entry belongs to
+        :param timestamp: The time at which the entry was measured
+        :param entry: The metrics of the source
+        :param legacy_raw_fields: The fields which are not stored as strings
+                                : if time-series storage is disabled
+        :return: None
+        """
+        if self.mongo_time_series_storage:
+            self._mongo_time_series_buffer.add(collection, doc_type, source_id,
+                                               timestamp, entry)
+            return
+
+        legacy_entry = {}
+        for field, value in entry.items():
+            if field in legacy_raw_fields:
+                legacy_entry[field] = value
+            elif isinstance(value, (dict, list)):
+                legacy_entry[field] = json.dumps(value)
+            else:
+                legacy_entry[field] = str(value)
+
+        self.mongo.update_one(
+            collection,
+            {'doc_type': doc_type, 'd': datetime.now().hour},
+            {
+                '$push': {source_id: legacy_entry},
+                '$inc': {'n_entries': 1},
+            }
+        )
+
+    def _flush_mongo_time_series(self) -> None:
+        """
+        This function writes the buffered time-series entries to Mongo with a
+        bulk write per collection. The received data is acknowledged only once
+        all the entries are written, so that if the store stops before, the
+        data is re-delivered rather than lost. If a write fails, the entries of
+        the collections which were not written are kept for the next flush.
+        Entries which were already written are not stored again if their data
+        is re-delivered.
+        :return: None
+        """
+        requests = self._mongo_time_series_buffer.get_requests()
+        for collection, collection_requests in requests.items():
+            if self.mongo.bulk_write(collection, collection_requests) is None:
+                self.logger.warning(
+                    "Could not write the time-series entries of %s to Mongo. "
+                    "Retrying on the next flush.", collection)
+                return
+            self._mongo_time_series_buffer.discard(collection)
+
+        if self._unacknowledged_delivery_tag is not None:
+            self.rabbitmq.basic_ack(self._unacknowledged_delivery_tag, True)
+            self._unacknowledged_delivery_tag = None
+        self._mongo_time_series_buffer.clear()
+
+    def _on_mongo_time_series_flush_timer(self) -> None:
+        # Flush the entries even if no data is received, and check again
+        # after another interval.
+        if self._mongo_time_series_buffer.is_flush_due():
+            self._flush_mongo_time_series()
+        self.rabbitmq.call_later(self._mongo_time_series_buffer.flush_interval,
+                                 self._on_mongo_time_series_flush_timer)
+
+    def _on_mongo_time_series_rollup_timer(self) -> None:
+        for collection in \
+                self._mongo_time_series_rollup.get_raw_data_collections():
+            try:
+                self._mongo_time_series_rollup.set_raw_data_retention(
+                    collection)
+                self._mongo_time_series_rollup.rollup(collection)
+            except Exception as e:
+                # Rolling up is retried the next time round, therefore a
+                # failure should not stop the store from processing data.
+                self.logger.error("Could not roll up the time-series data of "
+                                  "%s.", collection)
+                self.logger.exception(e)
+        self.rabbitmq.call_later(self._mongo_time_series_rollup_interval,
+                                 self._on_mongo_time_series_rollup_timer)
+
+    def _acknowledge_data(self, delivery_tag: int) -> None:
+        """
+        This function acknowledges the processed data. If time-series storage
+        is enabled, the acknowledgement is deferred until the buffered Mongo
+        entries are flushed, at which point all the data received so far is
+        acknowledged at once.
+        :param delivery_tag: The delivery tag of the processed data
+        :return: None
+        """
+        if not self.mongo_time_series_storage:
+            self.rabbitmq.basic_ack(delivery_tag, False)
+            return
+
+        self._unacknowledged_delivery_tag = delivery_tag
+        if self._mongo_time_series_buffer.is_flush_due():
+            self._flush_mongo_time_series()
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -80,8 +226,42 @@ class Store(PublisherSubscriberComponent):
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
+    def _initialise_mongo_time_series(self) -> None:
+        """
+        This function prepares the store to buffer time-series entries on a
+        newly initialised RabbitMQ connection or channel, before any data is
+        consumed.
+        :return: None
+        """
+        # The unacknowledged data is re-delivered on a new connection or
+        # channel, therefore its buffered entries must not be written.
+        self._mongo_time_series_buffer.clear()
+        self._unacknowledged_delivery_tag = None
+
+        # At most a buffer's worth of data is left unacknowledged. Therefore,
+        # if the buffered entries cannot be written, no more data is received
+        # until they are.
+        self.rabbitmq.basic_qos(
+            prefetch_count=self._mongo_time_series_buffer.flush_size)
+        self.rabbitmq.call_later(
+            self._mongo_time_series_buffer.flush_interval,
+            self._on_mongo_time_series_flush_timer)
+
+        # Raw data is rolled up once the buffered entries of its hour had
+        # time to be written.
+        if not self.mongo_time_series_rollup_owner:
+            return
+
+        self._mongo_time_series_rollup = TimeSeriesRollup(
+            self.mongo, self.logger, env.MONGO_RAW_DATA_RETENTION_DAYS,
+            self._mongo_time_series_buffer.flush_interval)
+        self.rabbitmq.call_later(self._mongo_time_series_rollup_interval,
+                                 self._on_mongo_time_series_rollup_timer)
+
     def start(self) -> None:
         self._initialise_rabbitmq()
+        if self.mongo_time_series_storage:
+            self._initialise_mongo_time_series()
         while True:
             try:
                 self._listen_for_data()
@@ -99,6 +279,8 @@ class Store(PublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        if self.mongo_time_series_storage:
+            self._flush_mongo_time_series()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
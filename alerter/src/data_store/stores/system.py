@@ -26,6 +26,12 @@ class SystemStore(Store):
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
 
+    @property
+    def mongo_time_series_rollup_owner(self) -> bool:
+        # The system store is always started, therefore it rolls up the raw
+        # time-series data of every store.
+        return True
+
     def _initialise_rabbitmq(self) -> None:
         """
         Initialise the necessary data for rabbitmq to be able to reach the data
@@ -95,7 +101,7 @@ class SystemStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge_data(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -239,44 +245,31 @@ class SystemStore(Store):
         system_id = meta_data['system_id']
         parent_id = meta_data['system_parent_id']
         metrics = data['data']
-        time_now = datetime.now()
-        self.mongo.update_one(
-            parent_id,
-            {'doc_type': 'system', 'd': time_now.hour},
-            {
-                '$push': {
-                    system_id: {
-                        'process_cpu_seconds_total': str(
-                            metrics['process_cpu_seconds_total']),
-                        'process_memory_usage': str(
-                            metrics['process_memory_usage']),
-                        'virtual_memory_usage': str(
-                            metrics['virtual_memory_usage']),
-                        'open_file_descriptors': str(
-                            metrics['open_file_descriptors']),
-                        'system_cpu_usage': str(metrics['system_cpu_usage']),
-                        'system_ram_usage': str(metrics['system_ram_usage']),
-                        'system_storage_usage': str(
-                            metrics['system_storage_usage']),
-                        'network_transmit_bytes_per_second': str(
-                            metrics['network_transmit_bytes_per_second']),
-                        'network_receive_bytes_per_second': str(
-                            metrics['network_receive_bytes_per_second']),
-                        'network_receive_bytes_total': str(
-                            metrics['network_receive_bytes_total']),
-                        'network_transmit_bytes_total': str(
-                            metrics['network_transmit_bytes_total']),
-                        'disk_io_time_seconds_total': str(
-                            metrics['disk_io_time_seconds_total']),
-                        'disk_io_time_seconds_in_interval': str(
-                            metrics['disk_io_time_seconds_in_interval']),
-                        'went_down_at': str(metrics['went_down_at']),
-                        'timestamp': meta_data['last_monitored'],
-                    }
-                },
-                '$inc': {'n_entries': 1},
-            }
-        )
+        entry = {
+            'process_cpu_seconds_total': metrics['process_cpu_seconds_total'],
+            'process_memory_usage': metrics['process_memory_usage'],
+            'virtual_memory_usage': metrics['virtual_memory_usage'],
+            'open_file_descriptors': metrics['open_file_descriptors'],
+            'system_cpu_usage': metrics['system_cpu_usage'],
+            'system_ram_usage': metrics['system_ram_usage'],
+            'system_storage_usage': metrics['system_storage_usage'],
+            'network_transmit_bytes_per_second':
+                metrics['network_transmit_bytes_per_second'],
+            'network_receive_bytes_per_second':
+                metrics['network_receive_bytes_per_second'],
+            'network_receive_bytes_total':
+                metrics['network_receive_bytes_total'],
+            'network_transmit_bytes_total':
+                metrics['network_transmit_bytes_total'],
+            'disk_io_time_seconds_total':
+                metrics['disk_io_time_seconds_total'],
+            'disk_io_time_seconds_in_interval':
+                metrics['disk_io_time_seconds_in_interval'],
+            'went_down_at': metrics['went_down_at'],
+            'timestamp': meta_data['last_monitored'],
+        }
+        self._store_mongo_entry(parent_id, 'system', system_id,
+                                meta_data['last_monitored'], entry)
 
     def _process_mongo_error_store(self, data: Dict) -> None:
         """
@@ -305,17 +298,9 @@ class SystemStore(Store):
             system_id = meta_data['system_id']
             parent_id = meta_data['system_parent_id']
             metrics = data['data']
-            time_now = datetime.now()
-            self.mongo.update_one(
-                parent_id,
-                {'doc_type': 'system', 'd': time_now.hour},
-                {
-                    '$push': {
-                        system_id: {
-                            'went_down_at': str(metrics['went_down_at']),
-                            'timestamp': meta_data['time'],
-                        }
-                    },
-                    '$inc': {'n_entries': 1},
-                }
-            )
+            entry = {
+                'went_down_at': metrics['went_down_at'],
+                'timestamp': meta_data['time'],
+            }
+            self._store_mongo_entry(parent_id, 'system', system_id,
+                                    meta_data['time'], entry)
@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Union, Type, Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -73,16 +73,18 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_contract: ChainlinkContract) -> None:
+                           cl_contract: ChainlinkContract,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a Chainlink contract's number metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param state_type: What type of number metrics we want to obtain
         :param cl_contract: The Chainlink contract in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : contract's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         if state_type == int:
@@ -102,21 +104,23 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("cl_contract.set" + attribute + '(new_value)')
 
-    def _load_list_state(self, cl_contract: ChainlinkContract) -> None:
+    def _load_list_state(self, cl_contract: ChainlinkContract,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a Chainlink contract's list metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param cl_contract: The Chainlink contract in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : contract's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         metric_attributes = cl_contract.get_list_metric_attributes()
@@ -126,7 +130,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             eval("cl_contract.set" + attribute + '(new_value)')
@@ -141,10 +145,13 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             :return: The loaded Chainlink Contract
         """
         self.logger.debug("Loading the state of %s from Redis", cl_contract)
+        redis_state = self._get_parent_redis_state(
+            cl_contract.parent_id,
+            '{}_{}'.format(cl_contract.node_id, cl_contract.proxy_address))
 
-        self._load_number_state(int, cl_contract)
-        self._load_number_state(float, cl_contract)
-        self._load_list_state(cl_contract)
+        self._load_number_state(int, cl_contract, redis_state)
+        self._load_number_state(float, cl_contract, redis_state)
+        self._load_list_state(cl_contract, redis_state)
 
         loaded_metrics_list = [
             '{}={}'.format(key, val)
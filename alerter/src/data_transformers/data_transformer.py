@@ -1,8 +1,9 @@
 import logging
 import sys
+import time
 from abc import abstractmethod
 from types import FrameType
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,22 +11,38 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
 from src.data_store.redis.redis_api import RedisApi
+from src.data_store.redis.store_keys import Keys
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils.constants.data import PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import get_sharded_routing_key
 from src.utils.types import Monitorable
 
 
 class DataTransformer(QueuingPublisherSubscriberComponent):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None,
+                 alerter_shards: int = 1) -> None:
         self._transformer_name = transformer_name
         self._redis = redis
         self._state = {}
 
+        # If the transformer is sharded, it only consumes the raw data of the
+        # monitorables mapped to its shard, from a queue of its own. The data
+        # for alerting is sent to the alerter shard of the monitorable's
+        # parent.
+        self._shard = shard
+        self._alerter_shards = alerter_shards
+
+        # For every parent, a snapshot of the parent's Redis hash together with
+        # the time it was taken and the ids of the monitorables whose state was
+        # loaded from it.
+        self._parent_state_snapshots = {}
+
         super().__init__(logger, rabbitmq, max_queue_size)
 
     def __str__(self) -> str:
@@ -43,6 +60,101 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
     def state(self) -> Dict:
         return self._state
 
+    @property
+    def shard(self) -> Optional[int]:
+        return self._shard
+
+    def _get_alerting_routing_key(self, routing_key: str,
+                                  data_for_alerting: Dict,
+                                  parent_id_key: str) -> str:
+        """
+        The data for alerting is sent to the alerter shard of the parent of the
+        monitorable, so that the alerting state of a chain is kept by one
+        shard.
+        The data is indexed by 'result' or 'error', either directly or per data
+        source, and the parent id is read from its meta_data.
+        :param routing_key: The routing key the alerter binds to if not sharded
+        :param data_for_alerting: The data for alerting of a monitorable
+        :param parent_id_key: The key of the parent id in the meta_data
+        :return: The routing key of the data for alerting
+        """
+        if self._alerter_shards <= 1:
+            return routing_key
+
+        responses = ([data_for_alerting] if 'result' in data_for_alerting
+                     or 'error' in data_for_alerting
+                     else data_for_alerting.values())
+        parent_id = next((
+            index_value['meta_data'][parent_id_key]
+            for response in responses
+            for index_value in response.values()
+            if isinstance(index_value, dict) and 'meta_data' in index_value
+        ), '')
+        return get_sharded_routing_key(routing_key, parent_id,
+                                       self._alerter_shards)
+
+    def _get_parent_redis_state(self, parent_id: str, monitorable_id: str) \
+            -> Dict[str, Optional[bytes]]:
+        """
+        This function returns the metrics stored in the Redis hash of the
+        parent, in the format returned by RedisApi.hget, so that the state of a
+        monitorable is loaded with a single round trip. The hash is retrieved
+        once for all the monitorables of the parent which are seen for the
+        first time within PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD seconds, as it
+        happens when the transformer is started. The hash is retrieved again if
+        the state of an already loaded monitorable is re-loaded.
+        :param parent_id: The id of the monitorable's parent
+        :param monitorable_id: The id of the monitorable whose state is loaded
+        :return: A dict mapping Redis keys to their values. If the data from
+               : Redis cannot be obtained, an empty dict is returned
+        """
+        current_time = time.time()
+        if parent_id in self._parent_state_snapshots:
+            taken_at, redis_state, loaded_ids = self._parent_state_snapshots[
+                parent_id]
+            snapshot_age = current_time - taken_at
+            if (snapshot_age <= PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD
+                    and monitorable_id not in loaded_ids):
+                loaded_ids.add(monitorable_id)
+                return redis_state
+
+        redis_hash = Keys.get_hash_parent(parent_id)
+        redis_state = {
+            key: None if value == b'None' else value
+            for key, value in self.redis.hgetall(redis_hash).items()
+        }
+
+        # Do not re-use the data if Redis could not be accessed, otherwise the
+        # monitorables seen next would not be loaded when Redis is back online
+        if self.redis.is_live:
+            self._parent_state_snapshots[parent_id] = (
+                current_time, redis_state, {monitorable_id})
+        else:
+            self._parent_state_snapshots.pop(parent_id, None)
+
+        return redis_state
+
+    @staticmethod
+    def _copy_response(response: Dict) -> Dict:
+        """
+        Given the data of a source as sent by a monitor or as transformed, i.e.
+        indexed by 'result' or 'error', this function returns a copy of it in
+        which only the index and the dicts directly under it (such as the
+        meta_data and data) are copied. This way the transformers can add,
+        remove or replace metrics without deep copying the data, and the
+        metric values are shared with the given data. Therefore, a metric value
+        must be replaced rather than changed in place.
+        :param response: The data of the source
+        :return: The copy of the data
+        """
+        return {
+            index_key: {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in index_value.items()
+            } if isinstance(index_value, dict) else index_value
+            for index_key, index_value in response.items()
+        }
+
     @abstractmethod
     def load_state(self, monitorable: Monitorable) -> Monitorable:
         pass
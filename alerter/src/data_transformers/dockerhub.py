@@ -75,15 +75,14 @@ class DockerHubDataTransformer(DataTransformer):
         # state won't be updated.
 
         self.logger.debug("Loading the state of %s from Redis", repo)
-        redis_hash = Keys.get_hash_parent(repo.parent_id)
         repo_id = repo.repo_id
+        redis_state = self._get_parent_redis_state(repo.parent_id, repo_id)
 
         # Load tags from Redis
         state_tags = repo.tags
         default_state_tags = None if state_tags is None else bytes(json.dumps(
             state_tags), 'utf-8')
-        redis_tags = self.redis.hget(redis_hash,
-                                     Keys.get_dockerhub_last_tags(repo_id),
+        redis_tags = redis_state.get(Keys.get_dockerhub_last_tags(repo_id),
                                      default_state_tags)
         tags = None if redis_tags is None else json.loads(
             redis_tags.decode('utf-8'))
@@ -91,8 +90,8 @@ class DockerHubDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = repo.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_dockerhub_last_monitored(repo_id),
+        redis_last_monitored = redis_state.get(
+            Keys.get_dockerhub_last_monitored(repo_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
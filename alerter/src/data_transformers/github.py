@@ -77,13 +77,13 @@ class GitHubDataTransformer(DataTransformer):
         # state won't be updated.
 
         self.logger.debug("Loading the state of %s from Redis", repo)
-        redis_hash = Keys.get_hash_parent(repo.parent_id)
         repo_id = repo.repo_id
+        redis_state = self._get_parent_redis_state(repo.parent_id, repo_id)
 
         # Load no_of_releases from Redis
         state_no_of_releases = repo.no_of_releases
-        redis_no_of_releases = self.redis.hget(
-            redis_hash, Keys.get_github_no_of_releases(repo_id),
+        redis_no_of_releases = redis_state.get(
+            Keys.get_github_no_of_releases(repo_id),
             bytes(str(state_no_of_releases), 'utf-8'))
         redis_no_of_releases = 'None' if redis_no_of_releases is None \
             else redis_no_of_releases.decode("utf-8")
@@ -92,8 +92,8 @@ class GitHubDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = repo.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_github_last_monitored(repo_id),
+        redis_last_monitored = redis_state.get(
+            Keys.get_github_last_monitored(repo_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -18,6 +18,7 @@ from src.data_transformers.starters import (
     start_substrate_node_data_transformer,
     start_substrate_network_data_transformer)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
 from src.utils.constants.names import (
     SYSTEM_DATA_TRANSFORMER_NAME, GITHUB_DATA_TRANSFORMER_NAME,
     DOCKERHUB_DATA_TRANSFORMER_NAME, CL_NODE_DATA_TRANSFORMER_NAME,
@@ -27,9 +28,13 @@ from src.utils.constants.names import (
     SUBSTRATE_NETWORK_DATA_TRANSFORMER_NAME)
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, DT_MAN_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY,
-    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY, TOPIC)
+    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY, TOPIC, SYSTEM_DT_INPUT_QUEUE_NAME,
+    CL_NODE_DT_INPUT_QUEUE_NAME, EVM_NODE_DT_INPUT_QUEUE_NAME,
+    COSMOS_NODE_DT_INPUT_QUEUE_NAME, SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.sharding import (
+    get_shards, get_shard_name, remove_stale_shard_queues)
 
 
 class DataTransformersManager(PublisherSubscriberComponent):
@@ -71,6 +76,13 @@ class DataTransformersManager(PublisherSubscriberComponent):
         self.rabbitmq.basic_consume(DT_MAN_HEARTBEAT_QUEUE_NAME,
                                     self._process_ping, True, False, None)
 
+        # Delete the queues of the shards which are no longer started, so that
+        # they do not keep on receiving raw data which is never consumed.
+        for transformer_details in self._get_sharded_transformers().values():
+            remove_stale_shard_queues(self.rabbitmq, self.logger,
+                                      transformer_details['input_queue'],
+                                      transformer_details['shards'])
+
         # Declare publishing intentions
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
         self.rabbitmq.confirm_delivery()
@@ -87,11 +99,42 @@ class DataTransformersManager(PublisherSubscriberComponent):
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
+    @staticmethod
+    def _get_sharded_transformers() -> Dict[str, Dict]:
+        """
+        :return: The input queue and the configured number of shards of every
+               : data transformer which can be sharded, indexed by the name of
+               : the data transformer
+        """
+        return {
+            SYSTEM_DATA_TRANSFORMER_NAME: {
+                'input_queue': SYSTEM_DT_INPUT_QUEUE_NAME,
+                'shards': env.SYSTEM_DATA_TRANSFORMER_SHARDS,
+            },
+            CL_NODE_DATA_TRANSFORMER_NAME: {
+                'input_queue': CL_NODE_DT_INPUT_QUEUE_NAME,
+                'shards': env.CHAINLINK_NODE_DATA_TRANSFORMER_SHARDS,
+            },
+            EVM_NODE_DATA_TRANSFORMER_NAME: {
+                'input_queue': EVM_NODE_DT_INPUT_QUEUE_NAME,
+                'shards': env.EVM_NODE_DATA_TRANSFORMER_SHARDS,
+            },
+            COSMOS_NODE_DATA_TRANSFORMER_NAME: {
+                'input_queue': COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+                'shards': env.COSMOS_NODE_DATA_TRANSFORMER_SHARDS,
+            },
+            SUBSTRATE_NODE_DATA_TRANSFORMER_NAME: {
+                'input_queue': SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
+                'shards': env.SUBSTRATE_NODE_DATA_TRANSFORMER_SHARDS,
+            },
+        }
+
     def _start_transformers_processes(self) -> None:
         """
         This method starts the data transformers in a separate process if they
         are not yet started or not alive. This must be done in case of a restart
-        of a manager.
+        of a manager. A sharded data transformer is started in a process per
+        shard, each of which is given its shard.
         :return: None
         """
         configuration = {
@@ -112,17 +155,24 @@ class DataTransformersManager(PublisherSubscriberComponent):
             SUBSTRATE_NETWORK_DATA_TRANSFORMER_NAME:
                 start_substrate_network_data_transformer,
         }
+        sharded_transformers = self._get_sharded_transformers()
         for transformer_name, transformer_starter in configuration.items():
-            if transformer_name not in self.transformer_process_dict or not \
-                    self.transformer_process_dict[transformer_name].is_alive():
+            shards = sharded_transformers.get(transformer_name, {}).get(
+                'shards', 1)
+            for shard in get_shards(shards):
+                shard_name = get_shard_name(transformer_name, shard)
+                if shard_name in self.transformer_process_dict and \
+                        self.transformer_process_dict[shard_name].is_alive():
+                    continue
+
                 log_and_print("Attempting to start the {}.".format(
-                    transformer_name), self.logger)
+                    shard_name), self.logger)
                 transformer_process = multiprocessing.Process(
-                    target=transformer_starter, args=())
+                    target=transformer_starter,
+                    args=() if shard is None else (shard,))
                 transformer_process.daemon = True
                 transformer_process.start()
-                self._transformer_process_dict[
-                    transformer_name] = transformer_process
+                self._transformer_process_dict[shard_name] = transformer_process
 
     def _process_ping(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -2,12 +2,12 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.networks.cosmos import CosmosNetwork
@@ -71,14 +71,16 @@ class CosmosNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_network: CosmosNetwork) -> None:
+    def _load_number_state(self, cosmos_network: CosmosNetwork,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : network's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_number_state_helper_network(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -92,21 +94,24 @@ class CosmosNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_list_of_dicts_state(self, cosmos_network: CosmosNetwork) -> None:
+    def _load_list_of_dicts_state(
+            self, cosmos_network: CosmosNetwork,
+            redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : network's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -119,7 +124,7 @@ class CosmosNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
@@ -128,9 +133,11 @@ class CosmosNetworkTransformer(DataTransformer):
 
     def load_state(self, cosmos_network: CosmosNetwork) -> CosmosNetwork:
         self.logger.debug("Loading the state of %s from Redis", cosmos_network)
+        redis_state = self._get_parent_redis_state(
+            cosmos_network.parent_id, cosmos_network.parent_id)
 
-        self._load_number_state(cosmos_network)
-        self._load_list_of_dicts_state(cosmos_network)
+        self._load_number_state(cosmos_network, redis_state)
+        self._load_list_of_dicts_state(cosmos_network, redis_state)
 
         self.logger.debug(
             "Restored %s state: _proposals=%s, _last_monitored_cosmos_rest=%s",
@@ -3,12 +3,12 @@ import json
 import logging
 from ast import literal_eval
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.networks.substrate import SubstrateNetwork
@@ -74,15 +74,17 @@ class SubstrateNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_boolean_state(self, substrate_network: SubstrateNetwork) -> None:
+    def _load_boolean_state(self, substrate_network: SubstrateNetwork,
+                            redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's boolean metrics from
         redis. If the data from Redis cannot be obtained, the state won't be
         updated.
         :param substrate_network: The network state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : network's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_bool_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -95,7 +97,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -105,14 +107,16 @@ class SubstrateNetworkTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_number_state(self, substrate_network: SubstrateNetwork) -> None:
+    def _load_number_state(self, substrate_network: SubstrateNetwork,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : network's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_number_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -126,7 +130,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -134,14 +138,16 @@ class SubstrateNetworkTransformer(DataTransformer):
             set_fn(new_value)
 
     def _load_list_of_dicts_state(
-            self, substrate_network: SubstrateNetwork) -> None:
+            self, substrate_network: SubstrateNetwork,
+            redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : network's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper_network(
             substrate_network)
 
@@ -155,7 +161,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
@@ -166,10 +172,12 @@ class SubstrateNetworkTransformer(DataTransformer):
             self, substrate_network: SubstrateNetwork) -> SubstrateNetwork:
         self.logger.debug("Loading the state of %s from Redis",
                           substrate_network)
+        redis_state = self._get_parent_redis_state(
+            substrate_network.parent_id, substrate_network.parent_id)
 
-        self._load_boolean_state(substrate_network)
-        self._load_number_state(substrate_network)
-        self._load_list_of_dicts_state(substrate_network)
+        self._load_boolean_state(substrate_network, redis_state)
+        self._load_number_state(substrate_network, redis_state)
+        self._load_list_of_dicts_state(substrate_network, redis_state)
 
         self.logger.debug(
             "Restored %s state: _grandpa_stalled=%s, _public_prop_count=%s, "
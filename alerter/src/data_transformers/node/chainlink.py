@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple, Union, Type
+from typing import Dict, Tuple, Union, Type, Optional
 
 import pika
 import pika.exceptions
@@ -15,6 +15,7 @@ from src.monitorables.nodes.chainlink_node import ChainlinkNode
 from src.utils.constants.data import (VALID_CHAINLINK_SOURCES,
                                       RAW_TO_TRANSFORMED_CHAINLINK_METRICS,
                                       INT_CHAINLINK_METRICS)
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           CL_NODE_DT_INPUT_QUEUE_NAME,
                                           CHAINLINK_NODE_RAW_DATA_ROUTING_KEY,
@@ -24,15 +25,22 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   NodeIsDownException,
                                   MessageWasNotDeliveredException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import convert_to_float, convert_to_int, is_mutable
 
 
 class ChainlinkNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, shard,
+                         env.CHAINLINK_NODE_ALERTER_SHARDS)
+
+        self._input_queue = add_shard_suffix(CL_NODE_DT_INPUT_QUEUE_NAME,
+                                             shard)
+        self._raw_data_routing_key = add_shard_suffix(
+            CHAINLINK_NODE_RAW_DATA_ROUTING_KEY, shard)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -43,20 +51,20 @@ class ChainlinkNodeDataTransformer(DataTransformer):
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, 'topic', False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", CL_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(CL_NODE_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue, False, True, False,
+                                    False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", CL_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(CL_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-                                 CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue, RAW_DATA_EXCHANGE,
+                         self._raw_data_routing_key)
+        self.rabbitmq.queue_bind(self._input_queue, RAW_DATA_EXCHANGE,
+                                 self._raw_data_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(CL_NODE_DT_INPUT_QUEUE_NAME,
+        self.rabbitmq.basic_consume(self._input_queue,
                                     self._process_raw_data, False, False, None)
 
         # Set producing configuration
@@ -73,15 +81,17 @@ class ChainlinkNodeDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_node: ChainlinkNode) -> None:
+                           cl_node: ChainlinkNode,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param state_type: What type of number metrics we want to obtain
         :param cl_node: The node in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
         if state_type == int:
             metric_attributes = cl_node.get_int_metric_attributes()
@@ -99,20 +109,22 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             state_value = eval('cl_node.' + attribute)
             redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("cl_node.set_" + attribute + '(new_value)')
 
-    def _load_str_state(self, cl_node: ChainlinkNode) -> None:
+    def _load_str_state(self, cl_node: ChainlinkNode,
+                        redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's str metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cl_node: The node in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
         str_metric_attributes = cl_node.get_str_metric_attributes()
 
@@ -127,27 +139,29 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             state_value = eval('cl_node.' + attribute)
             redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = None if redis_value is None or redis_value == b'None' \
                 else redis_value.decode("utf-8")
             eval("cl_node.set_" + attribute + '(new_value)')
 
-    def _load_dict_state(self, cl_node: ChainlinkNode) -> None:
+    def _load_dict_state(self, cl_node: ChainlinkNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         Note that since dicts inherit different structures, this function
         cannot be generalised easily
         :param cl_node: The node in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
 
         # Load current_gas_price_info from Redis
         state_current_gas_price_info = cl_node.current_gas_price_info
-        redis_current_gas_price_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_current_gas_price_info(cl_node_id),
+        redis_current_gas_price_info = redis_state.get(
+            Keys.get_cl_node_current_gas_price_info(cl_node_id),
             bytes(json.dumps(state_current_gas_price_info), 'utf-8'))
         current_gas_price_info = {
             'percentile': None,
@@ -159,8 +173,8 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
         # Load balance_info from Redis
         state_balance_info = cl_node.balance_info
-        redis_balance_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_balance_info(cl_node_id),
+        redis_balance_info = redis_state.get(
+            Keys.get_cl_node_balance_info(cl_node_id),
             bytes(json.dumps(state_balance_info), 'utf-8'))
         balance_info = {} if redis_balance_info is None \
             else json.loads(redis_balance_info.decode("utf-8"))
@@ -168,11 +182,13 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
     def load_state(self, cl_node: ChainlinkNode) -> ChainlinkNode:
         self.logger.debug("Loading the state of %s from Redis", cl_node)
+        redis_state = self._get_parent_redis_state(
+            cl_node.parent_id, cl_node.node_id)
 
-        self._load_number_state(int, cl_node)
-        self._load_number_state(float, cl_node)
-        self._load_str_state(cl_node)
-        self._load_dict_state(cl_node)
+        self._load_number_state(int, cl_node, redis_state)
+        self._load_number_state(float, cl_node, redis_state)
+        self._load_str_state(cl_node, redis_state)
+        self._load_dict_state(cl_node, redis_state)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, "
@@ -292,7 +308,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _update_state".format(self))
 
-        return copy.deepcopy(transformed_data)
+        # The data for saving is not changed once computed, therefore the
+        # transformed data itself can be saved.
+        return transformed_data
 
     def _process_transformed_prometheus_data_for_alerting(
             self, transformed_prometheus_data: Dict) -> Dict:
@@ -304,7 +322,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -325,11 +343,13 @@ class ChainlinkNodeDataTransformer(DataTransformer):
                 pd_data[metric]['current'] = value
 
             # We will try and generalise the sub-dict creation, some metrics
-            # however need different processing, therefore ignore for now
+            # however need different processing, therefore ignore for now. The
+            # mutable values are copied because some of them, such as the
+            # current_gas_price_info, are changed in place by the node.
             ignore_metrics = ['went_down_at']
             for metric in pd_data:
                 if metric not in ignore_metrics:
-                    metric_value = eval('node.' + metric)
+                    metric_value = getattr(node, metric)
                     pd_data[metric]['previous'] = (copy.deepcopy(metric_value)
                                                    if is_mutable(metric_value)
                                                    else metric_value)
@@ -344,7 +364,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             node: ChainlinkNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_prometheus_data)
+            processed_data = self._copy_response(transformed_prometheus_data)
             pd_meta_data = processed_data['error']['meta_data']
 
             # Do current and previous for last_source_used
@@ -397,7 +417,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             node_metrics = prometheus_data['result']['data']
             node_id = meta_data['node_id']
             node: ChainlinkNode = self.state[node_id]
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = self._copy_response(prometheus_data)
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -415,13 +435,15 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
             # If the metric is enabled, transform the current_gas_price_info's
             # percentile into the correct type. Note that the raw value is a
-            # string.
+            # string, and that it is shared with the raw data, therefore it is
+            # replaced rather than changed in place.
             if td_node_metrics['current_gas_price_info']:
                 str_percentile = td_node_metrics['current_gas_price_info'][
                     'percentile']
-                td_node_metrics['current_gas_price_info'][
-                    'percentile'] = convert_to_float(
-                    str_percentile.replace('%', ''), None)
+                td_node_metrics['current_gas_price_info'] = dict(
+                    td_node_metrics['current_gas_price_info'],
+                    percentile=convert_to_float(
+                        str_percentile.replace('%', ''), None))
 
             # Add latest_usage to the balance_info if not empty
             if node_metrics['balance']:
@@ -465,7 +487,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name
             # from the meta data
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = self._copy_response(prometheus_data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_prometheus to
@@ -510,7 +532,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            CL_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            self._get_alerting_routing_key(
+                                CL_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                                data_for_alerting, 'node_parent_id'),
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
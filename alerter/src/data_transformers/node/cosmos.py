@@ -1,13 +1,12 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.nodes.cosmos_node import CosmosNode
@@ -18,21 +17,28 @@ from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, COSMOS_NODE_DT_INPUT_QUEUE_NAME,
     COSMOS_NODE_RAW_DATA_ROUTING_KEY, STORE_EXCHANGE, ALERT_EXCHANGE,
     HEALTH_CHECK_EXCHANGE, COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils import env
 from src.utils.cosmos import (
     get_load_number_state_helper, get_load_bool_state_helper,
     get_load_str_state_helper, get_load_dict_state_helper)
 from src.utils.exceptions import (
     ReceivedUnexpectedDataException, NodeIsDownException,
     MessageWasNotDeliveredException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import str_to_bool_strict, convert_to_int
 
 
 class CosmosNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, shard, env.COSMOS_NODE_ALERTER_SHARDS)
+
+        self._input_queue = add_shard_suffix(COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+                                             shard)
+        self._raw_data_routing_key = add_shard_suffix(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY, shard)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -43,21 +49,20 @@ class CosmosNodeDataTransformer(DataTransformer):
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(
             RAW_DATA_EXCHANGE, 'topic', False, True, False, False)
-        self.logger.info("Creating queue '%s'", COSMOS_NODE_DT_INPUT_QUEUE_NAME)
+        self.logger.info("Creating queue '%s'", self._input_queue)
         self.rabbitmq.queue_declare(
-            COSMOS_NODE_DT_INPUT_QUEUE_NAME, False, True, False, False)
+            self._input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", COSMOS_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, COSMOS_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue,
+                         RAW_DATA_EXCHANGE, self._raw_data_routing_key)
         self.rabbitmq.queue_bind(
-            COSMOS_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-            COSMOS_NODE_RAW_DATA_ROUTING_KEY)
+            self._input_queue, RAW_DATA_EXCHANGE, self._raw_data_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+        self.rabbitmq.basic_consume(self._input_queue,
                                     self._process_raw_data, False, False, None)
 
         # Set producing configuration
@@ -73,14 +78,16 @@ class CosmosNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_number_state(self, cosmos_node: CosmosNode,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_number_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -94,21 +101,23 @@ class CosmosNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_bool_state(self, cosmos_node: CosmosNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_bool_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -121,7 +130,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -131,14 +140,16 @@ class CosmosNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_str_state(self, cosmos_node: CosmosNode,
+                        redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_str_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -151,21 +162,23 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_dict_state(self, cosmos_node: CosmosNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_dict_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -178,7 +191,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
@@ -187,11 +200,13 @@ class CosmosNodeDataTransformer(DataTransformer):
 
     def load_state(self, cosmos_node: CosmosNode) -> CosmosNode:
         self.logger.debug("Loading the state of %s from Redis", cosmos_node)
+        redis_state = self._get_parent_redis_state(
+            cosmos_node.parent_id, cosmos_node.node_id)
 
-        self._load_number_state(cosmos_node)
-        self._load_bool_state(cosmos_node)
-        self._load_str_state(cosmos_node)
-        self._load_dict_state(cosmos_node)
+        self._load_number_state(cosmos_node, redis_state)
+        self._load_bool_state(cosmos_node, redis_state)
+        self._load_str_state(cosmos_node, redis_state)
+        self._load_dict_state(cosmos_node, redis_state)
 
         self.logger.debug(
             "Restored %s state: _went_down_at_prometheus=%s, "
@@ -376,7 +391,9 @@ class CosmosNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        # The data for saving is not changed once computed, therefore the
+        # transformed data itself can be saved.
+        return transformed_data
 
     def _process_transformed_tendermint_rpc_data_for_alerting(
             self, transformed_tendermint_rpc_data: Dict) -> Dict:
@@ -389,7 +406,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -405,9 +422,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Add previous for each metric
             pd_data['went_down_at'][
                 'previous'] = node.went_down_at_tendermint_rpc
-            pd_data['slashed']['previous'] = copy.deepcopy(node.slashed)
-            pd_data['missed_blocks']['previous'] = copy.deepcopy(
-                node.missed_blocks)
+            pd_data['slashed']['previous'] = node.slashed
+            pd_data['missed_blocks']['previous'] = node.missed_blocks
             pd_data['is_syncing']['previous'] = node.is_syncing
             ## Check if the current node is a mev-tendermint node, if so send the previous state of the mev-tendermint metrics
             if td_meta_data['is_mev_tendermint_node']:
@@ -420,7 +436,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_tendermint_rpc_data)
+            processed_data = self._copy_response(
+                transformed_tendermint_rpc_data)
             if td_error_code == downtime_exception.code:
                 td_data = transformed_tendermint_rpc_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -448,7 +465,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -472,7 +489,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_cosmos_rest_data)
+            processed_data = self._copy_response(transformed_cosmos_rest_data)
             if td_error_code == downtime_exception.code:
                 td_data = transformed_cosmos_rest_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -500,7 +517,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -524,7 +541,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_prometheus_data)
+            processed_data = self._copy_response(transformed_prometheus_data)
             if td_error_code == downtime_exception.code:
                 td_data = transformed_prometheus_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -580,7 +597,7 @@ class CosmosNodeDataTransformer(DataTransformer):
         if 'result' in tendermint_rpc_data:
             meta_data = tendermint_rpc_data['result']['meta_data']
             node_metrics = tendermint_rpc_data['result']['data']
-            transformed_data = copy.deepcopy(tendermint_rpc_data)
+            transformed_data = self._copy_response(tendermint_rpc_data)
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
             node_id = meta_data['node_id']
@@ -650,7 +667,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(tendermint_rpc_data)
+            transformed_data = self._copy_response(tendermint_rpc_data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_tendermint_rpc to
@@ -676,7 +693,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             # meta_data by deleting the monitor_name and changing the time key
             # to last_monitored key
             meta_data = cosmos_rest_data['result']['meta_data']
-            transformed_data = copy.deepcopy(cosmos_rest_data)
+            transformed_data = self._copy_response(cosmos_rest_data)
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
             del td_meta_data['monitor_name']
@@ -694,7 +711,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(cosmos_rest_data)
+            transformed_data = self._copy_response(cosmos_rest_data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_cosmos_rest to the
@@ -717,7 +734,7 @@ class CosmosNodeDataTransformer(DataTransformer):
         if 'result' in prometheus_data:
             meta_data = prometheus_data['result']['meta_data']
             node_metrics = prometheus_data['result']['data']
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = self._copy_response(prometheus_data)
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -750,7 +767,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = self._copy_response(prometheus_data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_prometheus to
@@ -806,7 +823,9 @@ class CosmosNodeDataTransformer(DataTransformer):
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            self._get_alerting_routing_key(
+                                COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                                data_for_alerting, 'node_parent_id'),
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -912,8 +931,9 @@ class CosmosNodeDataTransformer(DataTransformer):
         # if acknowledgement fails the state would be erroneous when processing
         # the data again. Note, only update the state if there were no
         # processing errors. IMP: We are allowed to update the state before
-        # sending the data because deep copies where constructed when computing
-        # data_for_alerting, data_for_saving and transformed_data.
+        # sending the data because the state is updated by replacing its
+        # values, which are shared with data_for_alerting, data_for_saving and
+        # transformed_data, rather than by changing them in place.
         if not processing_error:
             try:
                 self._update_state(transformed_data)
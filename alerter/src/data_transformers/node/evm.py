@@ -1,8 +1,7 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Union, Type, Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,6 +11,7 @@ from src.data_store.redis.redis_api import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.nodes.evm_node import EVMNode
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     TOPIC, EVM_NODE_DT_INPUT_QUEUE_NAME, EVM_NODE_RAW_DATA_ROUTING_KEY,
@@ -19,6 +19,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   NodeIsDownException,
                                   MessageWasNotDeliveredException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import (convert_to_int, convert_to_float,
                              convert_none_to_bool)
 
@@ -26,9 +27,14 @@ from src.utils.types import (convert_to_int, convert_to_float,
 class EVMNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, shard, env.EVM_NODE_ALERTER_SHARDS)
+
+        self._input_queue = add_shard_suffix(EVM_NODE_DT_INPUT_QUEUE_NAME,
+                                             shard)
+        self._raw_data_routing_key = add_shard_suffix(
+            EVM_NODE_RAW_DATA_ROUTING_KEY, shard)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -40,21 +46,20 @@ class EVMNodeDataTransformer(DataTransformer):
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, TOPIC, False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", EVM_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(EVM_NODE_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue, False, True, False,
+                                    False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", EVM_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, EVM_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(EVM_NODE_DT_INPUT_QUEUE_NAME,
-                                 RAW_DATA_EXCHANGE,
-                                 EVM_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue, RAW_DATA_EXCHANGE,
+                         self._raw_data_routing_key)
+        self.rabbitmq.queue_bind(self._input_queue, RAW_DATA_EXCHANGE,
+                                 self._raw_data_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(EVM_NODE_DT_INPUT_QUEUE_NAME,
+        self.rabbitmq.basic_consume(self._input_queue,
                                     self._process_raw_data, False, False, None)
 
         # Set producing configuration
@@ -71,15 +76,17 @@ class EVMNodeDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           evm_node: EVMNode) -> None:
+                           evm_node: EVMNode,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param state_type: What type of number metrics we want to obtain
         :param evm_node: The node in question
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(evm_node.parent_id)
         evm_node_id = evm_node.node_id
         if state_type == int:
             metric_attributes = evm_node.get_int_metric_attributes()
@@ -99,7 +106,7 @@ class EVMNodeDataTransformer(DataTransformer):
             state_value = eval('evm_node.' + attribute)
             redis_key = eval('Keys.get_evm_node_' + attribute + '(evm_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
@@ -113,10 +120,12 @@ class EVMNodeDataTransformer(DataTransformer):
         :return: The loaded EVM node
         """
         self.logger.debug("Loading the state of %s from Redis", evm_node)
+        redis_state = self._get_parent_redis_state(
+            evm_node.parent_id, evm_node.node_id)
 
-        self._load_number_state(int, evm_node)
-        self._load_number_state(float, evm_node)
-        self._load_number_state(bool, evm_node)
+        self._load_number_state(int, evm_node, redis_state)
+        self._load_number_state(float, evm_node, redis_state)
+        self._load_number_state(bool, evm_node, redis_state)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, _syncing=%s, "
@@ -175,8 +184,10 @@ class EVMNodeDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The data for saving is not changed once computed, therefore the
+        # transformed data itself can be saved.
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -200,7 +211,7 @@ class EVMNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -225,7 +236,7 @@ class EVMNodeDataTransformer(DataTransformer):
             node: EVMNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = self._copy_response(transformed_data)
 
             if td_error_code == downtime_exception.code:
                 td_metrics = transformed_data['error']['data']
@@ -253,7 +264,7 @@ class EVMNodeDataTransformer(DataTransformer):
 
         if 'result' in data:
             meta_data = data['result']['meta_data']
-            transformed_data = copy.deepcopy(data)
+            transformed_data = self._copy_response(data)
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -275,7 +286,7 @@ class EVMNodeDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = self._copy_response(data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at to the time of error
@@ -306,7 +317,9 @@ class EVMNodeDataTransformer(DataTransformer):
             self, transformed_data: Dict, data_for_alerting: Dict,
             data_for_saving: Dict) -> None:
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            self._get_alerting_routing_key(
+                                EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                                data_for_alerting, 'node_parent_id'),
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -1,19 +1,19 @@
-import copy
 import json
 import logging
 from ast import literal_eval
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.nodes.substrate_node import SubstrateNode
 from src.utils.constants.data import (
     VALID_SUBSTRATE_NODE_SOURCES, INT_SUBSTRATE_NODE_WS_METRICS)
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY,
@@ -21,6 +21,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (
     ReceivedUnexpectedDataException, NodeIsDownException,
     MessageWasNotDeliveredException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.substrate import (
     get_load_number_state_helper, get_load_bool_state_helper,
     get_load_str_state_helper, get_load_dict_state_helper,
@@ -31,9 +32,15 @@ from src.utils.types import str_to_bool_strict
 class SubstrateNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, shard,
+                         env.SUBSTRATE_NODE_ALERTER_SHARDS)
+
+        self._input_queue = add_shard_suffix(
+            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, shard)
+        self._raw_data_routing_key = add_shard_suffix(
+            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY, shard)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -44,22 +51,20 @@ class SubstrateNodeDataTransformer(DataTransformer):
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(
             RAW_DATA_EXCHANGE, 'topic', False, True, False, False)
-        self.logger.info("Creating queue '%s'",
-                         SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(
-            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, False, True, False, False)
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue, False, True, False,
+                                    False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue, RAW_DATA_EXCHANGE,
+                         self._raw_data_routing_key)
+        self.rabbitmq.queue_bind(self._input_queue, RAW_DATA_EXCHANGE,
+                                 self._raw_data_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
+        self.rabbitmq.basic_consume(self._input_queue,
                                     self._process_raw_data, False, False, None)
 
         # Set producing configuration
@@ -75,14 +80,16 @@ class SubstrateNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_number_state(self, substrate_node: SubstrateNode,
+                           redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_number_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -96,21 +103,23 @@ class SubstrateNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_bool_state(self, substrate_node: SubstrateNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_bool_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -123,7 +132,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -133,14 +142,16 @@ class SubstrateNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_str_state(self, substrate_node: SubstrateNode,
+                        redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_str_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -153,21 +164,23 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_dict_state(self, substrate_node: SubstrateNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_state: The metrics stored in the Redis hash of the
+                          : node's parent
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_dict_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -180,16 +193,16 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
-    def _load_list_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_list_state(self, substrate_node: SubstrateNode,
+                         redis_state: Dict[str, Optional[bytes]]) -> None:
 
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_list_state_helper(substrate_node)
 
         for configuration in loading_helper:
@@ -197,19 +210,21 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_state.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             set_fn(new_value)
 
     def load_state(self, substrate_node: SubstrateNode) -> SubstrateNode:
         self.logger.debug("Loading the state of %s from Redis", substrate_node)
+        redis_state = self._get_parent_redis_state(
+            substrate_node.parent_id, substrate_node.node_id)
 
-        self._load_number_state(substrate_node)
-        self._load_bool_state(substrate_node)
-        self._load_str_state(substrate_node)
-        self._load_dict_state(substrate_node)
-        self._load_list_state(substrate_node)
+        self._load_number_state(substrate_node, redis_state)
+        self._load_bool_state(substrate_node, redis_state)
+        self._load_str_state(substrate_node, redis_state)
+        self._load_dict_state(substrate_node, redis_state)
+        self._load_list_state(substrate_node, redis_state)
 
         self.logger.debug(
             "Restored %s state: _last_monitored_websocket=%s, "
@@ -237,7 +252,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
     def _transform_websocket_data(self, websocket_data: Dict) -> Dict:
         if 'result' in websocket_data:
             meta_data = websocket_data['result']['meta_data']
-            transformed_data = copy.deepcopy(websocket_data)
+            transformed_data = self._copy_response(websocket_data)
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -260,33 +275,41 @@ class SubstrateNodeDataTransformer(DataTransformer):
                 td_node_metrics[transformed_metric] = literal_eval(
                     str(td_node_metrics[transformed_metric]))
 
-            if td_node_metrics['eras_stakers']:
-                transformed_value = literal_eval(
-                    str(td_node_metrics['eras_stakers']['total']))
+            # The eras_stakers and historical values are shared with the raw
+            # data, therefore they are replaced rather than changed in place.
+            eras_stakers = td_node_metrics['eras_stakers']
+            if eras_stakers:
+                transformed_eras_stakers = dict(eras_stakers)
+                transformed_value = literal_eval(str(eras_stakers['total']))
                 if transformed_value and token_decimals:
                     transformed_value = round(transformed_value /
                                               (10 ** token_decimals), 2)
-                td_node_metrics['eras_stakers']['total'] = transformed_value
+                transformed_eras_stakers['total'] = transformed_value
 
-                transformed_value = literal_eval(
-                    str(td_node_metrics['eras_stakers']['own']))
+                transformed_value = literal_eval(str(eras_stakers['own']))
                 if transformed_value and token_decimals:
                     transformed_value = round(transformed_value /
                                               (10 ** token_decimals), 2)
-                td_node_metrics['eras_stakers']['own'] = transformed_value
+                transformed_eras_stakers['own'] = transformed_value
 
-                if td_node_metrics['eras_stakers']['others']:
-                    for entry in td_node_metrics['eras_stakers']['others']:
+                if eras_stakers['others']:
+                    transformed_eras_stakers['others'] = []
+                    for entry in eras_stakers['others']:
                         transformed_value = literal_eval(str(entry['value']))
                         if transformed_value and token_decimals:
                             transformed_value = round(transformed_value /
                                                       (10 ** token_decimals), 2)
-                        entry['value'] = transformed_value
+                        transformed_eras_stakers['others'].append(
+                            dict(entry, value=transformed_value))
+
+                td_node_metrics['eras_stakers'] = transformed_eras_stakers
 
             if td_node_metrics['historical'] and token_decimals:
-                for block in td_node_metrics['historical']:
-                    block['slashed_amount'] = round(block['slashed_amount'] /
-                                                    (10 ** token_decimals), 2)
+                td_node_metrics['historical'] = [
+                    dict(block, slashed_amount=round(
+                        block['slashed_amount'] / (10 ** token_decimals), 2))
+                    for block in td_node_metrics['historical']
+                ]
 
             del td_node_metrics['system_properties']
             # Transform the meta_data by deleting the monitor_name and changing
@@ -307,7 +330,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(websocket_data)
+            transformed_data = self._copy_response(websocket_data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_websocket to
@@ -410,7 +433,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -450,7 +473,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             node: SubstrateNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_websocket_data)
+            processed_data = self._copy_response(transformed_websocket_data)
             if td_error_code == downtime_exception.code:
                 td_data = transformed_websocket_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -489,7 +512,9 @@ class SubstrateNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        # The data for saving is not changed once computed, therefore the
+        # transformed data itself can be saved.
+        return transformed_data
 
     def _process_transformed_data_for_alerting(
             self, transformed_data: Dict) -> Dict:
@@ -551,7 +576,9 @@ class SubstrateNodeDataTransformer(DataTransformer):
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            self._get_alerting_routing_key(
+                                SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                                data_for_alerting, 'node_parent_id'),
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -657,8 +684,9 @@ class SubstrateNodeDataTransformer(DataTransformer):
         # if acknowledgement fails the state would be erroneous when processing
         # the data again. Note, only update the state if there were no
         # processing errors. IMP: We are allowed to update the state before
-        # sending the data because deep copies where constructed when computing
-        # data_for_alerting, data_for_saving and transformed_data.
+        # sending the data because the state is updated by replacing its
+        # values, which are shared with data_for_alerting, data_for_saving and
+        # transformed_data, rather than by changing them in place.
         if not processing_error:
             try:
                 self._update_state(transformed_data)
@@ -1,8 +1,7 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,6 +11,7 @@ from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.system import System
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     SYSTEM_DT_INPUT_QUEUE_NAME, SYSTEM_RAW_DATA_ROUTING_KEY,
@@ -19,15 +19,20 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   SystemIsDownException,
                                   MessageWasNotDeliveredException)
+from src.utils.sharding import add_shard_suffix
 from src.utils.types import convert_to_float
 
 
 class SystemDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0, shard: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, shard, env.SYSTEM_ALERTER_SHARDS)
+
+        self._input_queue = add_shard_suffix(SYSTEM_DT_INPUT_QUEUE_NAME, shard)
+        self._raw_data_routing_key = add_shard_suffix(
+            SYSTEM_RAW_DATA_ROUTING_KEY, shard)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -39,21 +44,20 @@ class SystemDataTransformer(DataTransformer):
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, TOPIC, False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", SYSTEM_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(SYSTEM_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", self._input_queue)
+        self.rabbitmq.queue_declare(self._input_queue, False, True, False,
+                                    False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", SYSTEM_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE,
-                         SYSTEM_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(SYSTEM_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-                                 SYSTEM_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", self._input_queue, RAW_DATA_EXCHANGE,
+                         self._raw_data_routing_key)
+        self.rabbitmq.queue_bind(self._input_queue, RAW_DATA_EXCHANGE,
+                                 self._raw_data_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SYSTEM_DT_INPUT_QUEUE_NAME,
+        self.rabbitmq.basic_consume(self._input_queue,
                                     self._process_raw_data, False, False, None)
 
         # Set producing configuration
@@ -75,13 +79,13 @@ class SystemDataTransformer(DataTransformer):
         # state won't be updated.
 
         self.logger.debug("Loading the state of %s from Redis", system)
-        redis_hash = Keys.get_hash_parent(system.parent_id)
         system_id = system.system_id
+        redis_state = self._get_parent_redis_state(system.parent_id, system_id)
 
         # Load process_cpu_seconds_total from Redis
         state_process_cpu_seconds_total = system.process_cpu_seconds_total
-        redis_process_cpu_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_process_cpu_seconds_total(system_id),
+        redis_process_cpu_seconds_total = redis_state.get(
+            Keys.get_system_process_cpu_seconds_total(system_id),
             bytes(str(state_process_cpu_seconds_total), 'utf8'))
         redis_process_cpu_seconds_total = 'None' if \
             redis_process_cpu_seconds_total is None \
@@ -92,8 +96,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load process_memory_usage from Redis
         state_process_memory_usage = system.process_memory_usage
-        redis_process_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_process_memory_usage(system_id),
+        redis_process_memory_usage = redis_state.get(
+            Keys.get_system_process_memory_usage(system_id),
             bytes(str(state_process_memory_usage), 'utf-8'))
         redis_process_memory_usage = 'None' if \
             redis_process_memory_usage is None \
@@ -104,8 +108,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load virtual_memory_usage from Redis
         state_virtual_memory_usage = system.virtual_memory_usage
-        redis_virtual_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_virtual_memory_usage(system_id),
+        redis_virtual_memory_usage = redis_state.get(
+            Keys.get_system_virtual_memory_usage(system_id),
             bytes(str(state_virtual_memory_usage), 'utf-8'))
         redis_virtual_memory_usage = 'None' if \
             redis_virtual_memory_usage is None \
@@ -116,8 +120,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load open_file_descriptors from Redis
         state_open_file_descriptors = system.open_file_descriptors
-        redis_open_file_descriptors = self.redis.hget(
-            redis_hash, Keys.get_system_open_file_descriptors(system_id),
+        redis_open_file_descriptors = redis_state.get(
+            Keys.get_system_open_file_descriptors(system_id),
             bytes(str(state_open_file_descriptors), 'utf-8'))
         redis_open_file_descriptors = 'None' if \
             redis_open_file_descriptors is None \
@@ -128,8 +132,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_cpu_usage from Redis
         state_system_cpu_usage = system.system_cpu_usage
-        redis_system_cpu_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_cpu_usage(system_id),
+        redis_system_cpu_usage = redis_state.get(
+            Keys.get_system_system_cpu_usage(system_id),
             bytes(str(state_system_cpu_usage), 'utf-8'))
         redis_system_cpu_usage = 'None' if redis_system_cpu_usage is None \
             else redis_system_cpu_usage.decode("utf-8")
@@ -138,8 +142,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_ram_usage from Redis
         state_system_ram_usage = system.system_ram_usage
-        redis_system_ram_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_ram_usage(system_id),
+        redis_system_ram_usage = redis_state.get(
+            Keys.get_system_system_ram_usage(system_id),
             bytes(str(state_system_ram_usage), 'utf-8'))
         redis_system_ram_usage = 'None' if redis_system_ram_usage is None \
             else redis_system_ram_usage.decode("utf-8")
@@ -148,8 +152,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_storage_usage from Redis
         state_system_storage_usage = system.system_storage_usage
-        redis_system_storage_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_storage_usage(system_id),
+        redis_system_storage_usage = redis_state.get(
+            Keys.get_system_system_storage_usage(system_id),
             bytes(str(state_system_storage_usage), 'utf-8'))
         redis_system_storage_usage = 'None' \
             if redis_system_storage_usage is None \
@@ -161,8 +165,7 @@ class SystemDataTransformer(DataTransformer):
         # Load network_transmit_bytes_per_second from Redis
         state_network_transmit_bytes_per_second = \
             system.network_transmit_bytes_per_second
-        redis_network_transmit_bytes_per_second = self.redis.hget(
-            redis_hash,
+        redis_network_transmit_bytes_per_second = redis_state.get(
             Keys.get_system_network_transmit_bytes_per_second(system_id),
             bytes(str(state_network_transmit_bytes_per_second), 'utf-8'))
         redis_network_transmit_bytes_per_second = 'None' if \
@@ -176,8 +179,7 @@ class SystemDataTransformer(DataTransformer):
         # Load network_receive_bytes_per_second from Redis
         state_network_receive_bytes_per_second = \
             system.network_receive_bytes_per_second
-        redis_network_receive_bytes_per_second = self.redis.hget(
-            redis_hash,
+        redis_network_receive_bytes_per_second = redis_state.get(
             Keys.get_system_network_receive_bytes_per_second(system_id),
             bytes(str(state_network_receive_bytes_per_second), 'utf-8'))
         redis_network_receive_bytes_per_second = 'None' if \
@@ -190,8 +192,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load network_transmit_bytes_total from Redis
         state_network_transmit_bytes_total = system.network_transmit_bytes_total
-        redis_network_transmit_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_transmit_bytes_total(system_id),
+        redis_network_transmit_bytes_total = redis_state.get(
+            Keys.get_system_network_transmit_bytes_total(system_id),
             bytes(str(state_network_transmit_bytes_total), 'utf-8'))
         redis_network_transmit_bytes_total = 'None' if \
             redis_network_transmit_bytes_total is None \
@@ -202,8 +204,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load network_receive_bytes_total from Redis
         state_network_receive_bytes_total = system.network_receive_bytes_total
-        redis_network_receive_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_receive_bytes_total(system_id),
+        redis_network_receive_bytes_total = redis_state.get(
+            Keys.get_system_network_receive_bytes_total(system_id),
             bytes(str(state_network_receive_bytes_total), 'utf-8'))
         redis_network_receive_bytes_total = 'None' if \
             redis_network_receive_bytes_total is None \
@@ -215,8 +217,7 @@ class SystemDataTransformer(DataTransformer):
         # Load disk_io_time_seconds_in_interval from Redis
         state_disk_io_time_seconds_in_interval = \
             system.disk_io_time_seconds_in_interval
-        redis_disk_io_time_seconds_in_interval = self.redis.hget(
-            redis_hash,
+        redis_disk_io_time_seconds_in_interval = redis_state.get(
             Keys.get_system_disk_io_time_seconds_in_interval(system_id),
             bytes(str(state_disk_io_time_seconds_in_interval), 'utf-8'))
         redis_disk_io_time_seconds_in_interval = 'None' \
@@ -229,8 +230,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load disk_io_time_seconds_total from Redis
         state_disk_io_time_seconds_total = system.disk_io_time_seconds_total
-        redis_disk_io_time_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_disk_io_time_seconds_total(system_id),
+        redis_disk_io_time_seconds_total = redis_state.get(
+            Keys.get_system_disk_io_time_seconds_total(system_id),
             bytes(str(state_disk_io_time_seconds_total), 'utf-8'))
         redis_disk_io_time_seconds_total = 'None' if \
             redis_disk_io_time_seconds_total is None \
@@ -241,8 +242,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = system.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_system_last_monitored(system_id),
+        redis_last_monitored = redis_state.get(
+            Keys.get_system_last_monitored(system_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -251,8 +252,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load went_down_at from Redis
         state_went_down_at = system.went_down_at
-        redis_went_down_at = self.redis.hget(
-            redis_hash, Keys.get_system_went_down_at(system_id),
+        redis_went_down_at = redis_state.get(
+            Keys.get_system_went_down_at(system_id),
             bytes(str(state_went_down_at), 'utf-8'))
         redis_went_down_at = 'None' if redis_went_down_at is None \
             else redis_went_down_at.decode("utf-8")
@@ -347,8 +348,10 @@ class SystemDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The data for saving is not changed once computed, therefore the
+        # transformed data itself can be saved.
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -372,7 +375,7 @@ class SystemDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -420,7 +423,7 @@ class SystemDataTransformer(DataTransformer):
             system: System = self.state[td_system_id]
             downtime_exception = SystemIsDownException(td_system_name)
 
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = self._copy_response(transformed_data)
 
             if td_error_code == downtime_exception.code:
                 td_metrics = transformed_data['error']['data']
@@ -485,7 +488,7 @@ class SystemDataTransformer(DataTransformer):
                     disk_io_time_seconds_total - \
                     system.disk_io_time_seconds_total
 
-            transformed_data = copy.deepcopy(data)
+            transformed_data = self._copy_response(data)
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -514,7 +517,7 @@ class SystemDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = self._copy_response(data)
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at to the time of error
@@ -545,7 +548,9 @@ class SystemDataTransformer(DataTransformer):
                                     data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+                            self._get_alerting_routing_key(
+                                SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+                                data_for_alerting, 'system_parent_id'),
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -1 +1,2 @@
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.message_broker.rabbitmq.rabbitmq_api import SharedRabbitMQApi
@@ -1,5 +1,7 @@
+import functools
 import json
 import logging
+import threading
 import time
 from datetime import timedelta
 from typing import List, Optional, Union, Dict, Callable, Any, Sequence
@@ -30,6 +32,9 @@ class RabbitMQApi:
         self._host = host
         self._connection = None
         self._channel = None
+        # A channel used only by basic_publish_batch, see below
+        self._publishing_channel = None
+        self._returned_messages = []
         self._port = port  # Port used by the AMQP 0-9-1 and 1.0 clients
         self._username = username
         self._password = password
@@ -301,6 +306,74 @@ class RabbitMQApi:
             # If a message is not delivered, the exception below is raised.
             raise MessageWasNotDeliveredException(e)
 
+    def _on_message_returned(self, channel, method: pika.spec.Basic.Return,
+                             properties: pika.spec.BasicProperties,
+                             body: bytes) -> None:
+        self._returned_messages.append(
+            (method.exchange, method.routing_key, body))
+
+    # Should not be used if connection has not yet been initialised
+    def basic_publish_batch_unsafe(self, messages: List[Dict]) -> List[int]:
+        # Publishes the messages in a single transaction, so that the broker is
+        # waited for once per batch rather than once per message. This is done
+        # on a channel of its own, as a channel in confirm mode cannot be made
+        # transactional, and as acks sent on a transactional channel would
+        # only take effect once committed.
+        if self._publishing_channel is None or \
+                not self._publishing_channel.is_open:
+            self._logger.info("Creating a RabbitMQ Channel for publishing")
+            self._publishing_channel = self.connection.channel()
+            self._publishing_channel.tx_select()
+            # The broker returns the unroutable mandatory messages before the
+            # transaction is committed. The callback is added to the underlying
+            # channel so that they are recorded as soon as they are received,
+            # as the blocking channel would only dispatch them while consuming.
+            self._publishing_channel._impl.add_on_return_callback(
+                self._on_message_returned)
+
+        self._returned_messages = []
+        try:
+            for message in messages:
+                self._publishing_channel.basic_publish(
+                    message['exchange'], message['routing_key'],
+                    message['body'], message['properties'],
+                    message['mandatory'])
+            self._publishing_channel.tx_commit()
+        except Exception:
+            # Discard the channel so that the messages published so far are
+            # not committed with the next batch.
+            if self._publishing_channel.is_open:
+                self._publishing_channel.close()
+            self._publishing_channel = None
+            raise
+
+        # Match every returned message with the message it was published as
+        published = {}
+        for index, message in enumerate(messages):
+            body = message['body']
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            published.setdefault(
+                (message['exchange'], message['routing_key'], body), []
+            ).append(index)
+        returned = []
+        for returned_message in self._returned_messages:
+            if published.get(returned_message):
+                returned.append(published[returned_message].pop(0))
+
+        return sorted(returned)
+
+    def basic_publish_batch(self, messages: List[Dict]) \
+            -> Optional[Union[List[int], int]]:
+        # Every message is a dict holding the exchange, routing_key, body (str
+        # or bytes), properties and mandatory of the message. Returns the
+        # indices of the mandatory messages which could not be routed, and
+        # were therefore returned by the broker rather than delivered.
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self.basic_publish_batch_unsafe, [messages], -1)
+
     def basic_consume(self, queue: str, on_message_callback: Callable,
                       auto_ack: bool = False, exclusive: bool = False,
                       consumer_tag: str = None) -> Optional[int]:
@@ -353,6 +426,15 @@ class RabbitMQApi:
         if self._connection_initialised():
             return self._safe(self.channel.basic_qos, args, -1)
 
+    def call_later(self, delay: float, callback: Callable) -> Optional[int]:
+        # Schedules the callback to be called by the connection, for example
+        # while consuming, after delay seconds. Perform operation only if a
+        # connection has been initialised, if not, this function will throw a
+        # ConnectionNotInitialised exception
+        args = [delay, callback]
+        if self._connection_initialised():
+            return self._safe(self.connection.call_later, args, -1)
+
     def exchange_declare(self, exchange: str, exchange_type: str = TOPIC,
                          passive: bool = False, durable: bool = False,
                          auto_delete: bool = False, internal: bool = False) \
@@ -416,3 +498,70 @@ class RabbitMQApi:
                                           default_return: Any) -> None:
         while function(*args) == default_return:
             time.sleep(self.connection_check_time_interval_seconds)
+
+
+def _with_lock(operation: Callable) -> Callable:
+    # Performs an operation of a SharedRabbitMQApi while holding its lock, so
+    # that the connection and channel used by the operation are read under the
+    # lock, and are not replaced by another thread in the meantime.
+    @functools.wraps(operation)
+    def locked_operation(self: 'SharedRabbitMQApi', *args, **kwargs):
+        with self.lock:
+            return operation(self, *args, **kwargs)
+
+    return locked_operation
+
+
+class SharedRabbitMQApi(RabbitMQApi):
+    """
+    A RabbitMQApi which can be shared by components running in different
+    threads of the same process. Since pika connections are not thread-safe,
+    every operation performed on the connection is serialised using a
+    re-entrant lock. The lock is taken before the connection or channel is
+    read.
+    """
+
+    def __init__(self, logger: logging.Logger, host: str = 'localhost',
+                 port: int = 5672, username: str = '', password: str = '',
+                 connection_check_time_interval: timedelta = timedelta(
+                     seconds=30)) \
+            -> None:
+        super().__init__(logger, host, port, username, password,
+                         connection_check_time_interval)
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    def _safe(self, function, args: List[Any], default_return: Any):
+        with self._lock:
+            return super()._safe(function, args, default_return)
+
+    queue_declare = _with_lock(RabbitMQApi.queue_declare)
+    queue_bind = _with_lock(RabbitMQApi.queue_bind)
+    basic_publish = _with_lock(RabbitMQApi.basic_publish)
+    basic_consume = _with_lock(RabbitMQApi.basic_consume)
+    basic_get = _with_lock(RabbitMQApi.basic_get)
+    start_consuming = _with_lock(RabbitMQApi.start_consuming)
+    stop_consuming = _with_lock(RabbitMQApi.stop_consuming)
+    basic_ack = _with_lock(RabbitMQApi.basic_ack)
+    basic_nack = _with_lock(RabbitMQApi.basic_nack)
+    basic_qos = _with_lock(RabbitMQApi.basic_qos)
+    call_later = _with_lock(RabbitMQApi.call_later)
+    exchange_declare = _with_lock(RabbitMQApi.exchange_declare)
+    confirm_delivery = _with_lock(RabbitMQApi.confirm_delivery)
+    queue_purge = _with_lock(RabbitMQApi.queue_purge)
+    exchange_delete = _with_lock(RabbitMQApi.exchange_delete)
+    queue_delete = _with_lock(RabbitMQApi.queue_delete)
+    new_channel = _with_lock(RabbitMQApi.new_channel)
+
+    @_with_lock
+    def process_data_events(self, time_limit: float = 0) -> Optional[int]:
+        # Services the connection (for example heartbeats) while no other
+        # operation is being performed. Perform operation only if a connection
+        # has been initialised, if not, this function will throw a
+        # ConnectionNotInitialised exception
+        args = [time_limit]
+        if self._connection_initialised():
+            return self._safe(self.connection.process_data_events, args, -1)
@@ -0,0 +1,293 @@
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.data_store.redis import RedisApi, Keys
+
+
+class TendermintBlockCache:
+    """
+    This class caches the per-height Tendermint RPC data that the Cosmos node
+    monitors need to compute the historical validator metrics. Since every
+    validator monitor of a chain needs the same data for the same heights, the
+    cache is chain-scoped (keyed by parent_id and height) and lives in Redis so
+    that it can be shared by the monitor processes.
+
+    Every monitor using the cache subscribes to it by registering the last
+    height it monitored. A height is evicted once all the subscribed monitors
+    have monitored it. A subscriber which does not update its height for more
+    than subscriber_expiry (for example because its monitor was removed) is
+    ignored and unsubscribed, and no more than max_cached_heights heights below
+    the highest cached height are kept, so that the cache cannot grow forever.
+    """
+
+    def __init__(self, redis: RedisApi, parent_id: str, subscriber_id: str,
+                 subscriber_expiry: timedelta = timedelta(minutes=10),
+                 max_cached_heights: int = 1000) -> None:
+        self._redis = redis
+        self._parent_id = parent_id
+        self._subscriber_id = subscriber_id
+        self._subscriber_expiry = subscriber_expiry
+        self._max_cached_heights = max_cached_heights
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def parent_id(self) -> str:
+        return self._parent_id
+
+    @property
+    def subscriber_id(self) -> str:
+        return self._subscriber_id
+
+    @property
+    def subscriber_expiry(self) -> timedelta:
+        return self._subscriber_expiry
+
+    @property
+    def max_cached_heights(self) -> int:
+        return self._max_cached_heights
+
+    def get(self, height: int) -> Optional[Dict]:
+        """
+        This function returns the cached data of height <height>
+        :param height: The height whose data should be returned
+        :return: The cached data if it exists
+               : None otherwise
+        """
+        cached_data = self.redis.hget(
+            Keys.get_cosmos_tendermint_block_cache(self.parent_id),
+            str(height))
+        return None if cached_data is None else json.loads(cached_data)
+
+    def set(self, height: int, data: Dict) -> None:
+        """
+        This function stores the data of height <height> in the cache
+        :param height: The height whose data is being cached
+        :param data: The data to be cached
+        :return: None
+        """
+        self.redis.hset(Keys.get_cosmos_tendermint_block_cache(self.parent_id),
+                        str(height), json.dumps(data))
+
+    def mark_monitored(self, height: int) -> None:
+        """
+        This function registers that the subscriber monitored every height up
+        to <height>, and evicts the heights which are no longer needed by any
+        of the subscribers.
+        :param height: The last height monitored by the subscriber
+        :return: None
+        """
+        subscribers_key = Keys.get_cosmos_tendermint_block_cache_subscribers(
+            self.parent_id)
+        cache_key = Keys.get_cosmos_tendermint_block_cache(self.parent_id)
+        timestamp = datetime.now().timestamp()
+        self.redis.hset(subscribers_key, self.subscriber_id, json.dumps({
+            'height': height, 'timestamp': timestamp
+        }))
+
+        # Compute the lowest height monitored by the live subscribers, and
+        # unsubscribe the expired ones.
+        lowest_height_monitored = height
+        expired_subscribers = []
+        for subscriber_id, progress in self.redis.hgetall(
+                subscribers_key).items():
+            progress = json.loads(progress)
+            if (timestamp - progress['timestamp']
+                    > self.subscriber_expiry.total_seconds()):
+                expired_subscribers.append(subscriber_id)
+            else:
+                lowest_height_monitored = min(lowest_height_monitored,
+                                              progress['height'])
+
+        if expired_subscribers:
+            self.redis.hremove(subscribers_key, *expired_subscribers)
+
+        cached_heights = [int(cached_height) for cached_height in
+                          (self.redis.hkeys(cache_key) or [])]
+        if not cached_heights:
+            return
+
+        lowest_height_to_keep = max(
+            lowest_height_monitored + 1,
+            max(cached_heights) - self.max_cached_heights + 1)
+        heights_to_evict = [
+            str(cached_height) for cached_height in cached_heights
+            if cached_height < lowest_height_to_keep
+        ]
+        if heights_to_evict:
+            self.redis.hremove(cache_key, *heights_to_evict)
+
+
+class CosmosValidatorsSnapshotCache:
+    """
+    This class caches a chain-wide snapshot of the bond status and jailed
+    state of every validator, as retrieved from the paginated Cosmos REST
+    validators list. Rather than every validator monitor of a chain querying
+    the same data source for its own validator every round, the monitor which
+    acquires the fetch lock of the chain retrieves the whole list once and
+    stores it, and the other monitors of the chain read their status from it.
+    The cache is chain-scoped (keyed by parent_id) and lives in Redis so that
+    it can be shared by the monitor processes.
+
+    A snapshot is fresh for max_age after it is stored, and is then kept as a
+    stale snapshot until max_stale_age. Once the snapshot is no longer fresh,
+    only the monitor holding the fetch lock retrieves it again, so that the
+    monitors of the chain do not all retrieve the whole list at once. The
+    others read their status from the stale snapshot meanwhile. The lock
+    expires after fetch_lock_expiry in case its holder never releases it.
+    """
+
+    def __init__(self, redis: RedisApi, parent_id: str,
+                 max_age: timedelta = timedelta(seconds=10),
+                 max_stale_age: timedelta = timedelta(minutes=1),
+                 fetch_lock_expiry: timedelta = timedelta(seconds=30)) \
+            -> None:
+        self._redis = redis
+        self._parent_id = parent_id
+        self._max_age = max_age
+        self._max_stale_age = max_stale_age
+        self._fetch_lock_expiry = fetch_lock_expiry
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def parent_id(self) -> str:
+        return self._parent_id
+
+    @property
+    def max_age(self) -> timedelta:
+        return self._max_age
+
+    @property
+    def max_stale_age(self) -> timedelta:
+        return self._max_stale_age
+
+    @property
+    def fetch_lock_expiry(self) -> timedelta:
+        return self._fetch_lock_expiry
+
+    def get(self, include_stale: bool = False) -> Optional[Dict[str, Dict]]:
+        """
+        This function returns the cached validators snapshot of the chain
+        :param include_stale: Whether a snapshot which is no longer fresh but
+                            : did not expire should be returned
+        :return: The status of every validator keyed by operator address if a
+                 fresh snapshot exists, or a stale one if include_stale
+               : None otherwise
+        """
+        cached_snapshot = self.redis.get(
+            Keys.get_cosmos_validators_snapshot_cache(self.parent_id))
+        if cached_snapshot is None:
+            return None
+
+        cached_snapshot = json.loads(cached_snapshot)
+        snapshot_age = \
+            datetime.now().timestamp() - cached_snapshot['timestamp']
+        if include_stale or snapshot_age <= self.max_age.total_seconds():
+            return cached_snapshot['snapshot']
+
+        return None
+
+    def set(self, snapshot: Dict[str, Dict]) -> None:
+        """
+        This function stores the validators snapshot of the chain in the cache
+        until max_stale_age
+        :param snapshot: The status of every validator keyed by operator
+                       : address
+        :return: None
+        """
+        self.redis.set_for(
+            Keys.get_cosmos_validators_snapshot_cache(self.parent_id),
+            json.dumps({'timestamp': datetime.now().timestamp(),
+                        'snapshot': snapshot}), self.max_stale_age)
+
+    def acquire_fetch_lock(self) -> bool:
+        """
+        This function attempts to acquire the lock which allows a monitor of
+        the chain to retrieve the validators snapshot.
+        :return: True if the lock was acquired
+               : False if it is held by another monitor, or Redis is down
+        """
+        return self.redis.set_for_if_not_exists(
+            Keys.get_cosmos_validators_snapshot_fetch_lock(self.parent_id),
+            datetime.now().timestamp(), self.fetch_lock_expiry)
+
+    def release_fetch_lock(self) -> None:
+        """
+        This function releases the fetch lock of the chain
+        :return: None
+        """
+        self.redis.remove(
+            Keys.get_cosmos_validators_snapshot_fetch_lock(self.parent_id))
+
+
+class CosmosProposalsCache:
+    """
+    This class caches the governance proposals of a chain known by the Cosmos
+    network monitor, keyed by proposal id. Since a proposal no longer changes
+    once it is finalized, the network monitor only retrieves the proposals
+    which are still in their deposit or voting period every round, and serves
+    the rest from the cache. The cache lives in Redis so that the proposals
+    need not be retrieved all over again when the monitor is restarted.
+    """
+
+    def __init__(self, redis: RedisApi, parent_id: str) -> None:
+        self._redis = redis
+        self._parent_id = parent_id
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def parent_id(self) -> str:
+        return self._parent_id
+
+    def get(self) -> Dict[str, Dict]:
+        """
+        This function returns the cached proposals of the chain
+        :return: The cached proposals keyed by proposal id
+        """
+        return {
+            proposal_id: json.loads(proposal)
+            for proposal_id, proposal in self.redis.hgetall(
+                Keys.get_cosmos_proposals_cache(self.parent_id)).items()
+        }
+
+    def set(self, proposals: List[Dict]) -> None:
+        """
+        This function stores the given proposals in the cache, overwriting the
+        cached proposals with the same id
+        :param proposals: The proposals to be cached
+        :return: None
+        """
+        if proposals:
+            self.redis.hset_multiple(
+                Keys.get_cosmos_proposals_cache(self.parent_id),
+                {str(proposal['proposal_id']): json.dumps(proposal)
+                 for proposal in proposals})
+
+    def remove(self, proposal_ids: List[str]) -> None:
+        """
+        This function removes the proposals with the given ids from the cache
+        :param proposal_ids: The ids of the proposals to be removed
+        :return: None
+        """
+        if proposal_ids:
+            self.redis.hremove(Keys.get_cosmos_proposals_cache(self.parent_id),
+                               *proposal_ids)
+
+    def replace(self, proposals: List[Dict]) -> None:
+        """
+        This function replaces all the cached proposals of the chain with the
+        given proposals
+        :param proposals: The proposals to be cached
+        :return: None
+        """
+        self.redis.remove(Keys.get_cosmos_proposals_cache(self.parent_id))
+        self.set(proposals)
@@ -0,0 +1,128 @@
+import json
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from src.data_store.redis import RedisApi, Keys
+
+
+class SubstrateEraCache:
+    """
+    This class caches the per-era staking data that the Substrate validator
+    monitors retrieve for every era still stored on chain. Once an era is over
+    its data never changes, therefore the data of a finished era is retrieved
+    once and then served from the cache. The cache is chain-scoped (keyed by
+    parent_id, era and stash address) and lives in Redis, so that it survives
+    restarts, with an in-process LRU of at most max_lru_size entries in front
+    of it so that the eras looked up every round do not cost a Redis round
+    trip.
+
+    The lookups served by either layer are counted as hits, and the rest as
+    misses. The eras which fall out of the chain's history are evicted.
+    """
+
+    def __init__(self, redis: RedisApi, parent_id: str,
+                 max_lru_size: int = 1000) -> None:
+        self._redis = redis
+        self._parent_id = parent_id
+        self._max_lru_size = max_lru_size
+        self._lru = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+        # The era below which the eras were last evicted, so that the eviction
+        # is done once per era rather than every round
+        self._evicted_before_era = None
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def parent_id(self) -> str:
+        return self._parent_id
+
+    @property
+    def max_lru_size(self) -> int:
+        return self._max_lru_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @staticmethod
+    def _get_field(era: int, stash_address: str) -> str:
+        return '{}_{}'.format(era, stash_address)
+
+    def _add_to_lru(self, field: str, data: Dict) -> None:
+        self._lru[field] = data
+        self._lru.move_to_end(field)
+        if len(self._lru) > self.max_lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, era: int, stash_address: str) -> Optional[Dict]:
+        """
+        This function returns the cached data of a stash address at era <era>
+        :param era: The era whose data should be returned
+        :param stash_address: The stash address whose data should be returned
+        :return: The cached data if it exists
+               : None otherwise
+        """
+        field = self._get_field(era, stash_address)
+        if field in self._lru:
+            self._lru.move_to_end(field)
+            self._hits += 1
+            return self._lru[field]
+
+        cached_data = self.redis.hget(
+            Keys.get_substrate_era_cache(self.parent_id), field)
+        if cached_data is None:
+            self._misses += 1
+            return None
+
+        data = json.loads(cached_data)
+        self._add_to_lru(field, data)
+        self._hits += 1
+        return data
+
+    def set(self, era: int, stash_address: str, data: Dict) -> None:
+        """
+        This function stores the data of a stash address at era <era>. Only
+        the data of finished eras should be cached.
+        :param era: The era whose data is being cached
+        :param stash_address: The stash address whose data is being cached
+        :param data: The data to be cached
+        :return: None
+        """
+        field = self._get_field(era, stash_address)
+        self._add_to_lru(field, data)
+        self.redis.hset(Keys.get_substrate_era_cache(self.parent_id), field,
+                        json.dumps(data))
+
+    def evict_eras_before(self, era: int) -> None:
+        """
+        This function evicts the data of the eras before era <era>, for
+        example because they are no longer stored on chain.
+        :param era: The lowest era to keep
+        :return: None
+        """
+        if self._evicted_before_era == era:
+            return
+
+        for field in list(self._lru):
+            if int(field.split('_', 1)[0]) < era:
+                del self._lru[field]
+
+        cache_key = Keys.get_substrate_era_cache(self.parent_id)
+        cached_fields = self.redis.hkeys(cache_key)
+        if cached_fields is None:
+            return
+
+        fields_to_evict = [field for field in cached_fields
+                           if int(field.split('_', 1)[0]) < era]
+        if fields_to_evict:
+            self.redis.hremove(cache_key, *fields_to_evict)
+        self._evicted_before_era = era
@@ -23,6 +23,7 @@ from src.utils.constants.abis.v4 import V4_AGGREGATOR, V4_PROXY
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, CHAINLINK_CONTRACTS_RAW_DATA_ROUTING_KEY)
 from src.utils.data import get_json, get_prometheus_metrics_data
+from src.utils.evm import ContractCallBatcher, DEFAULT_MAX_CALLS_PER_BATCH
 from src.utils.exceptions import (ComponentNotGivenEnoughDataSourcesException,
                                   MetricNotFoundException, PANICException,
                                   CouldNotRetrieveContractsException,
@@ -42,7 +43,9 @@ class ChainlinkContractsMonitor(Monitor):
     def __init__(self, monitor_name: str, weiwatchers_url: str,
                  evm_nodes: List[str], node_configs: List[ChainlinkNodeConfig],
                  logger: logging.Logger, monitor_period: int,
-                 rabbitmq: RabbitMQApi, parent_id: str) -> None:
+                 rabbitmq: RabbitMQApi, parent_id: str,
+                 max_calls_per_batch: int = DEFAULT_MAX_CALLS_PER_BATCH
+                 ) -> None:
         # An exception is raised if the monitor is not given enough data
         # sources. The callee must also make sure that the given node_configs
         # have valid prometheus urls, and that prometheus and contracts
@@ -66,6 +69,15 @@ class ChainlinkContractsMonitor(Monitor):
             w3_interface.middleware_onion.inject(geth_poa_middleware, layer=0)
             self._evm_node_w3_interface[evm_node_url] = w3_interface
 
+        # The contract calls made to an evm node are grouped in batches of at
+        # most max_calls_per_batch calls.
+        self._evm_node_contract_call_batcher = {
+            evm_node_url: ContractCallBatcher(w3_interface, self.logger,
+                                              max_calls_per_batch)
+            for evm_node_url, w3_interface in
+            self._evm_node_w3_interface.items()
+        }
+
         # This dict stores the address of a chainlink node indexed by the
         # node id. This address is obtained from prometheus.
         self._node_address = {}
@@ -107,6 +119,10 @@ class ChainlinkContractsMonitor(Monitor):
     def evm_node_w3_interface(self) -> Dict[str, Web3]:
         return self._evm_node_w3_interface
 
+    @property
+    def evm_node_contract_call_batcher(self) -> Dict[str, ContractCallBatcher]:
+        return self._evm_node_contract_call_batcher
+
     @property
     def contracts_url(self) -> str:
         return self._contracts_url
@@ -221,17 +237,20 @@ class ChainlinkContractsMonitor(Monitor):
         :return: The url of the selected node.
                : None if no node is selected.
         """
-        for node_url, w3_interface in self._evm_node_w3_interface.items():
-            try:
-                if w3_interface.isConnected() and not w3_interface.eth.syncing:
-                    return node_url
-            except (ReqConnectionError, ReadTimeout, IncompleteRead,
-                    ChunkedEncodingError, ProtocolError, InvalidURL,
-                    InvalidSchema, MissingSchema) as e:
-                self.logger.debug("Error when trying to access %s", node_url)
-                self.logger.debug(e)
+        def is_synced(node_url: str) -> bool:
+            w3_interface = self._evm_node_w3_interface[node_url]
+            return w3_interface.isConnected() and not w3_interface.eth.syncing
 
-        return None
+        return self._select_data_source(
+            list(self._evm_node_w3_interface), lambda node_url: node_url,
+            is_synced, (ReqConnectionError, ReadTimeout, IncompleteRead,
+                        ChunkedEncodingError, ProtocolError, InvalidURL,
+                        InvalidSchema, MissingSchema), 'evm_rpc')
+
+    def _get_contract_call_batcher(
+            self, w3_interface: Web3) -> ContractCallBatcher:
+        return self.evm_node_contract_call_batcher[
+            w3_interface.provider.endpoint_uri]
 
     def _filter_contracts_by_node(self, selected_node: str) -> Dict:
         """
@@ -242,27 +261,43 @@ class ChainlinkContractsMonitor(Monitor):
                : on. The proxy contract address is used to identify a contract.
         """
         w3_interface = self.evm_node_w3_interface[selected_node]
+        if not self._node_address:
+            return {}
+
+        # The participants of each contract are the same for every node, so
+        # they are retrieved once for all the nodes.
+        contracts = []
+        participants_functions = []
+        for contract_data in self._contracts_data:
+            aggregator_address = contract_data['contractAddress']
+            contract_version = contract_data['contractVersion']
+            if contract_version == 3:
+                aggregator_contract = w3_interface.eth.contract(
+                    address=aggregator_address, abi=V3_AGGREGATOR)
+                participants_functions.append(
+                    aggregator_contract.functions.getOracles())
+                contracts.append(contract_data)
+            elif contract_version == 4:
+                aggregator_contract = w3_interface.eth.contract(
+                    address=aggregator_address, abi=V4_AGGREGATOR)
+                participants_functions.append(
+                    aggregator_contract.functions.transmitters())
+                contracts.append(contract_data)
+        contracts_participants = self._get_contract_call_batcher(
+            w3_interface).call(participants_functions)
+
         node_contracts = {}
         for node_id, address in self._node_address.items():
             transformed_address = w3_interface.toChecksumAddress(address)
             v3_participating_contracts = []
             v4_participating_contracts = []
-            for contract_data in self._contracts_data:
-                aggregator_address = contract_data['contractAddress']
-                proxy_address = contract_data['proxyAddress']
-                contract_version = contract_data['contractVersion']
-                if contract_version == 3:
-                    aggregator_contract = w3_interface.eth.contract(
-                        address=aggregator_address, abi=V3_AGGREGATOR)
-                    oracles = aggregator_contract.functions.getOracles().call()
-                    if transformed_address in oracles:
+            for contract_data, participants in zip(contracts,
+                                                   contracts_participants):
+                if transformed_address in participants:
+                    proxy_address = contract_data['proxyAddress']
+                    if contract_data['contractVersion'] == 3:
                         v3_participating_contracts.append(proxy_address)
-                elif contract_version == 4:
-                    aggregator_contract = w3_interface.eth.contract(
-                        address=aggregator_address, abi=V4_AGGREGATOR)
-                    transmitters = (
-                        aggregator_contract.functions.transmitters().call())
-                    if transformed_address in transmitters:
+                    else:
                         v4_participating_contracts.append(proxy_address)
 
             node_contracts[node_id] = {}
@@ -279,6 +314,28 @@ class ChainlinkContractsMonitor(Monitor):
         """
         self._node_contracts = node_contracts
 
+    def _get_proxies_data(self, call_batcher: ContractCallBatcher,
+                          proxy_addresses: List[str], proxy_abi: List[Dict],
+                          block_height: int) -> List[Tuple[str, str]]:
+        """
+        This function retrieves the aggregator address and the description of
+        each proxy contract.
+        :param call_batcher: The batcher used to call the contracts
+        :param proxy_addresses: The addresses of the proxy contracts
+        :param proxy_abi: The ABI of the proxy contracts
+        :param block_height: The block height the data is retrieved at
+        :return: A list of (aggregator address, description) tuples, in the
+               : order of the given proxy addresses
+        """
+        proxy_functions = []
+        for proxy_address in proxy_addresses:
+            proxy_contract = call_batcher.w3_interface.eth.contract(
+                address=proxy_address, abi=proxy_abi)
+            proxy_functions.append(proxy_contract.functions.aggregator())
+            proxy_functions.append(proxy_contract.functions.description())
+        proxy_results = call_batcher.call(proxy_functions, block_height)
+        return list(zip(proxy_results[::2], proxy_results[1::2]))
+
     def _get_v3_data(self, w3_interface: Web3, node_address: str,
                      node_id: str) -> Dict:
         """
@@ -330,20 +387,28 @@ class ChainlinkContractsMonitor(Monitor):
 
         data = {}
         v3_contracts = self.node_contracts[node_id]['v3']
-        for proxy_address in v3_contracts:
-            proxy_contract = w3_interface.eth.contract(address=proxy_address,
-                                                       abi=V3_PROXY)
-            aggregator_address = proxy_contract.functions.aggregator().call()
-            description = proxy_contract.functions.description().call()
+        if not v3_contracts:
+            return data
+
+        call_batcher = self._get_contract_call_batcher(w3_interface)
+        transformed_address = w3_interface.toChecksumAddress(node_address)
+
+        # All contracts are read at the same block height, and the calls made
+        # to the contracts are grouped so that they can be batched.
+        current_block_height = w3_interface.eth.get_block('latest')['number']
+        proxies_data = self._get_proxies_data(call_batcher, v3_contracts,
+                                              V3_PROXY, current_block_height)
+
+        contracts_events = []
+        aggregator_functions = []
+        for proxy_address, (aggregator_address, _) in zip(v3_contracts,
+                                                          proxies_data):
             aggregator_contract = w3_interface.eth.contract(
                 address=aggregator_address, abi=V3_AGGREGATOR)
-            transformed_address = w3_interface.toChecksumAddress(node_address)
 
             # Get all SubmissionReceived events related to the node in question
             # from the last block height not monitored until the current block
             # height. Note fromBlock and toBlock are inclusive.
-            current_block_height = w3_interface.eth.get_block('latest')[
-                'number']
             first_block_to_monitor = self.last_block_monitored[node_id][
                                          proxy_address] + 1 \
                 if proxy_address in self.last_block_monitored[node_id] \
@@ -358,8 +423,31 @@ class ChainlinkContractsMonitor(Monitor):
                     toBlock=current_block_height,
                     argument_filters={'oracle': transformed_address})
             events = event_filter.get_all_entries()
-            latest_round_data = (
-                aggregator_contract.functions.latestRoundData().call())
+            contracts_events.append(events)
+
+            aggregator_functions.append(
+                aggregator_contract.functions.latestRoundData())
+            aggregator_functions.append(
+                aggregator_contract.functions.withdrawablePayment(
+                    transformed_address))
+            aggregator_functions.extend([
+                aggregator_contract.functions.getRoundData(
+                    event['args']['round'])
+                for event in events
+            ])
+
+        # Retrieving the data of a round whose consensus is not reached yet
+        # reverts, so reverted calls are returned rather than raised.
+        aggregator_results = iter(call_batcher.call(
+            aggregator_functions, current_block_height, raise_reverted=False))
+        for proxy_address, (aggregator_address, description), events in zip(
+                v3_contracts, proxies_data, contracts_events):
+            latest_round_data = next(aggregator_results)
+            withdrawable_payment = next(aggregator_results)
+            rounds_data = [next(aggregator_results) for _ in events]
+            for result in [latest_round_data, withdrawable_payment]:
+                if isinstance(result, ContractLogicError):
+                    raise result
 
             # Construct the latest round data
             data[proxy_address] = {
@@ -370,9 +458,7 @@ class ChainlinkContractsMonitor(Monitor):
                 'latestAnswer': latest_round_data[1],
                 'latestTimestamp': latest_round_data[3],
                 'answeredInRound': latest_round_data[4],
-                'withdrawablePayment':
-                    aggregator_contract.functions.withdrawablePayment(
-                        transformed_address).call(),
+                'withdrawablePayment': withdrawable_payment,
                 'historicalRounds': []
             }
 
@@ -382,7 +468,8 @@ class ChainlinkContractsMonitor(Monitor):
                 self.last_round_observed[node_id][proxy_address]
                 if proxy_address in self.last_round_observed[node_id] else None
             )
-            for event in events:
+            last_block_monitored = current_block_height
+            for event, round_data in zip(events, rounds_data):
                 round_id = event['args']['round']
                 round_answer = None
                 round_timestamp = None
@@ -401,18 +488,16 @@ class ChainlinkContractsMonitor(Monitor):
                 # is stuck. Note, until consensus is reached, round data will
                 # still be shown with roundAnswer, roundTimestamp and
                 # answeredInRound set to None.
-                try:
-                    round_data = aggregator_contract.functions.getRoundData(
-                        round_id).call()
-                    round_answer = round_data[1]
-                    round_timestamp = round_data[3]
-                    answered_in_round = round_data[4]
-                except ContractLogicError as e:
+                if isinstance(round_data, ContractLogicError):
                     self.logger.error('Error when retrieving round %s data. It '
                                       'may be that no consensus is reached '
-                                      'yet.')
-                    self.logger.exception(e)
+                                      'yet.', round_id)
+                    self.logger.exception(round_data)
                     consensus_reached = False
+                else:
+                    round_answer = round_data[1]
+                    round_timestamp = round_data[3]
+                    answered_in_round = round_data[4]
 
                 historical_rounds.append({
                     'roundId': round_id,
@@ -423,11 +508,11 @@ class ChainlinkContractsMonitor(Monitor):
                 })
 
                 if not consensus_reached:
-                    current_block_height = event['blockNumber'] - 1
+                    last_block_monitored = event['blockNumber'] - 1
                     break
 
             self._last_block_monitored[node_id][
-                proxy_address] = current_block_height
+                proxy_address] = last_block_monitored
 
             # Store and send the last round observed
             data[proxy_address]['lastRoundObserved'] = last_round_observed
@@ -486,20 +571,28 @@ class ChainlinkContractsMonitor(Monitor):
 
         data = {}
         v4_contracts = self.node_contracts[node_id]['v4']
-        for proxy_address in v4_contracts:
-            proxy_contract = w3_interface.eth.contract(address=proxy_address,
-                                                       abi=V4_PROXY)
-            aggregator_address = proxy_contract.functions.aggregator().call()
-            description = proxy_contract.functions.description().call()
+        if not v4_contracts:
+            return data
+
+        call_batcher = self._get_contract_call_batcher(w3_interface)
+        transformed_address = w3_interface.toChecksumAddress(node_address)
+
+        # All contracts are read at the same block height, and the calls made
+        # to the contracts are grouped so that they can be batched.
+        current_block_height = w3_interface.eth.get_block('latest')['number']
+        proxies_data = self._get_proxies_data(call_batcher, v4_contracts,
+                                              V4_PROXY, current_block_height)
+
+        contracts_events = []
+        aggregator_functions = []
+        for proxy_address, (aggregator_address, _) in zip(v4_contracts,
+                                                          proxies_data):
             aggregator_contract = w3_interface.eth.contract(
                 address=aggregator_address, abi=V4_AGGREGATOR)
-            transformed_address = w3_interface.toChecksumAddress(node_address)
 
             # Get all NewTransmission events related to the node in question
             # from the last block height not monitored until the current block
             # height. Note fromBlock and toBlock are inclusive.
-            current_block_height = w3_interface.eth.get_block('latest')[
-                'number']
             first_block_to_monitor = self.last_block_monitored[node_id][
                                          proxy_address] + 1 \
                 if proxy_address in self.last_block_monitored[node_id] \
@@ -513,9 +606,28 @@ class ChainlinkContractsMonitor(Monitor):
                     fromBlock=first_block_to_monitor,
                     toBlock=current_block_height)
             events = event_filter.get_all_entries()
-            latest_round_data = aggregator_contract.functions.latestRoundData(
-            ).call()
-            transmitters = aggregator_contract.functions.transmitters().call()
+            contracts_events.append(events)
+
+            aggregator_functions.append(
+                aggregator_contract.functions.latestRoundData())
+            aggregator_functions.append(
+                aggregator_contract.functions.transmitters())
+            aggregator_functions.append(
+                aggregator_contract.functions.owedPayment(transformed_address))
+            aggregator_functions.extend([
+                aggregator_contract.functions.getRoundData(
+                    event['args']['aggregatorRoundId'])
+                for event in events
+            ])
+
+        aggregator_results = iter(call_batcher.call(aggregator_functions,
+                                                    current_block_height))
+        for proxy_address, (aggregator_address, description), events in zip(
+                v4_contracts, proxies_data, contracts_events):
+            latest_round_data = next(aggregator_results)
+            transmitters = next(aggregator_results)
+            owed_payment = next(aggregator_results)
+            rounds_data = [next(aggregator_results) for _ in events]
 
             try:
                 node_transmitter_index = transmitters.index(transformed_address)
@@ -535,8 +647,7 @@ class ChainlinkContractsMonitor(Monitor):
                 'latestAnswer': latest_round_data[1],
                 'latestTimestamp': latest_round_data[3],
                 'answeredInRound': latest_round_data[4],
-                'owedPayment': aggregator_contract.functions.owedPayment(
-                    transformed_address).call(),
+                'owedPayment': owed_payment,
                 'historicalRounds': []
             }
 
@@ -546,10 +657,8 @@ class ChainlinkContractsMonitor(Monitor):
                 self.last_round_observed[node_id][proxy_address]
                 if proxy_address in self.last_round_observed[node_id] else None
             )
-            for event in events:
+            for event, round_data in zip(events, rounds_data):
                 round_id = event['args']['aggregatorRoundId']
-                round_data = aggregator_contract.functions.getRoundData(
-                    round_id).call()
                 observers_list = list(event['args']['observers'])
 
                 try:
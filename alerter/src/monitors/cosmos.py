@@ -82,26 +82,20 @@ class CosmosMonitor(Monitor, ABC):
         :return: The node config of the selected node.
                : None if no node is selected.
         """
-        nodes = [node for node in nodes if node.cosmos_rest_url]
-        for node in nodes:
-            cosmos_rest_url = node.cosmos_rest_url
-            try:
-                api_ret = self.cosmos_rest_server_api.execute_with_checks(
-                    self.cosmos_rest_server_api.get_syncing, [cosmos_rest_url],
-                    node.node_name, sdk_version)
-                if not api_ret['syncing']:
-                    self.logger.debug('chosen %s.', cosmos_rest_url)
-                    return node
-            except (ReqConnectionError, ReadTimeout, InvalidURL, InvalidSchema,
-                    MissingSchema, IncompleteRead, ChunkedEncodingError,
-                    ProtocolError, CosmosSDKVersionIncompatibleException,
-                    CosmosRestServerApiCallException, KeyError) as e:
-                # If an expected error occurs we will log the error and re-try
-                # again with another node.
-                self.logger.debug("Error when trying to access %s: %s",
-                                  cosmos_rest_url, e)
+        def is_synced(node: CosmosNodeConfig) -> bool:
+            api_ret = self.cosmos_rest_server_api.execute_with_checks(
+                self.cosmos_rest_server_api.get_syncing,
+                [node.cosmos_rest_url], node.node_name, sdk_version)
+            return not api_ret['syncing']
 
-        return None
+        nodes = [node for node in nodes if node.cosmos_rest_url]
+        return self._select_data_source(
+            nodes, lambda node: node.cosmos_rest_url, is_synced,
+            (ReqConnectionError, ReadTimeout, InvalidURL, InvalidSchema,
+             MissingSchema, IncompleteRead, ChunkedEncodingError,
+             ProtocolError, CosmosSDKVersionIncompatibleException,
+             CosmosRestServerApiCallException, KeyError),
+            'cosmos_rest_{}'.format(sdk_version))
 
     def _select_cosmos_tendermint_node(
             self, nodes: List[CosmosNodeConfig]) -> Optional[CosmosNodeConfig]:
@@ -113,27 +107,19 @@ class CosmosMonitor(Monitor, ABC):
         :return: The node config of the selected node.
                : None if no node is selected.
         """
-        nodes = [node for node in nodes if node.tendermint_rpc_url]
-        for node in nodes:
-            tendermint_rpc_url = node.tendermint_rpc_url
-            try:
-                api_ret = self.tendermint_rpc_api.execute_with_checks(
-                    self.tendermint_rpc_api.get_status, [tendermint_rpc_url],
-                    node.node_name)
-                syncing = api_ret['result']['sync_info']['catching_up']
-                if not syncing:
-                    self.logger.debug('chosen %s.', tendermint_rpc_url)
-                    return node
-            except (ReqConnectionError, ReadTimeout, InvalidURL, InvalidSchema,
-                    MissingSchema, IncompleteRead, ChunkedEncodingError,
-                    ProtocolError, TendermintRPCCallException,
-                    TendermintRPCIncompatibleException, KeyError) as e:
-                # If an expected error occurs we will log the error and re-try
-                # again with another node.
-                self.logger.debug("Error when trying to access %s: %s",
-                                  tendermint_rpc_url, e)
+        def is_synced(node: CosmosNodeConfig) -> bool:
+            api_ret = self.tendermint_rpc_api.execute_with_checks(
+                self.tendermint_rpc_api.get_status, [node.tendermint_rpc_url],
+                node.node_name)
+            return not api_ret['result']['sync_info']['catching_up']
 
-        return None
+        nodes = [node for node in nodes if node.tendermint_rpc_url]
+        return self._select_data_source(
+            nodes, lambda node: node.tendermint_rpc_url, is_synced,
+            (ReqConnectionError, ReadTimeout, InvalidURL, InvalidSchema,
+             MissingSchema, IncompleteRead, ChunkedEncodingError,
+             ProtocolError, TendermintRPCCallException,
+             TendermintRPCIncompatibleException, KeyError), 'tendermint_rpc')
 
     def _cosmos_rest_reachable(
             self, node: CosmosNodeConfig, sdk_version: str) -> (
@@ -3,7 +3,7 @@ import json
 import logging
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
 
 import pika
 import pika.exceptions
@@ -14,9 +14,11 @@ from urllib3.exceptions import ProtocolError
 from src.configs.repo import DockerHubRepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           DOCKERHUB_RAW_DATA_ROUTING_KEY)
-from src.utils.data import get_json
+from src.utils.data import (get_json, get_json_conditionally,
+                            get_rate_limit_delay, ConditionalRequestCache)
 from src.utils.datetime import json_to_unix_time
 from src.utils.exceptions import (DataReadingException, PANICException,
                                   CannotAccessDockerHubPageException,
@@ -31,23 +33,113 @@ class DockerHubMonitor(Monitor):
         super().__init__(monitor_name, logger, monitor_period, rabbitmq)
         self._repo_config = repo_config
 
+        # If enabled, the first tags page is requested conditionally, and the
+        # tags are not published if they did not change since they were last
+        # published. Otherwise, since the tags are listed most recently updated
+        # first, the tags pages are only followed until a tag seen in the
+        # previous round is reached. The next round is delayed if the rate
+        # limit of the DockerHub API would be exceeded otherwise.
+        self._conditional_requests = (ConditionalRequestCache()
+                                      if env.ENABLE_REPO_CONDITIONAL_REQUESTS
+                                      else None)
+        self._last_pages: Optional[List] = None
+        self._data_modified = True
+        self._data_published = False
+        self._rate_limit_delay = 0.0
+
     @property
     def repo_config(self) -> DockerHubRepoConfig:
         return self._repo_config
 
+    @property
+    def conditional_requests(self) -> Optional[ConditionalRequestCache]:
+        return self._conditional_requests
+
+    @property
+    def next_round_delay(self) -> float:
+        return max(self.monitor_period, self._rate_limit_delay)
+
     def _display_data(self, data: Dict) -> str:
         # To cater for tags with unicode characters we must first encode
         # as utf-8 and then decode
         return json.dumps(data, ensure_ascii=False).encode('utf8').decode()
 
     def _get_data(self) -> List:
-        pages = [get_json(self.repo_config.tags_page, self.logger)]
-        i = 0
-        while pages[i]['next']:
-            pages.append(get_json(pages[i]['next'], self.logger))
-            i += 1
+        if self.conditional_requests is None:
+            pages = [get_json(self.repo_config.tags_page, self.logger)]
+            i = 0
+            while pages[i]['next']:
+                pages.append(get_json(pages[i]['next'], self.logger))
+                i += 1
+            return pages
+
+        first_page, self._data_modified, headers = get_json_conditionally(
+            self.repo_config.tags_page, self.logger,
+            self.conditional_requests)
+        if not self._data_modified and self._last_pages is not None:
+            pages, requests = self._last_pages, 1
+        else:
+            self._data_modified = True
+            pages, headers, requests = self._get_new_pages(first_page,
+                                                           headers)
+            self._last_pages = pages
+
+        self._rate_limit_delay = get_rate_limit_delay(headers, requests)
         return pages
 
+    def _get_new_pages(self, first_page: Dict, headers: Mapping[str, str]
+                       ) -> (List, Mapping[str, str], int):
+        """
+        This function follows the tags pages starting from <first_page> until
+        it reaches a tag which was seen in the previous round with the same
+        last_updated time. The tags of the previous round which come after it
+        are then added as a last page, unless the tags would not add up to the
+        count of tags of the repo, in which case all the pages are retrieved.
+        :param first_page: The first tags page
+        :param headers: The headers of the response of the first tags page
+        :return: The tags pages
+               : The headers of the last response
+               : The number of requests made, including the first page
+        """
+        if self._last_pages is None:
+            seen_tags = {}
+        else:
+            seen_tags = {(tag['name'], tag['last_updated']): tag
+                         for page in self._last_pages
+                         for tag in page['results']}
+
+        pages = [first_page]
+        requests = 1
+        while pages[-1]['next']:
+            if any((tag['name'], tag['last_updated']) in seen_tags
+                   for tag in pages[-1]['results']):
+                new_tags = {tag['name'] for page in pages
+                            for tag in page['results']}
+                pages.append({
+                    'count': first_page['count'],
+                    'next': None,
+                    'results': [tag for tag in seen_tags.values()
+                                if tag['name'] not in new_tags]
+                })
+                if sum(len(page['results'])
+                       for page in pages) == int(first_page['count']):
+                    return pages, headers, requests
+
+                # Some tags were deleted, so all the pages are retrieved
+                self.logger.debug("The tags of %s do not add up to %s, "
+                                  "retrieving all the tags pages.",
+                                  self.repo_config, first_page['count'])
+                pages = pages[:-1]
+                seen_tags = {}
+                continue
+
+            page, _, headers = get_json_conditionally(
+                pages[-1]['next'], self.logger, self.conditional_requests)
+            pages.append(page)
+            requests += 1
+
+        return pages, headers, requests
+
     def _process_error(self, error: PANICException) -> Dict:
         processed_data = {
             'error': {
@@ -116,6 +208,7 @@ class DockerHubMonitor(Monitor):
         data_retrieval_exception = None
         data = None
         data_retrieval_failed = True
+        self._data_modified = True
         try:
             data = self._get_data()
 
@@ -146,23 +239,29 @@ class DockerHubMonitor(Monitor):
                               self.repo_config.tags_page)
             self.logger.exception(data_retrieval_exception)
 
-        try:
-            processed_data = self._process_data(data_retrieval_failed,
-                                                [data_retrieval_exception],
-                                                [data])
-        except Exception as error:
-            self.logger.error("Error when processing data obtained from %s",
-                              self.repo_config.tags_page)
-            self.logger.exception(error)
-            # Do not send data if we experienced processing errors
-            return
+        if (not data_retrieval_failed and not self._data_modified
+                and self._data_published):
+            self.logger.debug("The tags of %s did not change since they were "
+                              "last published.", self.repo_config)
+        else:
+            self._data_published = False
+            try:
+                processed_data = self._process_data(
+                    data_retrieval_failed, [data_retrieval_exception], [data])
+            except Exception as error:
+                self.logger.error("Error when processing data obtained from "
+                                  "%s", self.repo_config.tags_page)
+                self.logger.exception(error)
+                # Do not send data if we experienced processing errors
+                return
 
-        self._send_data(processed_data)
+            self._send_data(processed_data)
+            self._data_published = not data_retrieval_failed
 
-        if not data_retrieval_failed:
-            # Only output the gathered metrics if there was no error
-            self.logger.debug(self._display_data(
-                processed_data['result']['data']))
+            if not data_retrieval_failed:
+                # Only output the gathered metrics if there was no error
+                self.logger.debug(self._display_data(
+                    processed_data['result']['data']))
 
         # Send a heartbeat only if the entire round was successful
         heartbeat = {
@@ -3,7 +3,7 @@ import json
 import logging
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import Dict
+from typing import Dict, Optional
 
 import pika
 import pika.exceptions
@@ -14,9 +14,11 @@ from urllib3.exceptions import ProtocolError
 from src.configs.repo import GitHubRepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           GITHUB_RAW_DATA_ROUTING_KEY)
-from src.utils.data import get_json
+from src.utils.data import (get_json, get_json_conditionally,
+                            get_rate_limit_delay, ConditionalRequestCache)
 from src.utils.exceptions import (DataReadingException, PANICException,
                                   CannotAccessGitHubPageException,
                                   GitHubAPICallException, JSONDecodeException)
@@ -29,17 +31,43 @@ class GitHubMonitor(Monitor):
         super().__init__(monitor_name, logger, monitor_period, rabbitmq)
         self._repo_config = repo_config
 
+        # If enabled, the releases page is requested conditionally, and the
+        # releases are not published if they did not change since they were
+        # last published. The next round is delayed if the rate limit of the
+        # GitHub API would be exceeded otherwise.
+        self._conditional_requests = (ConditionalRequestCache()
+                                      if env.ENABLE_REPO_CONDITIONAL_REQUESTS
+                                      else None)
+        self._data_modified = True
+        self._data_published = False
+        self._rate_limit_delay = 0.0
+
     @property
     def repo_config(self) -> GitHubRepoConfig:
         return self._repo_config
 
+    @property
+    def conditional_requests(self) -> Optional[ConditionalRequestCache]:
+        return self._conditional_requests
+
+    @property
+    def next_round_delay(self) -> float:
+        return max(self.monitor_period, self._rate_limit_delay)
+
     def _display_data(self, data: Dict) -> str:
         # To cater for releases with unicode characters we must first encode
         # as utf-8 and then decode
         return json.dumps(data, ensure_ascii=False).encode('utf8').decode()
 
     def _get_data(self) -> Dict:
-        return get_json(self.repo_config.releases_page, self.logger)
+        if self.conditional_requests is None:
+            return get_json(self.repo_config.releases_page, self.logger)
+
+        data, self._data_modified, headers = get_json_conditionally(
+            self.repo_config.releases_page, self.logger,
+            self.conditional_requests)
+        self._rate_limit_delay = get_rate_limit_delay(headers)
+        return data
 
     def _process_error(self, error: PANICException) -> Dict:
         processed_data = {
@@ -100,6 +128,7 @@ class GitHubMonitor(Monitor):
         data_retrieval_exception = None
         data = None
         data_retrieval_failed = True
+        self._data_modified = True
         try:
             data = self._get_data()
 
@@ -132,23 +161,29 @@ class GitHubMonitor(Monitor):
                               self.repo_config.releases_page)
             self.logger.exception(data_retrieval_exception)
 
-        try:
-            processed_data = self._process_data(data_retrieval_failed,
-                                                [data_retrieval_exception],
-                                                [data])
-        except Exception as error:
-            self.logger.error("Error when processing data obtained from %s",
-                              self.repo_config.releases_page)
-            self.logger.exception(error)
-            # Do not send data if we experienced processing errors
-            return
-
-        self._send_data(processed_data)
-
-        if not data_retrieval_failed:
-            # Only output the gathered metrics if there was no error
-            self.logger.debug(self._display_data(
-                processed_data['result']['data']))
+        if (not data_retrieval_failed and not self._data_modified
+                and self._data_published):
+            self.logger.debug("The releases of %s did not change since they "
+                              "were last published.", self.repo_config)
+        else:
+            self._data_published = False
+            try:
+                processed_data = self._process_data(
+                    data_retrieval_failed, [data_retrieval_exception], [data])
+            except Exception as error:
+                self.logger.error("Error when processing data obtained from "
+                                  "%s", self.repo_config.releases_page)
+                self.logger.exception(error)
+                # Do not send data if we experienced processing errors
+                return
+
+            self._send_data(processed_data)
+            self._data_published = not data_retrieval_failed
+
+            if not data_retrieval_failed:
+                # Only output the gathered metrics if there was no error
+                self.logger.debug(self._display_data(
+                    processed_data['result']['data']))
 
         # Send a heartbeat only if the entire round was successful
         heartbeat = {
@@ -1,7 +1,6 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -11,6 +10,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.starters import start_chainlink_contracts_monitor
 from src.utils.constants.monitorables import MonitorableType
 from src.utils.constants.names import CL_CONTRACTS_MONITOR_NAME_TEMPLATE
@@ -28,8 +28,9 @@ from src.utils.types import str_to_bool
 class ContractMonitorsManager(MonitorsManager):
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, manager_name, rabbitmq, monitors_runtime)
 
         self._contracts_configs = {}
 
@@ -204,14 +205,9 @@ class ContractMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the Chainlink contracts "
                       "monitor of {}".format(full_chain_name), self.logger)
-        process = multiprocessing.Process(
-            target=start_chainlink_contracts_monitor,
-            args=(weiwatchers_url, evm_nodes, node_configs, sub_chain,
-                  parent_id,))
-
-        # Kills children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(
+            start_chainlink_contracts_monitor,
+            (weiwatchers_url, evm_nodes, node_configs, sub_chain, parent_id,))
         self._config_process_dict[full_chain_name] = {}
         self._config_process_dict[full_chain_name][
             'component_name'] = CL_CONTRACTS_MONITOR_NAME_TEMPLATE.format(
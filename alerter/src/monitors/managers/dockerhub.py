@@ -1,9 +1,8 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +10,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.configs.repo import DockerHubRepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.starters import start_dockerhub_monitor
 from src.utils import env
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
@@ -30,8 +30,9 @@ from src.utils.types import str_to_bool
 class DockerHubMonitorsManager(MonitorsManager):
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, manager_name, rabbitmq, monitors_runtime)
 
         self._repos_configs = {}
 
@@ -93,11 +94,8 @@ class DockerHubMonitorsManager(MonitorsManager):
             str, base_chain: str, sub_chain: str) -> None:
         log_and_print("Creating a new process for the monitor of {}"
                       .format(repo_config.repo_name), self.logger)
-        process = multiprocessing.Process(target=start_dockerhub_monitor,
-                                          args=(repo_config,))
-        # Kill children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(start_dockerhub_monitor,
+                                              (repo_config,))
         self._config_process_dict[config_id] = {}
         self._config_process_dict[config_id]['component_name'] = (
             DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
@@ -1,8 +1,9 @@
 import logging
+import multiprocessing
 import sys
 from abc import ABC, abstractmethod
 from types import FrameType
-from typing import Dict
+from typing import Dict, Optional, Callable, Sequence, Union
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,6 +11,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.abstract.publisher_subscriber import \
     QueuingPublisherSubscriberComponent
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.monitors.runtime import MonitorsRuntime, MonitorTask
 from src.utils.constants.monitorables import MonitorableType
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY,
@@ -19,10 +21,15 @@ from src.utils.logging import log_and_print
 
 class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
     def __init__(self, logger: logging.Logger, name: str,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
         self._config_process_dict = {}
         self._name = name
 
+        # If given, the monitors are run as tasks of this runtime instead of
+        # being run in a process each.
+        self._monitors_runtime = monitors_runtime
+
         super().__init__(logger, rabbitmq)
 
     def __str__(self) -> str:
@@ -36,6 +43,33 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
     def name(self) -> str:
         return self._name
 
+    @property
+    def monitors_runtime(self) -> Optional[MonitorsRuntime]:
+        return self._monitors_runtime
+
+    def _start_monitor_process(
+            self, starter: Callable, args: Sequence
+    ) -> Union[multiprocessing.Process, MonitorTask]:
+        """
+        This function starts a monitor using the starter function <starter>
+        and the arguments <args>. By default the monitor is started in a new
+        process. If the manager was given a monitors runtime, the monitor is
+        initialised in a separate thread and then run as a task of the runtime
+        instead. Both can be checked using is_alive() and stopped using
+        terminate() and join().
+        :param starter: The function which initialises and starts the monitor
+        :param args: The arguments to be passed to the starter
+        :return: The process or runtime task running the monitor
+        """
+        if self.monitors_runtime is not None:
+            return self.monitors_runtime.start_monitor(starter, args)
+
+        process = multiprocessing.Process(target=starter, args=tuple(args))
+        # Kill children if parent is killed
+        process.daemon = True
+        process.start()
+        return process
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -136,5 +170,9 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
             process.terminate()
             process.join()
 
+        if self.monitors_runtime is not None:
+            log_and_print("Stopping the monitors runtime", self.logger)
+            self.monitors_runtime.stop()
+
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
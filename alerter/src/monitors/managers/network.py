@@ -1,7 +1,6 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict, Optional, List, Callable, Any
 
@@ -14,6 +13,7 @@ from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import (
     MonitorsManager)
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.starters import (
     start_cosmos_network_monitor, start_substrate_network_monitor)
 from src.utils.configs import (
@@ -33,8 +33,9 @@ from src.utils.types import str_to_bool, CONFIGS_WITH_VALIDATORS
 
 class NetworkMonitorsManager(MonitorsManager):
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, manager_name, rabbitmq, monitors_runtime)
 
         self._network_configs = {}
 
@@ -221,12 +222,8 @@ class NetworkMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the network monitor of "
                       "{}".format(chain), self.logger)
-        process = multiprocessing.Process(
-            target=starter_fn, args=(data_sources, parent_id, sub_chain, *args))
-
-        # Kills children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(
+            starter_fn, (data_sources, parent_id, sub_chain, *args))
         self._config_process_dict[chain] = {}
         self._config_process_dict[chain][
             'component_name'] = network_monitor_name_template.format(sub_chain)
@@ -1,9 +1,8 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
-from typing import Dict, Type, List, Callable
+from typing import Dict, Type, List, Callable, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -19,6 +18,7 @@ from src.monitors.node.chainlink import ChainlinkNodeMonitor
 from src.monitors.node.cosmos import CosmosNodeMonitor
 from src.monitors.node.evm import EVMNodeMonitor
 from src.monitors.node.substrate import SubstrateNodeMonitor
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.starters import start_node_monitor
 from src.utils.configs import (
     get_newly_added_configs, get_modified_configs, get_removed_configs,
@@ -39,8 +39,9 @@ from src.utils.types import CONFIGS_WITH_VALIDATORS
 class NodeMonitorsManager(MonitorsManager):
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, manager_name, rabbitmq, monitors_runtime)
 
         self._nodes_configs = {}
 
@@ -117,11 +118,8 @@ class NodeMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the monitor of {}".format(
             node_config.node_name), self.logger)
-        process = multiprocessing.Process(
-            target=start_node_monitor, args=(node_config, monitor_type, *args))
-        # Kill children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(
+            start_node_monitor, (node_config, monitor_type, *args))
         self._config_process_dict[config_id] = {}
         self._config_process_dict[config_id]['component_name'] = (
             NODE_MONITOR_NAME_TEMPLATE.format(node_config.node_name))
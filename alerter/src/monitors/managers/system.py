@@ -1,9 +1,8 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +10,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.starters import start_system_monitor
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
                                get_removed_configs)
@@ -32,8 +32,9 @@ class SystemMonitorsManager(MonitorsManager):
     BASE_CHAINS_WITH_SEPARATE_SYS_CONF = ['chainlink']
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi,
+                 monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, manager_name, rabbitmq, monitors_runtime)
 
         self._systems_configs = {}
 
@@ -105,11 +106,8 @@ class SystemMonitorsManager(MonitorsManager):
             base_chain: str, sub_chain: str) -> None:
         log_and_print("Creating a new process for the monitor of {}"
                       .format(system_config.system_name), self.logger)
-        process = multiprocessing.Process(target=start_system_monitor,
-                                          args=(system_config,))
-        # Kill children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(start_system_monitor,
+                                              (system_config,))
         self._config_process_dict[config_id] = {}
         self._config_process_dict[config_id]['component_name'] = (
             SYSTEM_MONITOR_NAME_TEMPLATE.format(system_config.system_name))
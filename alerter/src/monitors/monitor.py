@@ -1,23 +1,30 @@
 import logging
 import sys
 from abc import ABC, abstractmethod
+from functools import partial
 from types import FrameType
-from typing import Dict, List, Any, Union
+from typing import (Dict, List, Any, Union, Optional, Callable, Tuple, Type,
+                    TypeVar)
 
 import pika.exceptions
 import urllib3
 
 from src.abstract.publisher import PublisherComponent
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           TOPIC)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.source_health import (DataSourceHealthRegistry,
+                                     DATA_SOURCE_HEALTH_REGISTRY)
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+T = TypeVar('T')
+
 
 class Monitor(PublisherComponent, ABC):
 
@@ -27,6 +34,13 @@ class Monitor(PublisherComponent, ABC):
         self._monitor_period = monitor_period
         super().__init__(logger, rabbitmq)
 
+        # If enabled, the data sources are selected using the health registry
+        # shared by the monitors of the process, so that failing data sources
+        # are not probed every round.
+        self._data_source_health = (DATA_SOURCE_HEALTH_REGISTRY
+                                    if env.ENABLE_DATA_SOURCE_HEALTH_REGISTRY
+                                    else None)
+
     def __str__(self) -> str:
         return self.monitor_name
 
@@ -34,10 +48,71 @@ class Monitor(PublisherComponent, ABC):
     def monitor_period(self) -> int:
         return self._monitor_period
 
+    @property
+    def next_round_delay(self) -> float:
+        # The monitors which are rate limited by their data sources may wait
+        # longer than monitor_period before their next round
+        return self.monitor_period
+
     @property
     def monitor_name(self) -> str:
         return self._monitor_name
 
+    @property
+    def data_source_health(self) -> Optional[DataSourceHealthRegistry]:
+        return self._data_source_health
+
+    def _select_data_source(
+            self, sources: List[T], get_url: Callable[[T], str],
+            is_synced: Callable[[T], bool],
+            expected_errors: Tuple[Type[Exception], ...],
+            check: str) -> Optional[T]:
+        """
+        This function returns the first source which is synced, trying the
+        sources in the given order. If a data source health registry is used,
+        the sources are tried healthiest first, and the sources whose circuit
+        is open are skipped and re-probed in the background once due.
+        :param sources: The sources to select from
+        :param get_url: A function returning the url of a source
+        :param is_synced: A function which probes a source and returns whether
+                        : it is synced
+        :param expected_errors: The errors raised by is_synced if a source is
+                              : failing. Any other error is raised.
+        :param check: The name of the check performed by is_synced. The health
+                    : of a source is kept separately for every check.
+        :return: The selected source
+               : None if no source is selected
+        """
+        def get_key(source: T) -> Tuple[str, str]:
+            return get_url(source), check
+
+        registry = self.data_source_health
+        if registry is not None:
+            for source in sources:
+                registry.probe_in_background_if_due(
+                    get_key(source), partial(is_synced, source),
+                    expected_errors)
+            sources = registry.rank(sources, get_key)
+
+        for source in sources:
+            url = get_url(source)
+            try:
+                if registry is None:
+                    synced = is_synced(source)
+                else:
+                    synced = registry.probe(get_key(source),
+                                            partial(is_synced, source),
+                                            expected_errors)
+                if synced:
+                    self.logger.debug('chosen %s.', url)
+                    return source
+            except expected_errors as e:
+                # If an expected error occurs we will log the error and re-try
+                # again with another source.
+                self.logger.debug("Error when trying to access %s: %s", url, e)
+
+        return None
+
     @abstractmethod
     def _display_data(self, data: Dict) -> str:
         pass
@@ -105,10 +180,11 @@ class Monitor(PublisherComponent, ABC):
                 self.logger.exception(e)
                 raise e
 
-            self.logger.debug("Sleeping for %s seconds.", self.monitor_period)
+            next_round_delay = self.next_round_delay
+            self.logger.debug("Sleeping for %s seconds.", next_round_delay)
 
             # Use the BlockingConnection sleep to avoid dropped connections
-            self.rabbitmq.connection.sleep(self.monitor_period)
+            self.rabbitmq.connection.sleep(next_round_delay)
 
     def _on_terminate(self, signum: int, stack: FrameType) -> None:
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
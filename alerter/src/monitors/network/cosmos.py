@@ -1,12 +1,14 @@
 import copy
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from datetime import datetime, timedelta
+from typing import Any, List, Dict, Optional, Callable
 
 import pika
+from requests import Response
 
 from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.cosmos import CosmosProposalsCache
 from src.monitors.cosmos import (
     CosmosMonitor, _REST_VERSION_COSMOS_SDK_0_42_6,
     _REST_VERSION_COSMOS_SDK_0_39_2, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
@@ -14,6 +16,7 @@ from src.utils.constants.cosmos import (
     PROPOSAL_STATUS_UNSPECIFIED, PROPOSAL_STATUS_DEPOSIT_PERIOD,
     PROPOSAL_STATUS_VOTING_PERIOD, PROPOSAL_STATUS_PASSED,
     PROPOSAL_STATUS_REJECTED, PROPOSAL_STATUS_FAILED, PROPOSAL_STATUS_INVALID)
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, COSMOS_NETWORK_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import (
@@ -21,6 +24,16 @@ from src.utils.exceptions import (
     CosmosSDKVersionIncompatibleException, CosmosRestServerApiCallException,
     IncorrectJSONRetrievedException, NoSyncedDataSourceWasAccessibleException,
     CannotConnectWithDataSourceException, CosmosNetworkDataCouldNotBeObtained)
+from src.utils.timing import TimedTaskLimiter
+
+# The gRPC status code returned by the REST server for unknown proposals
+_GRPC_NOT_FOUND_CODE = 5
+
+# The statuses of the proposals which can still change
+_ACTIVE_PROPOSAL_STATUSES = {
+    PROPOSAL_STATUS_DEPOSIT_PERIOD: 'PROPOSAL_STATUS_DEPOSIT_PERIOD',
+    PROPOSAL_STATUS_VOTING_PERIOD: 'PROPOSAL_STATUS_VOTING_PERIOD',
+}
 
 
 class CosmosNetworkMonitor(CosmosMonitor):
@@ -42,13 +55,26 @@ class CosmosNetworkMonitor(CosmosMonitor):
 
     def __init__(self, monitor_name: str, data_sources: List[CosmosNodeConfig],
                  parent_id: str, chain_name: str, logger: logging.Logger,
-                 monitor_period: int, rabbitmq: RabbitMQApi) -> None:
+                 monitor_period: int, rabbitmq: RabbitMQApi,
+                 proposals_cache: Optional[CosmosProposalsCache] = None
+                 ) -> None:
 
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
         self._parent_id = parent_id
         self._chain_name = chain_name
 
+        # If given, the finalized proposals are served from this cache, and
+        # only the proposals in their deposit or voting period are retrieved
+        # every round, except once every proposals_full_retrieval_limiter
+        # interval when all the proposals are retrieved to reconcile the cache.
+        # The known proposals are loaded from the cache when first needed.
+        self._proposals_cache = proposals_cache
+        self._proposals: Optional[Dict[str, Dict]] = None
+        self._proposals_full_retrieval_limiter = TimedTaskLimiter(
+            timedelta(
+                seconds=env.COSMOS_PROPOSALS_FULL_RETRIEVAL_INTERVAL_SECONDS))
+
     @property
     def parent_id(self) -> str:
         return self._parent_id
@@ -57,6 +83,14 @@ class CosmosNetworkMonitor(CosmosMonitor):
     def chain_name(self) -> str:
         return self._chain_name
 
+    @property
+    def proposals_cache(self) -> Optional[CosmosProposalsCache]:
+        return self._proposals_cache
+
+    @property
+    def proposals_full_retrieval_limiter(self) -> TimedTaskLimiter:
+        return self._proposals_full_retrieval_limiter
+
     @staticmethod
     def _parse_proposal(proposal: Dict) -> Dict:
         """
@@ -181,23 +215,120 @@ class CosmosNetworkMonitor(CosmosMonitor):
         source_name = source.node_name
 
         def retrieval_process() -> Dict:
-            paginated_data = self._get_rest_data_with_pagination_keys(
-                self.cosmos_rest_server_api.get_proposals_v0_42_6,
-                [source_url, None], {}, source_name,
-                _REST_VERSION_COSMOS_SDK_0_42_6)
-
-            parsed_proposals = {'proposals': []}
-            for page in paginated_data:
-                for proposal in page['proposals']:
-                    parsed_proposals['proposals'].append(
-                        self._parse_proposal(proposal))
-
-            return parsed_proposals
+            if self.proposals_cache is None:
+                return {
+                    'proposals': self._get_proposals_v0_42_6(source, {})
+                }
+
+            if self._proposals is None:
+                self._proposals = self.proposals_cache.get()
+
+                # The cached proposals were reconciled before the restart
+                if self._proposals:
+                    self.proposals_full_retrieval_limiter.did_task()
+
+            if self.proposals_full_retrieval_limiter.can_do_task():
+                proposals = self._get_proposals_v0_42_6(source, {})
+                self._proposals = {
+                    str(proposal['proposal_id']): proposal
+                    for proposal in proposals
+                }
+                self.proposals_cache.replace(proposals)
+                self.proposals_full_retrieval_limiter.did_task()
+                return {
+                    'proposals': proposals
+                }
+
+            self._update_active_proposals_v0_42_6(source)
+            return {
+                'proposals': sorted(
+                    self._proposals.values(),
+                    key=lambda proposal: int(proposal['proposal_id']))
+            }
 
         return self._execute_cosmos_rest_retrieval_with_exceptions(
             retrieval_process, source_name, source_url,
             _REST_VERSION_COSMOS_SDK_0_42_6)
 
+    def _get_proposals_v0_42_6(self, source: CosmosNodeConfig,
+                               params: Dict) -> List[Dict]:
+        """
+        This function retrieves the proposals matching <params> from the data
+        source using version v0.42.6 of the Cosmos SDK for the REST server.
+        :param source: The chosen data source
+        :param params: The params filtering the proposals
+        :return: The parsed proposals
+        :raises: KeyError if the structure of the data returned by the
+                 endpoints is not as expected.
+        """
+        paginated_data = self._get_rest_data_with_pagination_keys(
+            self.cosmos_rest_server_api.get_proposals_v0_42_6,
+            [source.cosmos_rest_url, None], params, source.node_name,
+            _REST_VERSION_COSMOS_SDK_0_42_6)
+
+        return [self._parse_proposal(proposal) for page in paginated_data
+                for proposal in page['proposals']]
+
+    @staticmethod
+    def _is_not_found_response(ret: Any) -> bool:
+        if isinstance(ret, Response):
+            return ret.status_code == 404
+        return (isinstance(ret, Dict) and 'code' in ret
+                and str(ret['code']) == str(_GRPC_NOT_FOUND_CODE))
+
+    def _update_active_proposals_v0_42_6(
+            self, source: CosmosNodeConfig) -> None:
+        """
+        This function retrieves the proposals in their deposit or voting period
+        from the data source using version v0.42.6 of the Cosmos SDK for the
+        REST server, and updates the known proposals with them. The proposals
+        which were in their deposit or voting period but no longer are, are
+        retrieved individually. Proposals are only submitted in their deposit
+        period, so the new proposals are retrieved as well.
+        :param source: The chosen data source
+        :return: None
+        :raises: KeyError if the structure of the data returned by the
+                 endpoints is not as expected.
+        """
+        updated_proposals = []
+        for status in _ACTIVE_PROPOSAL_STATUSES.values():
+            updated_proposals.extend(self._get_proposals_v0_42_6(
+                source, {'proposal_status': status}))
+
+        updated_proposal_ids = {
+            str(proposal['proposal_id']) for proposal in updated_proposals
+        }
+        removed_proposal_ids = []
+        for proposal_id, proposal in self._proposals.items():
+            if (proposal['status'] not in _ACTIVE_PROPOSAL_STATUSES
+                    or proposal_id in updated_proposal_ids):
+                continue
+
+            ret = self.cosmos_rest_server_api.get_proposals_v0_42_6(
+                source.cosmos_rest_url, proposal_id, {})
+            if isinstance(ret, Dict) and 'proposal' in ret:
+                updated_proposals.append(self._parse_proposal(ret['proposal']))
+            elif self._is_not_found_response(ret):
+                # The proposals whose deposit period ends before the minimum
+                # deposit is reached are deleted from the chain
+                self.logger.debug("Proposal %s no longer exists, it is "
+                                  "assumed to be deleted.", proposal_id)
+                removed_proposal_ids.append(proposal_id)
+            else:
+                # The proposal is kept as it is, and retrieved again in the
+                # next round
+                self.logger.warning("Proposal %s could not be retrieved from "
+                                    "%s: %s", proposal_id, source.node_name,
+                                    ret)
+
+        for proposal in updated_proposals:
+            self._proposals[str(proposal['proposal_id'])] = proposal
+        for proposal_id in removed_proposal_ids:
+            del self._proposals[proposal_id]
+
+        self.proposals_cache.set(updated_proposals)
+        self.proposals_cache.remove(removed_proposal_ids)
+
     def _get_cosmos_rest_indirect_data(self, source: CosmosNodeConfig,
                                        sdk_version: str) -> Dict:
         """
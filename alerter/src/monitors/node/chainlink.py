@@ -4,7 +4,8 @@ import logging
 from collections import ChainMap, defaultdict
 from datetime import datetime, timedelta
 from http.client import IncompleteRead
-from typing import Dict, Callable
+from operator import attrgetter
+from typing import Any, Dict, Callable
 
 import pika
 from requests.exceptions import (ConnectionError as ReqConnectionError,
@@ -15,6 +16,7 @@ from urllib3.exceptions import ProtocolError
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils import env
 from src.utils.constants.data import CHAINLINK_CHAINS_URL
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
@@ -22,6 +24,7 @@ from src.utils.data import get_prometheus_metrics_data, get_json
 from src.utils.exceptions import (NodeIsDownException, PANICException,
                                   DataReadingException, InvalidUrlException,
                                   MetricNotFoundException)
+from src.utils.sharding import get_sharded_routing_key
 from src.utils.timing import TimedTaskLimiter
 
 
@@ -49,6 +52,12 @@ class ChainlinkNodeMonitor(Monitor):
         self._currency_symbol_limiter = TimedTaskLimiter(timedelta(hours=24))
         self._currency_symbol = ''
 
+        # The raw data is sent to the data transformer shard of the node, so
+        # that the state of the node is kept by one shard.
+        self._raw_data_routing_key = get_sharded_routing_key(
+            CHAINLINK_NODE_RAW_DATA_ROUTING_KEY, node_config.node_id,
+            env.CHAINLINK_NODE_DATA_TRANSFORMER_SHARDS)
+
     @property
     def node_config(self) -> ChainlinkNodeConfig:
         return self._node_config
@@ -138,6 +147,11 @@ class ChainlinkNodeMonitor(Monitor):
 
         raise NodeIsDownException(self.node_config.node_name)
 
+    def _get_retrieval_info_var(self, var: str) -> Any:
+        # The retrieval info refers to the state of the monitor by attribute
+        # path, as the state is read after the data is retrieved.
+        return attrgetter(var)(self)
+
     def _get_data(self) -> Dict:
         retrieval_info = {
             'prometheus': {
@@ -146,12 +160,12 @@ class ChainlinkNodeMonitor(Monitor):
                 'data_retrieval_exception': None,
                 'get_function': self._get_prometheus_data,
                 'processing_function': self._process_retrieved_prometheus_data,
-                'last_source_used_var': 'self._last_prometheus_source_used',
-                'monitoring_enabled_var': 'self.node_config._monitor_prometheus'
+                'last_source_used_var': 'last_prometheus_source_used',
+                'monitoring_enabled_var': 'node_config.monitor_prometheus'
             }
         }
         for source, info in retrieval_info.items():
-            if eval(info['monitoring_enabled_var']):
+            if self._get_retrieval_info_var(info['monitoring_enabled_var']):
                 try:
                     info['data'] = info['get_function']()
                     info['data_retrieval_failed'] = False
@@ -162,21 +176,27 @@ class ChainlinkNodeMonitor(Monitor):
                         "source.".format(source))
                     self.logger.exception(info['data_retrieval_exception'])
                 except (IncompleteRead, ChunkedEncodingError, ProtocolError):
+                    last_source_used = self._get_retrieval_info_var(
+                        info['last_source_used_var'])
                     info['data_retrieval_exception'] = DataReadingException(
-                        self.monitor_name, eval(info['last_source_used_var']))
+                        self.monitor_name, last_source_used)
                     self.logger.error("Error when retrieving data from %s",
-                                      eval(info['last_source_used_var']))
+                                      last_source_used)
                     self.logger.exception(info['data_retrieval_exception'])
                 except (InvalidURL, InvalidSchema, MissingSchema):
+                    last_source_used = self._get_retrieval_info_var(
+                        info['last_source_used_var'])
                     info['data_retrieval_exception'] = InvalidUrlException(
-                        eval(info['last_source_used_var']))
+                        last_source_used)
                     self.logger.error("Error when retrieving data from %s",
-                                      eval(info['last_source_used_var']))
+                                      last_source_used)
                     self.logger.exception(info['data_retrieval_exception'])
                 except MetricNotFoundException as e:
                     info['data_retrieval_exception'] = e
-                    self.logger.error("Error when retrieving data from %s",
-                                      eval(info['last_source_used_var']))
+                    self.logger.error(
+                        "Error when retrieving data from %s",
+                        self._get_retrieval_info_var(
+                            info['last_source_used_var']))
                     self.logger.exception(info['data_retrieval_exception'])
         return retrieval_info
 
@@ -315,7 +335,7 @@ class ChainlinkNodeMonitor(Monitor):
     def _send_data(self, data: Dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=RAW_DATA_EXCHANGE,
-            routing_key=CHAINLINK_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            routing_key=self._raw_data_routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
@@ -324,18 +344,19 @@ class ChainlinkNodeMonitor(Monitor):
         retrieval_info = self._get_data()
         processed_data = {}
         for source, info in retrieval_info.items():
-            if eval(info['monitoring_enabled_var']):
+            if self._get_retrieval_info_var(info['monitoring_enabled_var']):
+                last_source_used = self._get_retrieval_info_var(
+                    info['last_source_used_var'])
                 try:
                     processed_data[source] = self._process_data(
                         info['data_retrieval_failed'],
-                        [info['data_retrieval_exception'],
-                         eval(info['last_source_used_var'])],
+                        [info['data_retrieval_exception'], last_source_used],
                         [info['processing_function'], info['data']],
                     )
                 except Exception as error:
                     self.logger.error(
                         "Error when processing data obtained from %s",
-                        eval(info['last_source_used_var']))
+                        last_source_used)
                     self.logger.exception(error)
                     # Do not send data if we experienced processing errors
                     return
@@ -344,12 +365,11 @@ class ChainlinkNodeMonitor(Monitor):
 
         self._send_data(processed_data)
 
-        # Can't use list comprehension due to eval losing self.
-        data_retrieval_failed_list = []
-        for _, info in retrieval_info.items():
-            if eval(info['monitoring_enabled_var']):
-                data_retrieval_failed_list.append(
-                    info['data_retrieval_failed'])
+        data_retrieval_failed_list = [
+            info['data_retrieval_failed']
+            for _, info in retrieval_info.items()
+            if self._get_retrieval_info_var(info['monitoring_enabled_var'])
+        ]
 
         # ChainMap combines multiple dicts into 1. Note if there are same keys
         # in different dicts, the first occurrence is used. This should never
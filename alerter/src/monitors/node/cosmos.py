@@ -1,6 +1,7 @@
 import base64
 import copy
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.client import IncompleteRead
 from typing import List, Dict, Optional, Callable, Union
@@ -13,6 +14,8 @@ from urllib3.exceptions import ProtocolError
 
 from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.cosmos import (TendermintBlockCache,
+                                        CosmosValidatorsSnapshotCache)
 from src.monitors.cosmos import (
     CosmosMonitor, _REST_VERSION_COSMOS_SDK_0_42_6,
     _REST_VERSION_COSMOS_SDK_0_39_2, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
@@ -23,6 +26,7 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           COSMOS_NODE_RAW_DATA_ROUTING_KEY)
 from src.utils.cosmos import (
     bech32_to_address)
+from src.utils import env
 from src.utils.data import get_prometheus_metrics_data
 from src.utils.exceptions import (
     NodeIsDownException, DataReadingException, InvalidUrlException,
@@ -32,6 +36,7 @@ from src.utils.exceptions import (
     CannotConnectWithDataSourceException,
     CosmosRestServerDataCouldNotBeObtained, TendermintRPCCallException,
     TendermintRPCIncompatibleException, TendermintRPCDataCouldNotBeObtained)
+from src.utils.sharding import get_sharded_routing_key
 
 
 class CosmosNodeMonitor(CosmosMonitor):
@@ -54,7 +59,10 @@ class CosmosNodeMonitor(CosmosMonitor):
     def __init__(self, monitor_name: str, node_config: CosmosNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi,
-                 data_sources: List[CosmosNodeConfig]) -> None:
+                 data_sources: List[CosmosNodeConfig],
+                 tendermint_block_cache: Optional[TendermintBlockCache] = None,
+                 validators_snapshot_cache: Optional[
+                     CosmosValidatorsSnapshotCache] = None) -> None:
 
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
@@ -77,6 +85,12 @@ class CosmosNodeMonitor(CosmosMonitor):
         # number)
         self._max_catchup_blocks = 300
 
+        # The raw data is sent to the data transformer shard of the node, so
+        # that the state of the node is kept by one shard.
+        self._raw_data_routing_key = get_sharded_routing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY, node_config.node_id,
+            env.COSMOS_NODE_DATA_TRANSFORMER_SHARDS)
+
         # Construct list of archive nodes from data sources
         self._archive_nodes = [
             node for node in self.data_sources if node.is_archive_node
@@ -100,6 +114,17 @@ class CosmosNodeMonitor(CosmosMonitor):
         # the node at each monitoring round if it is a validator
         self._validator_consensus_address = None
 
+        # If given, the per-height Tendermint RPC archive data is first looked
+        # up in this cache, which is shared by all the monitors of the chain, so
+        # that the same heights are not retrieved once per validator monitor.
+        self._tendermint_block_cache = tendermint_block_cache
+
+        # If given, the bond status and jailed state of the validator are read
+        # from this chain-wide snapshot of the validators list, which is shared
+        # by all the monitors of the chain, so that the indirect data source is
+        # not queried once per validator monitor.
+        self._validators_snapshot_cache = validators_snapshot_cache
+
     @property
     def node_config(self) -> CosmosNodeConfig:
         return self._node_config
@@ -128,6 +153,15 @@ class CosmosNodeMonitor(CosmosMonitor):
     def validator_consensus_address(self) -> Optional[str]:
         return self._validator_consensus_address
 
+    @property
+    def tendermint_block_cache(self) -> Optional[TendermintBlockCache]:
+        return self._tendermint_block_cache
+
+    @property
+    def validators_snapshot_cache(self) -> Optional[
+            CosmosValidatorsSnapshotCache]:
+        return self._validators_snapshot_cache
+
     @staticmethod
     def _parse_validator_status(validator_status: Union[str, int]) -> str:
         """
@@ -198,6 +232,63 @@ class CosmosNodeMonitor(CosmosMonitor):
             retrieval_process, source_name, source_url,
             _REST_VERSION_COSMOS_SDK_0_39_2)
 
+    @staticmethod
+    def _parse_validators_snapshot(
+            paginated_validators: List[Dict]) -> Dict[str, Dict]:
+        """
+        Given a list of validators pages retrieved from the Cosmos REST server,
+        this function returns the indirect metrics of every validator keyed by
+        operator address.
+        :param paginated_validators: The retrieved validators pages
+        :return: The indirect metrics of every validator
+        """
+        snapshot = {}
+        for page in paginated_validators:
+            for validator in page['validators']:
+                snapshot[validator['operator_address']] = {
+                    'bond_status': CosmosNodeMonitor._parse_validator_status(
+                        validator['status']),
+                    'jailed': validator['jailed'],
+                }
+
+        return snapshot
+
+    def _get_validators_snapshot_v0_42_6(
+            self, source: CosmosNodeConfig) -> Dict[str, Dict]:
+        """
+        This function retrieves the whole validators list from the data source
+        using version v0.42.6 of the Cosmos SDK for the REST server, and
+        returns the indirect metrics of every validator keyed by operator
+        address.
+        :param source: The chosen data source
+        :return: The indirect metrics of every validator
+        :raises: KeyError if the structure of the data returned by the endpoints
+                 is not as expected.
+        """
+        paginated_validators = self._get_rest_data_with_pagination_keys(
+            self.cosmos_rest_server_api.get_staking_validators_v0_42_6,
+            [source.cosmos_rest_url, None], {}, source.node_name,
+            _REST_VERSION_COSMOS_SDK_0_42_6)
+        return self._parse_validators_snapshot(paginated_validators)
+
+    def _get_cached_validator_status(self) -> Optional[Dict]:
+        """
+        This function returns the indirect metrics of the validator from the
+        validators snapshot of the chain.
+        :return: The indirect metrics of the validator if the node is a
+                 validator which is in a snapshot that did not expire
+               : None otherwise
+        """
+        if (self.validators_snapshot_cache is None
+                or not self.node_config.is_validator):
+            return None
+
+        snapshot = self.validators_snapshot_cache.get()
+        if snapshot is None:
+            return None
+
+        return snapshot.get(self.node_config.operator_address)
+
     def _get_cosmos_rest_v0_42_6_indirect_data_validator(
             self, source: CosmosNodeConfig) -> Dict:
         """
@@ -228,6 +319,27 @@ class CosmosNodeMonitor(CosmosMonitor):
         source_name = source.node_name
 
         def retrieval_process() -> Dict:
+            # If a validators snapshot cache is given, the monitor holding the
+            # fetch lock of the chain retrieves the whole validators list so
+            # that the other monitors of the chain can read their status from
+            # it. Meanwhile, the other monitors read their status from the
+            # stale snapshot. A validator which is not in the list yet is
+            # queried individually.
+            snapshot_cache = self.validators_snapshot_cache
+            if snapshot_cache is not None:
+                if snapshot_cache.acquire_fetch_lock():
+                    try:
+                        snapshot = self._get_validators_snapshot_v0_42_6(
+                            source)
+                        snapshot_cache.set(snapshot)
+                    finally:
+                        snapshot_cache.release_fetch_lock()
+                else:
+                    snapshot = snapshot_cache.get(include_stale=True) or {}
+
+                if operator_address in snapshot:
+                    return snapshot[operator_address]
+
             staking_validators = \
                 self.cosmos_rest_server_api.execute_with_checks(
                     self.cosmos_rest_server_api.get_staking_validators_v0_42_6,
@@ -306,6 +418,14 @@ class CosmosNodeMonitor(CosmosMonitor):
         if not node_reachable:
             return {}, True, err
 
+        # If the status of the validator can be read from the validators
+        # snapshot of the chain, there is no need to select and query an
+        # indirect data source.
+        if sdk_version == _REST_VERSION_COSMOS_SDK_0_42_6:
+            cached_status = self._get_cached_validator_status()
+            if cached_status is not None:
+                return {**cached_status}, False, None
+
         # Select indirect nodes for indirect data retrieval.
         selected_indirect_node = self._select_cosmos_rest_node(
             self.data_sources, sdk_version)
@@ -565,6 +685,109 @@ class CosmosNodeMonitor(CosmosMonitor):
 
         return slashed, slashed_amount
 
+    def _get_tendermint_rpc_block_data(self, source: CosmosNodeConfig,
+                                       height: int) -> Dict:
+        """
+        This function retrieves the chain data of height <height> which is
+        needed to compute the historical metrics of any validator, that is the
+        validator set of the previous block, the validators which signed the
+        previous block and the slash events of block <height>. If the monitor
+        was given a Tendermint block cache, the data is first looked up in the
+        cache and stored in it once retrieved, so that the monitors of the same
+        chain retrieve each height only once.
+        :param source: The data source
+        :param height: The height whose data is to be retrieved
+        :return: A dict containing the block data of height <height>
+        :raises: KeyError if the structure of the data returned by the endpoints
+                 is not as expected.
+        """
+        if self.tendermint_block_cache is not None:
+            cached_block_data = self.tendermint_block_cache.get(height)
+            if cached_block_data is not None:
+                return cached_block_data
+
+        source_url = source.tendermint_rpc_url
+        source_name = source.node_name
+        paginated_validators = self._get_tendermint_data_with_count(
+            self.tendermint_rpc_api.get_validators, [source_url],
+            {'height': height - 1}, source_name)
+        validators_list = self._parse_validators_list(paginated_validators)
+        block_at_height = self.tendermint_rpc_api.execute_with_checks(
+            self.tendermint_rpc_api.get_block, [source_url, {'height': height}],
+            source_name)
+        block_results_at_height = self.tendermint_rpc_api.execute_with_checks(
+            self.tendermint_rpc_api.get_block_results,
+            [source_url, {'height': height}], source_name)
+
+        # Only the data needed by the monitors is kept to reduce the size of
+        # the cached data.
+        previous_block_signatures = block_at_height['result']['block'][
+            'last_commit']['signatures']
+        block_data = {
+            'validators': [{'address': validator_info['address']}
+                           for validator_info in validators_list],
+            'signed_validators': [
+                signature['validator_address']
+                for signature in previous_block_signatures
+                if signature['signature']
+            ],
+            'slash_events': [
+                event for event in
+                block_results_at_height['result']['begin_block_events']
+                if str.lower(event['type']) == 'slash'
+            ],
+        }
+
+        if self.tendermint_block_cache is not None:
+            self.tendermint_block_cache.set(height, block_data)
+
+        return block_data
+
+    @staticmethod
+    def _get_max_concurrent_archive_requests(source: CosmosNodeConfig) -> int:
+        """
+        When catching up, the per-height archive data is retrieved concurrently
+        from the selected data source, with at most this number of heights
+        being retrieved at the same time. The limit can be set per node, as
+        each node can handle a different load. If it is not set for the data
+        source, the default set in the environment is used.
+        :param source: The chosen data source
+        :return: The maximum number of heights to retrieve concurrently
+        """
+        if source.tendermint_rpc_max_concurrent_requests is not None:
+            return source.tendermint_rpc_max_concurrent_requests
+
+        return env.TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS
+
+    def _get_tendermint_rpc_blocks_data(self, source: CosmosNodeConfig,
+                                        heights: range) -> List[Dict]:
+        """
+        This function retrieves the per-height Tendermint RPC archive data of
+        every height in <heights>. If the maximum number of concurrent archive
+        requests of the data source is greater than 1, the heights are
+        retrieved concurrently from the data source, with no more than that
+        number of heights being retrieved at the same time. In any case the
+        data is returned in the order of <heights>.
+        :param source: The chosen data source
+        :param heights: The heights whose data should be retrieved
+        :return: The data of each height, ordered by height
+        :raises: The first exception raised while retrieving the data. In that
+               : case the heights not yet being retrieved are cancelled.
+        """
+        max_workers = min(self._get_max_concurrent_archive_requests(source),
+                          len(heights))
+        if max_workers <= 1:
+            return [self._get_tendermint_rpc_block_data(source, height)
+                    for height in heights]
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            return list(executor.map(
+                lambda height: self._get_tendermint_rpc_block_data(
+                    source, height), heights))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _get_tendermint_rpc_archive_data_validator(
             self, source: CosmosNodeConfig) -> Dict:
         source_url = source.tendermint_rpc_url
@@ -591,49 +814,30 @@ class CosmosNodeMonitor(CosmosMonitor):
             stopping_height = current_height + 1
             historical_data = []
 
-            for height_to_monitor in range(starting_height, stopping_height):
+            heights_to_monitor = range(starting_height, stopping_height)
+            blocks_data = self._get_tendermint_rpc_blocks_data(
+                source, heights_to_monitor)
+
+            for height_to_monitor, block_data in zip(heights_to_monitor,
+                                                     blocks_data):
                 # Since the current block has signing info belonging to the
                 # previous block, we must first check if the validator was
                 # active in the previous block
-                paginated_validators = \
-                    self._get_tendermint_data_with_count(
-                        self.tendermint_rpc_api.get_validators, [source_url],
-                        {'height': height_to_monitor - 1}, source_name)
-                validators_list = self._parse_validators_list(
-                    paginated_validators)
                 validator_was_active = self._is_validator_active(
-                    validators_list)
-                block_at_height = \
-                    self.tendermint_rpc_api.execute_with_checks(
-                        self.tendermint_rpc_api.get_block,
-                        [source_url, {'height': height_to_monitor}],
-                        source_name)
+                    block_data['validators'])
 
                 # Check if the validator was slashed and get the slash amount
                 # if it is provided
-                block_results_at_height = \
-                    self.tendermint_rpc_api.execute_with_checks(
-                        self.tendermint_rpc_api.get_block_results,
-                        [source_url, {'height': height_to_monitor}],
-                        source_name)
                 slashed, slashed_amount = self._validator_was_slashed(
-                    block_results_at_height['result']['begin_block_events'])
+                    block_data['slash_events'])
 
                 if validator_was_active:
-                    previous_block_signatures = block_at_height['result'][
-                        'block']['last_commit']['signatures']
-                    non_null_signatures = filter(lambda x: x['signature'],
-                                                 previous_block_signatures)
-                    signed_validators = set(
-                        map(lambda x: x['validator_address'],
-                            non_null_signatures))
-
                     historical_data.append({
                         'height': height_to_monitor,
                         'active_in_prev_block': True,
                         'signed_prev_block':
                             (self.validator_consensus_address
-                             in signed_validators),
+                             in block_data['signed_validators']),
                         'slashed': slashed,
                         'slashed_amount': slashed_amount
                     })
@@ -647,6 +851,8 @@ class CosmosNodeMonitor(CosmosMonitor):
                     })
 
             self._last_height_monitored_tendermint = current_height
+            if self.tendermint_block_cache is not None:
+                self.tendermint_block_cache.mark_monitored(current_height)
 
             # We need to reverse the historical data to show info about the
             # latest block first
@@ -971,7 +1177,7 @@ class CosmosNodeMonitor(CosmosMonitor):
     def _send_data(self, data: Dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=RAW_DATA_EXCHANGE,
-            routing_key=COSMOS_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            routing_key=self._raw_data_routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
@@ -14,10 +14,12 @@ from web3 import Web3
 from src.configs.nodes.evm import EVMNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           EVM_NODE_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import (PANICException, NodeIsDownException,
                                   DataReadingException, InvalidUrlException)
+from src.utils.sharding import get_sharded_routing_key
 
 
 class EVMNodeMonitor(Monitor):
@@ -27,6 +29,12 @@ class EVMNodeMonitor(Monitor):
         super().__init__(monitor_name, logger, monitor_period, rabbitmq)
         self._node_config = node_config
 
+        # The raw data is sent to the data transformer shard of the node, so
+        # that the state of the node is kept by one shard.
+        self._raw_data_routing_key = get_sharded_routing_key(
+            EVM_NODE_RAW_DATA_ROUTING_KEY, node_config.node_id,
+            env.EVM_NODE_DATA_TRANSFORMER_SHARDS)
+
         # This interface performs RPC requests, therefore no connection needs
         # to be managed. We can just perform the requests immediately and catch
         # errors. DISCLAIMER: There might be an issue with open connections not
@@ -97,7 +105,7 @@ class EVMNodeMonitor(Monitor):
     def _send_data(self, data: Dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=RAW_DATA_EXCHANGE,
-            routing_key=EVM_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            routing_key=self._raw_data_routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
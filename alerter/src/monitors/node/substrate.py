@@ -6,10 +6,13 @@ from typing import List, Optional, Dict, Callable
 
 import pika
 
+from src.api_wrappers.substrate import MAX_BLOCKS_PER_BATCH_QUERY
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.substrate import SubstrateEraCache
 from src.monitors.substrate import (
     SubstrateMonitor, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import (
@@ -17,6 +20,7 @@ from src.utils.exceptions import (
     NodeIsDownException, DataReadingException, SubstrateApiCallException,
     NoSyncedDataSourceWasAccessibleException,
     SubstrateWebSocketDataCouldNotBeObtained, PANICException)
+from src.utils.sharding import get_sharded_routing_key
 from src.utils.timing import TimedTaskLimiter
 
 
@@ -29,11 +33,17 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     def __init__(self, monitor_name: str, node_config: SubstrateNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi,
-                 data_sources: List[SubstrateNodeConfig]) -> None:
+                 data_sources: List[SubstrateNodeConfig],
+                 era_cache: Optional[SubstrateEraCache] = None) -> None:
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
         self._node_config = node_config
 
+        # If given, the staking data of the finished eras is retrieved from the
+        # cache rather than from the data source every round, as it does not
+        # change once an era is over.
+        self._era_cache = era_cache
+
         # If for archive data retrieval the selected data source is not an
         # archive node (could be that no archive node satisfied the selection
         # criteria or none were given by the user), the monitor won't go back
@@ -51,6 +61,12 @@ class SubstrateNodeMonitor(SubstrateMonitor):
         # large number)
         self._max_catchup_blocks = 300
 
+        # The raw data is sent to the data transformer shard of the node, so
+        # that the state of the node is kept by one shard.
+        self._raw_data_routing_key = get_sharded_routing_key(
+            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY, node_config.node_id,
+            env.SUBSTRATE_NODE_DATA_TRANSFORMER_SHARDS)
+
         # Construct list of archive nodes from data sources
         self._archive_nodes = [
             node for node in self.data_sources if node.is_archive_node
@@ -95,6 +111,35 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     def system_properties(self) -> Dict:
         return self._system_properties
 
+    @property
+    def era_cache(self) -> Optional[SubstrateEraCache]:
+        return self._era_cache
+
+    def _get_finished_era_stakers(self, source_ws_url: str, source_name: str,
+                                  era: int, stash_address: str) -> Dict:
+        """
+        This function returns the eras stakers of a stash address at an era
+        which is over, from the era cache if possible.
+        :param source_ws_url: The websocket url of the data source
+        :param source_name: The name of the data source
+        :param era: The finished era
+        :param stash_address: The stash address of the validator
+        :return: The eras stakers as returned by the Substrate API
+        """
+        if self.era_cache is not None:
+            cached_eras_stakers = self.era_cache.get(era, stash_address)
+            if cached_eras_stakers is not None:
+                return cached_eras_stakers
+
+        eras_stakers = self.substrate_api_wrapper.execute_with_checks(
+            self.substrate_api_wrapper.get_eras_stakers,
+            [source_ws_url, era, stash_address], source_name, False)
+
+        if self.era_cache is not None:
+            self.era_cache.set(era, stash_address, eras_stakers)
+
+        return eras_stakers
+
     def _get_websocket_direct_data(self) -> Dict:
         """
         This function retrieves node specific metrics directly from the node
@@ -239,17 +284,20 @@ class SubstrateNodeMonitor(SubstrateMonitor):
                     # if the validator was active (total stake for that era
                     # non 0 if active). If the validator was active at that era
                     # then that must indicate a pending payout.
-                    eras_stakers_for_era = \
-                        self.substrate_api_wrapper.execute_with_checks(
-                            self.substrate_api_wrapper.get_eras_stakers,
-                            [source_ws_url, eraIndex, stash_address],
-                            source_name, False)
+                    eras_stakers_for_era = self._get_finished_era_stakers(
+                        source_ws_url, source_name, eraIndex, stash_address)
                     total_stake_in_era = literal_eval(str(
                         eras_stakers_for_era['result']['total']))
 
                     if total_stake_in_era != 0:
                         unclaimed_rewards.append(eraIndex)
 
+            if self.era_cache is not None:
+                self.era_cache.evict_eras_before(starting_era)
+                self.logger.debug("Era cache of %s: %s hits, %s misses",
+                                  self.era_cache.parent_id,
+                                  self.era_cache.hits, self.era_cache.misses)
+
             # Construct rewards of the previous era
             previous_era_rewards = 0
             individual_awards = eras_reward_points['result']['individual']
@@ -407,6 +455,72 @@ class SubstrateNodeMonitor(SubstrateMonitor):
 
         return current_last_height
 
+    def _get_historical_slashed_and_offline(
+            self, source_ws_url: str, source_name: str, starting_height: int,
+            stopping_height: int) -> List[Dict]:
+        """
+        This function retrieves whether the validator was slashed or deemed
+        offline at every height from starting_height up to but excluding
+        stopping_height. If SUBSTRATE_API_MAX_BLOCKS_PER_BATCH is greater than
+        1, the heights are retrieved in chunks of that size (but no more than
+        the Substrate API accepts) with one request per chunk, otherwise three
+        requests are sent per height.
+        :param source_ws_url: The websocket url of the data source
+        :param source_name: The name of the data source
+        :param starting_height: The first height to retrieve
+        :param stopping_height: The height after the last height to retrieve
+        :return: A list containing the data of each height in ascending order
+        """
+        stash_address = self.node_config.stash_address
+        max_blocks_per_batch = min(env.SUBSTRATE_API_MAX_BLOCKS_PER_BATCH,
+                                   MAX_BLOCKS_PER_BATCH_QUERY)
+        historical_data = []
+
+        if max_blocks_per_batch <= 1:
+            for height_to_monitor in range(starting_height, stopping_height):
+                block_hash = self.substrate_api_wrapper.execute_with_checks(
+                    self.substrate_api_wrapper.get_block_hash,
+                    [source_ws_url, height_to_monitor], source_name, False)
+                slashed_amount = self.substrate_api_wrapper.execute_with_checks(
+                    self.substrate_api_wrapper.get_slashed_amount,
+                    [source_ws_url, block_hash['result'], stash_address],
+                    source_name, False)
+                is_offline = self.substrate_api_wrapper.execute_with_checks(
+                    self.substrate_api_wrapper.get_is_offline,
+                    [source_ws_url, block_hash['result'], stash_address],
+                    source_name, False)
+
+                historical_data.append({
+                    'height': height_to_monitor,
+                    'slashed': slashed_amount['result'] > 0,
+                    'slashed_amount': slashed_amount['result'],
+                    'is_offline': is_offline['result']
+                })
+
+            return historical_data
+
+        for chunk_start in range(starting_height, stopping_height,
+                                 max_blocks_per_batch):
+            chunk_end = min(chunk_start + max_blocks_per_batch,
+                            stopping_height) - 1
+            blocks_data = self.substrate_api_wrapper.execute_with_checks(
+                self.substrate_api_wrapper.get_blocks_slashed_and_offline,
+                [source_ws_url, chunk_start, chunk_end, [stash_address]],
+                source_name, False)
+
+            for height_to_monitor in range(chunk_start, chunk_end + 1):
+                # JSON object keys are strings
+                block_data = blocks_data['result'][str(height_to_monitor)]
+                slashed_amount = block_data['slashedAmount'][stash_address]
+                historical_data.append({
+                    'height': height_to_monitor,
+                    'slashed': slashed_amount > 0,
+                    'slashed_amount': slashed_amount,
+                    'is_offline': block_data['isOffline'][stash_address]
+                })
+
+        return historical_data
+
     def _get_websocket_archive_data_validator(
             self, source: SubstrateNodeConfig) -> Dict:
         """
@@ -421,7 +535,6 @@ class SubstrateNodeMonitor(SubstrateMonitor):
         source_ws_url = source.node_ws_url
         source_name = source.node_name
         is_source_archive = source.is_archive_node
-        stash_address = self.node_config.stash_address
 
         def retrieval_process() -> Dict:
             # Get the height of the last finalized block of the archive source.
@@ -439,27 +552,8 @@ class SubstrateNodeMonitor(SubstrateMonitor):
                     current_finalized_height, is_source_archive)
             starting_height = self.last_height_monitored_websocket + 1
             stopping_height = current_finalized_height + 1
-            historical_data = []
-
-            for height_to_monitor in range(starting_height, stopping_height):
-                block_hash = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_block_hash,
-                    [source_ws_url, height_to_monitor], source_name, False)
-                slashed_amount = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_slashed_amount,
-                    [source_ws_url, block_hash['result'], stash_address],
-                    source_name, False)
-                is_offline = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_is_offline,
-                    [source_ws_url, block_hash['result'], stash_address],
-                    source_name, False)
-
-                historical_data.append({
-                    'height': height_to_monitor,
-                    'slashed': slashed_amount['result'] > 0,
-                    'slashed_amount': slashed_amount['result'],
-                    'is_offline': is_offline['result']
-                })
+            historical_data = self._get_historical_slashed_and_offline(
+                source_ws_url, source_name, starting_height, stopping_height)
 
             self._last_height_monitored_websocket = current_finalized_height
 
@@ -643,7 +737,7 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     def _send_data(self, data: Dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=RAW_DATA_EXCHANGE,
-            routing_key=SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            routing_key=self._raw_data_routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
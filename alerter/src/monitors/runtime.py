@@ -0,0 +1,334 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Callable, Sequence
+
+import pika.exceptions
+
+from src.message_broker.rabbitmq import SharedRabbitMQApi
+from src.monitors.monitor import Monitor
+from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
+                                          HEALTH_CHECK_EXCHANGE, TOPIC)
+from src.utils.constants.starters import RESTART_SLEEPING_PERIOD
+from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.logging import log_and_print
+from src.utils.starters import get_stopped_message
+
+
+class MonitorTask:
+    """
+    A monitor which is run by a MonitorsRuntime rather than in its own process.
+    The task exposes the subset of the multiprocessing.Process interface used by
+    the monitors managers (start, is_alive, terminate and join), so that the
+    managers can handle tasks and processes in the same way.
+
+    A task may be created before its monitor is initialised, in which case the
+    monitor is given to it by the thread initialising it.
+    """
+
+    def __init__(self, monitor: Optional[Monitor],
+                 runtime: 'MonitorsRuntime') -> None:
+        self._monitor = monitor
+        self._runtime = runtime
+
+        # The thread initialising the monitor, if it is initialised by the
+        # runtime
+        self._initialiser = None
+
+        # The time at which the next monitoring round should start
+        self._next_round_time = time.time()
+        self._terminated = False
+
+        # Set whenever no monitoring round is being executed
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def __str__(self) -> str:
+        return str(self.monitor)
+
+    @property
+    def monitor(self) -> Optional[Monitor]:
+        return self._monitor
+
+    @monitor.setter
+    def monitor(self, monitor: Monitor) -> None:
+        self._monitor = monitor
+
+    @property
+    def initialiser(self) -> Optional[threading.Thread]:
+        return self._initialiser
+
+    @initialiser.setter
+    def initialiser(self, initialiser: threading.Thread) -> None:
+        self._initialiser = initialiser
+
+    @property
+    def runtime(self) -> 'MonitorsRuntime':
+        return self._runtime
+
+    @property
+    def next_round_time(self) -> float:
+        return self._next_round_time
+
+    @property
+    def running_round(self) -> bool:
+        return not self._idle.is_set()
+
+    @property
+    def terminated(self) -> bool:
+        return self._terminated
+
+    def start(self) -> None:
+        self.runtime.add_task(self)
+
+    def is_alive(self) -> bool:
+        """
+        A task is alive while its monitor is being initialised, and then while
+        the runtime's scheduler thread is running the task's rounds. A task
+        whose initialisation failed, or whose runtime stopped, is dead.
+        :return: Whether the task is alive
+        """
+        if self.terminated:
+            return False
+
+        if self.initialiser is not None and self.initialiser.is_alive():
+            return True
+
+        return self.monitor is not None and self.runtime.is_running
+
+    def terminate(self) -> None:
+        self._terminated = True
+        self.runtime.remove_task(self)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        # Wait for the monitoring round being executed, if any, to finish
+        self._idle.wait(timeout)
+
+    def round_started(self) -> None:
+        self._idle.clear()
+
+    def round_finished(self, next_round_time: float) -> None:
+        self._next_round_time = next_round_time
+        self._idle.set()
+
+
+class MonitorsRuntime:
+    """
+    The monitors runtime runs many monitors inside a single process. Every
+    monitor is scheduled as a task which executes one monitoring round
+    (Monitor._monitor) every monitor_period seconds on a pool of worker
+    threads. All the monitors share the runtime's RabbitMQ connection.
+
+    A monitoring round which fails only affects its own monitor, which is
+    re-scheduled the same way it would have been re-started in its own process.
+    """
+
+    def __init__(self, logger: logging.Logger, rabbitmq: SharedRabbitMQApi,
+                 max_workers: int) -> None:
+        self._logger = logger
+        self._rabbitmq = rabbitmq
+        self._max_workers = max_workers
+        self._tasks = []
+        self._tasks_lock = threading.Lock()
+        self._executor = None
+        self._scheduler = None
+        self._stop_event = threading.Event()
+
+        # Set when the shared RabbitMQ connection/channel must be
+        # re-initialised before the next monitoring rounds are executed
+        self._rabbitmq_initialisation_needed = True
+
+        # Holds the task whose monitor is being initialised by the current
+        # thread, if any
+        self._initialising = threading.local()
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def rabbitmq(self) -> SharedRabbitMQApi:
+        return self._rabbitmq
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def tasks(self) -> List[MonitorTask]:
+        with self._tasks_lock:
+            return list(self._tasks)
+
+    @property
+    def is_running(self) -> bool:
+        return self._scheduler is not None and self._scheduler.is_alive()
+
+    def _initialise_rabbitmq(self) -> None:
+        self.rabbitmq.connect_till_successful()
+        self.logger.info("Setting delivery confirmation on RabbitMQ channel")
+        self.rabbitmq.confirm_delivery()
+        self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
+        self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, TOPIC, False,
+                                       True, False, False)
+        self.logger.info("Creating '%s' exchange", HEALTH_CHECK_EXCHANGE)
+        self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
+                                       True, False, False)
+
+    def start_monitor(self, starter: Callable, args: Sequence) -> MonitorTask:
+        """
+        This function initialises a monitor in a separate thread using the
+        starter function <starter> and the arguments <args>, and returns
+        immediately. This way the caller, for example the consumer callback of
+        a monitors manager, is not blocked while the monitor is initialised,
+        which is re-tried until successful. Once initialised, the monitor is run
+        by the returned task.
+        :param starter: The function which initialises and starts the monitor
+        :param args: The arguments to be passed to the starter
+        :return: The task which will run the monitor
+        """
+        task = MonitorTask(None, self)
+        task.initialiser = threading.Thread(
+            target=self._initialise_task, args=(task, starter, args),
+            daemon=True)
+        task.initialiser.start()
+        return task
+
+    def _initialise_task(self, task: MonitorTask, starter: Callable,
+                         args: Sequence) -> None:
+        # The starter initialises the monitor and passes it to run_monitor,
+        # which gives it to the task being initialised by this thread.
+        self._initialising.task = task
+        starter(*args, runtime=self)
+
+    def run_monitor(self, monitor: Monitor) -> MonitorTask:
+        """
+        This function schedules the monitor to be run by the runtime. If the
+        monitor was initialised by a task started using start_monitor, the
+        monitor is run by that task.
+        :param monitor: The monitor to be run
+        :return: The task running the monitor
+        """
+        task = getattr(self._initialising, 'task', None)
+        if task is None:
+            task = MonitorTask(monitor, self)
+        else:
+            task.monitor = monitor
+        task.start()
+        return task
+
+    def add_task(self, task: MonitorTask) -> None:
+        with self._tasks_lock:
+            # The task may have been terminated while it was being initialised
+            if task.terminated:
+                return
+            self._tasks.append(task)
+        log_and_print("{} started.".format(task.monitor), task.monitor.logger)
+        self.start()
+
+    def remove_task(self, task: MonitorTask) -> None:
+        with self._tasks_lock:
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._scheduler = threading.Thread(target=self._schedule, daemon=True)
+        self._scheduler.start()
+
+    def stop(self) -> None:
+        """
+        This function stops scheduling monitoring rounds, waits for the rounds
+        being executed to finish and closes the shared RabbitMQ connection. The
+        tasks are dropped, so that they are not run twice if they are restarted.
+        :return: None
+        """
+        if not self.is_running:
+            return
+
+        self._stop_event.set()
+        self._scheduler.join()
+        self._executor.shutdown(wait=True)
+        with self._tasks_lock:
+            self._tasks.clear()
+        self.rabbitmq.disconnect_till_successful()
+
+    def _schedule(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self._rabbitmq_initialisation_needed:
+                    self._initialise_rabbitmq()
+                    self._rabbitmq_initialisation_needed = False
+
+                # Submit the monitoring round of every task which is due and
+                # which is not still executing its previous round
+                current_time = time.time()
+                with self._tasks_lock:
+                    for task in self._tasks:
+                        if (not task.running_round
+                                and task.next_round_time <= current_time):
+                            task.round_started()
+                            self._executor.submit(self._run_round, task)
+                    next_round_times = [task.next_round_time
+                                        for task in self._tasks
+                                        if not task.running_round]
+
+                # Service the shared connection while idle so that it is not
+                # dropped by RabbitMQ due to missed heartbeats
+                self.rabbitmq.process_data_events()
+            except (pika.exceptions.AMQPConnectionError,
+                    pika.exceptions.AMQPChannelError):
+                # Error would have already been logged by RabbitMQ logger.
+                self._rabbitmq_initialisation_needed = True
+                continue
+            except Exception as e:
+                self.logger.exception(e)
+                self._rabbitmq_initialisation_needed = True
+                time.sleep(RESTART_SLEEPING_PERIOD)
+                continue
+
+            # Wait until the next round is due, but not more than a second so
+            # that new tasks and finished rounds are picked up quickly.
+            sleeping_period = min(next_round_times, default=current_time + 1) \
+                - time.time()
+            self._stop_event.wait(max(0, min(sleeping_period, 1)))
+
+    def _run_round(self, task: MonitorTask) -> None:
+        """
+        This function executes one monitoring round of the task's monitor and
+        schedules its next round. The exceptions are handled as in
+        Monitor.start and start_monitor, so that a failing monitor is restarted
+        without affecting the other monitors.
+        :param task: The task whose monitoring round should be executed
+        :return: None
+        """
+        monitor = task.monitor
+        next_round_delay = monitor.monitor_period
+        try:
+            monitor._monitor()
+        except MessageWasNotDeliveredException as e:
+            # Log the fact that the message could not be sent.
+            monitor.logger.exception(e)
+        except (pika.exceptions.AMQPConnectionError,
+                pika.exceptions.AMQPChannelError):
+            # Error would have already been logged by RabbitMQ logger. The
+            # shared connection/channel must be re-initialised before the
+            # monitor is restarted.
+            log_and_print(get_stopped_message(monitor), monitor.logger)
+            self._rabbitmq_initialisation_needed = True
+            next_round_delay = 0
+        except Exception as e:
+            monitor.logger.exception(e)
+            log_and_print(get_stopped_message(monitor), monitor.logger)
+            log_and_print("Restarting {} in {} seconds.".format(
+                monitor, RESTART_SLEEPING_PERIOD), monitor.logger)
+            next_round_delay = RESTART_SLEEPING_PERIOD
+        else:
+            next_round_delay = monitor.next_round_delay
+            monitor.logger.debug("Sleeping for %s seconds.", next_round_delay)
+        finally:
+            task.round_finished(time.time() + next_round_delay)
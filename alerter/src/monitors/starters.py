@@ -1,6 +1,7 @@
 import logging
 import time
-from typing import TypeVar, Type, List
+from datetime import timedelta
+from typing import TypeVar, Type, List, Optional
 
 import pika.exceptions
 
@@ -10,13 +11,21 @@ from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.configs.repo import GitHubRepoConfig, DockerHubRepoConfig
 from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.cosmos import (TendermintBlockCache,
+                                        CosmosValidatorsSnapshotCache,
+                                        CosmosProposalsCache)
+from src.monitors.caches.substrate import SubstrateEraCache
 from src.monitors.contracts.chainlink import ChainlinkContractsMonitor
 from src.monitors.dockerhub import DockerHubMonitor
 from src.monitors.github import GitHubMonitor
 from src.monitors.monitor import Monitor
 from src.monitors.network.cosmos import CosmosNetworkMonitor
 from src.monitors.network.substrate import SubstrateNetworkMonitor
+from src.monitors.node.cosmos import CosmosNodeMonitor
+from src.monitors.node.substrate import SubstrateNodeMonitor
+from src.monitors.runtime import MonitorsRuntime, MonitorTask
 from src.monitors.system import SystemMonitor
 from src.utils import env
 from src.utils.constants.names import (
@@ -57,18 +66,28 @@ def _initialise_monitor_logger(monitor_display_name: str,
     return monitor_logger
 
 
+def _initialise_monitor_rabbitmq(
+        monitor_logger: logging.Logger,
+        runtime: Optional[MonitorsRuntime]) -> RabbitMQApi:
+    # The monitors run by a runtime share the runtime's RabbitMQ connection
+    if runtime is not None:
+        return runtime.rabbitmq
+
+    return RabbitMQApi(logger=monitor_logger.getChild(RabbitMQApi.__name__),
+                       host=env.RABBIT_IP)
+
+
 def _initialise_monitor(
         monitor_type: Type[T], monitor_display_name: str,
-        monitoring_period: int, config: MonitorableConfig, *args) -> T:
+        monitoring_period: int, config: MonitorableConfig, *args,
+        runtime: Optional[MonitorsRuntime] = None) -> T:
     monitor_logger = _initialise_monitor_logger(monitor_display_name,
                                                 monitor_type.__name__)
 
     # Try initialising the monitor until successful
     while True:
         try:
-            rabbitmq = RabbitMQApi(
-                logger=monitor_logger.getChild(RabbitMQApi.__name__),
-                host=env.RABBIT_IP)
+            rabbitmq = _initialise_monitor_rabbitmq(monitor_logger, runtime)
             monitor = monitor_type(monitor_display_name, config, monitor_logger,
                                    monitoring_period, rabbitmq, *args)
             log_and_print("Successfully initialised {}".format(
@@ -83,22 +102,104 @@ def _initialise_monitor(
     return monitor
 
 
+def _initialise_tendermint_block_cache(
+        monitor_display_name: str,
+        node_config: CosmosNodeConfig) -> TendermintBlockCache:
+    # The cache logs using the logger of the monitor it is given to
+    monitor_logger = _initialise_monitor_logger(monitor_display_name,
+                                                CosmosNodeMonitor.__name__)
+
+    # Try initialising the cache until successful
+    while True:
+        try:
+            redis = RedisApi(
+                logger=monitor_logger.getChild(RedisApi.__name__),
+                db=env.REDIS_DB, host=env.REDIS_IP, port=env.REDIS_PORT,
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            block_cache = TendermintBlockCache(redis, node_config.parent_id,
+                                               node_config.node_id)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return block_cache
+
+
+def _initialise_cosmos_validators_snapshot_cache(
+        monitor_display_name: str,
+        node_config: CosmosNodeConfig) -> CosmosValidatorsSnapshotCache:
+    # The cache logs using the logger of the monitor it is given to
+    monitor_logger = _initialise_monitor_logger(monitor_display_name,
+                                                CosmosNodeMonitor.__name__)
+
+    # Try initialising the cache until successful
+    while True:
+        try:
+            redis = RedisApi(
+                logger=monitor_logger.getChild(RedisApi.__name__),
+                db=env.REDIS_DB, host=env.REDIS_IP, port=env.REDIS_PORT,
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            # The snapshot is refreshed once per monitoring round, and while
+            # it is being refreshed the monitors may read it for a few more
+            # rounds.
+            snapshot_cache = CosmosValidatorsSnapshotCache(
+                redis, node_config.parent_id,
+                timedelta(seconds=env.NODE_MONITOR_PERIOD_SECONDS),
+                timedelta(seconds=5 * env.NODE_MONITOR_PERIOD_SECONDS))
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return snapshot_cache
+
+
+def _initialise_substrate_era_cache(
+        monitor_display_name: str,
+        node_config: SubstrateNodeConfig) -> SubstrateEraCache:
+    # The cache logs using the logger of the monitor it is given to
+    monitor_logger = _initialise_monitor_logger(monitor_display_name,
+                                                SubstrateNodeMonitor.__name__)
+
+    # Try initialising the cache until successful
+    while True:
+        try:
+            redis = RedisApi(
+                logger=monitor_logger.getChild(RedisApi.__name__),
+                db=env.REDIS_DB, host=env.REDIS_IP, port=env.REDIS_PORT,
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            era_cache = SubstrateEraCache(redis, node_config.parent_id)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return era_cache
+
+
 def _initialise_chainlink_contracts_monitor(
         monitor_display_name: str, monitoring_period: int, weiwatchers_url: str,
         evm_nodes: List[str], node_configs: List[ChainlinkNodeConfig],
-        parent_id: str) -> ChainlinkContractsMonitor:
+        parent_id: str, runtime: Optional[MonitorsRuntime] = None
+) -> ChainlinkContractsMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, ChainlinkContractsMonitor.__name__)
 
     # Try initialising the monitor until successful
     while True:
         try:
-            rabbitmq = RabbitMQApi(
-                logger=monitor_logger.getChild(RabbitMQApi.__name__),
-                host=env.RABBIT_IP)
+            rabbitmq = _initialise_monitor_rabbitmq(monitor_logger, runtime)
             monitor = ChainlinkContractsMonitor(
                 monitor_display_name, weiwatchers_url, evm_nodes, node_configs,
-                monitor_logger, monitoring_period, rabbitmq, parent_id)
+                monitor_logger, monitoring_period, rabbitmq, parent_id,
+                env.EVM_NODE_MAX_CALLS_PER_BATCH)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
@@ -114,19 +215,23 @@ def _initialise_chainlink_contracts_monitor(
 def _initialise_cosmos_network_monitor(
         monitor_display_name: str, monitoring_period: int,
         data_sources: List[CosmosNodeConfig], parent_id: str,
-        chain_name: str) -> CosmosNetworkMonitor:
+        chain_name: str, runtime: Optional[MonitorsRuntime] = None
+) -> CosmosNetworkMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, CosmosNetworkMonitor.__name__)
 
     # Try initialising the monitor until successful
     while True:
         try:
-            rabbitmq = RabbitMQApi(
-                logger=monitor_logger.getChild(RabbitMQApi.__name__),
-                host=env.RABBIT_IP)
+            rabbitmq = _initialise_monitor_rabbitmq(monitor_logger, runtime)
+            redis = RedisApi(
+                logger=monitor_logger.getChild(RedisApi.__name__),
+                db=env.REDIS_DB, host=env.REDIS_IP, port=env.REDIS_PORT,
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            proposals_cache = CosmosProposalsCache(redis, parent_id)
             monitor = CosmosNetworkMonitor(
                 monitor_display_name, data_sources, parent_id, chain_name,
-                monitor_logger, monitoring_period, rabbitmq)
+                monitor_logger, monitoring_period, rabbitmq, proposals_cache)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
@@ -143,16 +248,15 @@ def _initialise_substrate_network_monitor(
         monitor_display_name: str, monitoring_period: int,
         data_sources: List[SubstrateNodeConfig],
         governance_addresses: List[str], parent_id: str,
-        chain_name: str) -> SubstrateNetworkMonitor:
+        chain_name: str, runtime: Optional[MonitorsRuntime] = None
+) -> SubstrateNetworkMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, SubstrateNetworkMonitor.__name__)
 
     # Try initialising the monitor until successful
     while True:
         try:
-            rabbitmq = RabbitMQApi(
-                logger=monitor_logger.getChild(RabbitMQApi.__name__),
-                host=env.RABBIT_IP)
+            rabbitmq = _initialise_monitor_rabbitmq(monitor_logger, runtime)
             monitor = SubstrateNetworkMonitor(
                 monitor_display_name, data_sources, governance_addresses,
                 parent_id, chain_name, monitor_logger, monitoring_period,
@@ -169,83 +273,117 @@ def _initialise_substrate_network_monitor(
     return monitor
 
 
-def start_system_monitor(system_config: SystemConfig) -> None:
+def start_system_monitor(
+        system_config: SystemConfig,
+        runtime: Optional[MonitorsRuntime] = None) -> Optional[MonitorTask]:
     # Monitor display name based on system
     monitor_display_name = SYSTEM_MONITOR_NAME_TEMPLATE.format(
         system_config.system_name)
     system_monitor = _initialise_monitor(SystemMonitor, monitor_display_name,
                                          env.SYSTEM_MONITOR_PERIOD_SECONDS,
-                                         system_config)
-    start_monitor(system_monitor)
+                                         system_config, runtime=runtime)
+    return start_monitor(system_monitor, runtime)
 
 
-def start_github_monitor(repo_config: GitHubRepoConfig) -> None:
+def start_github_monitor(
+        repo_config: GitHubRepoConfig,
+        runtime: Optional[MonitorsRuntime] = None) -> Optional[MonitorTask]:
     # Monitor display name based on repo name. The '/' are replaced with spaces,
     # and the last space is removed.
     monitor_display_name = GITHUB_MONITOR_NAME_TEMPLATE.format(
         repo_config.repo_name.replace('/', ' ')[:-1])
     github_monitor = _initialise_monitor(GitHubMonitor, monitor_display_name,
                                          env.GITHUB_MONITOR_PERIOD_SECONDS,
-                                         repo_config)
-    start_monitor(github_monitor)
+                                         repo_config, runtime=runtime)
+    return start_monitor(github_monitor, runtime)
 
 
-def start_dockerhub_monitor(repo_config: DockerHubRepoConfig) -> None:
+def start_dockerhub_monitor(
+        repo_config: DockerHubRepoConfig,
+        runtime: Optional[MonitorsRuntime] = None) -> Optional[MonitorTask]:
     # Monitor display name based on repo name. The '/' are replaced with spaces,
     # and the last space is removed.
     monitor_display_name = DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
         repo_config.repo_namespace + ' ' + repo_config.repo_name)
     dockerhub_monitor = _initialise_monitor(
         DockerHubMonitor, monitor_display_name,
-        env.DOCKERHUB_MONITOR_PERIOD_SECONDS, repo_config)
-    start_monitor(dockerhub_monitor)
+        env.DOCKERHUB_MONITOR_PERIOD_SECONDS, repo_config, runtime=runtime)
+    return start_monitor(dockerhub_monitor, runtime)
 
 
 def start_node_monitor(node_config: NodeConfig, monitor_type: Type[T],
-                       *args) -> None:
+                       *args, runtime: Optional[MonitorsRuntime] = None
+                       ) -> Optional[MonitorTask]:
     # Monitor display name based on node
     monitor_display_name = NODE_MONITOR_NAME_TEMPLATE.format(
         node_config.node_name)
+
+    # The Cosmos node monitors of the same chain share a Tendermint block cache
+    # so that the archive data of each height is retrieved only once, and a
+    # validators snapshot so that the validators list is retrieved once per
+    # monitoring period.
+    if monitor_type == CosmosNodeMonitor:
+        args = (*args,
+                _initialise_tendermint_block_cache(monitor_display_name,
+                                                   node_config),
+                _initialise_cosmos_validators_snapshot_cache(
+                    monitor_display_name, node_config))
+
+    # The Substrate node monitors cache the staking data of the finished eras,
+    # as it does not change once an era is over.
+    if monitor_type == SubstrateNodeMonitor:
+        args = (*args, _initialise_substrate_era_cache(
+            monitor_display_name, node_config))
+
     node_monitor = _initialise_monitor(monitor_type, monitor_display_name,
                                        env.NODE_MONITOR_PERIOD_SECONDS,
-                                       node_config, *args)
-    start_monitor(node_monitor)
+                                       node_config, *args, runtime=runtime)
+    return start_monitor(node_monitor, runtime)
 
 
 def start_chainlink_contracts_monitor(
         weiwatchers_url: str, evm_nodes: List[str],
         node_configs: List[ChainlinkNodeConfig], sub_chain: str,
-        parent_id: str) -> None:
+        parent_id: str, runtime: Optional[MonitorsRuntime] = None
+) -> Optional[MonitorTask]:
     node_monitor = _initialise_chainlink_contracts_monitor(
         CL_CONTRACTS_MONITOR_NAME_TEMPLATE.format(sub_chain),
         env.CHAINLINK_CONTRACTS_MONITOR_PERIOD_SECONDS, weiwatchers_url,
-        evm_nodes, node_configs, parent_id)
-    start_monitor(node_monitor)
+        evm_nodes, node_configs, parent_id, runtime=runtime)
+    return start_monitor(node_monitor, runtime)
 
 
 def start_cosmos_network_monitor(
         data_sources: List[CosmosNodeConfig], parent_id: str,
-        chain_name: str) -> None:
+        chain_name: str, runtime: Optional[MonitorsRuntime] = None
+) -> Optional[MonitorTask]:
     monitor_display_name = COSMOS_NETWORK_MONITOR_NAME_TEMPLATE.format(
         chain_name)
     node_monitor = _initialise_cosmos_network_monitor(
         monitor_display_name, env.NETWORK_MONITOR_PERIOD_SECONDS, data_sources,
-        parent_id, chain_name)
-    start_monitor(node_monitor)
+        parent_id, chain_name, runtime=runtime)
+    return start_monitor(node_monitor, runtime)
 
 
 def start_substrate_network_monitor(
         data_sources: List[SubstrateNodeConfig], parent_id: str,
-        chain_name: str, governance_addresses: List[str]) -> None:
+        chain_name: str, governance_addresses: List[str],
+        runtime: Optional[MonitorsRuntime] = None) -> Optional[MonitorTask]:
     monitor_display_name = SUBSTRATE_NETWORK_MONITOR_NAME_TEMPLATE.format(
         chain_name)
     node_monitor = _initialise_substrate_network_monitor(
         monitor_display_name, env.NETWORK_MONITOR_PERIOD_SECONDS, data_sources,
-        governance_addresses, parent_id, chain_name)
-    start_monitor(node_monitor)
+        governance_addresses, parent_id, chain_name, runtime=runtime)
+    return start_monitor(node_monitor, runtime)
+
 
+def start_monitor(monitor: Monitor, runtime: Optional[MonitorsRuntime] = None
+                  ) -> Optional[MonitorTask]:
+    # If a runtime is given the monitor is run as one of the runtime's tasks,
+    # otherwise it is run in the current process until the process is killed.
+    if runtime is not None:
+        return runtime.run_monitor(monitor)
 
-def start_monitor(monitor: Monitor) -> None:
     while True:
         try:
             log_and_print("{} started.".format(monitor), monitor.logger)
@@ -58,17 +58,13 @@ class SubstrateMonitor(Monitor, ABC):
         :raises: SubstrateApiIsNotReachableException if the Substrate-API
                  service cannot be reached
         """
-        nodes = [node for node in nodes if node.node_ws_url]
-        for node in nodes:
+        def is_synced(node: SubstrateNodeConfig) -> bool:
             ws_url = node.node_ws_url
-            node_name = node.node_name
             try:
                 api_ret = self.substrate_api_wrapper.execute_with_checks(
                     self.substrate_api_wrapper.get_system_health, [ws_url],
-                    node_name, False)
-                if not api_ret['result']['isSyncing']:
-                    self.logger.debug('chosen %s.', ws_url)
-                    return node
+                    node.node_name, False)
+                return not api_ret['result']['isSyncing']
             except (ReqConnectionError, ReadTimeout, InvalidURL, InvalidSchema,
                     MissingSchema) as e:
                 # This means that the Substrate API either cannot be reached due
@@ -85,8 +81,13 @@ class SubstrateMonitor(Monitor, ABC):
                 # API call, therefore, re-try again with another node.
                 self.logger.error("Error when trying to access %s", ws_url)
                 self.logger.exception(e)
+                raise e
 
-        return None
+        nodes = [node for node in nodes if node.node_ws_url]
+        return self._select_data_source(
+            nodes, lambda node: node.node_ws_url, is_synced,
+            (IncompleteRead, ChunkedEncodingError, ProtocolError,
+             SubstrateApiCallException, KeyError), 'substrate_websocket')
 
     def _execute_websocket_retrieval_with_exceptions(
             self, function: Callable, source: SubstrateNodeConfig) -> Dict:
@@ -15,12 +15,14 @@ from urllib3.exceptions import ProtocolError
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           SYSTEM_RAW_DATA_ROUTING_KEY)
 from src.utils.data import get_prometheus_metrics_data
 from src.utils.exceptions import (MetricNotFoundException,
                                   SystemIsDownException, DataReadingException,
                                   PANICException, InvalidUrlException)
+from src.utils.sharding import get_sharded_routing_key
 
 
 class SystemMonitor(Monitor):
@@ -46,6 +48,12 @@ class SystemMonitor(Monitor):
             'node_disk_io_time_seconds_total': 'strict'
         }
 
+        # The raw data is sent to the data transformer shard of the system, so
+        # that the state of the system is kept by one shard.
+        self._raw_data_routing_key = get_sharded_routing_key(
+            SYSTEM_RAW_DATA_ROUTING_KEY, system_config.system_id,
+            env.SYSTEM_DATA_TRANSFORMER_SHARDS)
+
     @property
     def system_config(self) -> SystemConfig:
         return self._system_config
@@ -234,7 +242,7 @@ class SystemMonitor(Monitor):
 
     def _send_data(self, data: Dict) -> None:
         self.rabbitmq.basic_publish_confirm(
-            exchange=RAW_DATA_EXCHANGE, routing_key=SYSTEM_RAW_DATA_ROUTING_KEY,
+            exchange=RAW_DATA_EXCHANGE, routing_key=self._raw_data_routing_key,
             body=data, is_body_dict=True,
             properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
@@ -101,11 +101,19 @@ def parse_cosmos_node_config(node_config: Dict) -> CosmosNodeConfig:
     use_as_data_source = str_to_bool(node_config['use_as_data_source'])
     is_archive_node = str_to_bool(node_config['is_archive_node'])
     operator_address = node_config['operator_address']
+
+    # This is optional, if not given the default set in the environment is used
+    tendermint_rpc_max_concurrent_requests = node_config.get(
+        'tendermint_rpc_max_concurrent_requests')
+    tendermint_rpc_max_concurrent_requests = \
+        int(tendermint_rpc_max_concurrent_requests) \
+        if tendermint_rpc_max_concurrent_requests else None
     return CosmosNodeConfig(
         node_id, parent_id, node_name, monitor_node, monitor_prometheus,
         prometheus_url, monitor_cosmos_rest, cosmos_rest_url,
         monitor_tendermint_rpc, tendermint_rpc_url, is_validator,
-        is_archive_node, use_as_data_source, operator_address)
+        is_archive_node, use_as_data_source, operator_address,
+        tendermint_rpc_max_concurrent_requests)
 
 
 def parse_substrate_node_config(node_config: Dict) -> SubstrateNodeConfig:
@@ -53,3 +53,11 @@ Triggered At: {date_time}
 Parent ID: {parent_id}
 Origin ID: {origin_id}
 """
+
+# The minimum number of seconds between the alerts sent to a channel which is
+# rate limited per chat, so that the alerts are not rejected when re-tried
+TELEGRAM_MIN_SEND_INTERVAL = 1
+SLACK_MIN_SEND_INTERVAL = 1
+
+# The maximum number of alert messages listed in a digest message
+DIGEST_MAX_ALERT_MESSAGES = 10
@@ -15,6 +15,13 @@ VALID_COSMOS_NODE_SOURCES = ['prometheus', 'cosmos_rest', 'tendermint_rpc']
 VALID_COSMOS_NETWORK_SOURCES = ['cosmos_rest']
 VALID_SUBSTRATE_NODE_SOURCES = ['websocket']
 VALID_SUBSTRATE_NETWORK_SOURCES = ['websocket']
+# For how many seconds the Redis state of a parent retrieved by a data
+# transformer is used to load the state of newly seen monitorables
+PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD = 60
+# For how many seconds the mute state read from Redis by the alert router is
+# re-used before it is read again. Muting and unmuting through the commands of
+# the channels therefore takes at most this long to take effect.
+MUTE_STATE_CACHE_PERIOD = 5
 RAW_TO_TRANSFORMED_CHAINLINK_METRICS = {
     'head_tracker_current_head': 'current_height',
     'head_tracker_heads_received_total': 'total_block_headers_received',
@@ -1,12 +1,19 @@
 import json
 import logging
+import os
+import re
+import threading
+import time
 from enum import Enum
 from json import JSONDecodeError
-from typing import Dict
+from typing import Any, Dict, Optional, Iterable, Iterator, Mapping, Tuple
 
 import requests
 from prometheus_client.parser import text_string_to_metric_families
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from src.utils import env
 from src.utils.exceptions import (NoMetricsGivenException,
                                   MetricNotFoundException,
                                   ReceivedUnexpectedDataException)
@@ -17,6 +24,102 @@ class RequestStatus(Enum):
     FAILED = False
 
 
+class HttpSessionRegistry:
+    """
+    This class keeps a keep-alive HTTP session for the current process, so
+    that the connections opened to a data source are re-used across requests
+    and monitoring rounds rather than being opened and closed every time. The
+    session keeps a pool of up to pool_maxsize connections for each of the
+    last pool_connections hosts used, and failed requests are retried
+    max_retries times with an exponential backoff of backoff_factor.
+
+    Since connections cannot be shared between processes, a new session is
+    created if the registry is used by a forked process.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 max_retries: int = 0, backoff_factor: float = 0) -> None:
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._lock = threading.Lock()
+        self._session = None
+        self._session_pid = None
+
+    @property
+    def pool_connections(self) -> int:
+        return self._pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    @property
+    def backoff_factor(self) -> float:
+        return self._backoff_factor
+
+    def _create_session(self) -> requests.Session:
+        # Only retry the idempotent requests which fail with a gateway error,
+        # and return the last response rather than raising if the retries are
+        # exhausted. Connection errors are not retried, as the monitors fall
+        # back to another data source instead, and a node which is down would
+        # otherwise take max_retries + 1 times as long to be detected.
+        retry = Retry(total=self.max_retries, connect=0, read=0,
+                      backoff_factor=self.backoff_factor,
+                      status_forcelist=(502, 503, 504),
+                      allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self) -> requests.Session:
+        """
+        This function returns the session of the current process, creating it
+        if it does not exist yet.
+        :return: The HTTP session of the current process
+        """
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                self._session = self._create_session()
+                self._session_pid = os.getpid()
+            return self._session
+
+    def close(self) -> None:
+        """
+        This function closes the connections of the session of the current
+        process, if any.
+        :return: None
+        """
+        with self._lock:
+            if self._session is not None and self._session_pid == os.getpid():
+                self._session.close()
+            self._session = None
+            self._session_pid = None
+
+
+HTTP_SESSION_REGISTRY = HttpSessionRegistry(
+    env.HTTP_POOL_CONNECTIONS, env.HTTP_POOL_MAXSIZE, env.HTTP_MAX_RETRIES,
+    env.HTTP_RETRY_BACKOFF_FACTOR)
+
+
+def get_http_session(registry: Optional[HttpSessionRegistry] = None) \
+        -> requests.Session:
+    if registry is None:
+        registry = HTTP_SESSION_REGISTRY
+
+    return registry.get_session()
+
+
 def get_cosmos_json(endpoint: str, logger: logging.Logger, params=None,
                     verify: bool = True, timeout=10):
     # For Cosmos SDK versions <= 0.39.2 a 404 not found error may be returned if
@@ -25,8 +128,8 @@ def get_cosmos_json(endpoint: str, logger: logging.Logger, params=None,
     if params is None:
         params = {}
 
-    get_ret = requests.get(url=endpoint, params=params, timeout=timeout,
-                           verify=verify, headers={'Connection': 'close'})
+    get_ret = get_http_session().get(url=endpoint, params=params,
+                                     timeout=timeout, verify=verify)
     logger.debug("get_json: get_ret: %s", get_ret)
 
     try:
@@ -39,19 +142,289 @@ def get_json(endpoint: str, logger: logging.Logger, params=None,
              verify: bool = True, timeout=10):
     if params is None:
         params = {}
-    get_ret = requests.get(url=endpoint, params=params, timeout=timeout,
-                           verify=verify, headers={'Connection': 'close'})
+    get_ret = get_http_session().get(url=endpoint, params=params,
+                                     timeout=timeout, verify=verify)
     logger.debug("get_json: get_ret: %s", get_ret)
     return json.loads(get_ret.content.decode('UTF-8'))
 
 
+class ConditionalRequestCache:
+    """
+    This class keeps the validators (ETag and Last-Modified) and the JSON
+    content of the last successful response from every url, so that the urls
+    can be requested conditionally. A server answers a conditional request with
+    304 Not Modified if the content did not change since it was last
+    retrieved, without sending the content again, in which case the kept
+    content is re-used.
+    """
+
+    def __init__(self) -> None:
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._contents: Dict[str, Any] = {}
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._contents
+
+    def get_request_headers(self, url: str) -> Dict[str, str]:
+        """
+        This function returns the headers which make a request to <url>
+        conditional on the content having changed since it was last retrieved
+        :param url: The requested url
+        :return: The conditional request headers, empty if nothing is cached
+                 for the url
+        """
+        validators = self._validators.get(url, {})
+        headers = {}
+        if 'ETag' in validators:
+            headers['If-None-Match'] = validators['ETag']
+        if 'Last-Modified' in validators:
+            headers['If-Modified-Since'] = validators['Last-Modified']
+        return headers
+
+    def get_content(self, url: str) -> Any:
+        return self._contents.get(url)
+
+    def store(self, url: str, headers: Mapping[str, str],
+              content: Any) -> None:
+        """
+        This function keeps the content retrieved from <url> if the response
+        had any validators, as otherwise it cannot be requested conditionally
+        :param url: The requested url
+        :param headers: The headers of the response
+        :param content: The JSON content of the response
+        :return: None
+        """
+        validators = {header: headers[header]
+                      for header in ['ETag', 'Last-Modified']
+                      if header in headers}
+        if validators:
+            self._validators[url] = validators
+            self._contents[url] = content
+        else:
+            self.remove(url)
+
+    def remove(self, url: str) -> None:
+        self._validators.pop(url, None)
+        self._contents.pop(url, None)
+
+
+def get_json_conditionally(endpoint: str, logger: logging.Logger,
+                           cache: ConditionalRequestCache,
+                           verify: bool = True, timeout=10) \
+        -> Tuple[Any, bool, Mapping[str, str]]:
+    """
+    This function retrieves the JSON content of <endpoint> with a conditional
+    request, using and updating the validators kept in <cache>.
+    :param endpoint: The requested url
+    :param logger: The logger of the caller
+    :param cache: The cache of the validators and contents of the urls
+    :param verify: Whether the TLS certificate of the endpoint is verified
+    :param timeout: The timeout of the request
+    :return: The content, which is the cached content if the server answered
+           : 304 Not Modified
+           : Whether the content was modified since it was last retrieved
+           : The headers of the response
+    """
+    get_ret = get_http_session().get(
+        url=endpoint, headers=cache.get_request_headers(endpoint),
+        timeout=timeout, verify=verify)
+    logger.debug("get_json_conditionally: get_ret: %s", get_ret)
+
+    if get_ret.status_code == 304 and endpoint in cache:
+        return cache.get_content(endpoint), False, get_ret.headers
+
+    content = json.loads(get_ret.content.decode('UTF-8'))
+    if get_ret.ok:
+        cache.store(endpoint, get_ret.headers, content)
+    else:
+        cache.remove(endpoint)
+
+    return content, True, get_ret.headers
+
+
+def get_rate_limit_delay(headers: Mapping[str, str],
+                         requests_per_round: int = 1) -> float:
+    """
+    This function computes how long a monitor should wait before its next
+    round so that it does not exceed the rate limit described by the
+    X-RateLimit-Remaining and X-RateLimit-Reset headers of a response. If the
+    remaining requests do not cover another round, the monitor should wait
+    until the rate limit resets. Otherwise the remaining requests are spread
+    evenly until the reset.
+    :param headers: The headers of the last response
+    :param requests_per_round: The number of requests made in a round
+    :return: The delay in seconds, 0 if the headers do not describe a rate
+             limit
+    """
+    try:
+        # Some APIs append the window to the value, e.g. 100;w=21600
+        remaining = int(headers['X-RateLimit-Remaining'].split(';')[0])
+        reset_time = float(headers['X-RateLimit-Reset'].split(';')[0])
+    except (KeyError, ValueError):
+        return 0.0
+
+    seconds_to_reset = max(0.0, reset_time - time.time())
+    if remaining < requests_per_round:
+        return seconds_to_reset
+
+    return seconds_to_reset * requests_per_round / remaining
+
+
 def get_prometheus(endpoint: str, logger: logging.Logger, verify: bool = True):
-    metrics = requests.get(endpoint, timeout=10, verify=verify, headers={
-        'Connection': 'close'}).content
+    metrics = get_http_session().get(endpoint, timeout=10,
+                                     verify=verify).content
     logger.debug("Retrieved prometheus data from endpoint: " + endpoint)
     return metrics.decode('utf-8')
 
 
+# The size of the chunks read from a prometheus endpoint
+PROMETHEUS_CHUNK_SIZE = 64 * 1024
+
+# The sample names allowed in a metric family depending on its type, as in
+# prometheus_client's parser. Any other sample is a family on its own.
+_PROMETHEUS_TYPE_SUFFIXES = {
+    b'summary': (b'_count', b'_sum', b''),
+    b'histogram': (b'_count', b'_sum', b'_bucket'),
+}
+
+# Matches a list of labels without escape sequences, and each of its labels
+_PROMETHEUS_LABELS_RE = re.compile(r'(?:\s*[^=\s",]+\s*=\s*"[^"]*"\s*,?)*')
+_PROMETHEUS_LABEL_RE = re.compile(r'\s*([^=\s",]+)\s*=\s*"([^"]*)"')
+
+
+def get_prometheus_lines(endpoint: str, logger: logging.Logger,
+                         verify: bool = True) -> Iterator[bytes]:
+    """
+    This function streams the prometheus data exposed by the endpoint line by
+    line, so that the whole body never has to be kept in memory.
+    :param endpoint: The endpoint we are obtaining the data from
+    :param logger: Where logging should be sent
+    :param verify: Will verify the certificate if set to True
+    :return: An iterator over the lines of the prometheus data
+    """
+    with get_http_session().get(endpoint, timeout=10, verify=verify,
+                                stream=True) as response:
+        logger.debug("Retrieving prometheus data from endpoint: " + endpoint)
+        yield from response.iter_lines(chunk_size=PROMETHEUS_CHUNK_SIZE)
+
+
+def _parse_prometheus_sample(line: str) -> Tuple[Optional[str], float]:
+    """
+    This function parses the labels and the value of a prometheus sample. The
+    labels are returned as the JSON string json.dumps(labels) which is used to
+    key labelled samples, or as None if the sample has no labels.
+    :param line: The sample line
+    :return: (labels key, value)
+    """
+    label_start = line.find('{')
+    label_end = line.rfind('}')
+    if label_start == -1 or label_end == -1:
+        labels_text = ''
+        name_and_value = line.split(None, 1)
+        value_text = name_and_value[1] if len(name_and_value) == 2 else ''
+    else:
+        labels_text = line[label_start + 1:label_end]
+        value_text = line[label_end + 1:]
+
+    # The key can be built directly from the text when the labels are plain
+    # ASCII without escape sequences, since it is then identical to the JSON
+    # dump of the labels. Otherwise we fall back to prometheus_client's parser.
+    labels = None
+    if '\\' not in labels_text and labels_text.isascii() \
+            and labels_text.isprintable() \
+            and _PROMETHEUS_LABELS_RE.fullmatch(labels_text):
+        labels = _PROMETHEUS_LABEL_RE.findall(labels_text)
+        if len({label_name for label_name, _ in labels}) != len(labels):
+            labels = None
+
+    if labels is None:
+        sample = next(text_string_to_metric_families(line)).samples[0]
+        return (json.dumps(sample.labels) if sample.labels else None,
+                sample.value)
+
+    value_and_timestamp = value_text.split()
+    if not value_and_timestamp:
+        raise ValueError("Invalid prometheus sample: " + line)
+    value = float(value_and_timestamp[0])
+    if not labels:
+        return None, value
+
+    return '{' + ', '.join('"{}": "{}"'.format(label_name, label_value)
+                           for label_name, label_value in labels) + '}', value
+
+
+def parse_prometheus_metrics(lines: Iterable[bytes],
+                             requested_metrics: Iterable[str]) -> Dict:
+    """
+    This function parses the samples of the requested metrics from prometheus
+    data given line by line. The metric families are tracked as in
+    prometheus_client's parser so that the samples are named the same way,
+    but only the samples of the requested metrics have their labels and value
+    parsed. Labelled samples are keyed by json.dumps(labels), and the values of
+    unlabelled samples with the same name are summed.
+    :param lines: The lines of the prometheus data
+    :param requested_metrics: The names of the metrics to be parsed
+    :return: The values of the requested metrics which were found
+    """
+    requested = {metric.encode('utf-8'): metric
+                 for metric in requested_metrics}
+    response = {}
+    family_name = b''
+    family_type = b'untyped'
+    allowed_names = ()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if line.startswith(b'#'):
+            parts = line.split(None, 3)
+            if len(parts) < 3:
+                continue
+            if parts[1] == b'HELP' and parts[2] != family_name:
+                family_name = parts[2]
+                family_type = b'untyped'
+                allowed_names = (family_name,)
+            elif parts[1] == b'TYPE':
+                family_name = parts[2]
+                family_type = parts[3] if len(parts) == 4 else b'untyped'
+                allowed_names = tuple(
+                    family_name + suffix for suffix in
+                    _PROMETHEUS_TYPE_SUFFIXES.get(family_type, (b'',)))
+            continue
+
+        label_start = line.find(b'{')
+        if label_start != -1 and b'}' in line:
+            name = line[:label_start].strip()
+        else:
+            name = line.split(None, 1)[0]
+
+        if name not in allowed_names:
+            family_name = b''
+            family_type = b'untyped'
+            allowed_names = ()
+        elif family_type == b'counter' and not family_name.endswith(b'_total'):
+            # prometheus_client exposes these counters' samples as <name>_total
+            name += b'_total'
+
+        metric = requested.get(name)
+        if metric is None:
+            continue
+
+        labels_key, value = _parse_prometheus_sample(line.decode('utf-8'))
+        if metric not in response:
+            response[metric] = {labels_key: value} if labels_key else value
+        elif labels_key:
+            response[metric][labels_key] = value
+        else:
+            response[metric] = value + response[metric]
+
+    return response
+
+
 def get_prometheus_metrics_data(endpoint: str,
                                 requested_metrics: Dict[str, str],
                                 logger: logging.Logger,
@@ -72,29 +445,12 @@ def get_prometheus_metrics_data(endpoint: str,
     :param verify: Will verify the certificate if set to True
     :return: The metrics with their values
     """
-    response = {}
     if len(requested_metrics) == 0:
         raise NoMetricsGivenException("No metrics given when requesting "
                                       "prometheus data from " + endpoint)
 
-    metrics = get_prometheus(endpoint, logger, verify)
-    for family in text_string_to_metric_families(metrics):
-        for sample in family.samples:
-            if sample.name in requested_metrics:
-                if sample.name not in response:
-                    if sample.labels != {}:
-                        response[sample.name] = {}
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value
-                else:
-                    if sample.labels != {}:
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value + \
-                                                response[sample.name]
+    response = parse_prometheus_metrics(
+        get_prometheus_lines(endpoint, logger, verify), requested_metrics)
 
     missing_metrics = set(requested_metrics) - set(response)
     for metric in missing_metrics:
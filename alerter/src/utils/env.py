@@ -1,5 +1,7 @@
 import os
 
+from src.utils.sharding import MAX_SHARDS
+
 """
 This module is here to reduce any ambiguity with environment variables and
 types. We use `os.getenv()` to define a default value in the case that the
@@ -64,6 +66,112 @@ NETWORK_MONITOR_PERIOD_SECONDS = int(
     os.environ['NETWORK_MONITOR_PERIOD_SECONDS'])
 # These define how often a monitor runs an iteration of its monitoring loop
 
+# Monitors data retrieval
+TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv('TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS', 1))
+# This defines how many heights a Cosmos node monitor retrieves concurrently
+# from a Tendermint RPC data source when catching up, unless a different limit
+# is set for that node in its tendermint_rpc_max_concurrent_requests field
+EVM_NODE_MAX_CALLS_PER_BATCH = int(
+    os.getenv('EVM_NODE_MAX_CALLS_PER_BATCH', 100))
+# This defines how many contract calls the Chainlink contracts monitor groups
+# in a single JSON-RPC batch request to an EVM node
+SUBSTRATE_API_MAX_BLOCKS_PER_BATCH = int(
+    os.getenv('SUBSTRATE_API_MAX_BLOCKS_PER_BATCH', 1))
+# This defines how many heights a Substrate validator monitor retrieves in a
+# single request to the Substrate API when catching up (at most 100)
+COSMOS_PROPOSALS_FULL_RETRIEVAL_INTERVAL_SECONDS = int(
+    os.getenv('COSMOS_PROPOSALS_FULL_RETRIEVAL_INTERVAL_SECONDS', 0))
+# This defines how often a Cosmos network monitor retrieves all the governance
+# proposals of the chain. In the rounds in between, only the proposals in their
+# deposit or voting period are retrieved
+ENABLE_DATA_SOURCE_HEALTH_REGISTRY: bool = \
+    os.getenv('ENABLE_DATA_SOURCE_HEALTH_REGISTRY', 'False').lower() in (
+        "true", "yes", "y")
+DATA_SOURCE_FAILURE_THRESHOLD = int(
+    os.getenv('DATA_SOURCE_FAILURE_THRESHOLD', 3))
+DATA_SOURCE_CIRCUIT_OPEN_SECONDS = int(
+    os.getenv('DATA_SOURCE_CIRCUIT_OPEN_SECONDS', 60))
+# If enabled, the monitors rank the data sources they select from by health,
+# and stop probing a data source once it fails DATA_SOURCE_FAILURE_THRESHOLD
+# times in a row. Such a data source is then re-probed in the background every
+# DATA_SOURCE_CIRCUIT_OPEN_SECONDS until it recovers
+ENABLE_REPO_CONDITIONAL_REQUESTS: bool = \
+    os.getenv('ENABLE_REPO_CONDITIONAL_REQUESTS', 'False').lower() in (
+        "true", "yes", "y")
+# If enabled, the GitHub and DockerHub monitors request the repo pages
+# conditionally, do not publish the data of a repo if it did not change since
+# it was last published, stop paging the DockerHub tags once they reach the
+# tags seen in the previous round, and wait for the rate limits of the APIs to
+# reset before polling again
+
+# HTTP data retrieval
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 0))
+HTTP_RETRY_BACKOFF_FACTOR = float(os.getenv('HTTP_RETRY_BACKOFF_FACTOR', 0))
+# These define how many hosts and connections per host are kept alive by the
+# HTTP session of each process, and how idempotent HTTP requests which fail
+# with a gateway error are retried
+
+# Monitors runtime
+ENABLE_SHARED_MONITORS_RUNTIME: bool = \
+    os.getenv('ENABLE_SHARED_MONITORS_RUNTIME', 'False').lower() in (
+        "true", "yes", "y")
+SHARED_MONITORS_RUNTIME_WORKERS = int(
+    os.getenv('SHARED_MONITORS_RUNTIME_WORKERS', 10))
+# If enabled, the monitors of each monitors manager are run by worker threads
+# inside the manager's process and share one RabbitMQ connection, rather than
+# being run in a process each
+
+# Mongo time-series storage
+ENABLE_MONGO_TIME_SERIES_STORAGE: bool = \
+    os.getenv('ENABLE_MONGO_TIME_SERIES_STORAGE', 'False').lower() in (
+        "true", "yes", "y")
+MONGO_TIME_SERIES_FLUSH_SIZE = int(
+    os.getenv('MONGO_TIME_SERIES_FLUSH_SIZE', 500))
+MONGO_TIME_SERIES_FLUSH_INTERVAL = float(
+    os.getenv('MONGO_TIME_SERIES_FLUSH_INTERVAL', 5))
+MONGO_TIME_SERIES_ROLLUP_INTERVAL = float(
+    os.getenv('MONGO_TIME_SERIES_ROLLUP_INTERVAL', 300))
+MONGO_RAW_DATA_RETENTION_DAYS = int(
+    os.getenv('MONGO_RAW_DATA_RETENTION_DAYS', 0))
+# If enabled, the data stores keep the metrics in Mongo as typed values in
+# date/hour buckets, and write them in bulk once MONGO_TIME_SERIES_FLUSH_SIZE
+# entries are buffered or MONGO_TIME_SERIES_FLUSH_INTERVAL seconds have passed
+# Every MONGO_TIME_SERIES_ROLLUP_INTERVAL seconds, the system store rolls up
+# the hours which are over of every collection into 5 minute, hourly and daily
+# summaries. The raw data is expired after MONGO_RAW_DATA_RETENTION_DAYS,
+# unless this is 0.
+
+# Sharding
+SYSTEM_DATA_TRANSFORMER_SHARDS = min(int(
+    os.getenv('SYSTEM_DATA_TRANSFORMER_SHARDS', 1)), MAX_SHARDS)
+SYSTEM_ALERTER_SHARDS = min(int(
+    os.getenv('SYSTEM_ALERTER_SHARDS', 1)), MAX_SHARDS)
+EVM_NODE_DATA_TRANSFORMER_SHARDS = min(int(
+    os.getenv('EVM_NODE_DATA_TRANSFORMER_SHARDS', 1)), MAX_SHARDS)
+EVM_NODE_ALERTER_SHARDS = min(int(
+    os.getenv('EVM_NODE_ALERTER_SHARDS', 1)), MAX_SHARDS)
+CHAINLINK_NODE_DATA_TRANSFORMER_SHARDS = min(int(
+    os.getenv('CHAINLINK_NODE_DATA_TRANSFORMER_SHARDS', 1)), MAX_SHARDS)
+CHAINLINK_NODE_ALERTER_SHARDS = min(int(
+    os.getenv('CHAINLINK_NODE_ALERTER_SHARDS', 1)), MAX_SHARDS)
+COSMOS_NODE_DATA_TRANSFORMER_SHARDS = min(int(
+    os.getenv('COSMOS_NODE_DATA_TRANSFORMER_SHARDS', 1)), MAX_SHARDS)
+COSMOS_NODE_ALERTER_SHARDS = min(int(
+    os.getenv('COSMOS_NODE_ALERTER_SHARDS', 1)), MAX_SHARDS)
+SUBSTRATE_NODE_DATA_TRANSFORMER_SHARDS = min(int(
+    os.getenv('SUBSTRATE_NODE_DATA_TRANSFORMER_SHARDS', 1)), MAX_SHARDS)
+SUBSTRATE_NODE_ALERTER_SHARDS = min(int(
+    os.getenv('SUBSTRATE_NODE_ALERTER_SHARDS', 1)), MAX_SHARDS)
+# These define how many processes each system and node data transformer and
+# alerter is split into. The data of a system or node is always processed by
+# the same transformer shard, and the data of a chain by the same alerter
+# shard. If set to 1 the component is not sharded. At most 32 shards are
+# started. When the number of shards changes, the queues of the old shards are
+# deleted on startup.
+
 # Publishers limits
 DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE'])
@@ -74,6 +182,38 @@ ALERT_ROUTER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['ALERT_ROUTER_PUBLISHING_QUEUE_SIZE'])
 CONFIG_PUBLISHING_QUEUE_SIZE = int(
     os.environ['CONFIG_PUBLISHING_QUEUE_SIZE'])
+# If enabled, the publishers send the messages waiting in their publishing
+# queue in batches of at most PUBLISHING_BATCH_SIZE messages, waiting for
+# RabbitMQ once per batch rather than once per message
+ENABLE_BATCHED_PUBLISHING: bool = \
+    os.getenv('ENABLE_BATCHED_PUBLISHING', 'False').lower() in (
+        "true", "yes", "y")
+PUBLISHING_BATCH_SIZE = int(os.getenv('PUBLISHING_BATCH_SIZE', 100))
+
+# Channel Alerts Handlers
+ENABLE_NON_BLOCKING_ALERT_RETRIES: bool = \
+    os.getenv('ENABLE_NON_BLOCKING_ALERT_RETRIES', 'False').lower() in (
+        True, "true", "yes", "y")
+# If enabled, the Telegram, Slack, PagerDuty, Opsgenie and Email alerts
+# handlers re-try the alerts which cannot be sent with an exponential backoff,
+# while sending the alerts behind them, rather than blocking until they are
+# sent
+CHAT_ALERTS_DIGEST_WINDOW_SECONDS = int(
+    os.getenv('CHAT_ALERTS_DIGEST_WINDOW_SECONDS', 0))
+# If greater than 0, the Telegram and Slack alerts handlers send the alerts
+# received within this many seconds of each other which have the same
+# parent_id, severity and alert code together, in one digest message
+
+# Email Preferences
+EMAIL_SMTP_IDLE_TIMEOUT_SECONDS = int(
+    os.getenv('EMAIL_SMTP_IDLE_TIMEOUT_SECONDS', 0))
+# If greater than 0, the email alerts handlers keep their authenticated SMTP
+# connection open and re-use it for the emails sent within this many seconds of
+# each other, rather than connecting for every email
+EMAIL_ALERTS_BATCH_WINDOW_SECONDS = int(
+    os.getenv('EMAIL_ALERTS_BATCH_WINDOW_SECONDS', 0))
+# If greater than 0, the email alerts handlers send the alerts received within
+# this many seconds of each other together, in one email per recipient
 
 # Console Output
 ENABLE_CONSOLE_ALERTS: bool = \
@@ -0,0 +1,199 @@
+import logging
+from typing import List, Any, Union, Optional
+
+from eth_abi.exceptions import DecodingError
+from hexbytes import HexBytes
+from requests.exceptions import RequestException
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import ContractFunction
+from web3.exceptions import ContractLogicError, BadFunctionCallOutput
+from web3.types import BlockIdentifier
+
+from src.utils.data import get_http_session
+
+# The JSON-RPC error code used by EVM nodes for reverted calls
+_EXECUTION_REVERTED_ERROR_CODE = 3
+
+# The default number of calls grouped in a single batch request
+DEFAULT_MAX_CALLS_PER_BATCH = 100
+
+
+class ContractCallBatcher:
+    """
+    This class executes contract function calls (eth_call) on an EVM node in
+    JSON-RPC batch requests of at most max_batch_size calls, so that many calls
+    cost a single round trip to the node.
+
+    Not every EVM node accepts batch requests. If the node rejects batch
+    requests by answering with a single error object, the calls are executed
+    one by one through web3 from then on, as they are when max_batch_size is
+    at most 1. If a batch request fails otherwise, for example because the
+    node is restarting, only the calls of that round are executed one by one.
+    """
+
+    def __init__(self, w3_interface: Web3, logger: logging.Logger,
+                 max_batch_size: int = DEFAULT_MAX_CALLS_PER_BATCH) -> None:
+        self._w3_interface = w3_interface
+        self._logger = logger
+        self._max_batch_size = max_batch_size
+        self._batching_supported = max_batch_size > 1
+
+    @property
+    def w3_interface(self) -> Web3:
+        return self._w3_interface
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def batching_supported(self) -> bool:
+        return self._batching_supported
+
+    def _encode_call_data(self, function: ContractFunction) -> str:
+        contract = self.w3_interface.eth.contract(address=function.address,
+                                                  abi=function.contract_abi)
+        return contract.encodeABI(fn_name=function.function_identifier,
+                                  args=function.args, kwargs=function.kwargs)
+
+    def _decode_output(self, function: ContractFunction, output: str) -> Any:
+        # Decode the output the same way web3 does in ContractFunction.call
+        output_types = get_abi_output_types(function.abi)
+        try:
+            output_data = self.w3_interface.codec.decode_abi(
+                output_types, HexBytes(output))
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                "Could not decode contract function call to {} with return "
+                "data: {}, output_types: {}".format(
+                    function.fn_name, output, output_types)) from e
+
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types,
+                                       output_data)
+        return normalized_data[0] if len(normalized_data) == 1 \
+            else normalized_data
+
+    def _call_batch(self, functions: List[ContractFunction],
+                    block_identifier: BlockIdentifier) -> Optional[List[Any]]:
+        """
+        This function executes the calls in a single JSON-RPC batch request.
+        :param functions: The contract functions to be called
+        :param block_identifier: The block at which the calls are executed
+        :return: The outputs of the calls, or a ContractLogicError for every
+               : call which reverted
+               : None if the batch request failed or was rejected
+        """
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+        batch = [{
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'method': 'eth_call',
+            'params': [{'to': function.address,
+                        'data': self._encode_call_data(function)},
+                       block_identifier]
+        } for request_id, function in enumerate(functions)]
+
+        provider = self.w3_interface.provider
+        try:
+            response = get_http_session().post(
+                provider.endpoint_uri, json=batch,
+                **provider.get_request_kwargs())
+            responses = response.json()
+        except (RequestException, ValueError) as e:
+            self.logger.warning(
+                "A batch request to the EVM node %s failed, the contract "
+                "calls of this round will be executed one by one: %s",
+                provider.endpoint_uri, e)
+            return None
+
+        # A node which does not support batch requests answers the batch with
+        # a single error object rather than a response per request.
+        if isinstance(responses, dict) and 'error' in responses:
+            self.logger.warning(
+                "The EVM node %s rejected a batch request (%s), contract "
+                "calls will be executed one by one.", provider.endpoint_uri,
+                responses['error'])
+            self._batching_supported = False
+            return None
+
+        if isinstance(responses, list):
+            responses = {response.get('id'): response
+                         for response in responses
+                         if isinstance(response, dict)}
+        if (not isinstance(responses, dict)
+                or set(responses) != set(range(len(batch)))):
+            self.logger.warning(
+                "The EVM node %s returned an unexpected response to a batch "
+                "request, the contract calls of this round will be executed "
+                "one by one.", provider.endpoint_uri)
+            return None
+
+        results = []
+        for request_id, function in enumerate(functions):
+            response = responses[request_id]
+            if 'error' in response:
+                error = response['error']
+                if error.get('code') == _EXECUTION_REVERTED_ERROR_CODE \
+                        or 'revert' in str(error.get('message', '')).lower():
+                    results.append(ContractLogicError(error.get('message')))
+                else:
+                    # This is what web3 raises for JSON-RPC errors
+                    raise ValueError(error)
+            else:
+                results.append(self._decode_output(function,
+                                                   response['result']))
+
+        return results
+
+    def call(self, functions: List[ContractFunction],
+             block_identifier: BlockIdentifier = 'latest',
+             raise_reverted: bool = True) \
+            -> List[Union[Any, ContractLogicError]]:
+        """
+        This function executes the calls of the given contract functions.
+        :param functions: The contract functions to be called
+        :param block_identifier: The block at which the calls are executed
+        :param raise_reverted: If False, a call which reverted has its
+                             : ContractLogicError as output rather than raising
+                             : it, so that it does not affect the other calls
+        :return: The outputs of the calls in the order of the given functions
+        :raises ContractLogicError: If a call reverted and raise_reverted is
+                                  : True
+        """
+        batch_size = max(self.max_batch_size, 1)
+        results = []
+        batch_failed = False
+        for index in range(0, len(functions), batch_size):
+            batch_functions = functions[index:index + batch_size]
+            batch_results = None
+            if (self.batching_supported and not batch_failed
+                    and len(batch_functions) > 1):
+                batch_results = self._call_batch(batch_functions,
+                                                 block_identifier)
+                batch_failed = batch_results is None
+
+            if batch_results is None:
+                batch_results = []
+                for function in batch_functions:
+                    try:
+                        batch_results.append(function.call(
+                            block_identifier=block_identifier))
+                    except ContractLogicError as e:
+                        if raise_reverted:
+                            raise e
+                        batch_results.append(e)
+            elif raise_reverted:
+                for result in batch_results:
+                    if isinstance(result, ContractLogicError):
+                        raise result
+
+            results.extend(batch_results)
+
+        return results
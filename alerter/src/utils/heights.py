@@ -0,0 +1,58 @@
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+# The heap is rebuilt once it holds this many times more entries than there
+# are nodes, so that the stale entries do not accumulate
+_MAX_HEAP_SIZE_FACTOR = 2
+_MIN_HEAP_SIZE_FOR_REBUILD = 16
+
+
+class ChainHeightIndex:
+    """
+    This class keeps the current heights of the nodes of a chain, so that the
+    maximum height can be looked up in O(log n) rather than by iterating over
+    all the nodes. The heights are kept in a max-heap, and the entries made
+    stale by an update are only discarded once they reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._heights: Dict[str, int] = {}
+
+        # Heights are negated as heapq implements a min-heap
+        self._heap: List[Tuple[int, str]] = []
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    @property
+    def heights(self) -> Dict[str, int]:
+        return self._heights
+
+    def _rebuild(self) -> None:
+        self._heap = [(-height, node_id)
+                      for node_id, height in self._heights.items()]
+        heapq.heapify(self._heap)
+
+    def update(self, node_id: str, height: int) -> None:
+        if self._heights.get(node_id) == height:
+            return
+
+        self._heights[node_id] = height
+        heapq.heappush(self._heap, (-height, node_id))
+
+        if len(self._heap) > max(_MIN_HEAP_SIZE_FOR_REBUILD,
+                                 _MAX_HEAP_SIZE_FACTOR * len(self._heights)):
+            self._rebuild()
+
+    def get_max_height(self) -> Optional[int]:
+        while self._heap:
+            negated_height, node_id = self._heap[0]
+            if self._heights.get(node_id) == -negated_height:
+                return -negated_height
+
+            heapq.heappop(self._heap)
+
+        return None
@@ -0,0 +1,110 @@
+import hashlib
+import logging
+from typing import List, Optional
+
+import pika.frame
+
+from src.message_broker.rabbitmq import RabbitMQApi
+
+# The largest number of shards a component can be split into. This bounds the
+# shard queues which are looked for when the number of shards changes.
+MAX_SHARDS = 32
+
+# The constants of the linear congruential generator used by the jump
+# consistent hash, see https://arxiv.org/abs/1406.2294
+_JUMP_MULTIPLIER = 2862933555777941757
+_JUMP_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def get_shard(key: str, shards: int) -> int:
+    """
+    This function maps a key (for example a parent or node id) to a shard
+    using a jump consistent hash. The mapping is the same in every process, and
+    when the number of shards changes from n to n+1 only 1/(n+1) of the keys
+    are moved, and only to the new shard.
+    :param key: The key to be mapped
+    :param shards: The number of shards
+    :return: The shard of the key, from 0 to shards - 1
+    """
+    hashed_key = int.from_bytes(
+        hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+    shard = -1
+    next_shard = 0
+    while next_shard < shards:
+        shard = next_shard
+        hashed_key = (hashed_key * _JUMP_MULTIPLIER + 1) & _JUMP_MASK
+        next_shard = int((shard + 1) * (
+                float(1 << 31) / float((hashed_key >> 33) + 1)))
+
+    return max(shard, 0)
+
+
+def get_shards(shards: int) -> List[Optional[int]]:
+    """
+    :param shards: The configured number of shards of a component
+    :return: The shards to be started. If the component is not sharded, there
+           : is one shard, None, which keeps the component's original queues,
+           : routing keys and name
+    """
+    return [None] if shards <= 1 else list(range(shards))
+
+
+def add_shard_suffix(value: str, shard: Optional[int]) -> str:
+    # Gives a queue name or routing key of a shard
+    return value if shard is None else '{}.{}'.format(value, shard)
+
+
+def get_shard_name(name: str, shard: Optional[int]) -> str:
+    # Gives the name of a shard of a component
+    return name if shard is None else '{} (shard {})'.format(name, shard)
+
+
+def get_sharded_routing_key(routing_key: str, key: str, shards: int) -> str:
+    """
+    :param routing_key: The routing key the consumers of the data bind to
+    :param key: The key the data is sharded by
+    :param shards: The number of shards of the consumers
+    :return: The routing key the data should be published with so that it is
+           : consumed by the shard of the key
+    """
+    if shards <= 1:
+        return routing_key
+
+    return add_shard_suffix(routing_key, get_shard(key, shards))
+
+
+def get_stale_shard_queues(queue: str, shards: int) -> List[str]:
+    """
+    :param queue: The input queue of a sharded component
+    :param shards: The configured number of shards of the component
+    :return: The queues of the shards which are not started with this number
+           : of shards. These may be left over from a previous number of
+           : shards, in which case they are still bound to the exchanges
+    """
+    queues_in_use = [add_shard_suffix(queue, shard)
+                     for shard in get_shards(shards)]
+    queues = [queue] + [add_shard_suffix(queue, shard)
+                        for shard in range(MAX_SHARDS)]
+    return [queue for queue in queues if queue not in queues_in_use]
+
+
+def remove_stale_shard_queues(rabbitmq: RabbitMQApi, logger: logging.Logger,
+                              queue: str, shards: int) -> None:
+    """
+    This function deletes the queues of the shards which are no longer
+    started, together with their bindings. Otherwise, when the number of shards
+    changes, the durable queues of the old shards keep on receiving data which
+    is never consumed. Deleting a queue which does not exist has no effect.
+    :param rabbitmq: A connected RabbitMQ interface
+    :param logger: The logger of the component which owns the shards
+    :param queue: The input queue of the sharded component
+    :param shards: The configured number of shards of the component
+    :return: None
+    """
+    for stale_queue in get_stale_shard_queues(queue, shards):
+        logger.debug("Deleting queue '%s' if it exists", stale_queue)
+        ret = rabbitmq.queue_delete(stale_queue)
+        if isinstance(ret, pika.frame.Method) and ret.method.message_count:
+            logger.warning("Deleted stale shard queue '%s' together with %s "
+                           "unconsumed messages", stale_queue,
+                           ret.method.message_count)
@@ -0,0 +1,175 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import (Callable, Dict, Hashable, List, Optional, Set, Tuple,
+                    Type, TypeVar)
+
+from src.utils import env
+
+T = TypeVar('T')
+
+
+class DataSourceHealthRegistry:
+    """
+    This class keeps the health of the data sources probed by the monitors of
+    the current process, so that the monitors do not probe the sources which
+    are known to be failing every round. For every source the registry records
+    whether it was synced, its latency smoothed over the recent probes, and its
+    consecutive failures.
+
+    Sources are keyed by their url and the check performed on them, for
+    example the Cosmos SDK version of the REST queries. This way a source
+    which fails a check, such as a node which is not compatible with one of
+    the SDK versions tried, is not skipped when performing other checks on it.
+
+    Once a source fails failure_threshold times in a row its circuit is
+    opened, and it is no longer probed by the monitors. After open_period it
+    is probed once in the background, closing the circuit if the probe
+    succeeds and opening it for another open_period otherwise. The sources
+    whose circuit is closed are ranked by sync status, consecutive failures
+    and latency, so that the monitors probe the healthiest source first.
+    """
+
+    def __init__(self, failure_threshold: int = 3,
+                 open_period: timedelta = timedelta(seconds=60),
+                 latency_smoothing: float = 0.3) -> None:
+        self._failure_threshold = failure_threshold
+        self._open_period = open_period
+        self._latency_smoothing = latency_smoothing
+        self._lock = threading.Lock()
+        self._latencies: Dict[Hashable, float] = {}
+        self._synced: Dict[Hashable, bool] = {}
+        self._failures: Dict[Hashable, int] = {}
+
+        # The time at which the circuit of each failing source was opened
+        self._opened_at: Dict[Hashable, float] = {}
+
+        # The sources being probed in the background
+        self._probing: Set[Hashable] = set()
+        self._executor = None
+
+    @property
+    def failure_threshold(self) -> int:
+        return self._failure_threshold
+
+    @property
+    def open_period(self) -> timedelta:
+        return self._open_period
+
+    @property
+    def latencies(self) -> Dict[Hashable, float]:
+        return self._latencies
+
+    @property
+    def failures(self) -> Dict[Hashable, int]:
+        return self._failures
+
+    def is_circuit_open(self, key: Hashable) -> bool:
+        return key in self._opened_at
+
+    def record_success(self, key: Hashable, latency: float,
+                       synced: bool) -> None:
+        with self._lock:
+            last_latency = self._latencies.get(key)
+            self._latencies[key] = latency if last_latency is None else (
+                self._latency_smoothing * latency
+                + (1 - self._latency_smoothing) * last_latency)
+            self._synced[key] = synced
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+
+    def record_failure(self, key: Hashable) -> None:
+        with self._lock:
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if self._failures[key] >= self.failure_threshold:
+                self._opened_at[key] = time.time()
+
+    def rank(self, sources: List[T],
+             get_key: Callable[[T], Hashable]) -> List[T]:
+        """
+        This function returns the sources whose circuit is closed, healthiest
+        first. Sources which were not probed yet keep their given order and are
+        tried before the ones which were, so that they are probed at least once.
+        :param sources: The sources to rank
+        :param get_key: A function returning the key of a source
+        :return: The ranked sources whose circuit is closed
+        """
+        with self._lock:
+            def health(source: T) -> Tuple[bool, int, float]:
+                key = get_key(source)
+                return (not self._synced.get(key, True),
+                        self._failures.get(key, 0),
+                        self._latencies.get(key, 0.0))
+
+            return sorted([source for source in sources
+                           if get_key(source) not in self._opened_at],
+                          key=health)
+
+    def probe(self, key: Hashable, is_synced: Callable[[], bool],
+              expected_errors: Tuple[Type[Exception], ...]) -> bool:
+        """
+        This function probes a source, recording the outcome.
+        :param key: The key of the source
+        :param is_synced: A function which probes the source and returns
+                        : whether it is synced
+        :param expected_errors: The errors raised by is_synced if the source is
+                              : failing
+        :return: Whether the source is synced
+        :raises: Any error raised by is_synced. Only the expected errors are
+                 recorded as failures.
+        """
+        start = time.perf_counter()
+        try:
+            synced = is_synced()
+        except expected_errors:
+            self.record_failure(key)
+            raise
+
+        self.record_success(key, time.perf_counter() - start, synced)
+        return synced
+
+    def _probe_in_background(
+            self, key: Hashable, is_synced: Callable[[], bool],
+            expected_errors: Tuple[Type[Exception], ...]) -> None:
+        try:
+            self.probe(key, is_synced, expected_errors)
+        except expected_errors:
+            pass
+        finally:
+            with self._lock:
+                self._probing.discard(key)
+
+    def probe_in_background_if_due(
+            self, key: Hashable, is_synced: Callable[[], bool],
+            expected_errors: Tuple[Type[Exception], ...]) -> Optional[Future]:
+        """
+        This function probes a source whose circuit is open in the background,
+        if open_period passed since its circuit was opened and it is not being
+        probed already.
+        :param key: The key of the source
+        :param is_synced: A function which probes the source and returns
+                        : whether it is synced
+        :param expected_errors: The errors raised by is_synced if the source is
+                              : failing
+        :return: The future of the probe if it was started
+               : None otherwise
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if (opened_at is None or key in self._probing
+                    or time.time() - opened_at
+                    < self.open_period.total_seconds()):
+                return None
+
+            self._probing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+
+        return self._executor.submit(self._probe_in_background, key,
+                                     is_synced, expected_errors)
+
+
+DATA_SOURCE_HEALTH_REGISTRY = DataSourceHealthRegistry(
+    env.DATA_SOURCE_FAILURE_THRESHOLD,
+    timedelta(seconds=env.DATA_SOURCE_CIRCUIT_OPEN_SECONDS))
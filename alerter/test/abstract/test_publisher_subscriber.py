@@ -0,0 +1,135 @@
+import json
+import logging
+import unittest
+from types import FrameType
+from unittest import mock
+
+import pika
+
+from src.abstract.publisher_subscriber import (
+    QueuingPublisherSubscriberComponent)
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.exceptions import MessageWasNotDeliveredException
+
+
+class DummyQueuingPublisherSubscriber(QueuingPublisherSubscriberComponent):
+    def _initialise_rabbitmq(self) -> None:
+        pass
+
+    def _listen_for_data(self) -> None:
+        pass
+
+    def _send_heartbeat(self, data_to_send: dict) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        pass
+
+
+class TestQueuingPublisherSubscriberComponent(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = mock.MagicMock(spec=RabbitMQApi)
+        self.test_exchange = 'test_exchange'
+        self.test_routing_key = 'test.key'
+        self.test_properties = pika.BasicProperties(delivery_mode=2)
+        self.test_batch_size = 2
+        self.test_data = [{'test_index': index} for index in range(5)]
+        self.test_component = DummyQueuingPublisherSubscriber(
+            self.dummy_logger, self.rabbitmq, 10)
+        self.test_component._publishing_batch_size = self.test_batch_size
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.rabbitmq = None
+        self.test_component = None
+
+    def _push_test_data(self) -> None:
+        for data in self.test_data:
+            self.test_component._push_to_queue(
+                data, self.test_exchange, self.test_routing_key,
+                self.test_properties, True)
+
+    def _get_test_messages(self, data_list) -> list:
+        return [{'exchange': self.test_exchange,
+                 'routing_key': self.test_routing_key,
+                 'body': json.dumps(data).encode('utf-8'),
+                 'properties': self.test_properties, 'mandatory': True}
+                for data in data_list]
+
+    def test_push_to_queue_serialises_data_if_publishing_in_batches(
+            self) -> None:
+        data = {'test_key': ['test_value']}
+
+        self.test_component._push_to_queue(data, self.test_exchange,
+                                           self.test_routing_key)
+        data['test_key'].append('changed_value')
+
+        self.assertEqual(b'{"test_key": ["test_value"]}',
+                         self.test_component.publishing_queue.get()['data'])
+
+    def test_send_data_publishes_queued_data_in_batches(self) -> None:
+        self.rabbitmq.basic_publish_batch.return_value = []
+        self._push_test_data()
+
+        self.test_component._send_data()
+
+        self.assertEqual([
+            mock.call(self._get_test_messages(self.test_data[0:2])),
+            mock.call(self._get_test_messages(self.test_data[2:4])),
+            mock.call(self._get_test_messages(self.test_data[4:5])),
+        ], self.rabbitmq.basic_publish_batch.call_args_list)
+        self.rabbitmq.basic_publish_confirm.assert_not_called()
+        self.assertTrue(self.test_component.publishing_queue.empty())
+
+    def test_send_data_keeps_returned_data_at_front_of_queue(self) -> None:
+        self.rabbitmq.basic_publish_batch.return_value = [1]
+        self._push_test_data()
+
+        self.assertRaises(MessageWasNotDeliveredException,
+                          self.test_component._send_data)
+
+        self.assertEqual(self.test_data[1:], [
+            json.loads(data['data'])
+            for data in self.test_component.publishing_queue.queue])
+
+    def test_send_data_keeps_batch_in_queue_if_publishing_fails(self) -> None:
+        self.rabbitmq.basic_publish_batch.side_effect = [
+            [], pika.exceptions.AMQPConnectionError('test')]
+        self._push_test_data()
+
+        self.assertRaises(pika.exceptions.AMQPConnectionError,
+                          self.test_component._send_data)
+
+        self.assertEqual(3, self.test_component.publishing_queue.qsize())
+        self.assertEqual({'test_index': 2}, json.loads(
+            self.test_component.publishing_queue.queue[0]['data']))
+
+    def test_send_data_stops_if_rabbitmq_temporarily_unusable(self) -> None:
+        self.rabbitmq.basic_publish_batch.return_value = -1
+        self._push_test_data()
+
+        self.test_component._send_data()
+
+        self.rabbitmq.basic_publish_batch.assert_called_once()
+        self.assertEqual(5, self.test_component.publishing_queue.qsize())
+
+    def test_send_data_publishes_one_by_one_if_not_publishing_in_batches(
+            self) -> None:
+        self.test_component._publishing_batch_size = 0
+        self._push_test_data()
+
+        self.test_component._send_data()
+
+        self.assertEqual([
+            mock.call(exchange=self.test_exchange,
+                      routing_key=self.test_routing_key, body=data,
+                      is_body_dict=True, properties=self.test_properties,
+                      mandatory=True)
+            for data in self.test_data
+        ], self.rabbitmq.basic_publish_confirm.call_args_list)
+        self.rabbitmq.basic_publish_batch.assert_not_called()
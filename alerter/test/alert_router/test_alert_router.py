@@ -19,6 +19,7 @@ from src.alerter.grouped_alerts_metric_code import GroupedGithubAlertsMetricCode
 from src.data_store.redis import RedisApi, Keys
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
+from src.utils.constants.data import MUTE_STATE_CACHE_PERIOD
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     ALERT_ROUTER_CONFIGS_QUEUE_NAME, ALERT_ROUTER_INPUT_QUEUE_NAME,
@@ -1330,3 +1331,84 @@ class TestAlertRouter(unittest.TestCase):
                          self._test_alert_router.is_all_muted(severity_in))
         mock_redis_get.assert_called_once_with(self._test_alert_router._redis,
                                                test_redis_key, default=b"{}")
+
+    @freeze_time("2021-01-28 13:00:00")
+    @mock.patch.object(RedisApi, "get", autospec=True)
+    def test_is_all_muted_reuses_mute_state_within_cache_period(
+            self, mock_redis_get: MagicMock) -> None:
+        mock_redis_get.return_value = '{"x": true}'
+
+        self.assertTrue(self._test_alert_router.is_all_muted("x"))
+        mock_redis_get.return_value = '{"x": false}'
+        with freeze_time(datetime(2021, 1, 28, 13) + timedelta(
+                seconds=MUTE_STATE_CACHE_PERIOD - 1)):
+            self.assertTrue(self._test_alert_router.is_all_muted("x"))
+        self.assertEqual(1, mock_redis_get.call_count)
+
+        with freeze_time(datetime(2021, 1, 28, 13) + timedelta(
+                seconds=MUTE_STATE_CACHE_PERIOD)):
+            self.assertFalse(self._test_alert_router.is_all_muted("x"))
+        self.assertEqual(2, mock_redis_get.call_count)
+
+    @mock.patch.object(RedisApi, "hget", autospec=True)
+    def test_is_chain_severity_muted_caches_mute_state_per_parent(
+            self, mock_redis_hget: MagicMock) -> None:
+        mock_redis_hget.side_effect = ['{"x": true}', '{"x": false}']
+
+        self.assertTrue(self._test_alert_router.is_chain_severity_muted(
+            "PARENT_1", "x"))
+        self.assertFalse(self._test_alert_router.is_chain_severity_muted(
+            "PARENT_2", "x"))
+        self.assertTrue(self._test_alert_router.is_chain_severity_muted(
+            "PARENT_1", "x"))
+        self.assertEqual(2, mock_redis_hget.call_count)
+
+    def test__get_channel_ids_returns_channels_enabled_for_parent_and_severity(
+            self) -> None:
+        self._test_alert_router._config = {
+            self.CONFIG_ROUTING_KEY: {
+                'test_123': {'id': "test_123", 'info': True,
+                             'warning': False, 'parent_ids': ["PARENT_1"]},
+                'test_234': {'id': "test_234", 'info': True,
+                             'warning': True,
+                             'parent_ids': ["PARENT_1", "PARENT_2"]},
+            }
+        }
+
+        self.assertEqual(["test_123", "test_234"],
+                         self._test_alert_router._get_channel_ids(
+                             "PARENT_1", Severity.INFO.value))
+        self.assertEqual(["test_234"],
+                         self._test_alert_router._get_channel_ids(
+                             "PARENT_1", Severity.WARNING.value))
+        self.assertEqual([], self._test_alert_router._get_channel_ids(
+            "PARENT_3", Severity.INFO.value))
+
+    @mock.patch.object(AlertRouter, "extract_config")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test__get_channel_ids_uses_configs_received_after_routing(
+            self, mock_ack: MagicMock,
+            mock_extract_config: MagicMock) -> None:
+        mock_ack.return_value = None
+        mock_extract_config.return_value = {
+            'id': "test_123", 'info': True, 'warning': True, 'critical': True,
+            'error': True, 'parent_ids': ["PARENT_1"],
+        }
+        self._test_alert_router._config = {
+            self.CONFIG_ROUTING_KEY: {
+                'test_234': {'id': "test_234", 'info': True,
+                             'parent_ids': ["PARENT_1"]},
+            }
+        }
+        self.assertEqual(["test_234"],
+                         self._test_alert_router._get_channel_ids(
+                             "PARENT_1", Severity.INFO.value))
+
+        self._test_alert_router._process_configs(
+            None, pika.spec.Basic.Deliver(routing_key=self.CONFIG_ROUTING_KEY),
+            pika.spec.BasicProperties(),
+            json.dumps(self.TEST_CHANNEL_CONFIG_FILE))
+
+        self.assertEqual(["test_123"],
+                         self._test_alert_router._get_channel_ids(
+                             "PARENT_1", Severity.INFO.value))
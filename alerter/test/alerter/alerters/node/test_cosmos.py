@@ -460,6 +460,31 @@ class TestCosmosNodeAlerter(unittest.TestCase):
 
         eval(called_mock).assert_called_once()
 
+    @parameterized.expand([
+        (COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY + '.1', 'mock_proc_trans',),
+        (COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY, 'mock_basic_ack',),
+        ('chains.cosmos.regen.alerts_config', 'mock_proc_confs',),
+    ])
+    @mock.patch.object(CosmosNodeAlerter, "_process_transformed_data")
+    @mock.patch.object(CosmosNodeAlerter, "_process_configs")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_data_processes_transformed_data_of_shard_and_all_configs(
+            self, routing_key, called_mock, mock_basic_ack, mock_proc_confs,
+            mock_proc_trans) -> None:
+        test_alerter = CosmosNodeAlerter(
+            self.test_alerter_name, self.dummy_logger, self.rabbitmq,
+            self.test_configs_factory, self.test_queue_size, 1)
+        mock_basic_ack.return_value = None
+        mock_proc_confs.return_value = None
+        mock_proc_trans.return_value = None
+
+        method = pika.spec.Basic.Deliver(routing_key=routing_key)
+        body = json.dumps(self.test_data_str_1)
+        properties = pika.spec.BasicProperties()
+        test_alerter._process_data(None, method, properties, body)
+
+        eval(called_mock).assert_called_once()
+
     """
     In the majority of the tests below we will perform mocking. The tests for
     config processing and alerting were performed in separate test files which
@@ -555,3 +555,44 @@ class TestCosmosNodeAlertingFactory(unittest.TestCase):
             'bad_chain_id')
         self.assertEqual(expected_state,
                          self.cosmos_node_alerting_factory.alerting_state)
+
+    def test_update_current_height_stores_height_in_state_and_index(
+            self) -> None:
+        """
+        In this test we will check that the current height of a node is stored
+        in its alerting state and taken into account by
+        get_max_current_height
+        """
+        alerting_factory = self.cosmos_node_alerting_factory
+        for node_id in [self.test_node_id, self.test_dummy_node_id1]:
+            alerting_factory.create_alerting_state(
+                self.test_parent_id, node_id,
+                self.cosmos_node_alerts_config, False)
+
+        alerting_factory.update_current_height(
+            self.test_parent_id, self.test_node_id, 100)
+        alerting_factory.update_current_height(
+            self.test_parent_id, self.test_dummy_node_id1, 105)
+        alerting_factory.update_current_height(
+            self.test_parent_id, self.test_dummy_node_id1, 98)
+
+        self.assertEqual(98, alerting_factory.alerting_state[
+            self.test_parent_id][self.test_dummy_node_id1]['current_height'])
+        self.assertEqual(100, alerting_factory.get_max_current_height(
+            self.test_parent_id))
+        self.assertIsNone(alerting_factory.get_max_current_height(
+            self.test_dummy_parent_id1))
+
+    def test_remove_chain_alerting_state_removes_chain_height_index(
+            self) -> None:
+        alerting_factory = self.cosmos_node_alerting_factory
+        alerting_factory.create_alerting_state(
+            self.test_parent_id, self.test_node_id,
+            self.cosmos_node_alerts_config, False)
+        alerting_factory.update_current_height(
+            self.test_parent_id, self.test_node_id, 100)
+
+        alerting_factory.remove_chain_alerting_state(self.test_parent_id)
+
+        self.assertIsNone(alerting_factory.get_max_current_height(
+            self.test_parent_id))
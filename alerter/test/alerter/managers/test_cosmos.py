@@ -34,8 +34,10 @@ from src.utils.constants.rabbitmq import (
     COSMOS_NODE_ALERT_ROUTING_KEY, COSMOS_ALERTERS_MAN_CONFIGS_QUEUE_NAME,
     COSMOS_ALERTERS_MAN_HB_QUEUE_NAME, COSMOS_NETWORK_ALERT_ROUTING_KEY,
     PING_ROUTING_KEY, COSMOS_ALERTS_CONFIGS_ROUTING_KEY,
-    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY)
+    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY,
+    COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, TOPIC)
 from src.utils.exceptions import PANICException, MessageWasNotDeliveredException
+from src.utils.sharding import add_shard_suffix, get_shard, get_shard_name
 from test.test_utils.utils import (
     delete_exchange_if_exists, delete_queue_if_exists, disconnect_from_rabbit,
     connect_to_rabbit, infinite_fn)
@@ -310,6 +312,32 @@ class TestCosmosAlertersManager(unittest.TestCase):
         ]
         mock_basic_consume.assert_has_calls(expected_calls, True)
 
+    @mock.patch.object(env, "COSMOS_NODE_ALERTER_SHARDS", 1)
+    def test_initialise_rabbitmq_deletes_the_queues_of_stale_shards(
+            self) -> None:
+        # Declare and bind the queues of shards which are no longer started,
+        # as left over from a previous number of shards
+        stale_queues = [
+            add_shard_suffix(COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, 0),
+            add_shard_suffix(COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, 1)
+        ]
+        self.rabbitmq.connect()
+        self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
+                                       False, False)
+        for stale_queue in stale_queues:
+            self.rabbitmq.queue_declare(stale_queue, False, True, False, False)
+            self.rabbitmq.queue_bind(stale_queue, CONFIG_EXCHANGE,
+                                     COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
+        self.rabbitmq.disconnect()
+
+        self.test_manager._initialise_rabbitmq()
+
+        for stale_queue in stale_queues:
+            self.assertRaises(pika.exceptions.ChannelClosedByBroker,
+                              self.test_manager.rabbitmq.queue_declare,
+                              stale_queue, True)
+            self.test_manager.rabbitmq.new_channel()
+
     def test_send_heartbeat_sends_a_heartbeat_correctly(self) -> None:
         # This test creates a queue which receives messages with the same
         # routing key as the ones set by send_heartbeat, and checks that the
@@ -575,6 +603,77 @@ class TestCosmosAlertersManager(unittest.TestCase):
         mock_init_proc.assert_not_called()
         mock_start.assert_not_called()
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(CosmosAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerter_processes_starts_a_process_per_shard(
+            self, mock_start, mock_push_and_send) -> None:
+        """
+        In this test we will check that a sharded alerter is started in a
+        process per shard, and that since no chain is configured yet, a reset
+        alert is sent for every shard.
+        """
+        self.test_manager._configs_processor_helper[COSMOS_NODE_ALERTER_NAME][
+            'shards'] = 2
+        mock_start.return_value = None
+        mock_push_and_send.return_value = None
+
+        self.test_manager._create_and_start_alerter_processes()
+
+        self.assertNotIn(COSMOS_NODE_ALERTER_NAME,
+                         self.test_manager.alerter_process_dict)
+        for shard in range(2):
+            shard_process = self.test_manager.alerter_process_dict[
+                get_shard_name(COSMOS_NODE_ALERTER_NAME, shard)]
+            self.assertTrue(shard_process.daemon)
+            self.assertEqual(
+                (self.test_manager.node_alerts_config_factory, shard),
+                shard_process._args)
+            self.assertEqual(start_cosmos_node_alerter, shard_process._target)
+        self.assertEqual(3, mock_start.call_count)
+
+        expected_alert = ComponentResetAlert(
+            COSMOS_NODE_ALERTER_NAME, datetime.now().timestamp(),
+            CosmosNodeAlerter.__name__)
+        self.assertEqual(
+            [call(expected_alert.alert_data, COSMOS_NODE_ALERT_ROUTING_KEY)] * 2,
+            mock_push_and_send.call_args_list[:2])
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(CosmosAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerter_processes_resets_chains_of_shard_only(
+            self, mock_start, mock_push_and_send) -> None:
+        """
+        In this test we will check that once the chains are configured, a
+        restarted shard only resets the metrics of the chains mapped to it.
+        """
+        self.test_manager._configs_processor_helper[COSMOS_NODE_ALERTER_NAME][
+            'shards'] = 2
+        self.test_manager.node_alerts_config_factory._configs = \
+            self.node_config_expected
+        running_process = mock.MagicMock(spec=Process)
+        running_process.is_alive.return_value = True
+        chain_shard = get_shard(self.parent_id, 2)
+        self.test_manager._alerter_process_dict = {
+            get_shard_name(COSMOS_NODE_ALERTER_NAME, 1 - chain_shard):
+                running_process,
+            COSMOS_NETWORK_ALERTER_NAME: running_process,
+        }
+        mock_start.return_value = None
+        mock_push_and_send.return_value = None
+
+        self.test_manager._create_and_start_alerter_processes()
+
+        expected_alert = ComponentResetAlert(
+            COSMOS_NODE_ALERTER_NAME, datetime.now().timestamp(),
+            CosmosNodeAlerter.__name__, self.parent_id, self.chain_name)
+        mock_push_and_send.assert_called_once_with(
+            expected_alert.alert_data, COSMOS_NODE_ALERT_ROUTING_KEY)
+        self.assertEqual(1, mock_start.call_count)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(CosmosAlertersManager,
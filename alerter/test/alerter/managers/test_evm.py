@@ -433,7 +433,8 @@ class TestEVMNodeAlerterManager(unittest.TestCase):
         expected_alert = ComponentResetAlert(
             EVM_NODE_ALERTER_NAME, datetime.now().timestamp(),
             EVMNodeAlerter.__name__)
-        mock_push_and_send.assert_called_once_with(expected_alert.alert_data)
+        mock_push_and_send.assert_called_once_with(expected_alert.alert_data,
+                                                   EVM_NODE_ALERT_ROUTING_KEY)
 
     @mock.patch.object(EVMNodeAlerterManager,
                        "_push_latest_data_to_queue_and_send")
@@ -526,7 +526,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_system_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.system_alerts_configs_factory
+            self.system_alerts_configs_factory, None
         )
 
     @mock.patch("src.alerter.alerter_starters._initialise_github_alerter")
@@ -570,7 +570,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_chainlink_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.chainlink_node_alerts_configs_factory)
+            self.chainlink_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_evm_node_alerter")
@@ -586,7 +586,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_evm_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.evm_node_alerts_configs_factory)
+            self.evm_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_chainlink_contract_alerter")
@@ -619,7 +619,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_cosmos_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.cosmos_node_alerts_configs_factory)
+            self.cosmos_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_cosmos_network_alerter")
@@ -652,7 +652,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_substrate_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.substrate_node_alerts_configs_factory)
+            self.substrate_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_substrate_network_alerter")
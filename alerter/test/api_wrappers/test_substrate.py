@@ -78,6 +78,25 @@ class TestSubstrateApiWrapper(unittest.TestCase):
             timeout=self.timeout,
         )
 
+    @mock.patch("src.api_wrappers.substrate.get_json")
+    def test_get_blocks_slashed_and_offline_calls_api_correctly(
+            self, mock_get_json) -> None:
+        self.test_wrapper.get_blocks_slashed_and_offline(
+            self.test_node_ws_url, 10, 20,
+            [self.test_validator_stash, 'test_stash_2'])
+        api_call = '/api/custom/blocks/getSlashedAndOffline'
+        params = {
+            'websocket': self.test_node_ws_url,
+            'fromBlock': 10,
+            'toBlock': 20,
+            'accountIds': '{},test_stash_2'.format(self.test_validator_stash)
+        }
+        mock_get_json.assert_called_once_with(
+            endpoint="{}{}".format(self.api_url, api_call),
+            logger=self.dummy_logger, params=params, verify=self.verify,
+            timeout=self.timeout,
+        )
+
     @mock.patch("src.api_wrappers.substrate.get_json")
     def test_get_system_health_calls_api_correctly(self, mock_get_json) -> None:
         self.test_wrapper.get_system_health(self.test_node_ws_url)
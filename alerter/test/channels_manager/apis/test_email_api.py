@@ -67,6 +67,9 @@ class TestEmailApi(unittest.TestCase):
             '_username': self.test_email_api._username,
             '_password': self.test_email_api._password,
             '_port': self.test_email_api._port,
+            '_idle_timeout': 0,
+            '_connection': None,
+            '_connection_last_used': None,
         }
         self.assertDictEqual(expected_instance_variables,
                              self.test_email_api.__dict__)
@@ -248,3 +251,64 @@ class TestEmailApi(unittest.TestCase):
 
         # Check that the login function was not called.
         mock_login.assert_not_called()
+
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_re_uses_the_connection_if_idle_timeout_set(
+            self, mock_smtp_init) -> None:
+        self.test_email_api._idle_timeout = 60
+
+        self.test_email_api._send_smtp(self.test_msg)
+        self.test_email_api._send_smtp(self.test_msg)
+
+        # The connection is opened and authenticated once, and not closed
+        mock_smtp_init.assert_called_once_with(self.test_smtp, self.test_port)
+        connection = mock_smtp_init.return_value
+        connection.login.assert_called_once_with(self.test_username,
+                                                 self.test_password)
+        self.assertEqual(2, connection.send_message.call_count)
+        connection.quit.assert_not_called()
+
+    @mock.patch.object(smtplib, "SMTP")
+    @mock.patch("src.channels_manager.apis.email_api.time.monotonic")
+    def test_send_smtp_re_connects_if_connection_idle_for_too_long(
+            self, mock_monotonic, mock_smtp_init) -> None:
+        self.test_email_api._idle_timeout = 60
+        old_connection = mock.MagicMock()
+        new_connection = mock.MagicMock()
+        mock_smtp_init.side_effect = [old_connection, new_connection]
+        mock_monotonic.side_effect = [100, 161, 161]
+
+        self.test_email_api._send_smtp(self.test_msg)
+        self.test_email_api._send_smtp(self.test_msg)
+
+        old_connection.quit.assert_called_once_with()
+        new_connection.send_message.assert_called_once_with(self.test_msg)
+
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_re_connects_and_re_sends_if_re_used_connection_fails(
+            self, mock_smtp_init) -> None:
+        self.test_email_api._idle_timeout = 60
+        old_connection = mock.MagicMock()
+        new_connection = mock.MagicMock()
+        mock_smtp_init.side_effect = [old_connection, new_connection]
+        self.test_email_api._send_smtp(self.test_msg)
+        old_connection.send_message.side_effect = \
+            smtplib.SMTPServerDisconnected()
+
+        self.test_email_api._send_smtp(self.test_msg)
+
+        self.assertEqual(2, mock_smtp_init.call_count)
+        new_connection.send_message.assert_called_once_with(self.test_msg)
+        self.assertEqual(new_connection, self.test_email_api._connection)
+
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_raises_and_closes_if_new_connection_fails(
+            self, mock_smtp_init) -> None:
+        self.test_email_api._idle_timeout = 60
+        mock_smtp_init.return_value.send_message.side_effect = \
+            smtplib.SMTPServerDisconnected()
+
+        self.assertRaises(smtplib.SMTPServerDisconnected,
+                          self.test_email_api._send_smtp, self.test_msg)
+        mock_smtp_init.assert_called_once_with(self.test_smtp, self.test_port)
+        self.assertIsNone(self.test_email_api._connection)
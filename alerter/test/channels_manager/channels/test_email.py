@@ -77,6 +77,10 @@ class TestEmailChannel(unittest.TestCase):
         self.assertEqual(self.test_email_api.__dict__,
                          self.test_email_channel._email_api.__dict__)
 
+    def test_email_api_returns_email_api(self) -> None:
+        self.assertEqual(self.test_email_api,
+                         self.test_email_channel.email_api)
+
     @mock.patch.object(EmailApi, "send_email_with_html")
     def test_alert_sends_email_alert_correctly_to_all_addresses(
             self, mock_send_email_html) -> None:
@@ -129,3 +133,42 @@ class TestEmailChannel(unittest.TestCase):
         # details and the e-mails are dummy.
         actual_ret = self.test_email_channel.alert(self.test_alert)
         self.assertEqual(RequestStatus.FAILED, actual_ret)
+
+    @mock.patch.object(EmailApi, "send_email_with_html")
+    def test_alert_batch_sends_one_email_with_all_alerts_to_each_address(
+            self, mock_send_email_html) -> None:
+        expected_html_email_message = EMAIL_HTML_TEMPLATE.format(
+            alert_code=self.test_alert.alert_code.value,
+            severity=self.test_alert.severity, message=self.test_alert.message,
+            date_time=datetime.fromtimestamp(self.test_alert.timestamp),
+            parent_id=self.test_alert.parent_id,
+            origin_id=self.test_alert.origin_id
+        )
+        expected_plain_email_message = EMAIL_TEXT_TEMPLATE.format(
+            alert_code=self.test_alert.alert_code.value,
+            severity=self.test_alert.severity,
+            message=self.test_alert.message,
+            date_time=datetime.fromtimestamp(self.test_alert.timestamp),
+            parent_id=self.test_alert.parent_id,
+            origin_id=self.test_alert.origin_id
+        )
+        mock_send_email_html.return_value = None
+
+        actual_ret = self.test_email_channel.alert_batch(
+            [self.test_alert, self.test_alert])
+
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+        self.assertEqual(
+            [call("PANIC 2 alerts",
+                  expected_html_email_message + "<hr>" +
+                  expected_html_email_message,
+                  expected_plain_email_message * 2, to_address)
+             for to_address in self.test_emails_to],
+            mock_send_email_html.call_args_list)
+
+    @mock.patch.object(EmailApi, "send_email_with_html")
+    def test_alert_batch_returns_failed_if_some_emails_not_sent(
+            self, mock_send_email_html) -> None:
+        mock_send_email_html.side_effect = Exception('test')
+        actual_ret = self.test_email_channel.alert_batch([self.test_alert])
+        self.assertEqual(RequestStatus.FAILED, actual_ret)
@@ -2,10 +2,13 @@ import logging
 import unittest
 from unittest import mock
 
+from parameterized import parameterized
+
 from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
 from src.channels_manager.channels import TelegramChannel
+from src.utils.constants.channels import DIGEST_MAX_ALERT_MESSAGES
 from src.utils.data import RequestStatus
 
 
@@ -102,3 +105,46 @@ class TestTelegramChannel(unittest.TestCase):
         mock_send_message.side_effect = Exception('test')
         actual_ret = self.test_telegram_channel.alert(self.test_alert)
         self.assertEqual(RequestStatus.FAILED, actual_ret)
+
+    @parameterized.expand([(2,), (DIGEST_MAX_ALERT_MESSAGES + 2,), ])
+    @mock.patch.object(TelegramBotApi, "send_message")
+    def test_alert_digest_sends_a_digest_correctly(
+            self, no_of_alerts, mock_send_message) -> None:
+        alerts = [OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, percentage_usage, self.test_panic_severity,
+            self.test_last_monitored, self.test_panic_severity,
+            self.test_parent_id, self.test_system_id
+        ) for percentage_usage in range(no_of_alerts)]
+        expected_lines = ['*PANIC {}*: {} `{}` alerts'.format(
+            self.test_panic_severity, no_of_alerts,
+            self.test_alert.alert_code.name)]
+        expected_lines.extend(
+            '`{}`'.format(alert.message)
+            for alert in alerts[:DIGEST_MAX_ALERT_MESSAGES])
+        if no_of_alerts > DIGEST_MAX_ALERT_MESSAGES:
+            expected_lines.append('... and 2 more')
+
+        self.test_telegram_channel.alert_digest(alerts)
+
+        mock_send_message.assert_called_once_with('\n'.join(expected_lines))
+
+    @mock.patch.object(TelegramBotApi, "send_message")
+    def test_alert_digest_returns_success_if_api_request_ok(
+            self, mock_send_message) -> None:
+        mock_send_message.return_value = {
+            'ok': True,
+            'result': [],
+            'date': 1614010469,
+            'text': 'This is a test message'
+        }
+        actual_ret = self.test_telegram_channel.alert_digest(
+            [self.test_alert, self.test_alert])
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+
+    @mock.patch.object(TelegramBotApi, "send_message")
+    def test_alert_digest_returns_failed_if_api_request_raises_exception(
+            self, mock_send_message) -> None:
+        mock_send_message.side_effect = Exception('test')
+        actual_ret = self.test_telegram_channel.alert_digest(
+            [self.test_alert, self.test_alert])
+        self.assertEqual(RequestStatus.FAILED, actual_ret)
@@ -18,6 +18,7 @@ from src.alerter.alerts.system_alerts import (
 from src.channels_manager.apis.email_api import EmailApi
 from src.channels_manager.channels.email import EmailChannel
 from src.channels_manager.handlers import EmailAlertsHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -128,6 +129,22 @@ class TestEmailAlertsHandler(unittest.TestCase):
         self.assertEqual(self.test_channel,
                          self.test_email_alerts_handler.email_channel)
 
+    @mock.patch('sys.exit')
+    @mock.patch.object(EmailAlertsHandler, "disconnect_from_rabbit")
+    @mock.patch.object(EmailApi, "close")
+    def test_on_terminate_closes_smtp_connection_before_disconnecting_rabbit(
+            self, mock_close, mock_disconnect, mock_sys_exit) -> None:
+        calls = mock.Mock()
+        calls.attach_mock(mock_close, 'close')
+        calls.attach_mock(mock_disconnect, 'disconnect_from_rabbit')
+
+        self.test_email_alerts_handler._on_terminate(mock.MagicMock(),
+                                                     mock.MagicMock())
+
+        self.assertEqual([call.close(), call.disconnect_from_rabbit()],
+                         calls.mock_calls)
+        mock_sys_exit.assert_called_once()
+
     def test_alerts_queue_returns_the_alerts_queue(self) -> None:
         self.test_email_alerts_handler._alerts_queue = self.test_alerts_queue
         self.assertEqual(self.test_alerts_queue,
@@ -149,6 +166,10 @@ class TestEmailAlertsHandler(unittest.TestCase):
         self.assertEqual(CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(
             self.test_channel_id),
             self.test_email_alerts_handler._email_channel_routing_key)
+        self.assertEqual(0, self.test_email_alerts_handler._batch_window)
+        self.assertIsNone(self.test_email_alerts_handler._retry_scheduler)
+        self.assertIsNone(
+            self.test_email_alerts_handler._alerts_sending_scheduled_at)
 
     @mock.patch.object(RabbitMQApi, "basic_qos")
     def test_initialise_rabbitmq_initialises_rabbit_correctly(
@@ -722,6 +743,25 @@ class TestEmailAlertsHandler(unittest.TestCase):
         mock_exception.assert_not_called()
         mock_error.assert_not_called()
 
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(AlertRetryScheduler, "send_alerts")
+    def test_send_alerts_schedules_retries_if_retry_scheduler_given(
+            self, mock_scheduler_send_alerts, mock_call_later) -> None:
+        mock_scheduler_send_alerts.return_value = 10
+        test_retry_scheduler = AlertRetryScheduler(self.dummy_logger)
+        self.test_email_alerts_handler._retry_scheduler = test_retry_scheduler
+        self.test_email_alerts_handler.alerts_queue.put(self.test_alert)
+
+        self.test_email_alerts_handler._send_alerts()
+
+        mock_scheduler_send_alerts.assert_called_once_with(
+            self.test_email_alerts_handler.alerts_queue,
+            self.test_email_alerts_handler._send_alerts_to_channel,
+            self.test_alert_validity_threshold,
+            self.test_email_alerts_handler._get_alerts_to_send)
+        mock_call_later.assert_called_once_with(
+            10, self.test_email_alerts_handler._on_alerts_sending_timer)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(EmailChannel, "alert")
     def test_send_alerts_discards_old_alerts_and_sends_the_recent(
@@ -863,3 +903,101 @@ class TestEmailAlertsHandler(unittest.TestCase):
                          self.test_email_alerts_handler.alerts_queue.queue[0])
         self.assertEqual(test_alert_2,
                          self.test_email_alerts_handler.alerts_queue.queue[1])
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(EmailChannel, "alert_batch")
+    @mock.patch.object(EmailChannel, "alert")
+    def test_send_alerts_sends_all_recent_alerts_together_if_batched(
+            self, mock_alert, mock_alert_batch) -> None:
+        mock_alert_batch.return_value = RequestStatus.SUCCESS
+        self.test_email_alerts_handler._batch_window = 30
+        test_alert_old = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity,
+            datetime.now().timestamp() - self.test_alert_validity_threshold - 1,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_alert_recent1 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_alert_recent2 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_queue = Queue(4)
+        self.test_email_alerts_handler._alerts_queue = test_queue
+        test_queue.put(test_alert_old)
+        test_queue.put(test_alert_recent1)
+        test_queue.put(test_alert_recent2)
+
+        self.test_email_alerts_handler._send_alerts()
+
+        self.assertTrue(self.test_email_alerts_handler.alerts_queue.empty())
+        mock_alert_batch.assert_called_once_with(
+            [test_alert_recent1, test_alert_recent2])
+        mock_alert.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(EmailChannel, "alert_batch")
+    def test_send_alerts_keeps_the_batch_if_it_is_not_successfully_sent(
+            self, mock_alert_batch, mock_connection) -> None:
+        mock_alert_batch.return_value = RequestStatus.FAILED
+        mock_connection.return_value.sleep.return_value = None
+        self.test_email_alerts_handler._batch_window = 30
+        test_queue = Queue(4)
+        self.test_email_alerts_handler._alerts_queue = test_queue
+        for _ in range(2):
+            test_queue.put(OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            ))
+
+        self.test_email_alerts_handler._send_alerts()
+
+        self.assertEqual(self.test_max_attempts, mock_alert_batch.call_count)
+        self.assertEqual(2, self.test_email_alerts_handler.alerts_queue.qsize())
+
+    @mock.patch.object(EmailAlertsHandler, "_send_alerts")
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_alert_schedules_sending_once_per_window_if_batched(
+            self, mock_ack, mock_call_later, mock_send_alerts) -> None:
+        mock_ack.return_value = None
+        self.test_email_alerts_handler._batch_window = 30
+        alert_json = copy.deepcopy(self.test_alert.alert_data)
+        body = json.dumps(alert_json)
+        method = pika.spec.Basic.Deliver(routing_key='test')
+        properties = pika.spec.BasicProperties()
+
+        self.test_email_alerts_handler._process_alert(
+            None, method, properties, body)
+        self.test_email_alerts_handler._process_alert(
+            None, method, properties, body)
+
+        mock_call_later.assert_called_once_with(
+            30, self.test_email_alerts_handler._on_alerts_sending_timer)
+        mock_send_alerts.assert_not_called()
+        self.assertEqual(2, self.test_email_alerts_handler.alerts_queue.qsize())
+
+    @parameterized.expand([(True,), (False,), ])
+    @mock.patch.object(EmailAlertsHandler, "_send_heartbeat")
+    @mock.patch.object(EmailAlertsHandler, "_send_alerts")
+    def test_on_alerts_sending_timer_sends_alerts_and_hb_if_all_sent(
+            self, all_sent, mock_send_alerts, mock_send_hb) -> None:
+        self.test_email_alerts_handler._alerts_sending_scheduled_at = \
+            datetime.now().timestamp()
+        if not all_sent:
+            self.test_email_alerts_handler.alerts_queue.put(self.test_alert)
+
+        self.test_email_alerts_handler._on_alerts_sending_timer()
+
+        mock_send_alerts.assert_called_once_with()
+        self.assertEqual(all_sent, mock_send_hb.called)
+        self.assertIsNone(
+            self.test_email_alerts_handler._alerts_sending_scheduled_at)
@@ -17,6 +17,7 @@ from src.alerter.alerts.system_alerts import (
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.channels.opsgenie import OpsgenieChannel
 from src.channels_manager.handlers.opsgenie.alerts import OpsgenieAlertsHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -725,6 +726,25 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
         mock_exception.assert_not_called()
         mock_error.assert_not_called()
 
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(AlertRetryScheduler, "send_alerts")
+    def test_send_alerts_schedules_retries_if_retry_scheduler_given(
+            self, mock_scheduler_send_alerts, mock_call_later) -> None:
+        mock_scheduler_send_alerts.return_value = 10
+        test_retry_scheduler = AlertRetryScheduler(self.dummy_logger)
+        self.test_opsgenie_alerts_handler._retry_scheduler = \
+            test_retry_scheduler
+        self.test_opsgenie_alerts_handler.alerts_queue.put(self.test_alert)
+
+        self.test_opsgenie_alerts_handler._send_alerts()
+
+        mock_scheduler_send_alerts.assert_called_once_with(
+            self.test_opsgenie_alerts_handler.alerts_queue,
+            self.test_opsgenie_alerts_handler._opsgenie_channel.alert,
+            self.test_alert_validity_threshold)
+        mock_call_later.assert_called_once_with(
+            10, self.test_opsgenie_alerts_handler._on_alerts_sending_timer)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(OpsgenieChannel, "alert")
     def test_send_alerts_discards_old_alerts_and_sends_the_recent(
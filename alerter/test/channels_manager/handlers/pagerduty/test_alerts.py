@@ -18,6 +18,7 @@ from src.channels_manager.apis.pagerduty_api import PagerDutyApi
 from src.channels_manager.channels import PagerDutyChannel
 from src.channels_manager.handlers.pagerduty.alerts import (
     PagerDutyAlertsHandler)
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -733,6 +734,25 @@ class TestPagerDutyAlertsHandler(unittest.TestCase):
         mock_exception.assert_not_called()
         mock_error.assert_not_called()
 
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(AlertRetryScheduler, "send_alerts")
+    def test_send_alerts_schedules_retries_if_retry_scheduler_given(
+            self, mock_scheduler_send_alerts, mock_call_later) -> None:
+        mock_scheduler_send_alerts.return_value = 10
+        test_retry_scheduler = AlertRetryScheduler(self.dummy_logger)
+        self.test_pagerduty_alerts_handler._retry_scheduler = \
+            test_retry_scheduler
+        self.test_pagerduty_alerts_handler.alerts_queue.put(self.test_alert)
+
+        self.test_pagerduty_alerts_handler._send_alerts()
+
+        mock_scheduler_send_alerts.assert_called_once_with(
+            self.test_pagerduty_alerts_handler.alerts_queue,
+            self.test_pagerduty_alerts_handler.pagerduty_channel.alert,
+            self.test_alert_validity_threshold)
+        mock_call_later.assert_called_once_with(
+            10, self.test_pagerduty_alerts_handler._on_alerts_sending_timer)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(PagerDutyChannel, "alert")
     def test_send_alerts_discards_old_alerts_and_sends_the_recent(
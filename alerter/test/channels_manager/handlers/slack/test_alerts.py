@@ -17,6 +17,7 @@ from src.alerter.alerts.system_alerts import (
 from src.channels_manager.apis.slack_bot_api import SlackBotApi
 from src.channels_manager.channels import SlackChannel
 from src.channels_manager.handlers import SlackAlertsHandler
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -138,6 +139,7 @@ class TestSlackAlertsHandler(unittest.TestCase):
         self.assertEqual(
             self.test_alert_validity_threshold,
             self.test_slack_alerts_handler._alert_validity_threshold)
+        self.assertEqual(0, self.test_slack_alerts_handler._digest_window)
         self.assertEqual(CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
             self.test_channel_id),
             self.test_slack_alerts_handler._slack_alerts_handler_queue)
@@ -732,6 +734,141 @@ class TestSlackAlertsHandler(unittest.TestCase):
         mock_exception.assert_not_called()
         mock_error.assert_not_called()
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(SlackChannel, "alert_digest")
+    @mock.patch.object(SlackChannel, "alert")
+    def test_send_alerts_sends_coalescable_alerts_in_one_digest(
+            self, mock_alert, mock_alert_digest) -> None:
+        mock_alert.return_value = RequestStatus.SUCCESS
+        mock_alert_digest.return_value = RequestStatus.SUCCESS
+        self.test_slack_alerts_handler._digest_window = 30
+        test_alert_old = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity,
+            datetime.now().timestamp() - self.test_alert_validity_threshold - 1,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_alert_1 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_alert_other_parent = \
+            OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, 'other_parent_id',
+                self.test_system_id
+            )
+        test_alert_2 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_queue = Queue(4)
+        self.test_slack_alerts_handler._alerts_queue = test_queue
+        test_queue.put(test_alert_old)
+        test_queue.put(test_alert_1)
+        test_queue.put(test_alert_other_parent)
+        test_queue.put(test_alert_2)
+
+        self.test_slack_alerts_handler._send_alerts()
+
+        self.assertTrue(self.test_slack_alerts_handler.alerts_queue.empty())
+        mock_alert_digest.assert_called_once_with([test_alert_1, test_alert_2])
+        mock_alert.assert_called_once_with(test_alert_other_parent)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(SlackChannel, "alert_digest")
+    def test_send_alerts_keeps_the_digest_if_it_is_not_successfully_sent(
+            self, mock_alert_digest, mock_connection) -> None:
+        mock_alert_digest.return_value = RequestStatus.FAILED
+        mock_connection.return_value.sleep.return_value = None
+        self.test_slack_alerts_handler._digest_window = 30
+        test_queue = Queue(4)
+        self.test_slack_alerts_handler._alerts_queue = test_queue
+        for _ in range(2):
+            test_queue.put(OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            ))
+
+        self.test_slack_alerts_handler._send_alerts()
+
+        self.assertEqual(self.test_max_attempts, mock_alert_digest.call_count)
+        self.assertEqual(2, self.test_slack_alerts_handler.alerts_queue.qsize())
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(SlackChannel, "alert_digest")
+    def test_send_alerts_retries_the_digest_with_the_retry_scheduler(
+            self, mock_alert_digest, mock_connection, mock_call_later) -> None:
+        mock_alert_digest.return_value = RequestStatus.FAILED
+        test_retry_scheduler = AlertRetryScheduler(self.dummy_logger)
+        self.test_slack_alerts_handler._retry_scheduler = test_retry_scheduler
+        self.test_slack_alerts_handler._digest_window = 30
+        test_queue = Queue(4)
+        self.test_slack_alerts_handler._alerts_queue = test_queue
+        test_alerts = [OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        ) for _ in range(2)]
+        for test_alert in test_alerts:
+            test_queue.put(test_alert)
+
+        self.test_slack_alerts_handler._send_alerts()
+
+        mock_alert_digest.assert_called_once_with(test_alerts)
+        mock_connection.sleep.assert_not_called()
+        mock_call_later.assert_called_once()
+        self.assertEqual(test_alerts, list(test_queue.queue))
+        self.assertEqual(1, test_retry_scheduler.retries)
+        self.assertEqual(2, test_retry_scheduler.pending_retries)
+
+    @mock.patch.object(SlackAlertsHandler, "_send_alerts")
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_alert_schedules_sending_once_per_window_if_coalesced(
+            self, mock_ack, mock_call_later, mock_send_alerts) -> None:
+        mock_ack.return_value = None
+        self.test_slack_alerts_handler._digest_window = 30
+        alert_json = copy.deepcopy(self.test_alert.alert_data)
+        body = json.dumps(alert_json)
+        method = pika.spec.Basic.Deliver(routing_key='test')
+        properties = pika.spec.BasicProperties()
+
+        self.test_slack_alerts_handler._process_alert(None, method, properties, body)
+        self.test_slack_alerts_handler._process_alert(None, method, properties, body)
+
+        mock_call_later.assert_called_once_with(
+            30, self.test_slack_alerts_handler._on_alerts_sending_timer)
+        mock_send_alerts.assert_not_called()
+        self.assertEqual(2, self.test_slack_alerts_handler.alerts_queue.qsize())
+
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(AlertRetryScheduler, "send_alerts")
+    def test_send_alerts_schedules_retries_if_retry_scheduler_given(
+            self, mock_scheduler_send_alerts, mock_call_later) -> None:
+        mock_scheduler_send_alerts.return_value = 10
+        test_retry_scheduler = AlertRetryScheduler(self.dummy_logger)
+        self.test_slack_alerts_handler._retry_scheduler = test_retry_scheduler
+        self.test_slack_alerts_handler.alerts_queue.put(self.test_alert)
+
+        self.test_slack_alerts_handler._send_alerts()
+
+        mock_scheduler_send_alerts.assert_called_once_with(
+            self.test_slack_alerts_handler.alerts_queue,
+            self.test_slack_alerts_handler._send_alerts_to_channel,
+            self.test_alert_validity_threshold,
+            self.test_slack_alerts_handler._get_alerts_to_send)
+        mock_call_later.assert_called_once_with(
+            10, self.test_slack_alerts_handler._on_alerts_sending_timer)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(SlackChannel, "alert")
     def test_send_alerts_discards_old_alerts_and_sends_the_recent(
@@ -0,0 +1,234 @@
+import logging
+import random
+import unittest
+from datetime import datetime, timedelta
+from queue import Queue
+from unittest import mock
+from unittest.mock import call
+
+from freezegun import freeze_time
+from parameterized import parameterized
+
+from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsIncreasedAboveThresholdAlert)
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
+from src.utils.data import RequestStatus
+
+
+class TestAlertRetryScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_max_attempts = 3
+        self.test_base_delay = 10
+        self.test_max_delay = 15
+        self.test_alert_validity_threshold = 600
+        self.test_system_name = 'test_system'
+        self.test_percentage_usage = 50
+        self.test_panic_severity = 'WARNING'
+        self.test_parent_id = 'parent_1234'
+        self.test_system_id = 'system_id32423'
+        self.test_alerts_queue = Queue(10)
+        self.test_send_alert = mock.MagicMock()
+        self.test_retry_scheduler = AlertRetryScheduler(
+            self.dummy_logger, self.test_max_attempts, self.test_base_delay,
+            self.test_max_delay)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.test_alerts_queue = None
+        self.test_send_alert = None
+        self.test_retry_scheduler = None
+
+    def _put_alert(self, timestamp: float = None) \
+            -> OpenFileDescriptorsIncreasedAboveThresholdAlert:
+        if timestamp is None:
+            timestamp = datetime.now().timestamp()
+        alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, timestamp, self.test_panic_severity,
+            self.test_parent_id, self.test_system_id
+        )
+        self.test_alerts_queue.put(alert)
+        return alert
+
+    def _send_alerts(self):
+        return self.test_retry_scheduler.send_alerts(
+            self.test_alerts_queue, self.test_send_alert,
+            self.test_alert_validity_threshold)
+
+    @parameterized.expand([
+        (1, 10,),
+        (2, 15,),
+        (3, 15,),
+    ])
+    @mock.patch.object(random, "uniform")
+    def test_get_retry_delay_doubles_the_delay_up_to_max_delay(
+            self, failed_attempts, expected_delay, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+
+        self.assertEqual(
+            expected_delay,
+            self.test_retry_scheduler._get_retry_delay(failed_attempts))
+        mock_uniform.assert_called_once_with(expected_delay / 2,
+                                             expected_delay)
+
+    @freeze_time("2012-01-01")
+    def test_send_alerts_sends_all_alerts_and_returns_none_if_all_sent(
+            self) -> None:
+        self.test_send_alert.return_value = RequestStatus.SUCCESS
+        alerts = [self._put_alert() for _ in range(3)]
+
+        self.assertIsNone(self._send_alerts())
+
+        self.assertTrue(self.test_alerts_queue.empty())
+        self.assertEqual([call(alert) for alert in alerts],
+                         self.test_send_alert.call_args_list)
+        self.assertEqual(0, self.test_retry_scheduler.retries)
+
+    @freeze_time("2012-01-01")
+    def test_send_alerts_discards_expired_alerts(self) -> None:
+        self.test_send_alert.return_value = RequestStatus.SUCCESS
+        self._put_alert(datetime.now().timestamp()
+                        - self.test_alert_validity_threshold - 1)
+        recent_alert = self._put_alert()
+
+        self._send_alerts()
+
+        self.assertTrue(self.test_alerts_queue.empty())
+        self.test_send_alert.assert_called_once_with(recent_alert)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(random, "uniform")
+    def test_send_alerts_keeps_failed_alert_and_sends_the_alerts_behind_it(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        failing_alert = self._put_alert()
+        other_alert = self._put_alert()
+        self.test_send_alert.side_effect = [RequestStatus.FAILED,
+                                            RequestStatus.SUCCESS]
+
+        self.assertEqual(self.test_base_delay, self._send_alerts())
+
+        self.assertEqual([failing_alert], list(self.test_alerts_queue.queue))
+        self.assertEqual([call(failing_alert), call(other_alert)],
+                         self.test_send_alert.call_args_list)
+        self.assertEqual(1, self.test_retry_scheduler.retries)
+        self.assertEqual(1, self.test_retry_scheduler.pending_retries)
+
+    @mock.patch.object(random, "uniform")
+    def test_send_alerts_retries_alert_only_once_its_backoff_passes(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        with freeze_time("2012-01-01") as frozen_time:
+            self._put_alert()
+            self._send_alerts()
+
+            frozen_time.tick(timedelta(seconds=self.test_base_delay - 1))
+            self.assertEqual(1, self._send_alerts())
+            self.assertEqual(1, self.test_send_alert.call_count)
+
+            frozen_time.tick(timedelta(seconds=1))
+            self.assertEqual(self.test_max_delay, self._send_alerts())
+            self.assertEqual(2, self.test_send_alert.call_count)
+
+    @mock.patch.object(random, "uniform")
+    def test_send_alerts_gives_up_on_alert_after_max_attempts(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        with freeze_time("2012-01-01") as frozen_time:
+            self._put_alert()
+            for _ in range(self.test_max_attempts):
+                self._send_alerts()
+                frozen_time.tick(timedelta(seconds=self.test_max_delay))
+
+        self.assertTrue(self.test_alerts_queue.empty())
+        self.assertEqual(self.test_max_attempts,
+                         self.test_send_alert.call_count)
+        self.assertEqual(self.test_max_attempts - 1,
+                         self.test_retry_scheduler.retries)
+        self.assertEqual(1, self.test_retry_scheduler.given_up)
+        self.assertEqual(0, self.test_retry_scheduler.pending_retries)
+
+    def test_send_alerts_spaces_out_alerts_by_min_send_interval(self) -> None:
+        self.test_retry_scheduler._min_send_interval = 1
+        self.test_send_alert.return_value = RequestStatus.SUCCESS
+        with freeze_time("2012-01-01") as frozen_time:
+            first_alert = self._put_alert()
+            second_alert = self._put_alert()
+
+            self.assertEqual(1, self._send_alerts())
+            self.test_send_alert.assert_called_once_with(first_alert)
+
+            frozen_time.tick(timedelta(seconds=1))
+            self.assertIsNone(self._send_alerts())
+            self.test_send_alert.assert_called_with(second_alert)
+            self.assertTrue(self.test_alerts_queue.empty())
+
+    @freeze_time("2012-01-01")
+    def test_send_alerts_forgets_alerts_removed_from_the_queue(self) -> None:
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        self._put_alert()
+        self._send_alerts()
+        self.test_alerts_queue.get()
+        self.test_alerts_queue.task_done()
+
+        self.assertIsNone(self._send_alerts())
+        self.assertEqual(0, self.test_retry_scheduler.pending_retries)
+
+    @freeze_time("2012-01-01")
+    def test_is_only_retrying_true_if_queued_alerts_wait_to_be_retried(
+            self) -> None:
+        self.assertTrue(
+            self.test_retry_scheduler.is_only_retrying(self.test_alerts_queue))
+
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        self._put_alert()
+        self._send_alerts()
+
+        self.assertTrue(
+            self.test_retry_scheduler.is_only_retrying(self.test_alerts_queue))
+
+    @freeze_time("2012-01-01")
+    def test_is_only_retrying_false_if_a_queued_alert_was_not_attempted(
+            self) -> None:
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        self._put_alert()
+        self._send_alerts()
+        self._put_alert()
+
+        self.assertFalse(
+            self.test_retry_scheduler.is_only_retrying(self.test_alerts_queue))
+
+    @mock.patch.object(random, "uniform")
+    def test_send_alerts_sends_and_retries_alerts_to_send_together(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        alerts = [self._put_alert() for _ in range(2)]
+        self.test_send_alert.return_value = RequestStatus.FAILED
+        with freeze_time("2012-01-01") as frozen_time:
+            self.assertEqual(
+                self.test_base_delay,
+                self.test_retry_scheduler.send_alerts(
+                    self.test_alerts_queue, self.test_send_alert,
+                    self.test_alert_validity_threshold,
+                    lambda alert: list(self.test_alerts_queue.queue)))
+
+            self.test_send_alert.assert_called_once_with(alerts)
+            self.assertEqual(alerts, list(self.test_alerts_queue.queue))
+            self.assertEqual(1, self.test_retry_scheduler.retries)
+            self.assertEqual(2, self.test_retry_scheduler.pending_retries)
+
+            self.test_send_alert.return_value = RequestStatus.SUCCESS
+            frozen_time.tick(timedelta(seconds=self.test_base_delay))
+            self.assertIsNone(self.test_retry_scheduler.send_alerts(
+                self.test_alerts_queue, self.test_send_alert,
+                self.test_alert_validity_threshold,
+                lambda alert: list(self.test_alerts_queue.queue)))
+
+        self.assertEqual([call(alerts), call(alerts)],
+                         self.test_send_alert.call_args_list)
+        self.assertTrue(self.test_alerts_queue.empty())
+        self.assertEqual(0, self.test_retry_scheduler.pending_retries)
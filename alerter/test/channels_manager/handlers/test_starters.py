@@ -29,10 +29,12 @@ from src.channels_manager.handlers.log.alerts import LogAlertsHandler
 from src.channels_manager.handlers.opsgenie.alerts import OpsgenieAlertsHandler
 from src.channels_manager.handlers.pagerduty.alerts import (
     PagerDutyAlertsHandler)
+from src.channels_manager.handlers.retry_scheduler import AlertRetryScheduler
 from src.channels_manager.handlers.slack.commands import (
     SlackCommandsHandler)
 from src.channels_manager.handlers.starters import (
     _initialise_channel_handler_logger, _initialise_alerts_logger,
+    _initialise_alert_retry_scheduler,
     _initialise_telegram_alerts_handler, start_telegram_alerts_handler,
     _initialise_telegram_commands_handler, start_telegram_commands_handler,
     _initialise_slack_alerts_handler, start_slack_alerts_handler,
@@ -322,6 +324,25 @@ class TestHandlerStarters(unittest.TestCase):
 
         self.assertEqual(self.dummy_logger, returned_logger)
 
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
+    def test_initialise_alert_retry_scheduler_returns_none_if_disabled(
+            self) -> None:
+        self.assertIsNone(_initialise_alert_retry_scheduler(self.dummy_logger,
+                                                            1))
+
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", True)
+    def test_initialise_alert_retry_scheduler_creates_scheduler_if_enabled(
+            self) -> None:
+        retry_scheduler = _initialise_alert_retry_scheduler(self.dummy_logger,
+                                                            1)
+
+        self.assertIsInstance(retry_scheduler, AlertRetryScheduler)
+        self.assertEqual(1, retry_scheduler.min_send_interval)
+        self.assertEqual(
+            self.dummy_logger.getChild(AlertRetryScheduler.__name__),
+            retry_scheduler.logger)
+
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
     @mock.patch("src.channels_manager.handlers.starters.TelegramBotApi")
@@ -360,7 +381,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            digest_window=env.CHAT_ALERTS_DIGEST_WINDOW_SECONDS,
+            retry_scheduler=None)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_telegram_alerts_handler")
@@ -475,6 +498,7 @@ class TestHandlerStarters(unittest.TestCase):
         mock_start_handler.assert_called_once_with(
             self.telegram_commands_handler)
 
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
     @mock.patch("src.channels_manager.handlers.starters.SlackBotApi")
@@ -514,7 +538,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            digest_window=env.CHAT_ALERTS_DIGEST_WINDOW_SECONDS,
+            retry_scheduler=None)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_slack_alerts_handler")
@@ -693,6 +719,7 @@ class TestHandlerStarters(unittest.TestCase):
                                               self.twiml, self.twiml_is_url)
         mock_start_handler.assert_called_once_with(self.twilio_alerts_handler)
 
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
     @mock.patch("src.channels_manager.handlers.starters.PagerDutyApi")
@@ -729,7 +756,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            retry_scheduler=None)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_pagerduty_alerts_handler")
@@ -749,6 +777,7 @@ class TestHandlerStarters(unittest.TestCase):
         mock_start_handler.assert_called_once_with(
             self.pagerduty_alerts_handler)
 
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
     @mock.patch("src.channels_manager.handlers.starters.EmailApi")
@@ -776,9 +805,9 @@ class TestHandlerStarters(unittest.TestCase):
             self.email_channel_name)
         mock_init_logger.assert_called_once_with(handler_display_name,
                                                  EmailAlertsHandler.__name__)
-        mock_email_api.assert_called_once_with(self.smtp, self.call_from,
-                                               self.username, self.password,
-                                               self.port)
+        mock_email_api.assert_called_once_with(
+            self.smtp, self.call_from, self.username, self.password, self.port,
+            env.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS)
         mock_email_channel.assert_called_once_with(
             self.email_channel_name, self.email_channel_id,
             self.dummy_logger.getChild(EmailChannel.__name__), self.emails_to,
@@ -788,7 +817,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            batch_window=env.EMAIL_ALERTS_BATCH_WINDOW_SECONDS,
+            retry_scheduler=None)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_email_alerts_handler")
@@ -808,6 +839,7 @@ class TestHandlerStarters(unittest.TestCase):
             self.email_channel_name, self.username, self.password, self.port)
         mock_start_handler.assert_called_once_with(self.email_alerts_handler)
 
+    @mock.patch.object(env, "ENABLE_NON_BLOCKING_ALERT_RETRIES", False)
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
     @mock.patch("src.channels_manager.handlers.starters.OpsgenieApi")
@@ -844,7 +876,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            retry_scheduler=None)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_opsgenie_alerts_handler")
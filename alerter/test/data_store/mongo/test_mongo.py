@@ -3,6 +3,7 @@ import unittest
 from datetime import timedelta, datetime
 from time import sleep
 
+from pymongo import UpdateOne
 from pymongo.errors import (PyMongoError, OperationFailure,
                             ServerSelectionTimeoutError)
 
@@ -210,6 +211,29 @@ class TestMongoApiWithMongoOnline(unittest.TestCase):
         self.assertEqual(get_result[1]['doc_type'], self.test_2)
         self.assertEqual(get_result[1]['d'], self.time_used)
 
+    def test_bulk_write_executes_all_requests_on_the_specified_collection(
+            self):
+        # Check that col1 is empty
+        get_result = list(self.mongo._db[self.col1].find({}))
+        self.assertEqual(len(get_result), 0)
+
+        self.mongo.bulk_write(self.col1, [
+            UpdateOne(self.query1, self.doc_1, upsert=True),
+            UpdateOne(self.query2, self.doc_2, upsert=True),
+            UpdateOne(self.query1, self.doc_3, upsert=True),
+        ])
+
+        # Check that the values were added to col1
+        get_result = list(self.mongo._db[self.col1].find({}))
+        self.assertEqual(len(get_result), 2)
+        self.assertEqual(get_result[0]['1'][0][self.key_m_1], self.val_m_1)
+        self.assertEqual(get_result[0]['1'][1][self.key_m_2], self.val_m_2)
+        self.assertEqual(get_result[0]['n_entries'], 2)
+        self.assertEqual(get_result[0]['doc_type'], self.test_1)
+        self.assertEqual(get_result[1]['2'][0][self.key_m_2], self.val_m_2)
+        self.assertEqual(get_result[1]['n_entries'], 1)
+        self.assertEqual(get_result[1]['doc_type'], self.test_2)
+
     def test_get_all_returns_inserted_values_in_order_of_insert(self):
         # Check that col1 is empty
         get_result = self.mongo.get_all(self.col1)
@@ -345,6 +369,11 @@ class TestMongoApiWithMongoOffline(unittest.TestCase):
                                                self.doc_1)
         self.assertIsNone(default_return)
 
+    def test_bulk_write_returns_none_first_time_round(self):
+        default_return = self.mongo.bulk_write(
+            self.col1, [UpdateOne(self.query1, self.doc_1, upsert=True)])
+        self.assertIsNone(default_return)
+
     def test_get_all_returns_none_first_time_round(self):
         default_return = self.mongo.get_all(self.col1)
         self.assertIsNone(default_return)
@@ -373,6 +402,11 @@ class TestMongoApiWithMongoOffline(unittest.TestCase):
         self.assertIsNone(self.mongo.update_one(self.col1, self.query1,
                                                 self.doc_1))
 
+    def test_bulk_write_returns_none_if_mongo_already_down(self):
+        self.mongo._set_as_down()
+        self.assertIsNone(self.mongo.bulk_write(
+            self.col1, [UpdateOne(self.query1, self.doc_1, upsert=True)]))
+
     def test_insert_many_returns_none_if_mongo_already_down(self):
         self.mongo._set_as_down()
         documents = [self.val1, self.val2, self.val3]
@@ -0,0 +1,242 @@
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from bson.decimal128 import Decimal128
+from freezegun import freeze_time
+from pymongo import ReplaceOne, UpdateOne
+
+from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.rollup import (
+    merge_summaries, summarise_entries, rollup_bucket, TimeSeriesRollup)
+
+
+class TestRollupHelpers(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_bucket_start = datetime(2021, 1, 28, 13,
+                                          tzinfo=timezone.utc)
+        self.test_timestamp = self.test_bucket_start.timestamp()
+        self.test_entries = [
+            {'current_height': 102, 'syncing': False, 'went_down_at': None,
+             'timestamp': self.test_timestamp + 20},
+            {'current_height': 100, 'syncing': True, 'went_down_at': None,
+             'timestamp': self.test_timestamp},
+            {'current_height': Decimal128('106'), 'syncing': False,
+             'went_down_at': None, 'timestamp': self.test_timestamp + 400},
+        ]
+
+    def test_summarise_entries_summarises_metrics_in_order_of_time(
+            self) -> None:
+        expected_output = {
+            'current_height': {'last': Decimal128('106'), 'min': 100,
+                               'max': 106.0, 'avg': 308 / 3, 'n': 3},
+            'syncing': {'last': False},
+            'went_down_at': {'last': None},
+        }
+
+        self.assertEqual(expected_output,
+                         summarise_entries(self.test_entries))
+
+    def test_merge_summaries_weights_averages_by_number_of_values(
+            self) -> None:
+        summaries = [
+            {'current_height': {'last': 102, 'min': 100, 'max': 102,
+                                'avg': 101, 'n': 3},
+             'syncing': {'last': True}},
+            {'current_height': {'last': 110, 'min': 104, 'max': 110,
+                                'avg': 109, 'n': 1},
+             'syncing': {'last': False}},
+        ]
+        expected_output = {
+            'current_height': {'last': 110, 'min': 100, 'max': 110,
+                               'avg': 103, 'n': 4},
+            'syncing': {'last': False},
+        }
+
+        self.assertEqual(expected_output, merge_summaries(summaries))
+
+    def test_rollup_bucket_returns_5_minute_and_hourly_rollups(self) -> None:
+        bucket = {
+            '_id': 'test_id', 'doc_type': 'node', 'd': '2021-01-28', 'h': 13,
+            't': self.test_bucket_start, 'n_writes': 3,
+            'node_1': self.test_entries,
+        }
+
+        expected_output = [
+            {'doc_type': 'node_rollup', 'r': '1h',
+             't': self.test_bucket_start,
+             'node_1': summarise_entries(self.test_entries)},
+            {'doc_type': 'node_rollup', 'r': '5m',
+             't': self.test_bucket_start,
+             'node_1': summarise_entries(self.test_entries[:2])},
+            {'doc_type': 'node_rollup', 'r': '5m',
+             't': self.test_bucket_start + timedelta(minutes=5),
+             'node_1': summarise_entries(self.test_entries[2:])},
+        ]
+        self.assertEqual(expected_output, rollup_bucket(bucket))
+
+
+class TestTimeSeriesRollup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.mongo = mock.MagicMock(spec=MongoApi)
+        self.test_collection = 'test_parent_id'
+        self.test_retention_days = 30
+        self.test_delay = 5
+        self.test_rollup = TimeSeriesRollup(
+            self.mongo, self.dummy_logger, self.test_retention_days,
+            self.test_delay)
+        self.test_bucket_start = datetime(2021, 1, 28, 13,
+                                          tzinfo=timezone.utc)
+        self.test_entry = {'current_height': 100,
+                           'timestamp': self.test_bucket_start.timestamp()}
+        self.test_bucket = {
+            '_id': 'test_id', 'doc_type': 'node', 'd': '2021-01-28', 'h': 13,
+            't': self.test_bucket_start.replace(tzinfo=None), 'n_writes': 1,
+            'node_1': [self.test_entry],
+        }
+        self.test_stored_hourly_rollup = {
+            '_id': 'test_rollup_id', 'doc_type': 'node_rollup', 'r': '1h',
+            't': datetime(2021, 1, 28, 12),
+            'node_1': {'current_height': {'last': 98, 'min': 96, 'max': 98,
+                                          'avg': 97, 'n': 2}},
+        }
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.mongo = None
+        self.test_rollup = None
+
+    def test_get_raw_data_collections_returns_collections_with_raw_buckets(
+            self) -> None:
+        self.mongo.get_collection_names.return_value = [
+            'test_parent_id_2', 'installer_authentication', 'test_parent_id']
+        self.mongo.get_one.side_effect = \
+            lambda collection, query: None \
+            if collection == 'installer_authentication' else self.test_bucket
+
+        self.assertEqual(['test_parent_id', 'test_parent_id_2'],
+                         self.test_rollup.get_raw_data_collections())
+        self.mongo.get_one.assert_any_call('test_parent_id',
+                                           {'h': {'$exists': True}})
+
+    def test_get_raw_data_collections_returns_nothing_if_mongo_error(
+            self) -> None:
+        self.mongo.get_collection_names.return_value = None
+
+        self.assertEqual([], self.test_rollup.get_raw_data_collections())
+
+    def test_set_raw_data_retention_creates_ttl_index_once(self) -> None:
+        self.mongo.get_index_information.return_value = {
+            '_id_': {'v': 2, 'key': [('_id', 1)]}}
+
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.mongo.create_index.assert_called_once_with(
+            self.test_collection, [('t', 1)], {
+                'expireAfterSeconds': self.test_retention_days * 86400,
+                'partialFilterExpression': {'h': {'$exists': True}},
+            })
+
+    def test_set_raw_data_retention_retries_if_index_not_created(
+            self) -> None:
+        self.mongo.get_index_information.return_value = {}
+        self.mongo.create_index.return_value = None
+
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.assertEqual(2, self.mongo.create_index.call_count)
+
+    def test_set_raw_data_retention_modifies_expiry_of_existing_index(
+            self) -> None:
+        self.mongo.get_index_information.return_value = {
+            't_1': {'v': 2, 'key': [('t', 1)], 'expireAfterSeconds': 86400,
+                    'partialFilterExpression': {'h': {'$exists': True}}}}
+
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.mongo.create_index.assert_not_called()
+        self.mongo.modify_collection.assert_called_once_with(
+            self.test_collection, {'index': {
+                'keyPattern': {'t': 1},
+                'expireAfterSeconds': self.test_retention_days * 86400,
+            }})
+
+    def test_set_raw_data_retention_does_nothing_if_expiry_already_set(
+            self) -> None:
+        self.mongo.get_index_information.return_value = {
+            't_1': {'v': 2, 'key': [('t', 1)],
+                    'expireAfterSeconds': self.test_retention_days * 86400}}
+
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.mongo.create_index.assert_not_called()
+        self.mongo.modify_collection.assert_not_called()
+
+    @mock.patch.object(logging.Logger, "warning")
+    def test_set_raw_data_retention_warns_and_retries_if_indexes_unknown(
+            self, mock_warning) -> None:
+        self.mongo.get_index_information.return_value = None
+
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+        self.test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.mongo.create_index.assert_not_called()
+        self.assertEqual(2, self.mongo.get_index_information.call_count)
+        self.assertEqual(2, mock_warning.call_count)
+
+    def test_set_raw_data_retention_keeps_raw_data_if_retention_is_0(
+            self) -> None:
+        test_rollup = TimeSeriesRollup(self.mongo, self.dummy_logger, 0,
+                                       self.test_delay)
+
+        test_rollup.set_raw_data_retention(self.test_collection)
+
+        self.mongo.create_index.assert_not_called()
+
+    @freeze_time("2021-01-28 15:00:00")
+    def test_rollup_writes_rollups_and_marks_bucket_as_rolled_up(
+            self) -> None:
+        self.mongo.get_by.side_effect = [[self.test_bucket],
+                                         [self.test_stored_hourly_rollup]]
+
+        self.test_rollup.rollup(self.test_collection)
+
+        self.assertEqual(
+            mock.call(self.test_collection, {
+                'h': {'$exists': True}, 'rolled_up': {'$ne': True},
+                't': {'$lte': datetime.now(timezone.utc) - timedelta(
+                    hours=1, seconds=self.test_delay)},
+            }), self.mongo.get_by.call_args_list[0])
+        hourly_rollup = {
+            'doc_type': 'node_rollup', 'r': '1h', 't': self.test_bucket_start,
+            'node_1': {'current_height': {'last': 100, 'min': 100,
+                                          'max': 100, 'avg': 100, 'n': 1}},
+        }
+        five_minute_rollup = dict(hourly_rollup, r='5m')
+        daily_rollup = {
+            'doc_type': 'node_rollup', 'r': '1d',
+            't': self.test_bucket_start.replace(hour=0),
+            'node_1': {'current_height': {'last': 100, 'min': 96,
+                                          'max': 100, 'avg': 98, 'n': 3}},
+        }
+        expected_requests = [
+            ReplaceOne({'doc_type': 'node_rollup', 'r': document['r'],
+                        't': document['t']}, document, upsert=True)
+            for document in [hourly_rollup, five_minute_rollup, daily_rollup]
+        ] + [UpdateOne({'_id': 'test_id', 'n_writes': 1},
+                       {'$set': {'rolled_up': True}})]
+        self.mongo.bulk_write.assert_called_once_with(self.test_collection,
+                                                      expected_requests)
+
+    def test_rollup_does_nothing_if_buckets_could_not_be_read(self) -> None:
+        self.mongo.get_by.return_value = None
+
+        self.test_rollup.rollup(self.test_collection)
+
+        self.mongo.bulk_write.assert_not_called()
@@ -0,0 +1,166 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from bson.decimal128 import Decimal128
+from freezegun import freeze_time
+from parameterized import parameterized
+from pymongo import UpdateOne
+
+from src.data_store.mongo.time_series import (
+    get_time_series_bucket, to_bson_value, TimeSeriesBuffer)
+
+
+class TestTimeSeriesHelpers(unittest.TestCase):
+    def test_get_time_series_bucket_returns_utc_date_and_hour_bucket(
+            self) -> None:
+        timestamp = datetime(2021, 1, 28, 13, 59, 59,
+                             tzinfo=timezone.utc).timestamp()
+
+        actual_output = get_time_series_bucket('node', timestamp)
+
+        self.assertEqual({'doc_type': 'node', 'd': '2021-01-28', 'h': 13},
+                         actual_output)
+
+    @parameterized.expand([
+        (10, 10,),
+        (10.5, 10.5,),
+        (True, True,),
+        (None, None,),
+        ('test', 'test',),
+        (2 ** 63 - 1, 2 ** 63 - 1,),
+        (2 ** 63, Decimal128(str(2 ** 63)),),
+        (-2 ** 63 - 1, Decimal128(str(-2 ** 63 - 1)),),
+        (10 ** 40, str(10 ** 40),),
+        ({'balance': 10 ** 20, 'symbol': 'ETH'},
+         {'balance': Decimal128(str(10 ** 20)), 'symbol': 'ETH'},),
+        ([1, 10 ** 20], [1, Decimal128(str(10 ** 20))],),
+    ])
+    def test_to_bson_value_keeps_types_storable_by_mongo(
+            self, value, expected_output) -> None:
+        self.assertEqual(expected_output, to_bson_value(value))
+
+
+class TestTimeSeriesBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_flush_size = 3
+        self.test_flush_interval = 5
+        self.test_collection = 'test_parent_id'
+        self.test_other_collection = 'test_other_parent_id'
+        self.test_bucket_start = datetime(2021, 1, 28, 13,
+                                          tzinfo=timezone.utc)
+        self.test_timestamp = self.test_bucket_start.timestamp()
+        self.test_next_hour_timestamp = self.test_timestamp + 3600
+        self.test_entry_1 = {'current_height': 100,
+                             'timestamp': self.test_timestamp}
+        self.test_entry_2 = {'current_height': 101,
+                             'timestamp': self.test_timestamp + 10}
+        with freeze_time(datetime.fromtimestamp(self.test_timestamp)):
+            self.test_buffer = TimeSeriesBuffer(self.test_flush_size,
+                                                self.test_flush_interval)
+
+    def tearDown(self) -> None:
+        self.test_buffer = None
+
+    def test_get_requests_groups_entries_by_collection_and_bucket(
+            self) -> None:
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_timestamp, self.test_entry_1)
+        self.test_buffer.add(self.test_collection, 'node', 'node_2',
+                             self.test_timestamp, self.test_entry_1)
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_timestamp + 10, self.test_entry_2)
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_next_hour_timestamp, self.test_entry_2)
+        self.test_buffer.add(self.test_other_collection, 'network',
+                             self.test_other_collection, self.test_timestamp,
+                             self.test_entry_1)
+
+        expected_requests = {
+            self.test_collection: [
+                UpdateOne(
+                    {'doc_type': 'node', 'd': '2021-01-28', 'h': 13},
+                    {
+                        '$addToSet': {
+                            'node_1': {'$each': [self.test_entry_1,
+                                                 self.test_entry_2]},
+                            'node_2': {'$each': [self.test_entry_1]},
+                        },
+                        '$inc': {'n_writes': 1},
+                        '$setOnInsert': {'t': self.test_bucket_start},
+                        '$unset': {'rolled_up': ''},
+                    }, upsert=True),
+                UpdateOne(
+                    {'doc_type': 'node', 'd': '2021-01-28', 'h': 14},
+                    {
+                        '$addToSet': {
+                            'node_1': {'$each': [self.test_entry_2]}},
+                        '$inc': {'n_writes': 1},
+                        '$setOnInsert': {
+                            't': self.test_bucket_start + timedelta(hours=1)},
+                        '$unset': {'rolled_up': ''},
+                    }, upsert=True),
+            ],
+            self.test_other_collection: [
+                UpdateOne(
+                    {'doc_type': 'network', 'd': '2021-01-28', 'h': 13},
+                    {
+                        '$addToSet': {self.test_other_collection: {
+                            '$each': [self.test_entry_1]}},
+                        '$inc': {'n_writes': 1},
+                        '$setOnInsert': {'t': self.test_bucket_start},
+                        '$unset': {'rolled_up': ''},
+                    }, upsert=True),
+            ],
+        }
+        self.assertEqual(expected_requests, self.test_buffer.get_requests())
+        self.assertEqual(5, self.test_buffer.size)
+
+    def test_is_flush_due_once_flush_size_entries_are_buffered(self) -> None:
+        with freeze_time(datetime.fromtimestamp(self.test_timestamp)):
+            for _ in range(self.test_flush_size - 1):
+                self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                                     self.test_timestamp, self.test_entry_1)
+            self.assertFalse(self.test_buffer.is_flush_due())
+
+            self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                                 self.test_timestamp, self.test_entry_1)
+            self.assertTrue(self.test_buffer.is_flush_due())
+
+    def test_is_flush_due_once_flush_interval_passed_since_last_flush(
+            self) -> None:
+        flush_time = datetime.fromtimestamp(self.test_timestamp)
+        with freeze_time(flush_time + timedelta(
+                seconds=self.test_flush_interval - 1)):
+            self.assertFalse(self.test_buffer.is_flush_due())
+        with freeze_time(flush_time + timedelta(
+                seconds=self.test_flush_interval)) as frozen_time:
+            self.assertTrue(self.test_buffer.is_flush_due())
+
+            self.test_buffer.clear()
+            self.assertFalse(self.test_buffer.is_flush_due())
+            frozen_time.tick(timedelta(seconds=self.test_flush_interval))
+            self.assertTrue(self.test_buffer.is_flush_due())
+
+    def test_discard_removes_only_the_entries_of_the_collection(self) -> None:
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_timestamp, self.test_entry_1)
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_next_hour_timestamp, self.test_entry_2)
+        self.test_buffer.add(self.test_other_collection, 'network',
+                             self.test_other_collection, self.test_timestamp,
+                             self.test_entry_1)
+
+        self.test_buffer.discard(self.test_collection)
+
+        self.assertEqual([self.test_other_collection],
+                         list(self.test_buffer.get_requests()))
+        self.assertEqual(1, self.test_buffer.size)
+
+    def test_clear_removes_all_the_entries(self) -> None:
+        self.test_buffer.add(self.test_collection, 'node', 'node_1',
+                             self.test_timestamp, self.test_entry_1)
+
+        self.test_buffer.clear()
+
+        self.assertEqual({}, self.test_buffer.get_requests())
+        self.assertEqual(0, self.test_buffer.size)
@@ -144,6 +144,17 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         sleep(self.time_with_error_margin.seconds)
         self.assertNotEqual(self.redis.get_unsafe(self.key1), self.val1_bytes)
 
+    def test_set_for_if_not_exists_unsafe_sets_key_only_if_it_does_not_exist(
+            self):
+        self.assertTrue(self.redis.set_for_if_not_exists_unsafe(
+            self.key1, self.val1, self.time))
+        self.assertFalse(self.redis.set_for_if_not_exists_unsafe(
+            self.key1, self.val2, self.time))
+
+        self.assertEqual(self.redis.get_unsafe(self.key1), self.val1_bytes)
+        self.assertEqual(self.time.seconds,
+                         self.redis.time_to_live_unsafe(self.key1))
+
     def test_time_to_live_unsafe_returns_None_if_key_does_not_exist(self):
         self.redis.set(self.key1, self.val1)
 
@@ -343,6 +354,73 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.redis.hremove_unsafe(self.hash_name, self.key1)
         self.assertFalse(self.redis.hexists_unsafe(self.hash_name, self.key1))
 
+    def test_hgetall_unsafe_returns_empty_dict_if_hash_does_not_exist(self):
+        self.assertEqual({}, self.redis.hgetall_unsafe(self.hash_name))
+
+    def test_hgetall_unsafe_returns_all_fields_of_hash(self):
+        self.redis.hset_multiple_unsafe(self.hash_name, {
+            self.key1: self.val1, self.key2: self.val2})
+        self.assertEqual({self.key1: self.val1_bytes,
+                          self.key2: self.val2_bytes},
+                         self.redis.hgetall_unsafe(self.hash_name))
+
+    def test_scan_keys_unsafe_gets_only_keys_that_match_prefix_pattern(self):
+        prefixed_key1 = 'aaa' + self.key1
+        prefixed_key2 = 'bbb' + self.key2
+        prefixed_key3 = 'aa' + self.key3
+        self.redis.set_unsafe(prefixed_key1, self.val1)
+        self.redis.set_unsafe(prefixed_key2, self.val2)
+        self.redis.set_unsafe(prefixed_key3, self.val3_int)
+
+        keys_list = self.redis.scan_keys_unsafe('aa*', count=1)
+        self.assertSetEqual(set(keys_list), {prefixed_key1, prefixed_key3})
+
+    def test_hscan_keys_unsafe_gets_only_keys_that_match_pattern(self):
+        self.redis.hset_multiple_unsafe(self.hash_name, {
+            'aa' + self.key1: self.val1, 'bb' + self.key2: self.val2,
+            'aa' + self.key3: self.val2})
+
+        keys_list = self.redis.hscan_keys_unsafe(self.hash_name, 'aa*',
+                                                 count=1)
+        self.assertSetEqual(set(keys_list),
+                            {'aa' + self.key1, 'aa' + self.key3})
+
+    def test_hremove_multiple_unsafe_removes_keys_of_every_hash(self):
+        other_hash_name = 'other_' + self.hash_name
+        self.redis.hset_multiple_unsafe(self.hash_name, {
+            self.key1: self.val1, self.key2: self.val2})
+        self.redis.hset_multiple_unsafe(other_hash_name, {
+            self.key1: self.val1, self.key2: self.val2})
+
+        self.redis.hremove_multiple_unsafe({
+            self.hash_name: [self.key1, self.key2],
+            other_hash_name: [self.key2], 'empty_hash': []})
+
+        self.assertEqual({}, self.redis.hgetall_unsafe(self.hash_name))
+        self.assertEqual({self.key1: self.val1_bytes},
+                         self.redis.hgetall_unsafe(other_hash_name))
+
+    def test_sadd_and_sremove_multiple_unsafe_update_every_set(self):
+        self.redis.sadd_multiple_unsafe({
+            self.key1: [self.val1, self.val2], self.key2: [self.val1]})
+        self.redis.sremove_multiple_unsafe({self.key1: [self.val1]})
+
+        self.assertListEqual([self.val2],
+                             self.redis.smembers_unsafe(self.key1))
+        self.assertListEqual([self.val1],
+                             self.redis.smembers_unsafe(self.key2))
+
+    def test_hset_and_sadd_multiple_unsafe_sets_key_and_updates_sets(self):
+        self.redis.hset_and_sadd_multiple_unsafe(
+            self.hash_name, self.key1, self.val1,
+            {self.key2: [self.val1, self.val2], 'empty_set': []})
+
+        self.assertEqual(self.val1_bytes,
+                         self.redis.hget_unsafe(self.hash_name, self.key1))
+        self.assertListEqual(sorted([self.val1, self.val2]),
+                             sorted(self.redis.smembers_unsafe(self.key2)))
+        self.assertFalse(self.redis.exists_unsafe('empty_set'))
+
     def test_delete_all_unsafe_does_nothing_if_no_keys_exist(self):
         self.redis.delete_all_unsafe()
         self.assertEqual(0, len(self.redis.get_keys_unsafe()))
@@ -430,6 +508,20 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.assertIsNone(self.redis.set_for(self.key1, self.val1, self.time))
         self.assertFalse(self.redis.exists_unsafe(self.key1))
 
+    def test_set_for_if_not_exists_sets_key_only_if_it_does_not_exist(self):
+        self.assertTrue(self.redis.set_for_if_not_exists(
+            self.key1, self.val1, self.time))
+        self.assertFalse(self.redis.set_for_if_not_exists(
+            self.key1, self.val2, self.time))
+        self.assertEqual(self.redis.get(self.key1), self.val1_bytes)
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_set_for_if_not_exists_returns_false_and_nothing_set_if_redis_down(
+            self, _):
+        self.assertFalse(self.redis.set_for_if_not_exists(
+            self.key1, self.val1, self.time))
+        self.assertFalse(self.redis.exists_unsafe(self.key1))
+
     def test_time_to_live_returns_correct_timeout_when_set(self):
         self.redis.set_for(self.key1, self.val1, self.time)
 
@@ -685,6 +777,38 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.assertIsNone(self.redis.hremove(self.hash_name, self.key1))
         self.assertTrue(self.redis.hexists_unsafe(self.hash_name, self.key1))
 
+    def test_hgetall_returns_all_fields_of_hash(self):
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual({self.key1: self.val1_bytes},
+                         self.redis.hgetall(self.hash_name))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hgetall_returns_empty_dict_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual({}, self.redis.hgetall(self.hash_name))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_scan_keys_returns_none_if_redis_down(self, _):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.assertIsNone(self.redis.scan_keys())
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hscan_keys_returns_none_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertIsNone(self.redis.hscan_keys(self.hash_name))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_sadd_multiple_returns_none_if_redis_down(self, _):
+        self.assertIsNone(self.redis.sadd_multiple({self.key1: [self.val1]}))
+        self.assertListEqual([], self.redis.smembers_unsafe(self.key1))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hset_and_sadd_multiple_returns_none_if_redis_down(self, _):
+        self.assertIsNone(self.redis.hset_and_sadd_multiple(
+            self.hash_name, self.key1, self.val1, {self.key2: [self.val1]}))
+        self.assertFalse(self.redis.hexists_unsafe(self.hash_name, self.key1))
+        self.assertListEqual([], self.redis.smembers_unsafe(self.key2))
+
     def test_delete_all_does_nothing_if_no_keys_exist(self):
         self.redis.delete_all()
         self.assertEqual(0, len(self.redis.get_keys()))
@@ -779,6 +903,11 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
         self.assertRaises(RedisConnectionError, self.redis.set_for_unsafe,
                           self.key, self.val, self.time)
 
+    def test_set_for_if_not_exists_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError,
+                          self.redis.set_for_if_not_exists_unsafe, self.key,
+                          self.val, self.time)
+
     def test_time_to_live_unsafe_throws_connection_exception(self):
         self.assertRaises(RedisConnectionError,
                           self.redis.time_to_live_unsafe, self.key)
@@ -845,6 +974,10 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
     def test_set_for_returns_none(self):
         self.assertIsNone(self.redis.set_for(self.key, self.val, self.time))
 
+    def test_set_for_if_not_exists_returns_false(self):
+        self.assertFalse(
+            self.redis.set_for_if_not_exists(self.key, self.val, self.time))
+
     def test_time_to_live_returns_none(self):
         self.assertIsNone(self.redis.time_to_live(self.key))
 
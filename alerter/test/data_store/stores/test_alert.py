@@ -21,9 +21,12 @@ from src.alerter.alerters.node.cosmos import CosmosNodeAlerter
 from src.alerter.alerters.node.evm import EVMNodeAlerter
 from src.alerter.alerters.node.substrate import SubstrateNodeAlerter
 from src.alerter.alerters.system import SystemAlerter
+from src.alerter.grouped_alerts_metric_code import (
+    GroupedAlertsMetricCode, GroupedInternalAlertsMetricCode)
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.redis_api import RedisApi
-from src.data_store.redis.store_keys import Keys
+from src.data_store.redis.store_keys import (
+    Keys, get_metrics_without_alert_key)
 from src.data_store.stores.alert import AlertStore
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
@@ -872,11 +875,58 @@ class TestAlertStore(unittest.TestCase):
         self.test_store._process_mongo_store(self.alert_data_1)
         mock_update_one.assert_called_once()
 
-    @mock.patch.object(RedisApi, "hset")
+    def test_every_alert_metric_stored_in_redis_has_a_key(self) -> None:
+        metrics = [
+            metric_code.value
+            for metric_code_class in GroupedAlertsMetricCode.__subclasses__()
+            if metric_code_class is not GroupedInternalAlertsMetricCode
+            for metric_code in metric_code_class
+        ]
+
+        self.assertEqual([], get_metrics_without_alert_key(metrics))
+
+    @mock.patch.object(RedisApi, "hset_and_sadd_multiple")
+    def test_process_redis_store_raises_key_error_if_metric_has_no_key(
+            self, mock_hset_and_sadd_multiple) -> None:
+        alert = copy.deepcopy(self.alert_data_1)
+        alert['metric'] = 'test_metric_with_no_key'
+
+        self.assertRaises(KeyError, self.test_store._process_redis_store,
+                          alert)
+        mock_hset_and_sadd_multiple.assert_not_called()
+
+    @mock.patch.object(RedisApi, "hset_and_sadd_multiple")
     def test_process_redis_store_calls_hset_on_normal_alerts(
-            self, mock_hset) -> None:
+            self, mock_hset_and_sadd_multiple) -> None:
         self.test_store._process_redis_store(self.alert_data_1)
-        mock_hset.assert_called_once()
+        mock_hset_and_sadd_multiple.assert_called_once()
+
+    @mock.patch.object(RedisApi, "sadd_multiple")
+    @mock.patch.object(RedisApi, "hset")
+    def test_process_redis_store_indexes_alert_key_with_the_alert(
+            self, mock_hset, mock_sadd_multiple) -> None:
+        self.test_store._process_redis_store(self.alert_data_9)
+
+        chain_hash = Keys.get_hash_parent(self.alert_data_9['parent_id'])
+        metric_key = eval(
+            "Keys.get_alert_{}(self.alert_data_9['origin_id'])".format(
+                self.alert_data_9['metric']))
+        self.assertTrue(self.redis.hexists(chain_hash, metric_key))
+        self.assertIn(metric_key, self.redis.smembers(
+            Keys.get_set_alert_keys(
+                self.test_store._get_alert_keys_prefix(metric_key),
+                self.alert_data_9['parent_id'])))
+        mock_hset.assert_not_called()
+        mock_sadd_multiple.assert_not_called()
+
+    @mock.patch.object(RedisApi, "hset_and_sadd_multiple", return_value=None)
+    def test_process_redis_store_marks_index_as_stale_if_redis_write_fails(
+            self, _) -> None:
+        self.test_store._alert_keys_indexed = True
+
+        self.test_store._process_redis_store(self.alert_data_9)
+
+        self.assertFalse(self.test_store._alert_keys_indexed)
 
     @parameterized.expand([
         ("self.alert_data_1",),
@@ -933,9 +983,9 @@ class TestAlertStore(unittest.TestCase):
         ("self.alert_data_9",),
         ("self.alert_data_10",),
     ])
-    @mock.patch.object(RedisApi, "hset")
+    @mock.patch.object(RedisApi, "hset_and_sadd_multiple")
     def test_process_redis_store_calls_redis_correctly_storing_metrics(
-            self, mock_system_data, mock_hset) -> None:
+            self, mock_system_data, mock_hset_and_sadd_multiple) -> None:
         data = eval(mock_system_data)
         self.test_store._process_redis_store(data)
 
@@ -957,9 +1007,10 @@ class TestAlertStore(unittest.TestCase):
         metric_state_args = data['metric_state_args']
         key = eval('Keys.get_alert_{}(*metric_state_args)'.format(metric))
 
-        call_1 = call(name, key, value)
+        index = self.test_store._get_alert_key_index(data['parent_id'], key)
+        call_1 = call(name, key, value, index)
 
-        mock_hset.assert_has_calls([call_1])
+        mock_hset_and_sadd_multiple.assert_has_calls([call_1])
 
     def test_process_redis_store_system_removes_all_chains_sys_metrics_pid_none(
             self) -> None:
@@ -985,6 +1036,40 @@ class TestAlertStore(unittest.TestCase):
         self.assertFalse(self.redis.hexists(chain_hash_1, metric_key_1))
         self.assertFalse(self.redis.hexists(chain_hash_2, metric_key_2))
 
+    def test_process_redis_store_resets_metrics_stored_before_store_started(
+            self) -> None:
+        # Metrics stored directly in Redis, for example by a previous version
+        # of the store, are not in the index of the alert keys.
+        chain_hash = Keys.get_hash_parent(self.alert_data_9['parent_id'])
+        metric_key = Keys.get_alert_system_is_down(
+            self.alert_data_9['origin_id'])
+        self.redis.hset(chain_hash, metric_key, 'test_value')
+        self.assertFalse(self.test_store._alert_keys_indexed)
+
+        self.test_store._process_redis_store(
+            self.alert_internal_system_all_chains)
+
+        self.assertFalse(self.redis.hexists(chain_hash, metric_key))
+        self.assertTrue(self.test_store._alert_keys_indexed)
+
+    def test_process_redis_store_indexes_metrics_once_index_is_built(
+            self) -> None:
+        self.test_store._process_redis_store(
+            self.alert_internal_system_all_chains)
+        self.test_store._process_redis_store(self.alert_data_9)
+        chain_hash = Keys.get_hash_parent(self.alert_data_9['parent_id'])
+        metric_key = eval(
+            "Keys.get_alert_{}(self.alert_data_9['origin_id'])".format(
+                self.alert_data_9['metric']))
+        self.assertTrue(self.redis.hexists(chain_hash, metric_key))
+
+        with mock.patch.object(RedisApi, "scan_keys") as mock_scan_keys:
+            self.test_store._process_redis_store(
+                self.alert_internal_system_all_chains)
+            mock_scan_keys.assert_not_called()
+
+        self.assertFalse(self.redis.hexists(chain_hash, metric_key))
+
     def test_process_redis_store_system_removes_all_system_metrics_for_chain(
             self) -> None:
         # First set metrics for different chains and check that they were set
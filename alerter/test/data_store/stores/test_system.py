@@ -3,7 +3,7 @@ import logging
 import time
 import unittest
 from datetime import datetime
-from datetime import timedelta
+from datetime import timedelta, timezone
 from unittest import mock
 from unittest.mock import call
 
@@ -11,8 +11,11 @@ import pika
 import pika.exceptions
 from freezegun import freeze_time
 from parameterized import parameterized
+from pymongo import UpdateOne
 
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.time_series import (TimeSeriesBuffer,
+                                              get_time_series_bucket)
 from src.data_store.redis import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.system import SystemStore
@@ -785,6 +788,131 @@ class TestSystemStore(unittest.TestCase):
         )
         mock_update_one.assert_has_calls([call_1])
 
+    @mock.patch.object(MongoApi, "update_one")
+    def test_process_mongo_result_store_buffers_typed_entry_if_time_series(
+            self, mock_update_one) -> None:
+        self.test_store._mongo_time_series_storage = True
+        data = self.system_data_1['result']
+
+        self.test_store._process_mongo_result_store(data)
+
+        mock_update_one.assert_not_called()
+        expected_entry = dict(data['data'],
+                              timestamp=data['meta_data']['last_monitored'])
+        expected_requests = {
+            self.parent_id: [UpdateOne(
+                get_time_series_bucket('system', self.last_monitored),
+                {
+                    '$addToSet': {
+                        self.system_id: {'$each': [expected_entry]}},
+                    '$inc': {'n_writes': 1},
+                    '$setOnInsert': {'t': datetime.fromtimestamp(
+                        self.last_monitored, tz=timezone.utc).replace(
+                        minute=0, second=0, microsecond=0)},
+                    '$unset': {'rolled_up': ''},
+                }, upsert=True)]
+        }
+        self.assertEqual(
+            expected_requests,
+            self.test_store._mongo_time_series_buffer.get_requests())
+
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    @mock.patch.object(MongoApi, "bulk_write")
+    def test_acknowledge_data_acks_all_data_once_time_series_flushed(
+            self, mock_bulk_write, mock_ack) -> None:
+        self.test_store._mongo_time_series_storage = True
+        self.test_store._mongo_time_series_buffer = TimeSeriesBuffer(2, 60)
+
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+        self.test_store._acknowledge_data(1)
+        mock_bulk_write.assert_not_called()
+        mock_ack.assert_not_called()
+
+        self.test_store._process_mongo_result_store(
+            self.system_data_2['result'])
+        self.test_store._acknowledge_data(2)
+        mock_bulk_write.assert_called_once_with(self.parent_id, mock.ANY)
+        mock_ack.assert_called_once_with(2, True)
+        self.assertEqual(0, self.test_store._mongo_time_series_buffer.size)
+
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    def test_initialise_mongo_time_series_limits_unacknowledged_data(
+            self, mock_basic_qos, mock_call_later) -> None:
+        self.test_store._mongo_time_series_buffer = TimeSeriesBuffer(50, 60)
+        self.test_store._unacknowledged_delivery_tag = 1
+
+        self.test_store._initialise_mongo_time_series()
+
+        mock_basic_qos.assert_called_once_with(prefetch_count=50)
+        self.assertIsNone(self.test_store._unacknowledged_delivery_tag)
+        mock_call_later.assert_has_calls([
+            call(60, self.test_store._on_mongo_time_series_flush_timer),
+            call(self.test_store._mongo_time_series_rollup_interval,
+                 self.test_store._on_mongo_time_series_rollup_timer)])
+
+    def test_system_store_owns_the_time_series_rollup(self) -> None:
+        self.assertTrue(self.test_store.mongo_time_series_rollup_owner)
+
+    @mock.patch.object(SystemStore, "mongo_time_series_rollup_owner",
+                       new_callable=mock.PropertyMock)
+    @mock.patch.object(RabbitMQApi, "call_later")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    def test_initialise_mongo_time_series_does_not_roll_up_if_not_owner(
+            self, mock_basic_qos, mock_call_later, mock_owner) -> None:
+        mock_owner.return_value = False
+        self.test_store._mongo_time_series_buffer = TimeSeriesBuffer(50, 60)
+
+        self.test_store._initialise_mongo_time_series()
+
+        mock_basic_qos.assert_called_once_with(prefetch_count=50)
+        mock_call_later.assert_called_once_with(
+            60, self.test_store._on_mongo_time_series_flush_timer)
+        self.assertIsNone(self.test_store._mongo_time_series_rollup)
+
+    @mock.patch.object(RabbitMQApi, "call_later")
+    def test_rollup_timer_rolls_up_raw_data_collections_and_reschedules(
+            self, mock_call_later) -> None:
+        self.test_store._mongo_time_series_rollup = mock.MagicMock()
+        self.test_store._mongo_time_series_rollup.get_raw_data_collections \
+            .return_value = [self.parent_id, self.parent_id_2]
+        mock_rollup = self.test_store._mongo_time_series_rollup.rollup
+        mock_rollup.side_effect = [Exception('test'), None]
+
+        self.test_store._on_mongo_time_series_rollup_timer()
+
+        mock_rollup.assert_has_calls([call(self.parent_id),
+                                      call(self.parent_id_2)])
+        mock_call_later.assert_called_once_with(
+            self.test_store._mongo_time_series_rollup_interval,
+            self.test_store._on_mongo_time_series_rollup_timer)
+
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    @mock.patch.object(MongoApi, "bulk_write")
+    def test_acknowledge_data_keeps_data_unacked_if_time_series_not_written(
+            self, mock_bulk_write, mock_ack) -> None:
+        self.test_store._mongo_time_series_storage = True
+        self.test_store._mongo_time_series_buffer = TimeSeriesBuffer(1, 60)
+        mock_bulk_write.return_value = None
+
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+        self.test_store._acknowledge_data(1)
+        mock_ack.assert_not_called()
+        self.assertEqual(1, self.test_store._mongo_time_series_buffer.size)
+
+        # The buffered entries are written on the next flush
+        mock_bulk_write.return_value = mock.MagicMock()
+        self.test_store._process_mongo_result_store(
+            self.system_data_2['result'])
+        self.test_store._acknowledge_data(2)
+        self.assertEqual(2, mock_bulk_write.call_count)
+        self.assertEqual(
+            2, len(mock_bulk_write.call_args.args[1][0]._doc['$addToSet'][
+                self.system_id]['$each']))
+        mock_ack.assert_called_once_with(2, True)
+
     @parameterized.expand([
         ("self.system_data_1",),
         ("self.system_data_2",),
@@ -25,6 +25,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (
     PANICException, NodeIsDownException, ReceivedUnexpectedDataException,
     MessageWasNotDeliveredException)
+from src.utils.sharding import get_sharded_routing_key
 from test.test_utils.utils import (
     connect_to_rabbit, disconnect_from_rabbit, delete_exchange_if_exists,
     delete_queue_if_exists, save_cosmos_node_to_redis)
@@ -1297,6 +1298,25 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
             expected_data_for_saving,
             self.test_data_transformer.publishing_queue.queue[1])
 
+    @mock.patch.object(env, "COSMOS_NODE_ALERTER_SHARDS", 3)
+    def test_place_latest_data_on_queue_sends_data_to_alerter_shard_of_chain(
+            self) -> None:
+        test_data_transformer = CosmosNodeDataTransformer(
+            self.transformer_name, self.dummy_logger, self.redis, self.rabbitmq,
+            self.max_queue_size)
+
+        test_data_transformer._place_latest_data_on_queue(
+            self.processed_data_example_result_all,
+            self.transformed_data_example_result_all)
+
+        self.assertEqual(
+            get_sharded_routing_key(COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                                    self.node_1.parent_id, 3),
+            test_data_transformer.publishing_queue.queue[0]['routing_key'])
+        self.assertEqual(
+            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+            test_data_transformer.publishing_queue.queue[1]['routing_key'])
+
     @parameterized.expand([
         ({
              'prometheus': {
@@ -12,11 +12,12 @@ import pika.exceptions
 from freezegun import freeze_time
 from parameterized import parameterized
 
-from src.data_store.redis import RedisApi
+from src.data_store.redis import RedisApi, Keys
 from src.data_transformers.node.evm import EVMNodeDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitorables.nodes.evm_node import EVMNode
 from src.utils import env
+from src.utils.constants.data import PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, RAW_DATA_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE,
     EVM_NODE_DT_INPUT_QUEUE_NAME, EVM_NODE_RAW_DATA_ROUTING_KEY,
@@ -487,6 +488,68 @@ class TestEVMNodeDataTransformer(unittest.TestCase):
         # Clean test db
         self.redis.delete_all()
 
+    def test_load_state_reads_redis_once_for_new_nodes_of_the_same_parent(
+            self) -> None:
+        # Clean test db
+        self.redis.delete_all()
+
+        # Save the state of two nodes of the same parent to Redis first
+        test_other_evm_node = EVMNode(
+            'test_other_evm_node', 'test_other_evm_node_id',
+            self.test_evm_node_parent_id)
+        test_other_evm_node.set_current_height(self.test_current_height + 1)
+        save_evm_node_to_redis(self.redis, self.test_evm_node)
+        save_evm_node_to_redis(self.redis, test_other_evm_node)
+
+        # Reset evm nodes to default values
+        self.test_evm_node.reset()
+        test_other_evm_node.reset()
+
+        # Load state
+        with mock.patch.object(self.redis, 'hgetall',
+                               wraps=self.redis.hgetall) as mock_hgetall:
+            loaded_evm_node = self.test_data_transformer.load_state(
+                self.test_evm_node)
+            loaded_other_evm_node = self.test_data_transformer.load_state(
+                test_other_evm_node)
+
+        self.assertEqual(self.test_current_height,
+                         loaded_evm_node.current_height)
+        self.assertEqual(self.test_current_height + 1,
+                         loaded_other_evm_node.current_height)
+        mock_hgetall.assert_called_once_with(
+            Keys.get_hash_parent(self.test_evm_node_parent_id))
+
+        # Clean test db
+        self.redis.delete_all()
+
+    @freeze_time("2012-01-01")
+    def test_load_state_reads_redis_again_if_node_reloaded_or_state_is_old(
+            self) -> None:
+        # Clean test db
+        self.redis.delete_all()
+
+        test_other_evm_node = EVMNode(
+            'test_other_evm_node', 'test_other_evm_node_id',
+            self.test_evm_node_parent_id)
+
+        with mock.patch.object(self.redis, 'hgetall',
+                               wraps=self.redis.hgetall) as mock_hgetall:
+            # Loading the state of the same node again reads Redis again
+            self.test_data_transformer.load_state(self.test_evm_node)
+            self.test_data_transformer.load_state(self.test_evm_node)
+            self.assertEqual(2, mock_hgetall.call_count)
+
+            # The state read for the parent is not used for new nodes after
+            # PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD seconds
+            with freeze_time(datetime(2012, 1, 1) + timedelta(
+                    seconds=PARENT_STATE_SNAPSHOT_VALIDITY_PERIOD + 1)):
+                self.test_data_transformer.load_state(test_other_evm_node)
+            self.assertEqual(3, mock_hgetall.call_count)
+
+        # Clean test db
+        self.redis.delete_all()
+
     def test_update_state_raises_except_and_keeps_state_if_no_result_or_err(
             self) -> None:
         self.test_data_transformer._state = copy.deepcopy(self.test_state)
@@ -946,6 +946,23 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
         self.assertEqual(proc_alerting_return, data_for_alerting)
         self.assertEqual(proc_saving_return, data_for_saving)
 
+    @parameterized.expand([
+        ('self.raw_data_example_general_error',),
+        ('self.raw_data_example_downtime_error',),
+        ('self.raw_data_example_result_all',),
+        ('self.raw_data_example_result_options_None',),
+    ])
+    def test_transform_data_does_not_change_the_raw_data(
+            self, raw_data) -> None:
+        self.node_1.reset()
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+        raw_data = eval(raw_data)
+        expected_raw_data = copy.deepcopy(raw_data)
+
+        self.test_data_transformer._transform_data(raw_data)
+
+        self.assertEqual(expected_raw_data, raw_data)
+
     @parameterized.expand([
         ({'websocket': {}},),
         ({'websocket': 'bad_val'},),
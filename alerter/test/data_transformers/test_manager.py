@@ -29,8 +29,9 @@ from src.utils.constants.names import (
     SUBSTRATE_NETWORK_DATA_TRANSFORMER_NAME)
 from src.utils.constants.rabbitmq import (
     DT_MAN_HEARTBEAT_QUEUE_NAME, HEALTH_CHECK_EXCHANGE, PING_ROUTING_KEY,
-    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY)
+    HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY, COSMOS_NODE_DT_INPUT_QUEUE_NAME)
 from src.utils.exceptions import PANICException, MessageWasNotDeliveredException
+from src.utils.sharding import add_shard_suffix, get_shard_name
 from test.test_utils.utils import (
     infinite_fn, connect_to_rabbit, delete_queue_if_exists,
     delete_exchange_if_exists, disconnect_from_rabbit)
@@ -177,6 +178,26 @@ class TestDataTransformersManager(unittest.TestCase):
             DT_MAN_HEARTBEAT_QUEUE_NAME, False, True, False, False)
         self.assertEqual(0, res.method.message_count)
 
+    @mock.patch.object(env, "COSMOS_NODE_DATA_TRANSFORMER_SHARDS", 2)
+    def test_initialise_rabbitmq_deletes_the_queues_of_stale_shards(
+            self) -> None:
+        # Declare the queue of a shard which is no longer started and the
+        # unsharded queue, as left over from previous numbers of shards
+        stale_queues = [COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+                        add_shard_suffix(COSMOS_NODE_DT_INPUT_QUEUE_NAME, 2)]
+        self.rabbitmq.connect()
+        for stale_queue in stale_queues:
+            self.rabbitmq.queue_declare(stale_queue, False, True, False, False)
+        self.rabbitmq.disconnect()
+
+        self.test_manager._initialise_rabbitmq()
+
+        for stale_queue in stale_queues:
+            self.assertRaises(pika.exceptions.ChannelClosedByBroker,
+                              self.test_manager.rabbitmq.queue_declare,
+                              stale_queue, True)
+            self.test_manager.rabbitmq.new_channel()
+
     @mock.patch.object(RabbitMQApi, "start_consuming")
     def test_listen_for_data_calls_start_consuming(
             self, mock_start_consuming) -> None:
@@ -295,6 +316,25 @@ class TestDataTransformersManager(unittest.TestCase):
 
         self.assertEqual(10, mock_start.call_count)
 
+    @mock.patch.object(env, "COSMOS_NODE_DATA_TRANSFORMER_SHARDS", 3)
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_start_transformers_processes_starts_a_process_per_shard(
+            self, mock_start) -> None:
+        mock_start.return_value = None
+
+        self.test_manager._start_transformers_processes()
+
+        self.assertEqual(12, mock_start.call_count)
+        self.assertNotIn(COSMOS_NODE_DATA_TRANSFORMER_NAME,
+                         self.test_manager.transformer_process_dict)
+        for shard in range(3):
+            shard_process = self.test_manager.transformer_process_dict[
+                get_shard_name(COSMOS_NODE_DATA_TRANSFORMER_NAME, shard)]
+            self.assertTrue(shard_process.daemon)
+            self.assertEqual((shard,), shard_process._args)
+            self.assertEqual(start_cosmos_node_data_transformer,
+                             shard_process._target)
+
     @mock.patch.object(multiprocessing, "Process")
     @mock.patch.object(multiprocessing.Process, "is_alive")
     @mock.patch.object(multiprocessing.Process, "start")
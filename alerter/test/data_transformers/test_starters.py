@@ -333,8 +333,8 @@ class TestDataTransformersStarters(unittest.TestCase):
         start_system_data_transformer()
 
         mock_start_transformer.assert_called_once_with(self.test_system_dt)
-        mock_initialise_dt.assert_called_once_with(SystemDataTransformer,
-                                                   SYSTEM_DATA_TRANSFORMER_NAME)
+        mock_initialise_dt.assert_called_once_with(
+            SystemDataTransformer, SYSTEM_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -360,7 +360,7 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_cl_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            ChainlinkNodeDataTransformer, CL_NODE_DATA_TRANSFORMER_NAME)
+            ChainlinkNodeDataTransformer, CL_NODE_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -373,7 +373,7 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_evm_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            EVMNodeDataTransformer, EVM_NODE_DATA_TRANSFORMER_NAME)
+            EVMNodeDataTransformer, EVM_NODE_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -401,7 +401,7 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_cosmos_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            CosmosNodeDataTransformer, COSMOS_NODE_DATA_TRANSFORMER_NAME)
+            CosmosNodeDataTransformer, COSMOS_NODE_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -26,6 +26,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (PANICException, SystemIsDownException,
                                   ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
+from src.utils.sharding import get_sharded_routing_key
 from test.test_utils.utils import save_system_to_redis
 
 
@@ -987,6 +988,27 @@ class TestSystemDataTransformer(unittest.TestCase):
             expected_data_for_saving,
             self.test_data_transformer.publishing_queue.queue[1])
 
+    @mock.patch.object(env, 'SYSTEM_ALERTER_SHARDS', 3)
+    def test_place_latest_data_on_queue_sends_data_to_alerter_shard_of_parent(
+            self) -> None:
+        test_data_transformer = SystemDataTransformer(
+            self.transformer_name, self.dummy_logger, self.redis, self.rabbitmq,
+            self.max_queue_size)
+        test_data_transformer._place_latest_data_on_queue(
+            self.transformed_data_example_result,
+            self.test_data_for_alerting_result,
+            self.transformed_data_example_result
+        )
+
+        expected_routing_key = get_sharded_routing_key(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, self.test_system_parent_id, 3)
+        self.assertEqual(
+            expected_routing_key,
+            test_data_transformer.publishing_queue.queue[0]['routing_key'])
+        self.assertEqual(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+            test_data_transformer.publishing_queue.queue[1]['routing_key'])
+
     @parameterized.expand([({}, False,), ('self.test_state', True), ])
     @mock.patch.object(SystemDataTransformer, "_transform_data")
     @mock.patch.object(RabbitMQApi, "basic_ack")
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import timedelta
 from typing import List, Any, Optional, Union
 from unittest import TestCase, mock
@@ -7,7 +8,7 @@ from unittest.mock import MagicMock, PropertyMock
 import pika.exceptions
 from parameterized import parameterized
 
-from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq import RabbitMQApi, SharedRabbitMQApi
 from src.utils import env
 from src.utils.exceptions import (
     ConnectionNotInitialisedException, BlankCredentialException,
@@ -762,6 +763,82 @@ class TestRabbitMQApi(TestCase):
             pika.BasicProperties(), True
         )
 
+    def _get_test_batch(self) -> List[dict]:
+        return [
+            {'exchange': "TEST_EXCHANGE", 'routing_key': self.TEST_ROUTING_KEY,
+             'body': body, 'properties': pika.BasicProperties(),
+             'mandatory': True}
+            for body in [self.TEST_BODY_TEXT, b"Test Body 2",
+                         self.TEST_BODY_TEXT]
+        ]
+
+    def test_basic_publish_batch_unsafe_publishes_in_one_transaction(
+            self) -> None:
+        self.rabbit._connection = MagicMock()
+        publishing_channel = self.rabbit.connection.channel.return_value
+        publishing_channel.is_open = True
+        messages = self._get_test_batch()
+
+        self.assertEqual([], self.rabbit.basic_publish_batch_unsafe(messages))
+        self.assertEqual([], self.rabbit.basic_publish_batch_unsafe(messages))
+
+        self.rabbit.connection.channel.assert_called_once_with()
+        publishing_channel.tx_select.assert_called_once_with()
+        self.assertEqual([
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY, message['body'],
+                      pika.BasicProperties(), True)
+            for message in messages + messages
+        ], publishing_channel.basic_publish.call_args_list)
+        self.assertEqual(2, publishing_channel.tx_commit.call_count)
+
+    def test_basic_publish_batch_unsafe_returns_indices_of_returned_messages(
+            self) -> None:
+        self.rabbit._connection = MagicMock()
+        publishing_channel = self.rabbit.connection.channel.return_value
+        return_method = pika.spec.Basic.Return(
+            exchange="TEST_EXCHANGE", routing_key=self.TEST_ROUTING_KEY)
+        publishing_channel.tx_commit.side_effect = lambda: [
+            self.rabbit._on_message_returned(
+                publishing_channel, return_method, pika.BasicProperties(),
+                body) for body in [b"Test Body 2", b"Test Body"]
+        ]
+
+        self.assertEqual([0, 1], self.rabbit.basic_publish_batch_unsafe(
+            self._get_test_batch()))
+
+    def test_basic_publish_batch_unsafe_discards_channel_on_error(
+            self) -> None:
+        self.rabbit._connection = MagicMock()
+        publishing_channel = self.rabbit.connection.channel.return_value
+        publishing_channel.is_open = True
+        publishing_channel.tx_commit.side_effect = \
+            pika.exceptions.AMQPChannelError(self.TEST_EXCEPTION_TEXT)
+
+        self.assertRaises(pika.exceptions.AMQPChannelError,
+                          self.rabbit.basic_publish_batch_unsafe,
+                          self._get_test_batch())
+        publishing_channel.close.assert_called_once_with()
+
+        self.assertRaises(pika.exceptions.AMQPChannelError,
+                          self.rabbit.basic_publish_batch_unsafe,
+                          self._get_test_batch())
+        self.assertEqual(2, self.rabbit.connection.channel.call_count)
+
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_batch_returns_same_if_successful(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock
+    ):
+        mock_safe.return_value = [1]
+        mock_connection_initialised.return_value = True
+        messages = self._get_test_batch()
+
+        self.assertEqual([1], self.rabbit.basic_publish_batch(messages))
+        mock_connection_initialised.assert_called_once_with(self.rabbit)
+        mock_safe.assert_called_once_with(
+            self.rabbit, self.rabbit.basic_publish_batch_unsafe, [messages], -1
+        )
+
     @parameterized.expand([(0,), (None,), (1,), (-1,)])
     @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
     @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
@@ -1433,3 +1510,78 @@ class TestRabbitMQApi(TestCase):
         self.assertIsNone(self.rabbit.perform_operation_till_successful(
             test_function, [retries], -1
         ))
+
+
+class TestSharedRabbitMQApi(TestCase):
+    def setUp(self) -> None:
+        self.rabbit_logger = logging.getLogger("testRabbit")
+        self.rabbit_logger.disabled = True
+        self.rabbit = SharedRabbitMQApi(
+            self.rabbit_logger, env.RABBIT_IP, env.RABBIT_PORT, '', '',
+            timedelta(seconds=1))
+
+    def tearDown(self) -> None:
+        self.rabbit_logger = None
+        self.rabbit = None
+
+    def test_safe_performs_operations_while_holding_the_lock(self) -> None:
+        lock_acquired_by_other_thread = []
+
+        def try_acquiring_lock():
+            acquired = self.rabbit.lock.acquire(blocking=False)
+            lock_acquired_by_other_thread.append(acquired)
+            if acquired:
+                self.rabbit.lock.release()
+
+        def test_function():
+            other_thread = threading.Thread(target=try_acquiring_lock)
+            other_thread.start()
+            other_thread.join()
+            return "OK"
+
+        self.assertEqual("OK", self.rabbit._safe(test_function, [], -1))
+        self.assertEqual([False], lock_acquired_by_other_thread)
+
+    @parameterized.expand([
+        ('queue_declare', ['test_queue'],),
+        ('queue_bind', ['test_queue', 'test_exchange', 'test.key'],),
+        ('basic_publish', ['test_exchange', 'test.key', 'test_body'],),
+        ('basic_ack', [1],),
+        ('exchange_declare', ['test_exchange'],),
+        ('queue_delete', ['test_queue'],),
+    ])
+    def test_operations_read_the_channel_while_holding_the_lock(
+            self, operation, args) -> None:
+        lock_acquired_by_other_thread = []
+
+        def try_acquiring_lock():
+            acquired = self.rabbit.lock.acquire(blocking=False)
+            lock_acquired_by_other_thread.append(acquired)
+            if acquired:
+                self.rabbit.lock.release()
+
+        def get_channel():
+            other_thread = threading.Thread(target=try_acquiring_lock)
+            other_thread.start()
+            other_thread.join()
+            return MagicMock()
+
+        self.rabbit._connection = MagicMock()
+        with mock.patch.object(SharedRabbitMQApi, 'channel',
+                               new_callable=PropertyMock) as mock_channel:
+            mock_channel.side_effect = get_channel
+            getattr(self.rabbit, operation)(*args)
+
+        self.assertEqual([False], lock_acquired_by_other_thread)
+
+    def test_process_data_events_raises_if_connection_not_initialised(
+            self) -> None:
+        self.assertRaises(ConnectionNotInitialisedException,
+                          self.rabbit.process_data_events)
+
+    def test_process_data_events_services_the_connection(self) -> None:
+        self.rabbit._connection = MagicMock()
+
+        self.rabbit.process_data_events(5)
+
+        self.rabbit.connection.process_data_events.assert_called_once_with(5)
@@ -0,0 +1,304 @@
+import json
+import logging
+import unittest
+from datetime import timedelta, datetime
+
+from freezegun import freeze_time
+from redis import ConnectionError as RedisConnectionError
+
+from src.data_store.redis import RedisApi, Keys
+from src.monitors.caches.cosmos import (TendermintBlockCache,
+                                        CosmosValidatorsSnapshotCache,
+                                        CosmosProposalsCache)
+from src.utils import env
+
+
+class TestTendermintBlockCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        # Clear test database
+        self.redis.delete_all_unsafe()
+
+        self.test_parent_id = 'test_parent_id'
+        self.test_subscriber_id = 'test_subscriber_id'
+        self.test_other_subscriber_id = 'test_other_subscriber_id'
+        self.test_subscriber_expiry = timedelta(minutes=10)
+        self.test_max_cached_heights = 100
+        self.test_block_data = {
+            'validators': [{'address': 'test_address_1'}],
+            'signed_validators': ['test_address_1'],
+            'slash_events': [],
+        }
+        self.cache_key = Keys.get_cosmos_tendermint_block_cache(
+            self.test_parent_id)
+        self.subscribers_key = \
+            Keys.get_cosmos_tendermint_block_cache_subscribers(
+                self.test_parent_id)
+        self.test_cache = TendermintBlockCache(
+            self.redis, self.test_parent_id, self.test_subscriber_id,
+            self.test_subscriber_expiry, self.test_max_cached_heights)
+        self.test_other_cache = TendermintBlockCache(
+            self.redis, self.test_parent_id, self.test_other_subscriber_id,
+            self.test_subscriber_expiry, self.test_max_cached_heights)
+
+    def tearDown(self) -> None:
+        self.redis.delete_all_unsafe()
+        self.dummy_logger = None
+        self.redis = None
+        self.test_cache = None
+        self.test_other_cache = None
+
+    def test_get_returns_none_if_height_not_cached(self) -> None:
+        self.assertIsNone(self.test_cache.get(100))
+
+    def test_get_returns_data_set_by_any_subscriber_of_the_chain(self) -> None:
+        self.test_other_cache.set(100, self.test_block_data)
+        self.assertEqual(self.test_block_data, self.test_cache.get(100))
+
+    def test_get_does_not_return_data_cached_for_other_chains(self) -> None:
+        other_chain_cache = TendermintBlockCache(
+            self.redis, 'other_parent_id', self.test_subscriber_id)
+        other_chain_cache.set(100, self.test_block_data)
+        self.assertIsNone(self.test_cache.get(100))
+
+    @freeze_time("2012-01-01")
+    def test_mark_monitored_registers_the_subscriber_progress(self) -> None:
+        self.test_cache.mark_monitored(100)
+
+        progress = json.loads(self.redis.hget(self.subscribers_key,
+                                              self.test_subscriber_id))
+        self.assertEqual({
+            'height': 100, 'timestamp': datetime.now().timestamp()
+        }, progress)
+
+    def test_mark_monitored_evicts_heights_monitored_by_all_subscribers(
+            self) -> None:
+        for height in range(95, 106):
+            self.test_cache.set(height, self.test_block_data)
+
+        self.test_cache.mark_monitored(100)
+        self.test_other_cache.mark_monitored(105)
+
+        self.assertEqual({str(height) for height in range(101, 106)},
+                         set(self.redis.hkeys(self.cache_key)))
+
+    def test_mark_monitored_keeps_heights_needed_by_lagging_subscriber(
+            self) -> None:
+        for height in range(95, 106):
+            self.test_cache.set(height, self.test_block_data)
+
+        self.test_other_cache.mark_monitored(97)
+        self.test_cache.mark_monitored(105)
+
+        self.assertEqual({str(height) for height in range(98, 106)},
+                         set(self.redis.hkeys(self.cache_key)))
+
+    def test_mark_monitored_ignores_and_unsubscribes_expired_subscribers(
+            self) -> None:
+        for height in range(95, 106):
+            self.test_cache.set(height, self.test_block_data)
+        expired_time = datetime.now() - self.test_subscriber_expiry - \
+            timedelta(seconds=1)
+        with freeze_time(expired_time):
+            self.test_other_cache.mark_monitored(96)
+
+        self.test_cache.mark_monitored(103)
+
+        self.assertEqual({'104', '105'}, set(self.redis.hkeys(self.cache_key)))
+        self.assertFalse(self.redis.hexists(self.subscribers_key,
+                                            self.test_other_subscriber_id))
+
+    def test_mark_monitored_keeps_at_most_max_cached_heights(self) -> None:
+        for height in range(1, 151):
+            self.test_cache.set(height, self.test_block_data)
+
+        self.test_other_cache.mark_monitored(1)
+        self.test_cache.mark_monitored(1)
+
+        self.assertEqual({str(height) for height in range(51, 151)},
+                         set(self.redis.hkeys(self.cache_key)))
+
+
+class TestCosmosValidatorsSnapshotCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        # Clear test database
+        self.redis.delete_all_unsafe()
+
+        self.test_parent_id = 'test_parent_id'
+        self.test_max_age = timedelta(seconds=30)
+        self.test_max_stale_age = timedelta(minutes=2)
+        self.test_fetch_lock_expiry = timedelta(seconds=20)
+        self.test_snapshot = {
+            'test_operator_address_1': {'bond_status': 'bonded',
+                                        'jailed': False},
+            'test_operator_address_2': {'bond_status': 'unbonding',
+                                        'jailed': True},
+        }
+        self.cache_key = Keys.get_cosmos_validators_snapshot_cache(
+            self.test_parent_id)
+        self.fetch_lock_key = Keys.get_cosmos_validators_snapshot_fetch_lock(
+            self.test_parent_id)
+        self.test_cache = CosmosValidatorsSnapshotCache(
+            self.redis, self.test_parent_id, self.test_max_age,
+            self.test_max_stale_age, self.test_fetch_lock_expiry)
+
+    def tearDown(self) -> None:
+        self.redis.delete_all_unsafe()
+        self.dummy_logger = None
+        self.redis = None
+        self.test_cache = None
+
+    def test_get_returns_none_if_no_snapshot_cached(self) -> None:
+        self.assertIsNone(self.test_cache.get())
+
+    def test_get_returns_snapshot_set_by_any_monitor_of_the_chain(
+            self) -> None:
+        other_cache = CosmosValidatorsSnapshotCache(
+            self.redis, self.test_parent_id, self.test_max_age)
+        other_cache.set(self.test_snapshot)
+        self.assertEqual(self.test_snapshot, self.test_cache.get())
+
+    def test_get_does_not_return_snapshot_cached_for_other_chains(
+            self) -> None:
+        other_chain_cache = CosmosValidatorsSnapshotCache(
+            self.redis, 'other_parent_id', self.test_max_age)
+        other_chain_cache.set(self.test_snapshot)
+        self.assertIsNone(self.test_cache.get())
+
+    def test_get_returns_none_if_snapshot_is_stale(self) -> None:
+        stale_time = datetime.now() - self.test_max_age - timedelta(seconds=1)
+        with freeze_time(stale_time):
+            self.test_cache.set(self.test_snapshot)
+
+        self.assertIsNone(self.test_cache.get())
+
+    def test_get_returns_stale_snapshot_if_stale_snapshots_included(
+            self) -> None:
+        stale_time = datetime.now() - self.test_max_age - timedelta(seconds=1)
+        with freeze_time(stale_time):
+            self.test_cache.set(self.test_snapshot)
+
+        self.assertEqual(self.test_snapshot,
+                         self.test_cache.get(include_stale=True))
+
+    def test_set_stores_snapshot_for_max_stale_age(self) -> None:
+        self.test_cache.set(self.test_snapshot)
+
+        cached_snapshot = json.loads(self.redis.get(self.cache_key))
+        self.assertEqual(self.test_snapshot, cached_snapshot['snapshot'])
+        time_to_live = self.redis.time_to_live(self.cache_key)
+        self.assertLessEqual(time_to_live,
+                             self.test_max_stale_age.total_seconds())
+        self.assertGreater(time_to_live, self.test_max_age.total_seconds())
+
+    def test_acquire_fetch_lock_acquires_lock_once_per_chain(self) -> None:
+        other_cache = CosmosValidatorsSnapshotCache(
+            self.redis, self.test_parent_id, self.test_max_age)
+        other_chain_cache = CosmosValidatorsSnapshotCache(
+            self.redis, 'other_parent_id', self.test_max_age)
+
+        self.assertTrue(self.test_cache.acquire_fetch_lock())
+        self.assertFalse(other_cache.acquire_fetch_lock())
+        self.assertTrue(other_chain_cache.acquire_fetch_lock())
+
+    def test_acquire_fetch_lock_sets_lock_for_fetch_lock_expiry(self) -> None:
+        self.test_cache.acquire_fetch_lock()
+
+        time_to_live = self.redis.time_to_live(self.fetch_lock_key)
+        self.assertLessEqual(time_to_live,
+                             self.test_fetch_lock_expiry.total_seconds())
+        self.assertGreater(time_to_live, 0)
+
+    def test_release_fetch_lock_allows_lock_to_be_acquired_again(
+            self) -> None:
+        other_cache = CosmosValidatorsSnapshotCache(
+            self.redis, self.test_parent_id, self.test_max_age)
+        self.test_cache.acquire_fetch_lock()
+
+        self.test_cache.release_fetch_lock()
+
+        self.assertTrue(other_cache.acquire_fetch_lock())
+
+
+class TestCosmosProposalsCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        # Clear test database
+        self.redis.delete_all_unsafe()
+
+        self.test_parent_id = 'test_parent_id'
+        self.test_proposal_1 = {'proposal_id': 1, 'status': 3}
+        self.test_proposal_2 = {'proposal_id': 2, 'status': 2}
+        self.test_cache = CosmosProposalsCache(self.redis,
+                                               self.test_parent_id)
+
+    def tearDown(self) -> None:
+        self.redis.delete_all_unsafe()
+        self.dummy_logger = None
+        self.redis = None
+        self.test_cache = None
+
+    def test_get_returns_empty_dict_if_no_proposals_cached(self) -> None:
+        self.assertEqual({}, self.test_cache.get())
+
+    def test_set_stores_proposals_keyed_by_proposal_id(self) -> None:
+        self.test_cache.set([self.test_proposal_1, self.test_proposal_2])
+        self.assertEqual({'1': self.test_proposal_1,
+                          '2': self.test_proposal_2}, self.test_cache.get())
+
+    def test_set_overwrites_cached_proposals_with_the_same_id(self) -> None:
+        self.test_cache.set([self.test_proposal_1, self.test_proposal_2])
+        updated_proposal_2 = {'proposal_id': 2, 'status': 3}
+
+        self.test_cache.set([updated_proposal_2])
+
+        self.assertEqual({'1': self.test_proposal_1,
+                          '2': updated_proposal_2}, self.test_cache.get())
+
+    def test_get_does_not_return_proposals_cached_for_other_chains(
+            self) -> None:
+        other_chain_cache = CosmosProposalsCache(self.redis,
+                                                 'other_parent_id')
+        other_chain_cache.set([self.test_proposal_1])
+        self.assertEqual({}, self.test_cache.get())
+
+    def test_remove_removes_the_given_proposals_only(self) -> None:
+        self.test_cache.set([self.test_proposal_1, self.test_proposal_2])
+        self.test_cache.remove(['2'])
+        self.assertEqual({'1': self.test_proposal_1}, self.test_cache.get())
+
+    def test_replace_replaces_all_the_cached_proposals(self) -> None:
+        self.test_cache.set([self.test_proposal_1, self.test_proposal_2])
+        self.test_cache.replace([self.test_proposal_2])
+        self.assertEqual({'2': self.test_proposal_2}, self.test_cache.get())
@@ -0,0 +1,108 @@
+import logging
+import unittest
+
+from redis import ConnectionError as RedisConnectionError
+
+from src.data_store.redis import RedisApi, Keys
+from src.monitors.caches.substrate import SubstrateEraCache
+from src.utils import env
+
+
+class TestSubstrateEraCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        # Clear test database
+        self.redis.delete_all_unsafe()
+
+        self.test_parent_id = 'test_parent_id'
+        self.test_stash_address = 'test_stash_address'
+        self.test_max_lru_size = 3
+        self.test_eras_stakers = {
+            'result': {
+                'total': '0x00000000000000000048a4faa9941924',
+                'own': 100001845000000,
+                'others': [],
+            }
+        }
+        self.cache_key = Keys.get_substrate_era_cache(self.test_parent_id)
+        self.test_cache = SubstrateEraCache(self.redis, self.test_parent_id,
+                                            self.test_max_lru_size)
+
+    def tearDown(self) -> None:
+        self.redis.delete_all_unsafe()
+        self.dummy_logger = None
+        self.redis = None
+        self.test_cache = None
+
+    def test_get_returns_none_and_counts_a_miss_if_era_not_cached(
+            self) -> None:
+        self.assertIsNone(self.test_cache.get(10, self.test_stash_address))
+        self.assertEqual(0, self.test_cache.hits)
+        self.assertEqual(1, self.test_cache.misses)
+
+    def test_get_returns_cached_data_and_counts_a_hit(self) -> None:
+        self.test_cache.set(10, self.test_stash_address,
+                            self.test_eras_stakers)
+
+        self.assertEqual(self.test_eras_stakers,
+                         self.test_cache.get(10, self.test_stash_address))
+        self.assertEqual(1, self.test_cache.hits)
+        self.assertEqual(0, self.test_cache.misses)
+
+    def test_get_returns_data_cached_in_redis_by_another_cache(self) -> None:
+        other_cache = SubstrateEraCache(self.redis, self.test_parent_id)
+        other_cache.set(10, self.test_stash_address, self.test_eras_stakers)
+
+        self.assertEqual(self.test_eras_stakers,
+                         self.test_cache.get(10, self.test_stash_address))
+        self.assertEqual(1, self.test_cache.hits)
+
+    def test_get_does_not_return_data_of_other_stash_or_chain(self) -> None:
+        other_chain_cache = SubstrateEraCache(self.redis, 'other_parent_id')
+        other_chain_cache.set(10, self.test_stash_address,
+                              self.test_eras_stakers)
+        self.test_cache.set(10, 'other_stash_address', self.test_eras_stakers)
+
+        self.assertIsNone(self.test_cache.get(10, self.test_stash_address))
+
+    def test_get_is_served_by_the_lru_without_redis(self) -> None:
+        self.test_cache.set(10, self.test_stash_address,
+                            self.test_eras_stakers)
+        self.redis.delete_all_unsafe()
+
+        self.assertEqual(self.test_eras_stakers,
+                         self.test_cache.get(10, self.test_stash_address))
+
+    def test_lru_keeps_at_most_max_lru_size_recently_used_eras(self) -> None:
+        for era in range(10, 14):
+            self.test_cache.set(era, self.test_stash_address,
+                                self.test_eras_stakers)
+        self.redis.delete_all_unsafe()
+
+        self.assertIsNone(self.test_cache.get(10, self.test_stash_address))
+        for era in range(11, 14):
+            self.assertEqual(self.test_eras_stakers,
+                             self.test_cache.get(era, self.test_stash_address))
+
+    def test_evict_eras_before_evicts_older_eras_only(self) -> None:
+        for era in range(10, 14):
+            self.test_cache.set(era, self.test_stash_address,
+                                self.test_eras_stakers)
+
+        self.test_cache.evict_eras_before(12)
+
+        self.assertEqual({'12_test_stash_address', '13_test_stash_address'},
+                         set(self.redis.hkeys(self.cache_key)))
+        self.assertIsNone(self.test_cache.get(11, self.test_stash_address))
+        self.assertEqual(self.test_eras_stakers,
+                         self.test_cache.get(12, self.test_stash_address))
@@ -183,10 +183,17 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
             self.node_id_2, self.parent_id_2, self.node_name_2,
             self.monitor_node_2, self.monitor_prometheus_2,
             self.node_prometheus_urls_2)
+        # The contract calls are not batched, so that they can be mocked one
+        # by one
         self.test_monitor = ChainlinkContractsMonitor(
             self.monitor_name, self.weiwatchers_url, self.evm_nodes,
             [self.node_config_1, self.node_config_2], self.dummy_logger,
-            self.monitoring_period, self.rabbitmq, self.parent_id_1)
+            self.monitoring_period, self.rabbitmq, self.parent_id_1, 1)
+
+        # The data sources are selected without the health registry shared by
+        # the monitors of the process, so that the tests do not affect each
+        # other
+        self.test_monitor._data_source_health = None
 
     def tearDown(self) -> None:
         # Delete any queues and exchanges which are common across many tests
@@ -226,6 +233,22 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         self.assertEqual(self.test_data_dict,
                          self.test_monitor.evm_node_w3_interface)
 
+    def test_evm_node_contract_call_batcher_returns_batcher_of_each_node(
+            self) -> None:
+        test_monitor = ChainlinkContractsMonitor(
+            self.monitor_name, self.weiwatchers_url, self.evm_nodes,
+            [self.node_config_1, self.node_config_2], self.dummy_logger,
+            self.monitoring_period, self.rabbitmq, self.parent_id_1, 50)
+
+        self.assertEqual(set(self.evm_nodes),
+                         set(test_monitor.evm_node_contract_call_batcher))
+        for evm_node_url in self.evm_nodes:
+            call_batcher = test_monitor.evm_node_contract_call_batcher[
+                evm_node_url]
+            self.assertEqual(test_monitor.evm_node_w3_interface[evm_node_url],
+                             call_batcher.w3_interface)
+            self.assertEqual(50, call_batcher.max_batch_size)
+
     def test_contracts_url_returns_wei_watchers_url(self) -> None:
         self.assertEqual(self.weiwatchers_url, self.test_monitor.contracts_url)
 
@@ -579,19 +602,19 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         """
         In this test we we assume that the data retrieved from the chain is the
         one declared in the setUp function. This is used to check if contracts
-        are filtered according to which nodes are participating on them.
+        are filtered according to which nodes are participating on them. Note
+        that the participants of a contract are retrieved once for all nodes.
         """
         self.test_monitor._node_address = self.node_address_example
         self.test_monitor._contracts_data = self.retrieved_contracts_example
         mock_to_checksum.side_effect = [self.address_1, self.address_2]
         mock_call.side_effect = [
-            self.contract_1_oracles, self.contract_2_oracles,
-            self.contract_3_transmitters, self.contract_4_transmitters,
             self.contract_1_oracles, self.contract_2_oracles,
             self.contract_3_transmitters, self.contract_4_transmitters]
 
         actual = self.test_monitor._filter_contracts_by_node(self.evm_nodes[0])
         self.assertEqual(self.filtered_contracts_example, actual)
+        self.assertEqual(4, mock_call.call_count)
 
     def test_store_node_contracts_stores_node_contracts(self) -> None:
         self.assertEqual({}, self.test_monitor.node_contracts)
@@ -630,11 +653,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_1, self.contract_description_1, [
+            self.contract_address_1, self.contract_description_1,
+            self.contract_address_2, self.contract_description_2, [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
-            self.contract_address_2, self.contract_description_2, [
+            [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
@@ -677,11 +701,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_1, self.contract_description_1, [
+            self.contract_address_1, self.contract_description_1,
+            self.contract_address_2, self.contract_description_2, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
-            self.contract_address_2, self.contract_description_2, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
@@ -716,11 +741,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_1, self.contract_description_1, [
+            self.contract_address_1, self.contract_description_1,
+            self.contract_address_2, self.contract_description_2, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
-            self.contract_address_2, self.contract_description_2, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
@@ -788,7 +814,8 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
             }
         ])
         mock_call.side_effect = [
-            self.contract_address_1, self.contract_description_1, [
+            self.contract_address_1, self.contract_description_1,
+            self.contract_address_2, self.contract_description_2, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
@@ -796,7 +823,7 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
              self.updated_at, self.answered_in_round - 2],
             [self.current_round - 1, self.answer, self.started_at,
              self.updated_at, self.answered_in_round - 1],
-            self.contract_address_2, self.contract_description_2, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment,
@@ -893,11 +920,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
             },
         ])
         mock_call.side_effect = [
-            self.contract_address_1, self.contract_description_1, [
+            self.contract_address_1, self.contract_description_1,
+            self.contract_address_2, self.contract_description_2, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment, ContractLogicError('test'),
-            self.contract_address_2, self.contract_description_2, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.withdrawable_payment, ContractLogicError('test'),
@@ -986,11 +1014,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_3_transmitters, self.withdrawable_payment,
-            self.contract_address_4, self.contract_description_4, [
+            [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
@@ -1031,11 +1060,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_3_transmitters, self.withdrawable_payment,
-            self.contract_address_4, self.contract_description_4, [
+            [
                 self.current_block, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
@@ -1068,11 +1098,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_3_transmitters, self.withdrawable_payment,
-            self.contract_address_4, self.contract_description_4, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
@@ -1127,11 +1158,12 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         mock_get_block.return_value = {'number': self.current_block}
         mock_create_filter.return_value = TestEventsClass([])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
-            self.contract_3_transmitters,
-            self.contract_address_4, self.contract_description_4, [
+            self.contract_3_transmitters, 0,
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
@@ -1190,7 +1222,8 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
             },
         ])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_3_transmitters, self.withdrawable_payment,
@@ -1198,7 +1231,7 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
              self.updated_at, self.answered_in_round - 2],
             [self.current_round - 1, self.answer, self.started_at,
              self.updated_at, self.answered_in_round - 1],
-            self.contract_address_4, self.contract_description_4, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
@@ -1311,7 +1344,8 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
             },
         ])
         mock_call.side_effect = [
-            self.contract_address_3, self.contract_description_3, [
+            self.contract_address_3, self.contract_description_3,
+            self.contract_address_4, self.contract_description_4, [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_3_transmitters, self.withdrawable_payment,
@@ -1319,7 +1353,7 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
              self.updated_at, self.answered_in_round - 2],
             [self.current_round - 1, self.answer, self.started_at,
              self.updated_at, self.answered_in_round - 1],
-            self.contract_address_4, self.contract_description_4, [
+            [
                 self.current_round, self.answer, self.started_at,
                 self.updated_at, self.answered_in_round],
             self.contract_4_transmitters, self.withdrawable_payment,
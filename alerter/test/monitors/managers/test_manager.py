@@ -1,7 +1,9 @@
 import logging
+import multiprocessing
 import unittest
 from abc import ABC
 from datetime import timedelta, datetime
+from typing import Optional
 from unittest import mock
 from unittest.mock import call
 
@@ -14,6 +16,7 @@ from src.abstract.publisher_subscriber import (
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
+from src.monitors.runtime import MonitorsRuntime
 from src.monitors.node.chainlink import ChainlinkNodeMonitor
 from src.monitors.node.evm import EVMNodeMonitor
 from src.utils import env
@@ -30,8 +33,9 @@ from test.test_utils.utils import (
 class MonitorManagerInstance(MonitorsManager, ABC):
     def __init__(
             self, logger: logging.Logger, name: str,
-            rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, name, rabbitmq)
+            rabbitmq: RabbitMQApi,
+            monitors_runtime: Optional[MonitorsRuntime] = None) -> None:
+        super().__init__(logger, name, rabbitmq, monitors_runtime)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -666,3 +670,44 @@ class TestMonitorsManager(unittest.TestCase):
 
         mock_push.assert_has_calls(calls)
         self.assertEqual(2, mock_send_data.call_count)
+
+    def test_monitors_runtime_returns_monitors_runtime(self) -> None:
+        # Test that by default the monitors are not run by a runtime
+        self.assertIsNone(self.test_manager.monitors_runtime)
+
+        # Test that the property returns the correct value
+        self.test_manager._monitors_runtime = self.test_data_str
+        self.assertEqual(self.test_data_str,
+                         self.test_manager.monitors_runtime)
+
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_start_monitor_process_starts_a_daemon_process_by_default(
+            self, mock_start) -> None:
+        mock_starter = mock.MagicMock()
+
+        actual_output = self.test_manager._start_monitor_process(
+            mock_starter, ('test_arg_1', 'test_arg_2'))
+
+        self.assertIsInstance(actual_output, multiprocessing.Process)
+        self.assertTrue(actual_output.daemon)
+        self.assertEqual(mock_starter, actual_output._target)
+        self.assertEqual(('test_arg_1', 'test_arg_2'), actual_output._args)
+        mock_start.assert_called_once_with()
+        mock_starter.assert_not_called()
+
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_start_monitor_process_runs_monitor_in_runtime_if_given(
+            self, mock_start) -> None:
+        mock_runtime = mock.MagicMock()
+        mock_runtime.start_monitor.return_value = 'test_task'
+        self.test_manager._monitors_runtime = mock_runtime
+        mock_starter = mock.MagicMock()
+
+        actual_output = self.test_manager._start_monitor_process(
+            mock_starter, ('test_arg_1', 'test_arg_2'))
+
+        self.assertEqual('test_task', actual_output)
+        mock_runtime.start_monitor.assert_called_once_with(
+            mock_starter, ('test_arg_1', 'test_arg_2'))
+        mock_starter.assert_not_called()
+        mock_start.assert_not_called()
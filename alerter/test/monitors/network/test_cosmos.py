@@ -1,7 +1,9 @@
+import copy
 import json
 import logging
 import unittest
 from datetime import timedelta, datetime
+from typing import Dict
 from unittest import mock
 
 from freezegun import freeze_time
@@ -10,12 +12,14 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
 from src.api_wrappers.cosmos import CosmosRestServerApiWrapper
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.cosmos import CosmosProposalsCache
 from src.monitors.network.cosmos import CosmosNetworkMonitor
 from src.utils import env
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, RAW_DATA_EXCHANGE,
     COSMOS_NETWORK_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import PANICException, MessageWasNotDeliveredException
+from src.utils.timing import TimedTaskLimiter
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
     disconnect_from_rabbit)
@@ -760,6 +764,21 @@ expected_proposals_3 = {
 }
 
 
+
+def _retrieved_proposal_v0_42_6(proposal_id: str, status: str) -> Dict:
+    proposal = copy.deepcopy(retrieved_proposals_1_v3['proposals'][0])
+    proposal['proposal_id'] = proposal_id
+    proposal['status'] = 'proposal_status_{}'.format(status)
+    return proposal
+
+
+def _expected_proposal(proposal_id: str, status: str) -> Dict:
+    proposal = copy.deepcopy(expected_proposals_1['proposals'][0])
+    proposal['proposal_id'] = proposal_id
+    proposal['status'] = status
+    return proposal
+
+
 class TestCosmosNetworkMonitor(unittest.TestCase):
     def setUp(self) -> None:
         # Dummy data
@@ -831,6 +850,128 @@ class TestCosmosNetworkMonitor(unittest.TestCase):
     def test_chain_name_returns_chain_name(self) -> None:
         self.assertEqual(self.chain_name, self.test_monitor.chain_name)
 
+    def _mock_get_proposals_v0_42_6(self, active_proposals: Dict,
+                                    proposals: Dict, errors: Dict = None):
+        """
+        This function returns a side effect for get_proposals_v0_42_6 which
+        lists the <active_proposals> keyed by status, and returns the
+        <proposals> keyed by id when queried individually, the <errors> keyed
+        by id, or a not found error if the queried proposal does not exist
+        """
+        errors = errors or {}
+
+        def get_proposals(cosmos_rest_url, proposal_id=None, params=None):
+            if proposal_id is not None:
+                if proposal_id in errors:
+                    return errors[proposal_id]
+                if proposal_id not in proposals:
+                    return {'code': 5, 'message': 'proposal does not exist'}
+                return {'proposal': proposals[proposal_id]}
+
+            status = params['proposal_status'].lower()
+            return {
+                'proposals': active_proposals.get(status, []),
+                'pagination': {'next_key': None}
+            }
+
+        return get_proposals
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'get_proposals_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_retrieves_all_if_due(
+            self, mock_proposals) -> None:
+        mock_cache = mock.MagicMock(spec=CosmosProposalsCache)
+        mock_cache.get.return_value = {}
+        self.test_monitor._proposals_cache = mock_cache
+        mock_proposals.return_value = retrieved_proposals_1_v3
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                self.data_sources[0])
+
+        self.assertEqual(expected_proposals_1, actual_return)
+        mock_proposals.assert_called_once_with(
+            self.data_sources[0].cosmos_rest_url, None, {})
+        mock_cache.replace.assert_called_once_with(
+            expected_proposals_1['proposals'])
+        self.assertFalse(
+            self.test_monitor.proposals_full_retrieval_limiter.can_do_task())
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'get_proposals_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_updates_active_proposals(
+            self, mock_proposals) -> None:
+        """
+        The finalized proposals are served from the cache, the active ones are
+        updated, the new ones are added, the active proposals which no longer
+        exist are removed, and the ones which could not be retrieved are kept.
+        """
+        mock_cache = mock.MagicMock(spec=CosmosProposalsCache)
+        mock_cache.get.return_value = {
+            '1': _expected_proposal('1', 'passed'),
+            '2': _expected_proposal('2', 'voting_period'),
+            '3': _expected_proposal('3', 'voting_period'),
+            '4': _expected_proposal('4', 'deposit_period'),
+            '6': _expected_proposal('6', 'voting_period'),
+        }
+        self.test_monitor._proposals_cache = mock_cache
+        mock_proposals.side_effect = self._mock_get_proposals_v0_42_6(
+            {
+                'proposal_status_voting_period': [
+                    _retrieved_proposal_v0_42_6('2', 'voting_period')],
+                'proposal_status_deposit_period': [
+                    _retrieved_proposal_v0_42_6('5', 'deposit_period')],
+            },
+            {'3': _retrieved_proposal_v0_42_6('3', 'rejected')},
+            {'6': {'code': 13, 'message': 'internal error'}})
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                self.data_sources[0])
+
+        expected_updated_proposals = [
+            _expected_proposal('5', 'deposit_period'),
+            _expected_proposal('2', 'voting_period'),
+            _expected_proposal('3', 'rejected'),
+        ]
+        self.assertEqual({
+            'proposals': [
+                _expected_proposal('1', 'passed'),
+                _expected_proposal('2', 'voting_period'),
+                _expected_proposal('3', 'rejected'),
+                _expected_proposal('5', 'deposit_period'),
+                _expected_proposal('6', 'voting_period'),
+            ]
+        }, actual_return)
+        self.assertEqual(5, mock_proposals.call_count)
+        mock_cache.set.assert_called_once_with(expected_updated_proposals)
+        mock_cache.remove.assert_called_once_with(['4'])
+        mock_cache.replace.assert_not_called()
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'get_proposals_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_retrieves_all_periodically(
+            self, mock_proposals) -> None:
+        mock_cache = mock.MagicMock(spec=CosmosProposalsCache)
+        mock_cache.get.return_value = {
+            '1': _expected_proposal('1', 'passed'),
+        }
+        self.test_monitor._proposals_cache = mock_cache
+        self.test_monitor._proposals_full_retrieval_limiter = \
+            TimedTaskLimiter(timedelta(seconds=60))
+        mock_proposals.return_value = retrieved_proposals_1_v3
+
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                self.data_sources[0])
+            mock_cache.replace.assert_not_called()
+
+            frozen_time.tick(timedelta(seconds=60))
+            actual_return = \
+                self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                    self.data_sources[0])
+
+        self.assertEqual(expected_proposals_1, actual_return)
+        mock_cache.replace.assert_called_once_with(
+            expected_proposals_1['proposals'])
+
     @parameterized.expand([
         (retrieved_proposals_1_v1, expected_proposals_1),
         (retrieved_proposals_1_v2, expected_proposals_1),
@@ -203,8 +203,8 @@ class TestChainlinkNodeMonitor(unittest.TestCase):
                 'get_function': self.test_monitor._get_prometheus_data,
                 'processing_function':
                     self.test_monitor._process_retrieved_prometheus_data,
-                'last_source_used_var': 'self._last_prometheus_source_used',
-                'monitoring_enabled_var': 'self.node_config._monitor_prometheus'
+                'last_source_used_var': 'last_prometheus_source_used',
+                'monitoring_enabled_var': 'node_config.monitor_prometheus'
             }
             # When more sources are added this should contain source types with
             # successfully obtained data.
@@ -217,8 +217,8 @@ class TestChainlinkNodeMonitor(unittest.TestCase):
                 'get_function': self.test_monitor._get_prometheus_data,
                 'processing_function':
                     self.test_monitor._process_retrieved_prometheus_data,
-                'last_source_used_var': 'self._last_prometheus_source_used',
-                'monitoring_enabled_var': 'self.node_config._monitor_prometheus'
+                'last_source_used_var': 'last_prometheus_source_used',
+                'monitoring_enabled_var': 'node_config.monitor_prometheus'
             }
             # When more sources are added this should contain source types with
             # successfully obtained data.
@@ -231,8 +231,8 @@ class TestChainlinkNodeMonitor(unittest.TestCase):
                 'get_function': self.test_monitor._get_prometheus_data,
                 'processing_function':
                     self.test_monitor._process_retrieved_prometheus_data,
-                'last_source_used_var': 'self._last_prometheus_source_used',
-                'monitoring_enabled_var': 'self.node_config._monitor_prometheus'
+                'last_source_used_var': 'last_prometheus_source_used',
+                'monitoring_enabled_var': 'node_config.monitor_prometheus'
             }
             # When more sources are added this should contain source types with
             # successfully obtained data.
@@ -1,12 +1,15 @@
 import copy
 import json
 import logging
+import threading
+import time
 import unittest
 from datetime import timedelta, datetime
 from http.client import IncompleteRead
 from typing import Dict
 from unittest import mock
 
+import pika
 from freezegun import freeze_time
 from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
@@ -34,6 +37,7 @@ from src.utils.exceptions import (
     TendermintRPCCallException, TendermintRPCDataCouldNotBeObtained,
     TendermintRPCIncompatibleException, MetricNotFoundException,
     MessageWasNotDeliveredException)
+from src.utils.sharding import get_sharded_routing_key
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
     disconnect_from_rabbit, assert_not_called_with)
@@ -175,6 +179,11 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             self.monitoring_period, self.rabbitmq, self.data_sources,
         )
 
+        # The data sources are selected without the health registry shared by
+        # the monitors of the process, so that the tests do not affect each
+        # other
+        self.test_monitor._data_source_health = None
+
         self.received_retrieval_info_all_source_types_enabled = {
             'prometheus': {
                 'data': self.retrieved_prometheus_data_example_1,
@@ -309,6 +318,28 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.test_monitor._max_catchup_blocks = 400
         self.assertEqual(400, self.test_monitor.max_catchup_blocks)
 
+    @mock.patch.object(env, 'TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS', 4)
+    def test_get_max_concurrent_archive_requests_defaults_to_env_value(
+            self) -> None:
+        self.assertIsNone(
+            self.data_sources[0].tendermint_rpc_max_concurrent_requests)
+        self.assertEqual(
+            4, self.test_monitor._get_max_concurrent_archive_requests(
+                self.data_sources[0]))
+
+    @mock.patch.object(env, 'TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS', 4)
+    def test_get_max_concurrent_archive_requests_returns_node_limit_if_set(
+            self) -> None:
+        self.data_sources[0].set_tendermint_rpc_max_concurrent_requests(10)
+        self.data_sources[1].set_tendermint_rpc_max_concurrent_requests(2)
+
+        self.assertEqual(
+            10, self.test_monitor._get_max_concurrent_archive_requests(
+                self.data_sources[0]))
+        self.assertEqual(
+            2, self.test_monitor._get_max_concurrent_archive_requests(
+                self.data_sources[1]))
+
     def test_archive_nodes_returns_archive_nodes(
             self) -> None:
         self.assertEqual([self.data_sources[1], self.data_sources[2]],
@@ -328,6 +359,26 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(500,
                          self.test_monitor.last_height_monitored_tendermint)
 
+    def test_tendermint_block_cache_returns_tendermint_block_cache(
+            self) -> None:
+        # Test that by default the monitor does not use a cache
+        self.assertIsNone(self.test_monitor.tendermint_block_cache)
+
+        # Test that the property returns the correct value
+        self.test_monitor._tendermint_block_cache = self.test_data_dict
+        self.assertEqual(self.test_data_dict,
+                         self.test_monitor.tendermint_block_cache)
+
+    def test_validators_snapshot_cache_returns_validators_snapshot_cache(
+            self) -> None:
+        # Test that by default the monitor does not use a cache
+        self.assertIsNone(self.test_monitor.validators_snapshot_cache)
+
+        # Test that the property returns the correct value
+        self.test_monitor._validators_snapshot_cache = self.test_data_dict
+        self.assertEqual(self.test_data_dict,
+                         self.test_monitor.validators_snapshot_cache)
+
     def test_validator_consensus_address_returns_validator_consensus_address(
             self) -> None:
         # Test that on init, validator_consensus_address is None
@@ -402,6 +453,129 @@ class TestCosmosNodeMonitor(unittest.TestCase):
                 self.data_sources[0])
         self.assertEqual(expected_return, actual_return)
 
+    @mock.patch.object(CosmosRestServerApiWrapper,
+                       'get_staking_validators_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_validator_caches_snapshot(
+            self, mock_staking_validators) -> None:
+        """
+        We will check that if a validators snapshot cache is given, the whole
+        validators list is retrieved and cached, and the status of the
+        validator is read from it.
+        """
+        operator_address = self.test_monitor.node_config.operator_address
+        mock_cache = mock.MagicMock()
+        self.test_monitor._validators_snapshot_cache = mock_cache
+        mock_staking_validators.side_effect = [
+            {
+                "validators": [{"operator_address": operator_address,
+                                "jailed": False,
+                                "status": "BOND_STATUS_BONDED"}],
+                "pagination": {"next_key": "test_key"}
+            },
+            {
+                "validators": [{"operator_address": "other_address",
+                                "jailed": True,
+                                "status": "BOND_STATUS_UNBONDING"}],
+                "pagination": {"next_key": None}
+            },
+        ]
+        expected_snapshot = {
+            operator_address: {'jailed': False,
+                               'bond_status': BOND_STATUS_BONDED},
+            'other_address': {'jailed': True,
+                              'bond_status': BOND_STATUS_UNBONDING},
+        }
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data_validator(
+                self.data_sources[0])
+
+        self.assertEqual(expected_snapshot[operator_address], actual_return)
+        mock_cache.set.assert_called_once_with(expected_snapshot)
+        mock_cache.release_fetch_lock.assert_called_once()
+        self.assertEqual(2, mock_staking_validators.call_count)
+        mock_staking_validators.assert_called_with(
+            self.data_sources[0].cosmos_rest_url, None,
+            {'pagination.key': 'test_key'})
+
+    @mock.patch.object(CosmosRestServerApiWrapper,
+                       'get_staking_validators_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_validator_queries_if_new(
+            self, mock_staking_validators) -> None:
+        """
+        We will check that if the validator is not in the retrieved validators
+        list, it is queried individually.
+        """
+        operator_address = self.test_monitor.node_config.operator_address
+        mock_cache = mock.MagicMock()
+        self.test_monitor._validators_snapshot_cache = mock_cache
+        mock_staking_validators.side_effect = [
+            {"validators": [], "pagination": {"next_key": None}},
+            {"validator": {"jailed": True, "status": "BOND_STATUS_BONDED"}},
+        ]
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data_validator(
+                self.data_sources[0])
+
+        self.assertEqual({'jailed': True, 'bond_status': BOND_STATUS_BONDED},
+                         actual_return)
+        mock_cache.set.assert_called_once_with({})
+        mock_staking_validators.assert_called_with(
+            self.data_sources[0].cosmos_rest_url, operator_address, {})
+
+    @mock.patch.object(CosmosRestServerApiWrapper,
+                       'get_staking_validators_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_validator_reads_stale_snap(
+            self, mock_staking_validators) -> None:
+        """
+        We will check that if another monitor of the chain holds the fetch
+        lock, the validators list is not retrieved and the status of the
+        validator is read from the stale snapshot.
+        """
+        operator_address = self.test_monitor.node_config.operator_address
+        stale_status = {'jailed': False, 'bond_status': BOND_STATUS_BONDED}
+        mock_cache = mock.MagicMock()
+        mock_cache.acquire_fetch_lock.return_value = False
+        mock_cache.get.return_value = {operator_address: stale_status}
+        self.test_monitor._validators_snapshot_cache = mock_cache
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data_validator(
+                self.data_sources[0])
+
+        self.assertEqual(stale_status, actual_return)
+        mock_cache.get.assert_called_once_with(include_stale=True)
+        mock_cache.set.assert_not_called()
+        mock_staking_validators.assert_not_called()
+
+    @mock.patch.object(CosmosRestServerApiWrapper,
+                       'get_staking_validators_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_validator_queries_if_locked(
+            self, mock_staking_validators) -> None:
+        """
+        We will check that if another monitor of the chain holds the fetch
+        lock and there is no stale snapshot, the validator is queried
+        individually.
+        """
+        operator_address = self.test_monitor.node_config.operator_address
+        mock_cache = mock.MagicMock()
+        mock_cache.acquire_fetch_lock.return_value = False
+        mock_cache.get.return_value = None
+        self.test_monitor._validators_snapshot_cache = mock_cache
+        mock_staking_validators.return_value = {
+            "validator": {"jailed": True, "status": "BOND_STATUS_BONDED"}}
+
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data_validator(
+                self.data_sources[0])
+
+        self.assertEqual({'jailed': True, 'bond_status': BOND_STATUS_BONDED},
+                         actual_return)
+        mock_cache.set.assert_not_called()
+        mock_staking_validators.assert_called_once_with(
+            self.data_sources[0].cosmos_rest_url, operator_address, {})
+
     def test_get_cosmos_rest_indirect_data_return_if_empty_source_url(
             self) -> None:
         expected_ret = {
@@ -582,6 +756,59 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(({}, True, err), actual_ret_v0_42_6)
         self.assertEqual(({}, True, err), actual_ret_v0_39_2)
 
+    @mock.patch.object(CosmosNodeMonitor, '_get_cosmos_rest_indirect_data')
+    @mock.patch.object(CosmosNodeMonitor, '_cosmos_rest_reachable')
+    @mock.patch.object(CosmosNodeMonitor, '_select_cosmos_rest_node')
+    def test_get_cosmos_rest_version_data_returns_cached_status_if_cached(
+            self, mock_select_cosmos_rest_node, mock_cosmos_rest_reachable,
+            mock_get_indirect_data) -> None:
+        """
+        In this test we will check that if the status of the validator is in
+        the validators snapshot of the chain, it is returned without selecting
+        and querying an indirect data source.
+        """
+        cached_status = {'jailed': False, 'bond_status': BOND_STATUS_BONDED}
+        mock_cache = mock.MagicMock()
+        mock_cache.get.return_value = {
+            self.test_monitor.node_config.operator_address: cached_status
+        }
+        self.test_monitor._validators_snapshot_cache = mock_cache
+        mock_cosmos_rest_reachable.return_value = (True, None)
+
+        actual_ret = self.test_monitor._get_cosmos_rest_version_data(
+            self.sdk_version_0_42_6)
+
+        self.assertEqual((cached_status, False, None), actual_ret)
+        mock_select_cosmos_rest_node.assert_not_called()
+        mock_get_indirect_data.assert_not_called()
+
+    @mock.patch.object(CosmosNodeMonitor, '_get_cosmos_rest_indirect_data')
+    @mock.patch.object(CosmosNodeMonitor, '_cosmos_rest_reachable')
+    @mock.patch.object(CosmosNodeMonitor, '_select_cosmos_rest_node')
+    def test_get_cosmos_rest_version_data_retrieves_data_if_not_cached(
+            self, mock_select_cosmos_rest_node, mock_cosmos_rest_reachable,
+            mock_get_indirect_data) -> None:
+        """
+        In this test we will check that if there is no validators snapshot of
+        the chain, an indirect data source is selected and queried.
+        """
+        mock_cache = mock.MagicMock()
+        mock_cache.get.return_value = None
+        self.test_monitor._validators_snapshot_cache = mock_cache
+        mock_select_cosmos_rest_node.return_value = self.data_sources[1]
+        mock_cosmos_rest_reachable.return_value = (True, None)
+        mock_get_indirect_data.return_value = \
+            self.retrieved_cosmos_rest_indirect_data_1
+
+        actual_ret = self.test_monitor._get_cosmos_rest_version_data(
+            self.sdk_version_0_42_6)
+
+        self.assertEqual(
+            (self.retrieved_cosmos_rest_indirect_data_1, False, None),
+            actual_ret)
+        mock_get_indirect_data.assert_called_once_with(
+            self.data_sources[1], self.sdk_version_0_42_6)
+
     @mock.patch.object(CosmosNodeMonitor, '_get_cosmos_rest_version_data')
     def test_get_cosmos_rest_v0_39_2_data_calls_get_cosmos_rest_version_data(
             self, mock_get_rest_version) -> None:
@@ -1232,6 +1459,7 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             begin_block_events)
         self.assertEqual(expected_return, actual_return)
 
+    @mock.patch.object(env, 'TENDERMINT_RPC_MAX_CONCURRENT_REQUESTS', 1)
     @mock.patch.object(TendermintRpcApiWrapper, 'get_block')
     @mock.patch.object(TendermintRpcApiWrapper, 'get_validators')
     @mock.patch.object(TendermintRpcApiWrapper, 'get_block_results')
@@ -1438,6 +1666,192 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(self.retrieved_tendermint_archive_data, actual_return)
         self.assertEqual(52, self.test_monitor.last_height_monitored_tendermint)
 
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_block')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_validators')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_block_results')
+    def test_get_tendermint_rpc_block_data_retrieves_and_caches_if_not_cached(
+            self, mock_get_block_results, mock_get_validators,
+            mock_get_block) -> None:
+        mock_cache = mock.MagicMock()
+        mock_cache.get.return_value = None
+        self.test_monitor._tendermint_block_cache = mock_cache
+        mock_get_validators.return_value = {
+            "result": {
+                "validators": [{"address": "address_1", "voting_power": "1"}],
+                'count': "1",
+                'total': "1",
+            }
+        }
+        mock_get_block.return_value = {
+            "result": {
+                "block": {
+                    "last_commit": {
+                        "signatures": [
+                            {"validator_address": "address_1",
+                             "signature": "X4s29VIs3BCruDsas0Rhgkci2BQ=="},
+                            {"validator_address": "address_2",
+                             "signature": None},
+                        ]
+                    }
+                },
+            }
+        }
+        slash_event = {"type": "slash", "attributes": []}
+        mock_get_block_results.return_value = {
+            'result': {
+                'begin_block_events': [
+                    {"type": "transfer", "attributes": []}, slash_event
+                ]
+            }
+        }
+        expected_block_data = {
+            'validators': [{'address': 'address_1'}],
+            'signed_validators': ['address_1'],
+            'slash_events': [slash_event],
+        }
+
+        actual_return = self.test_monitor._get_tendermint_rpc_block_data(
+            self.data_sources[0], 50)
+
+        self.assertEqual(expected_block_data, actual_return)
+        mock_cache.get.assert_called_once_with(50)
+        mock_cache.set.assert_called_once_with(50, expected_block_data)
+
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_block')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_validators')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_block_results')
+    def test_get_tendermint_rpc_block_data_returns_cached_data_if_cached(
+            self, mock_get_block_results, mock_get_validators,
+            mock_get_block) -> None:
+        cached_block_data = {
+            'validators': [{'address': 'address_1'}],
+            'signed_validators': ['address_1'],
+            'slash_events': [],
+        }
+        mock_cache = mock.MagicMock()
+        mock_cache.get.return_value = cached_block_data
+        self.test_monitor._tendermint_block_cache = mock_cache
+
+        actual_return = self.test_monitor._get_tendermint_rpc_block_data(
+            self.data_sources[0], 50)
+
+        self.assertEqual(cached_block_data, actual_return)
+        mock_get_validators.assert_not_called()
+        mock_get_block.assert_not_called()
+        mock_get_block_results.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @parameterized.expand([
+        (1,),
+        (3,),
+        (10,),
+    ])
+    @mock.patch.object(CosmosNodeMonitor, '_get_tendermint_rpc_block_data')
+    def test_get_tendermint_rpc_blocks_data_returns_data_in_height_order(
+            self, max_concurrent_requests, mock_get_block_data) -> None:
+        """
+        In this test we will check that the data of each height is returned in
+        the order of the heights even if the heights are retrieved
+        concurrently and the lower heights take longer to be retrieved.
+        """
+        self.data_sources[0].set_tendermint_rpc_max_concurrent_requests(
+            max_concurrent_requests)
+
+        def get_block_data(source, height):
+            time.sleep((60 - height) * 0.005)
+            return {'height': height}
+
+        mock_get_block_data.side_effect = get_block_data
+
+        actual_return = self.test_monitor._get_tendermint_rpc_blocks_data(
+            self.data_sources[0], range(50, 60))
+
+        self.assertEqual([{'height': height} for height in range(50, 60)],
+                         actual_return)
+        self.assertEqual(10, mock_get_block_data.call_count)
+        mock_get_block_data.assert_has_calls(
+            [mock.call(self.data_sources[0], height)
+             for height in range(50, 60)], any_order=True)
+
+    @mock.patch.object(CosmosNodeMonitor, '_get_tendermint_rpc_block_data')
+    def test_get_tendermint_rpc_blocks_data_bounds_concurrent_requests(
+            self, mock_get_block_data) -> None:
+        self.data_sources[0].set_tendermint_rpc_max_concurrent_requests(3)
+        lock = threading.Lock()
+        in_progress = [0]
+        max_in_progress = [0]
+
+        def get_block_data(source, height):
+            with lock:
+                in_progress[0] += 1
+                max_in_progress[0] = max(max_in_progress[0], in_progress[0])
+            time.sleep(0.01)
+            with lock:
+                in_progress[0] -= 1
+            return {'height': height}
+
+        mock_get_block_data.side_effect = get_block_data
+
+        self.test_monitor._get_tendermint_rpc_blocks_data(
+            self.data_sources[0], range(50, 70))
+
+        self.assertEqual(3, max_in_progress[0])
+
+    @parameterized.expand([
+        (1,),
+        (3,),
+    ])
+    @mock.patch.object(CosmosNodeMonitor, '_get_tendermint_rpc_block_data')
+    def test_get_tendermint_rpc_blocks_data_raises_retrieval_exception(
+            self, max_concurrent_requests, mock_get_block_data) -> None:
+        self.data_sources[0].set_tendermint_rpc_max_concurrent_requests(
+            max_concurrent_requests)
+        test_exception = TendermintRPCCallException('test_call', 'test_error')
+
+        def get_block_data(source, height):
+            if height == 52:
+                raise test_exception
+            return {'height': height}
+
+        mock_get_block_data.side_effect = get_block_data
+
+        self.assertRaises(
+            TendermintRPCCallException,
+            self.test_monitor._get_tendermint_rpc_blocks_data,
+            self.data_sources[0], range(50, 60))
+
+    @mock.patch.object(CosmosNodeMonitor, '_get_tendermint_rpc_block_data')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_block')
+    def test_get_tendermint_rpc_archive_data_validator_marks_cache_monitored(
+            self, mock_get_block, mock_get_block_data) -> None:
+        mock_cache = mock.MagicMock()
+        self.test_monitor._tendermint_block_cache = mock_cache
+        self.test_monitor._last_height_monitored_tendermint = 49
+        mock_get_block.return_value = {
+            "result": {
+                "block": {
+                    "header": {
+                        "height": "52"
+                    }
+                },
+            }
+        }
+        mock_get_block_data.return_value = {
+            'validators': [],
+            'signed_validators': [],
+            'slash_events': [],
+        }
+
+        self.test_monitor._get_tendermint_rpc_archive_data_validator(
+            self.data_sources[0])
+
+        mock_get_block_data.assert_has_calls([
+            mock.call(self.data_sources[0], 50),
+            mock.call(self.data_sources[0], 51),
+            mock.call(self.data_sources[0], 52),
+        ])
+        mock_cache.mark_monitored.assert_called_once_with(52)
+
     @parameterized.expand([
         (False,),
         ('',),
@@ -1915,6 +2329,24 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(self.processed_prometheus_data_example_1,
                          json.loads(body))
 
+    @mock.patch.object(env, "COSMOS_NODE_DATA_TRANSFORMER_SHARDS", 3)
+    @mock.patch.object(RabbitMQApi, "basic_publish_confirm")
+    def test_send_data_sends_data_to_data_transformer_shard_of_node(
+            self, mock_publish) -> None:
+        test_monitor = CosmosNodeMonitor(
+            self.monitor_name, self.data_sources[2], self.dummy_logger,
+            self.monitoring_period, self.rabbitmq, self.data_sources)
+
+        test_monitor._send_data(self.processed_prometheus_data_example_1)
+
+        mock_publish.assert_called_once_with(
+            exchange=RAW_DATA_EXCHANGE,
+            routing_key=get_sharded_routing_key(
+                COSMOS_NODE_RAW_DATA_ROUTING_KEY,
+                self.data_sources[2].node_id, 3),
+            body=self.processed_prometheus_data_example_1, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(CosmosNodeMonitor, "_send_data")
     @mock.patch.object(CosmosNodeMonitor, "_send_heartbeat")
@@ -13,6 +13,7 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
 from src.api_wrappers.substrate import SubstrateApiWrapper
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.substrate import SubstrateEraCache
 from src.monitors.node.substrate import SubstrateNodeMonitor
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -47,6 +48,10 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.test_queue_name = 'Test Queue'
         self.test_exception_1 = PANICException('test_exception_1', 1)
         self.stash_address_1 = 'stash_address_1'
+        self.test_eras_stakers = {
+            'result': {'total': '0x00000000000000000048a4faa9941924',
+                       'own': 100001845000000, 'others': []}
+        }
         self.controller_address_1 = 'controller_address_1'
 
         # --------------- Data retrieval variables and examples ---------------
@@ -202,6 +207,7 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.connection_check_time_interval = None
         self.rabbitmq = None
         self.test_exception_1 = None
+        self.test_eras_stakers = None
         self.substrate_test_nodes.clear_attributes()
         self.substrate_test_nodes = None
         self.test_monitor = None
@@ -358,6 +364,46 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.assertFalse(
             self.test_monitor.system_properties_limiter.can_do_task())
 
+    @mock.patch.object(SubstrateApiWrapper, 'get_eras_stakers')
+    def test_get_finished_era_stakers_returns_cached_data_if_cached(
+            self, mock_get_eras_stakers) -> None:
+        era_cache = mock.MagicMock(spec=SubstrateEraCache)
+        era_cache.get.return_value = self.test_eras_stakers
+        test_monitor = SubstrateNodeMonitor(
+            self.monitor_name, self.data_sources[2], self.dummy_logger,
+            self.monitoring_period, self.rabbitmq, self.data_sources,
+            era_cache)
+
+        actual_return = test_monitor._get_finished_era_stakers(
+            self.data_sources[0].node_ws_url, self.data_sources[0].node_name,
+            10, self.stash_address_1)
+
+        self.assertEqual(self.test_eras_stakers, actual_return)
+        era_cache.get.assert_called_once_with(10, self.stash_address_1)
+        mock_get_eras_stakers.assert_not_called()
+        era_cache.set.assert_not_called()
+
+    @mock.patch.object(SubstrateApiWrapper, 'get_eras_stakers')
+    def test_get_finished_era_stakers_retrieves_and_caches_data_if_not_cached(
+            self, mock_get_eras_stakers) -> None:
+        era_cache = mock.MagicMock(spec=SubstrateEraCache)
+        era_cache.get.return_value = None
+        mock_get_eras_stakers.return_value = self.test_eras_stakers
+        test_monitor = SubstrateNodeMonitor(
+            self.monitor_name, self.data_sources[2], self.dummy_logger,
+            self.monitoring_period, self.rabbitmq, self.data_sources,
+            era_cache)
+
+        actual_return = test_monitor._get_finished_era_stakers(
+            self.data_sources[0].node_ws_url, self.data_sources[0].node_name,
+            10, self.stash_address_1)
+
+        self.assertEqual(self.test_eras_stakers, actual_return)
+        mock_get_eras_stakers.assert_called_once_with(
+            self.data_sources[0].node_ws_url, 10, self.stash_address_1)
+        era_cache.set.assert_called_once_with(10, self.stash_address_1,
+                                              self.test_eras_stakers)
+
     @mock.patch.object(SubstrateApiWrapper, 'get_system_properties')
     @mock.patch.object(SubstrateApiWrapper, 'get_history_depth')
     @mock.patch.object(SubstrateApiWrapper, 'get_active_era')
@@ -475,6 +521,7 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
                 current_last_height, current_height, is_source_archive)
         self.assertEqual(expected_return, actual_return)
 
+    @mock.patch.object(env, "SUBSTRATE_API_MAX_BLOCKS_PER_BATCH", 1)
     @mock.patch.object(SubstrateApiWrapper, 'get_is_offline')
     @mock.patch.object(SubstrateApiWrapper, 'get_slashed_amount')
     @mock.patch.object(SubstrateApiWrapper, 'get_block_hash')
@@ -508,6 +555,78 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.assertEqual(self.retrieved_websocket_archive_data_validator,
                          actual_return)
 
+    @mock.patch.object(env, "SUBSTRATE_API_MAX_BLOCKS_PER_BATCH", 2)
+    @mock.patch.object(SubstrateApiWrapper, 'get_blocks_slashed_and_offline')
+    @mock.patch.object(SubstrateNodeMonitor,
+                       '_determine_last_height_monitored_websocket')
+    @mock.patch.object(SubstrateApiWrapper, 'get_header')
+    @mock.patch.object(SubstrateApiWrapper, 'get_finalized_head')
+    def test_get_websocket_archive_data_validator_return_if_batched(
+            self, mock_get_finalized_head, mock_get_header, mock_determine_lhm,
+            mock_get_blocks_slashed_and_offline) -> None:
+        stash_address = self.test_monitor.node_config.stash_address
+        mock_get_finalized_head.return_value = {
+            "result": "0xe27d6f3cc8976a1b88d4e88c77be1b0d19c347b13185bd0d806646"
+        }
+        mock_get_header.return_value = {"result": {"number": 52}}
+        mock_determine_lhm.return_value = 49
+        mock_get_blocks_slashed_and_offline.side_effect = [
+            {"result": {
+                "50": {"slashedAmount": {stash_address: 0},
+                       "isOffline": {stash_address: False}},
+                "51": {"slashedAmount": {stash_address: 0},
+                       "isOffline": {stash_address: True}},
+            }},
+            {"result": {
+                "52": {"slashedAmount": {stash_address: 1234560000000},
+                       "isOffline": {stash_address: False}},
+            }},
+        ]
+
+        actual_return = \
+            self.test_monitor._get_websocket_archive_data_validator(
+                self.data_sources[1])
+
+        self.assertEqual(self.retrieved_websocket_archive_data_validator,
+                         actual_return)
+        source_ws_url = self.data_sources[1].node_ws_url
+        mock_get_blocks_slashed_and_offline.assert_has_calls([
+            mock.call(source_ws_url, 50, 51, [stash_address]),
+            mock.call(source_ws_url, 52, 52, [stash_address]),
+        ])
+
+    @mock.patch.object(env, "SUBSTRATE_API_MAX_BLOCKS_PER_BATCH", 500)
+    @mock.patch.object(SubstrateApiWrapper, 'get_blocks_slashed_and_offline')
+    @mock.patch.object(SubstrateNodeMonitor,
+                       '_determine_last_height_monitored_websocket')
+    @mock.patch.object(SubstrateApiWrapper, 'get_header')
+    @mock.patch.object(SubstrateApiWrapper, 'get_finalized_head')
+    def test_get_websocket_archive_data_validator_limits_batches_to_api_max(
+            self, mock_get_finalized_head, mock_get_header, mock_determine_lhm,
+            mock_get_blocks_slashed_and_offline) -> None:
+        stash_address = self.test_monitor.node_config.stash_address
+        mock_get_finalized_head.return_value = {
+            "result": "0xe27d6f3cc8976a1b88d4e88c77be1b0d19c347b13185bd0d806646"
+        }
+        mock_get_header.return_value = {"result": {"number": 252}}
+        mock_determine_lhm.return_value = 49
+        mock_get_blocks_slashed_and_offline.side_effect = \
+            lambda ws_url, from_block, to_block, account_ids: {"result": {
+                str(height): {"slashedAmount": {stash_address: 0},
+                              "isOffline": {stash_address: False}}
+                for height in range(from_block, to_block + 1)
+            }}
+
+        self.test_monitor._get_websocket_archive_data_validator(
+            self.data_sources[1])
+
+        source_ws_url = self.data_sources[1].node_ws_url
+        self.assertEqual([
+            mock.call(source_ws_url, 50, 149, [stash_address]),
+            mock.call(source_ws_url, 150, 249, [stash_address]),
+            mock.call(source_ws_url, 250, 252, [stash_address]),
+        ], mock_get_blocks_slashed_and_offline.call_args_list)
+
     def test_get_websocket_archive_data_non_validator_return(self) -> None:
         actual_return = \
             self.test_monitor._get_websocket_archive_data_non_validator()
@@ -23,6 +23,7 @@ from src.utils import env
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils.source_health import DataSourceHealthRegistry
 from src.utils.exceptions import (
     ComponentNotGivenEnoughDataSourcesException, PANICException,
     CosmosSDKVersionIncompatibleException, CosmosRestServerApiCallException,
@@ -135,6 +136,11 @@ class TestCosmosMonitor(unittest.TestCase):
             self.monitoring_period, self.rabbitmq
         )
 
+        # The data sources are selected without the health registry shared by
+        # the monitors of the process, so that the tests do not affect each
+        # other
+        self.test_monitor._data_source_health = None
+
     def tearDown(self) -> None:
         connect_to_rabbit(self.test_monitor.rabbitmq)
         delete_queue_if_exists(self.test_monitor.rabbitmq, self.test_queue_name)
@@ -377,6 +383,72 @@ class TestCosmosMonitor(unittest.TestCase):
             self.data_sources, self.sdk_version_0_39_2)
         self.assertIsNone(actual)
 
+    @mock.patch.object(CosmosRestServerApiWrapper, 'execute_with_checks')
+    def test_select_cosmos_rest_node_skips_nodes_whose_circuit_is_open(
+            self, mock_execute_with_checks) -> None:
+        """
+        In this test we will check that if a data source health registry is
+        used, a node which failed is not probed again once its circuit is
+        open
+        """
+        self.test_monitor._data_source_health = DataSourceHealthRegistry(1)
+        mock_execute_with_checks.side_effect = [
+            ReqConnectionError('test'),
+            {"syncing": False},
+            {"syncing": False}
+        ]
+        for _ in range(2):
+            actual = self.test_monitor._select_cosmos_rest_node(
+                self.data_sources[:2], self.sdk_version_0_39_2)
+            self.assertEqual(self.data_sources[1], actual)
+
+        self.assertEqual(3, mock_execute_with_checks.call_count)
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'execute_with_checks')
+    def test_select_cosmos_rest_node_keeps_the_health_of_each_sdk_version(
+            self, mock_execute_with_checks) -> None:
+        """
+        In this test we will check that if a data source health registry is
+        used, a node which is not compatible with one Cosmos SDK version is
+        still selected for the other version
+        """
+        self.test_monitor._data_source_health = DataSourceHealthRegistry(1)
+        mock_execute_with_checks.side_effect = [
+            CosmosSDKVersionIncompatibleException('test_node', 'v0.42.6'),
+            {"syncing": False}
+        ]
+
+        actual = self.test_monitor._select_cosmos_rest_node(
+            self.data_sources[:1], self.sdk_version_0_42_6)
+        self.assertIsNone(actual)
+        actual = self.test_monitor._select_cosmos_rest_node(
+            self.data_sources[:1], self.sdk_version_0_39_2)
+        self.assertEqual(self.data_sources[0], actual)
+
+        self.assertEqual(2, mock_execute_with_checks.call_count)
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'execute_with_checks')
+    def test_select_cosmos_rest_node_probes_the_fastest_node_first(
+            self, mock_execute_with_checks) -> None:
+        """
+        In this test we will check that if a data source health registry is
+        used, the synced node with the lowest latency is probed first
+        """
+        registry = DataSourceHealthRegistry()
+        for node, latency in zip(self.data_sources, [0.5, 0.3, 0.1]):
+            registry.record_success(
+                (node.cosmos_rest_url,
+                 'cosmos_rest_{}'.format(self.sdk_version_0_39_2)),
+                latency, True)
+        self.test_monitor._data_source_health = registry
+        mock_execute_with_checks.return_value = {"syncing": False}
+
+        actual = self.test_monitor._select_cosmos_rest_node(
+            self.data_sources, self.sdk_version_0_39_2)
+
+        self.assertEqual(self.data_sources[2], actual)
+        mock_execute_with_checks.assert_called_once()
+
     @mock.patch.object(TendermintRpcApiWrapper, 'execute_with_checks')
     def test_select_cosmos_tendermint_node_selects_first_reachable_synced_node(
             self, mock_execute_with_checks) -> None:
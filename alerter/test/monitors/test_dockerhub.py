@@ -9,6 +9,7 @@ from unittest import mock
 import pika
 import pika.exceptions
 from freezegun import freeze_time
+from parameterized import parameterized
 from requests.exceptions import (ConnectionError as ReqConnectionError,
                                  ReadTimeout, ChunkedEncodingError)
 from urllib3.exceptions import ProtocolError
@@ -21,6 +22,7 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE,
                                           DOCKERHUB_RAW_DATA_ROUTING_KEY,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils.data import ConditionalRequestCache
 from src.utils.exceptions import (PANICException, DockerHubAPICallException,
                                   CannotAccessDockerHubPageException,
                                   DataReadingException, JSONDecodeException,
@@ -120,6 +122,94 @@ class TestDockerHubMonitor(unittest.TestCase):
     def test_repo_config_returns_repo_config(self) -> None:
         self.assertEqual(self.repo_config, self.test_monitor.repo_config)
 
+    @staticmethod
+    def _get_tags_page(tags, next_page, count='4') -> dict:
+        return {
+            'count': count,
+            'next': next_page,
+            'results': [{'name': name, 'last_updated': last_updated}
+                        for name, last_updated in tags]
+        }
+
+    @mock.patch('src.monitors.dockerhub.get_json_conditionally')
+    def test_get_data_stops_paging_at_tags_seen_in_previous_round(
+            self, mock_get_json_conditionally) -> None:
+        self.test_monitor._conditional_requests = ConditionalRequestCache()
+        self.test_monitor._last_pages = self.retrieved_metrics_example
+        first_page = self._get_tags_page(
+            [('v2', '2021-11-01T10:00:00.000000Z'),
+             ('latest', '2021-11-01T10:00:00.000000Z')], 'next_url')
+        second_page = self._get_tags_page(
+            [('stable', '2021-09-11T12:00:15.013101Z'),
+             ('v1', '2021-09-22T10:11:13.451446Z')], 'next_next_url')
+        mock_get_json_conditionally.side_effect = [
+            (first_page, True, {}), (second_page, True, {})]
+
+        actual_output = self.test_monitor._get_data()
+
+        self.assertEqual([
+            first_page, second_page,
+            {'count': '4', 'next': None, 'results': []}
+        ], actual_output)
+        self.assertEqual(2, mock_get_json_conditionally.call_count)
+        self.assertEqual(actual_output, self.test_monitor._last_pages)
+
+    @mock.patch('src.monitors.dockerhub.get_json_conditionally')
+    def test_get_data_retrieves_all_pages_if_seen_tags_do_not_add_up(
+            self, mock_get_json_conditionally) -> None:
+        self.test_monitor._conditional_requests = ConditionalRequestCache()
+        self.test_monitor._last_pages = self.retrieved_metrics_example
+        # The latest tag was deleted, so it is still seen but not counted
+        first_page = self._get_tags_page(
+            [('v2', '2021-11-01T10:00:00.000000Z'),
+             ('stable', '2021-09-11T12:00:15.013101Z')], 'next_url', '3')
+        second_page = self._get_tags_page(
+            [('v1', '2021-09-22T10:11:13.451446Z')], None, '3')
+        mock_get_json_conditionally.side_effect = [
+            (first_page, True, {}), (second_page, True, {})]
+
+        actual_output = self.test_monitor._get_data()
+
+        self.assertEqual([first_page, second_page], actual_output)
+
+    @mock.patch('src.monitors.dockerhub.get_json_conditionally')
+    def test_get_data_returns_previous_pages_if_not_modified(
+            self, mock_get_json_conditionally) -> None:
+        self.test_monitor._conditional_requests = ConditionalRequestCache()
+        self.test_monitor._last_pages = self.retrieved_metrics_example
+        mock_get_json_conditionally.return_value = (
+            self.retrieved_metrics_example[0], False, {})
+
+        actual_output = self.test_monitor._get_data()
+
+        self.assertEqual(self.retrieved_metrics_example, actual_output)
+        self.assertFalse(self.test_monitor._data_modified)
+        mock_get_json_conditionally.assert_called_once()
+
+    @parameterized.expand([
+        (False, True, False,),
+        (False, False, True,),
+        (True, True, True,),
+    ])
+    @mock.patch.object(DockerHubMonitor, "_send_heartbeat")
+    @mock.patch.object(DockerHubMonitor, "_send_data")
+    @mock.patch.object(DockerHubMonitor, "_get_data")
+    def test_monitor_sends_data_only_if_modified_or_not_published(
+            self, data_modified, data_published, expected_data_sent,
+            mock_get_data, mock_send_data, mock_send_hb) -> None:
+        def get_data():
+            self.test_monitor._data_modified = data_modified
+            return self.retrieved_metrics_example
+
+        mock_get_data.side_effect = get_data
+        self.test_monitor._data_published = data_published
+
+        self.test_monitor._monitor()
+
+        self.assertEqual(expected_data_sent, mock_send_data.called)
+        self.assertTrue(self.test_monitor._data_published)
+        mock_send_hb.assert_called_once()
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         # To make sure that there is no connection/channel already
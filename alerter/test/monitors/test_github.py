@@ -9,6 +9,7 @@ from unittest import mock
 import pika
 import pika.exceptions
 from freezegun import freeze_time
+from parameterized import parameterized
 from requests.exceptions import (ConnectionError as ReqConnectionError,
                                  ReadTimeout, ChunkedEncodingError)
 from urllib3.exceptions import ProtocolError
@@ -22,6 +23,7 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           GITHUB_RAW_DATA_ROUTING_KEY,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           TOPIC)
+from src.utils.data import ConditionalRequestCache
 from src.utils.exceptions import (PANICException, GitHubAPICallException,
                                   CannotAccessGitHubPageException,
                                   DataReadingException, JSONDecodeException,
@@ -117,6 +119,54 @@ class TestGitHubMonitor(unittest.TestCase):
     def test_repo_config_returns_repo_config(self) -> None:
         self.assertEqual(self.repo_config, self.test_monitor.repo_config)
 
+    @freeze_time("2012-01-01")
+    @mock.patch('src.monitors.github.get_json_conditionally')
+    def test_get_data_requests_releases_conditionally_and_uses_rate_limit(
+            self, mock_get_json_conditionally) -> None:
+        self.test_monitor._conditional_requests = ConditionalRequestCache()
+        mock_get_json_conditionally.return_value = (
+            self.retrieved_metrics_example, False,
+            {'X-RateLimit-Remaining': '0',
+             'X-RateLimit-Reset': str(datetime(2012, 1, 1, 1).timestamp())})
+
+        actual_output = self.test_monitor._get_data()
+
+        self.assertEqual(self.retrieved_metrics_example, actual_output)
+        self.assertFalse(self.test_monitor._data_modified)
+        mock_get_json_conditionally.assert_called_once_with(
+            self.releases_page, self.dummy_logger,
+            self.test_monitor.conditional_requests)
+        self.assertEqual(3600, self.test_monitor.next_round_delay)
+
+    def test_next_round_delay_is_at_least_the_monitor_period(self) -> None:
+        self.test_monitor._rate_limit_delay = 1
+        self.assertEqual(self.monitoring_period,
+                         self.test_monitor.next_round_delay)
+
+    @parameterized.expand([
+        (False, True, False,),
+        (False, False, True,),
+        (True, True, True,),
+    ])
+    @mock.patch.object(GitHubMonitor, "_send_heartbeat")
+    @mock.patch.object(GitHubMonitor, "_send_data")
+    @mock.patch.object(GitHubMonitor, "_get_data")
+    def test_monitor_sends_data_only_if_modified_or_not_published(
+            self, data_modified, data_published, expected_data_sent,
+            mock_get_data, mock_send_data, mock_send_hb) -> None:
+        def get_data():
+            self.test_monitor._data_modified = data_modified
+            return self.retrieved_metrics_example
+
+        mock_get_data.side_effect = get_data
+        self.test_monitor._data_published = data_published
+
+        self.test_monitor._monitor()
+
+        self.assertEqual(expected_data_sent, mock_send_data.called)
+        self.assertTrue(self.test_monitor._data_published)
+        mock_send_hb.assert_called_once()
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         try:
@@ -0,0 +1,213 @@
+import logging
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pika.exceptions
+from freezegun import freeze_time
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq import SharedRabbitMQApi
+from src.monitors.runtime import MonitorsRuntime, MonitorTask
+from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
+                                          HEALTH_CHECK_EXCHANGE, TOPIC)
+from src.utils.constants.starters import RESTART_SLEEPING_PERIOD
+from src.utils.exceptions import MessageWasNotDeliveredException
+
+
+class TestMonitorsRuntime(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_max_workers = 2
+        self.test_monitor_period = 60
+        self.rabbitmq = mock.MagicMock(spec=SharedRabbitMQApi)
+        self.test_runtime = MonitorsRuntime(self.dummy_logger, self.rabbitmq,
+                                            self.test_max_workers)
+        self.test_monitor = self._create_test_monitor('test_monitor')
+        self.test_other_monitor = self._create_test_monitor(
+            'test_other_monitor')
+        self.test_task = MonitorTask(self.test_monitor, self.test_runtime)
+
+    def tearDown(self) -> None:
+        self.test_runtime.stop()
+        self.dummy_logger = None
+        self.rabbitmq = None
+        self.test_runtime = None
+        self.test_monitor = None
+        self.test_other_monitor = None
+        self.test_task = None
+
+    def _create_test_monitor(self, monitor_name: str) -> mock.MagicMock:
+        monitor = mock.MagicMock()
+        monitor.monitor_name = monitor_name
+        monitor.monitor_period = self.test_monitor_period
+        monitor.next_round_delay = self.test_monitor_period
+        monitor.logger = self.dummy_logger
+        return monitor
+
+    def test_task_is_alive_until_terminated(self) -> None:
+        self.test_runtime.add_task(self.test_task)
+        self.assertTrue(self.test_task.is_alive())
+
+        self.test_task.terminate()
+
+        self.assertFalse(self.test_task.is_alive())
+        self.assertEqual([], self.test_runtime.tasks)
+
+    def test_task_is_not_alive_if_the_runtime_stops(self) -> None:
+        self.test_runtime.add_task(self.test_task)
+        self.assertTrue(self.test_task.is_alive())
+
+        self.test_runtime.stop()
+
+        self.assertFalse(self.test_task.is_alive())
+        self.assertEqual([], self.test_runtime.tasks)
+
+    @parameterized.expand([(True, True,), (False, False,)])
+    def test_task_is_alive_while_its_monitor_is_initialised(
+            self, initialiser_alive, expected_alive) -> None:
+        task = MonitorTask(None, self.test_runtime)
+        task.initialiser = mock.MagicMock()
+        task.initialiser.is_alive.return_value = initialiser_alive
+
+        self.assertEqual(expected_alive, task.is_alive())
+
+    def test_terminated_task_is_not_added_once_initialised(self) -> None:
+        task = MonitorTask(None, self.test_runtime)
+        task.terminate()
+        task.monitor = self.test_monitor
+
+        self.test_runtime.add_task(task)
+
+        self.assertEqual([], self.test_runtime.tasks)
+        self.assertFalse(self.test_runtime.is_running)
+
+    def test_task_join_waits_for_running_round_to_finish(self) -> None:
+        self.test_task.round_started()
+        self.assertTrue(self.test_task.running_round)
+        self.test_task.join(0)
+        self.assertTrue(self.test_task.running_round)
+
+        self.test_task.round_finished(100)
+        self.test_task.join()
+
+        self.assertFalse(self.test_task.running_round)
+        self.assertEqual(100, self.test_task.next_round_time)
+
+    @mock.patch.object(MonitorsRuntime, 'start')
+    def test_run_monitor_adds_a_task_running_the_monitor(
+            self, mock_start) -> None:
+        actual_output = self.test_runtime.run_monitor(self.test_monitor)
+
+        self.assertEqual(self.test_monitor, actual_output.monitor)
+        self.assertEqual(self.test_runtime, actual_output.runtime)
+        self.assertEqual([actual_output], self.test_runtime.tasks)
+        mock_start.assert_called_once_with()
+
+    @mock.patch.object(MonitorsRuntime, 'start')
+    def test_start_monitor_initialises_the_monitor_in_a_separate_thread(
+            self, mock_start) -> None:
+        initialised = threading.Event()
+        starter_threads = []
+
+        def test_starter(test_arg, runtime):
+            # Block until the task was returned to check that the caller is
+            # not blocked by the initialisation
+            initialised.wait(5)
+            starter_threads.append(threading.current_thread())
+            return runtime.run_monitor(self.test_monitor)
+
+        actual_output = self.test_runtime.start_monitor(test_starter,
+                                                        ('test_arg',))
+        self.assertIsNone(actual_output.monitor)
+        self.assertTrue(actual_output.is_alive())
+        initialised.set()
+        actual_output.initialiser.join(5)
+
+        self.assertEqual([actual_output.initialiser], starter_threads)
+        self.assertNotEqual(threading.current_thread(), starter_threads[0])
+        self.assertEqual(self.test_monitor, actual_output.monitor)
+        self.assertEqual([actual_output], self.test_runtime.tasks)
+        mock_start.assert_called_once_with()
+
+    @freeze_time("2012-01-01")
+    def test_run_round_monitors_and_schedules_next_round_after_period(
+            self) -> None:
+        self.test_task.round_started()
+
+        self.test_runtime._run_round(self.test_task)
+
+        self.test_monitor._monitor.assert_called_once_with()
+        self.assertFalse(self.test_task.running_round)
+        self.assertEqual(
+            datetime.now().timestamp() + self.test_monitor_period,
+            self.test_task.next_round_time)
+
+    @freeze_time("2012-01-01")
+    def test_run_round_schedules_next_round_after_next_round_delay(
+            self) -> None:
+        self.test_monitor.next_round_delay = 300
+        self.test_task.round_started()
+
+        self.test_runtime._run_round(self.test_task)
+
+        self.assertEqual(datetime.now().timestamp() + 300,
+                         self.test_task.next_round_time)
+
+    @parameterized.expand([
+        (MessageWasNotDeliveredException('test'), 60, False,),
+        (pika.exceptions.AMQPConnectionError('test'), 0, True,),
+        (pika.exceptions.AMQPChannelError('test'), 0, True,),
+        (Exception('test'), RESTART_SLEEPING_PERIOD, False,),
+    ])
+    @freeze_time("2012-01-01")
+    def test_run_round_handles_monitoring_errors(
+            self, exception, expected_delay,
+            expected_reinitialisation) -> None:
+        self.test_runtime._rabbitmq_initialisation_needed = False
+        self.test_monitor._monitor.side_effect = exception
+        self.test_task.round_started()
+
+        self.test_runtime._run_round(self.test_task)
+
+        self.assertFalse(self.test_task.running_round)
+        self.assertEqual(datetime.now().timestamp() + expected_delay,
+                         self.test_task.next_round_time)
+        self.assertEqual(expected_reinitialisation,
+                         self.test_runtime._rabbitmq_initialisation_needed)
+
+    def test_initialise_rabbitmq_initialises_the_shared_connection(
+            self) -> None:
+        self.test_runtime._initialise_rabbitmq()
+
+        self.rabbitmq.connect_till_successful.assert_called_once_with()
+        self.rabbitmq.confirm_delivery.assert_called_once_with()
+        self.rabbitmq.exchange_declare.assert_has_calls([
+            mock.call(RAW_DATA_EXCHANGE, TOPIC, False, True, False, False),
+            mock.call(HEALTH_CHECK_EXCHANGE, TOPIC, False, True, False, False)
+        ])
+
+    def test_runtime_runs_monitors_with_fault_isolation(self) -> None:
+        """
+        In this test we will check that when the runtime is started, the
+        monitors are run on the shared connection, and that a monitor raising
+        an exception does not stop the other monitors from being run.
+        """
+        self.test_monitor._monitor.side_effect = Exception('test')
+
+        self.test_runtime.run_monitor(self.test_monitor)
+        self.test_runtime.run_monitor(self.test_other_monitor)
+        deadline = time.time() + 5
+        while (time.time() < deadline
+               and not self.test_other_monitor._monitor.called):
+            time.sleep(0.01)
+        self.test_runtime.stop()
+
+        self.assertFalse(self.test_runtime.is_running)
+        self.test_monitor._monitor.assert_called_once_with()
+        self.test_other_monitor._monitor.assert_called_once_with()
+        self.rabbitmq.connect_till_successful.assert_called_once_with()
+        self.rabbitmq.disconnect_till_successful.assert_called_once_with()
@@ -9,7 +9,11 @@ from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.configs.nodes.evm import EVMNodeConfig
 from src.configs.repo import GitHubRepoConfig, DockerHubRepoConfig
 from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.caches.cosmos import (TendermintBlockCache,
+                                        CosmosValidatorsSnapshotCache,
+                                        CosmosProposalsCache)
 from src.monitors.contracts.chainlink import ChainlinkContractsMonitor
 from src.monitors.dockerhub import DockerHubMonitor
 from src.monitors.github import GitHubMonitor
@@ -18,13 +22,16 @@ from src.monitors.network.substrate import SubstrateNetworkMonitor
 from src.monitors.node.chainlink import ChainlinkNodeMonitor
 from src.monitors.node.cosmos import CosmosNodeMonitor
 from src.monitors.node.evm import EVMNodeMonitor
+from src.monitors.node.substrate import SubstrateNodeMonitor
 from src.monitors.starters import (
     _initialise_monitor_logger, _initialise_monitor, start_system_monitor,
     start_github_monitor, start_node_monitor,
     _initialise_chainlink_contracts_monitor, start_chainlink_contracts_monitor,
     start_dockerhub_monitor, _initialise_cosmos_network_monitor,
     start_cosmos_network_monitor, _initialise_substrate_network_monitor,
-    start_substrate_network_monitor)
+    start_substrate_network_monitor, _initialise_tendermint_block_cache,
+    _initialise_cosmos_validators_snapshot_cache,
+    _initialise_substrate_era_cache, start_monitor)
 from src.monitors.system import SystemMonitor
 from src.utils import env
 from src.utils.constants.names import (
@@ -129,6 +136,14 @@ class TestMonitorStarters(unittest.TestCase):
         self.test_cosmos_node_monitor = CosmosNodeMonitor(
             self.node_monitor_name, self.cosmos_node_config, self.dummy_logger,
             self.node_monitoring_period, self.rabbitmq, self.data_sources)
+        self.test_tendermint_block_cache = TendermintBlockCache(
+            RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                     env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER),
+            self.cosmos_node_config.parent_id, self.cosmos_node_config.node_id)
+        self.test_validators_snapshot_cache = CosmosValidatorsSnapshotCache(
+            RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                     env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER),
+            self.cosmos_node_config.parent_id)
 
         # Chainlink Contracts Monitor
         self.cl_contracts_monitor_name = 'chainlink_contracts_monitor'
@@ -350,6 +365,21 @@ class TestMonitorStarters(unittest.TestCase):
             self.cosmos_chain_name)
         self.assertEqual(self.test_cosmos_network_monitor, actual_output)
 
+    @mock.patch("src.monitors.starters._initialise_monitor_logger")
+    def test_initialise_cosmos_network_monitor_gives_proposals_cache(
+            self, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+
+        actual_output = _initialise_cosmos_network_monitor(
+            self.cosmos_network_monitor_name, self.network_monitoring_period,
+            self.cosmos_data_sources, self.cosmos_parent_id,
+            self.cosmos_chain_name)
+
+        self.assertIsInstance(actual_output.proposals_cache,
+                              CosmosProposalsCache)
+        self.assertEqual(self.cosmos_parent_id,
+                         actual_output.proposals_cache.parent_id)
+
     @mock.patch("src.monitors.starters._initialise_monitor_logger")
     def test_initialise_substrate_network_monitor_calls_init_logger_correctly(
             self, mock_init_logger) -> None:
@@ -390,12 +420,14 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_system_monitor(self.system_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_system_monitor)
+        mock_start_monitor.assert_called_once_with(self.test_system_monitor,
+                                                   None)
         mock_initialise_monitor.assert_called_once_with(
             SystemMonitor,
             SYSTEM_MONITOR_NAME_TEMPLATE.format(
                 self.system_config.system_name),
-            env.SYSTEM_MONITOR_PERIOD_SECONDS, self.system_config
+            env.SYSTEM_MONITOR_PERIOD_SECONDS, self.system_config,
+            runtime=None
         )
 
     @mock.patch("src.monitors.starters._initialise_monitor")
@@ -407,12 +439,14 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_github_monitor(self.github_repo_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_github_monitor)
+        mock_start_monitor.assert_called_once_with(self.test_github_monitor,
+                                                   None)
         mock_initialise_monitor.assert_called_once_with(
             GitHubMonitor,
             GITHUB_MONITOR_NAME_TEMPLATE.format(
                 self.github_repo_config.repo_name.replace('/', ' ')[:-1]),
-            env.GITHUB_MONITOR_PERIOD_SECONDS, self.github_repo_config
+            env.GITHUB_MONITOR_PERIOD_SECONDS, self.github_repo_config,
+            runtime=None
         )
 
     @mock.patch("src.monitors.starters._initialise_monitor")
@@ -424,43 +458,107 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_dockerhub_monitor(self.dockerhub_repo_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_dockerhub_monitor)
+        mock_start_monitor.assert_called_once_with(self.test_dockerhub_monitor,
+                                                   None)
         mock_initialise_monitor.assert_called_once_with(
             DockerHubMonitor,
             DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
                 self.dockerhub_repo_config.repo_namespace + ' ' +
                 self.dockerhub_repo_config.repo_name),
-            env.DOCKERHUB_MONITOR_PERIOD_SECONDS, self.dockerhub_repo_config
+            env.DOCKERHUB_MONITOR_PERIOD_SECONDS, self.dockerhub_repo_config,
+            runtime=None
         )
 
     @parameterized.expand([
         ('self.test_chainlink_node_monitor', 'self.chainlink_node_config',
-         ChainlinkNodeMonitor, [],),
+         ChainlinkNodeMonitor, [], [],),
         ('self.test_evm_node_monitor', 'self.evm_node_config',
-         EVMNodeMonitor, [],),
+         EVMNodeMonitor, [], [],),
         ('self.test_cosmos_node_monitor', 'self.cosmos_node_config',
-         CosmosNodeMonitor, ['self.data_sources'],),
+         CosmosNodeMonitor, ['self.data_sources'],
+         ['self.test_tendermint_block_cache',
+          'self.test_validators_snapshot_cache'],),
     ])
+    @mock.patch("src.monitors.starters."
+                "_initialise_cosmos_validators_snapshot_cache")
+    @mock.patch("src.monitors.starters._initialise_tendermint_block_cache")
     @mock.patch("src.monitors.starters._initialise_monitor")
     @mock.patch('src.monitors.starters.start_monitor')
     def test_start_node_monitor_calls_sub_functions_correctly(
             self, monitor, node_config, monitor_type, other_args,
-            mock_start_monitor, mock_initialise_monitor) -> None:
+            initialised_args, mock_start_monitor, mock_initialise_monitor,
+            mock_initialise_block_cache,
+            mock_initialise_snapshot_cache) -> None:
         mock_start_monitor.return_value = None
         mock_initialise_monitor.return_value = eval(monitor)
+        mock_initialise_block_cache.return_value = \
+            self.test_tendermint_block_cache
+        mock_initialise_snapshot_cache.return_value = \
+            self.test_validators_snapshot_cache
         evaluated_args = []
         for arg in other_args:
             evaluated_args.append(eval(arg))
+        evaluated_initialised_args = []
+        for arg in initialised_args:
+            evaluated_initialised_args.append(eval(arg))
 
         start_node_monitor(eval(node_config), monitor_type, *evaluated_args)
 
-        mock_start_monitor.assert_called_once_with(eval(monitor))
+        mock_start_monitor.assert_called_once_with(eval(monitor), None)
         mock_initialise_monitor.assert_called_once_with(
             monitor_type, NODE_MONITOR_NAME_TEMPLATE.format(
                 eval(node_config).node_name), env.NODE_MONITOR_PERIOD_SECONDS,
-            eval(node_config), *evaluated_args
+            eval(node_config), *evaluated_args, *evaluated_initialised_args,
+            runtime=None
         )
 
+    @mock.patch("src.monitors.starters._initialise_monitor_logger")
+    def test_initialise_tendermint_block_cache_creates_cache_correctly(
+            self, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+
+        actual_output = _initialise_tendermint_block_cache(
+            self.node_monitor_name, self.cosmos_node_config)
+
+        mock_init_logger.assert_called_once_with(
+            self.node_monitor_name, CosmosNodeMonitor.__name__)
+        self.assertEqual(self.cosmos_node_config.parent_id,
+                         actual_output.parent_id)
+        self.assertEqual(self.cosmos_node_config.node_id,
+                         actual_output.subscriber_id)
+
+    @mock.patch("src.monitors.starters._initialise_monitor_logger")
+    def test_initialise_cosmos_validators_snapshot_cache_creates_cache(
+            self, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+
+        actual_output = _initialise_cosmos_validators_snapshot_cache(
+            self.node_monitor_name, self.cosmos_node_config)
+
+        mock_init_logger.assert_called_once_with(
+            self.node_monitor_name, CosmosNodeMonitor.__name__)
+        self.assertEqual(self.cosmos_node_config.parent_id,
+                         actual_output.parent_id)
+        self.assertEqual(timedelta(seconds=env.NODE_MONITOR_PERIOD_SECONDS),
+                         actual_output.max_age)
+        self.assertEqual(
+            timedelta(seconds=5 * env.NODE_MONITOR_PERIOD_SECONDS),
+            actual_output.max_stale_age)
+
+    @mock.patch("src.monitors.starters._initialise_monitor_logger")
+    def test_initialise_substrate_era_cache_creates_cache_correctly(
+            self, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+        substrate_node_config = self.substrate_test_nodes.archive_validator
+
+        actual_output = _initialise_substrate_era_cache(
+            self.node_monitor_name, substrate_node_config)
+
+        mock_init_logger.assert_called_once_with(
+            self.node_monitor_name, SubstrateNodeMonitor.__name__)
+        self.assertEqual(substrate_node_config.parent_id,
+                         actual_output.parent_id)
+
     @mock.patch("src.monitors.starters._initialise_chainlink_contracts_monitor")
     @mock.patch('src.monitors.starters.start_monitor')
     def test_start_chainlink_contracts_monitor_calls_sub_functions_correctly(
@@ -477,12 +575,12 @@ class TestMonitorStarters(unittest.TestCase):
                                           self.cl_contracts_parent_id)
 
         mock_start_monitor.assert_called_once_with(
-            self.test_chainlink_contracts_monitor)
+            self.test_chainlink_contracts_monitor, None)
         mock_initialise_cl_contracts_monitor.assert_called_once_with(
             CL_CONTRACTS_MONITOR_NAME_TEMPLATE.format(test_sub_chain),
             env.CHAINLINK_CONTRACTS_MONITOR_PERIOD_SECONDS,
             self.weiwatchers_url, self.evm_nodes, self.node_configs,
-            self.cl_contracts_parent_id
+            self.cl_contracts_parent_id, runtime=None
         )
 
     @mock.patch("src.monitors.starters._initialise_cosmos_network_monitor")
@@ -501,12 +599,12 @@ class TestMonitorStarters(unittest.TestCase):
                                      self.cosmos_chain_name)
 
         mock_start_monitor.assert_called_once_with(
-            self.test_cosmos_network_monitor)
+            self.test_cosmos_network_monitor, None)
         mock_initialise_cosmos_network_monitor.assert_called_once_with(
             monitor_display_name,
             env.NETWORK_MONITOR_PERIOD_SECONDS,
             self.cosmos_data_sources, self.cosmos_parent_id,
-            self.cosmos_chain_name
+            self.cosmos_chain_name, runtime=None
         )
 
     @mock.patch("src.monitors.starters._initialise_substrate_network_monitor")
@@ -525,9 +623,36 @@ class TestMonitorStarters(unittest.TestCase):
             self.substrate_chain_name, self.governance_addresses)
 
         mock_start_monitor.assert_called_once_with(
-            self.test_substrate_network_monitor)
+            self.test_substrate_network_monitor, None)
         mock_initialise_substrate_network_monitor.assert_called_once_with(
             monitor_display_name, env.NETWORK_MONITOR_PERIOD_SECONDS,
             self.substrate_data_sources, self.governance_addresses,
-            self.substrate_parent_id, self.substrate_chain_name
+            self.substrate_parent_id, self.substrate_chain_name, runtime=None
         )
+
+    @mock.patch("src.monitors.starters._initialise_monitor_logger")
+    def test_initialise_monitor_uses_runtime_rabbitmq_if_runtime_given(
+            self, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+        test_runtime = mock.MagicMock()
+        test_runtime.rabbitmq = self.rabbitmq
+
+        actual_output = _initialise_monitor(
+            SystemMonitor, self.system_monitor_name,
+            self.system_monitoring_period, self.system_config,
+            runtime=test_runtime)
+
+        self.assertIs(self.rabbitmq, actual_output.rabbitmq)
+
+    @mock.patch.object(SystemMonitor, 'start')
+    def test_start_monitor_runs_monitor_in_runtime_if_runtime_given(
+            self, mock_start) -> None:
+        test_runtime = mock.MagicMock()
+        test_runtime.run_monitor.return_value = 'test_task'
+
+        actual_output = start_monitor(self.test_system_monitor, test_runtime)
+
+        self.assertEqual('test_task', actual_output)
+        test_runtime.run_monitor.assert_called_once_with(
+            self.test_system_monitor)
+        mock_start.assert_not_called()
@@ -100,6 +100,11 @@ class TestSubstrateMonitor(unittest.TestCase):
             self.monitoring_period, self.rabbitmq
         )
 
+        # The data sources are selected without the health registry shared by
+        # the monitors of the process, so that the tests do not affect each
+        # other
+        self.test_monitor._data_source_health = None
+
     def tearDown(self) -> None:
         connect_to_rabbit(self.test_monitor.rabbitmq)
         delete_queue_if_exists(self.test_monitor.rabbitmq, self.test_queue_name)
@@ -26,6 +26,7 @@ from src.utils.exceptions import (PANICException, SystemIsDownException,
                                   DataReadingException, InvalidUrlException,
                                   MetricNotFoundException,
                                   MessageWasNotDeliveredException)
+from src.utils.sharding import get_sharded_routing_key
 
 
 class TestSystemMonitor(unittest.TestCase):
@@ -397,6 +398,23 @@ class TestSystemMonitor(unittest.TestCase):
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
+    @mock.patch.object(env, "SYSTEM_DATA_TRANSFORMER_SHARDS", 3)
+    @mock.patch.object(RabbitMQApi, "basic_publish_confirm")
+    def test_send_data_sends_data_to_data_transformer_shard_of_system(
+            self, mock_publish) -> None:
+        test_monitor = SystemMonitor(self.monitor_name, self.system_config,
+                                     self.dummy_logger, self.monitoring_period,
+                                     self.rabbitmq)
+
+        test_monitor._send_data(self.processed_data_example)
+
+        mock_publish.assert_called_once_with(
+            exchange=RAW_DATA_EXCHANGE,
+            routing_key=get_sharded_routing_key(SYSTEM_RAW_DATA_ROUTING_KEY,
+                                                self.system_id, 3),
+            body=self.processed_data_example, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(SystemMonitor, "_get_data")
     def test_monitor_sends_data_and_hb_if_data_retrieve_and_processing_success(
@@ -1,10 +1,25 @@
+import json
+import logging
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
 from unittest.mock import Mock
 
+import requests
+from freezegun import freeze_time
 from parameterized import parameterized
+from urllib3.util.retry import Retry
 
-from src.utils.data import transformed_data_processing_helper
-from src.utils.exceptions import ReceivedUnexpectedDataException
+from src.utils.data import (transformed_data_processing_helper,
+                            HttpSessionRegistry, get_json,
+                            parse_prometheus_metrics,
+                            get_prometheus_metrics_data,
+                            ConditionalRequestCache, get_json_conditionally,
+                            get_rate_limit_delay)
+from src.utils.exceptions import (ReceivedUnexpectedDataException,
+                                  MetricNotFoundException,
+                                  NoMetricsGivenException)
 from test.test_utils.utils import dummy_function, dummy_none_function
 
 
@@ -62,3 +77,341 @@ class TestDataUtils(unittest.TestCase):
 
         test_result_fn.assert_called_once_with(10)
         test_error_fn.assert_called_once_with(20)
+
+
+class TestPrometheusDataUtils(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_endpoint = 'http://test_endpoint:9100/metrics'
+        self.test_lines = [
+            b'# HELP node_cpu_seconds_total Seconds the CPUs spent in each mode.',
+            b'# TYPE node_cpu_seconds_total counter',
+            b'node_cpu_seconds_total{cpu="0",mode="idle"} 10.5',
+            b'node_cpu_seconds_total{ cpu="1" , mode="idle" ,} 20 1600000000',
+            b'# TYPE node_filesystem_avail_bytes gauge',
+            b'node_filesystem_avail_bytes{mountpoint="/a\\"b\\\\c"} 1e3',
+            b'node_filesystem_avail_bytes{mountpoint="/\xc3\xa9"} +Inf',
+            b'# TYPE process_cpu_seconds_total counter',
+            b'process_cpu_seconds_total 100',
+            b'# TYPE head_tracker_heads_received counter',
+            b'head_tracker_heads_received 5',
+            b'',
+            b'untyped_metric 1',
+            b'untyped_metric 2',
+            b'# TYPE unrequested_metric gauge',
+            b'unrequested_metric{this is not valid} not_a_number',
+        ]
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+
+    def test_parse_prometheus_metrics_parses_only_requested_metrics(
+            self) -> None:
+        actual_output = parse_prometheus_metrics(self.test_lines, [
+            'node_cpu_seconds_total', 'node_filesystem_avail_bytes',
+            'process_cpu_seconds_total', 'head_tracker_heads_received_total',
+            'untyped_metric', 'missing_metric'
+        ])
+
+        self.assertEqual({
+            'node_cpu_seconds_total': {
+                json.dumps({'cpu': '0', 'mode': 'idle'}): 10.5,
+                json.dumps({'cpu': '1', 'mode': 'idle'}): 20.0,
+            },
+            'node_filesystem_avail_bytes': {
+                json.dumps({'mountpoint': '/a"b\\c'}): 1000.0,
+                json.dumps({'mountpoint': '/\u00e9'}): float('inf'),
+            },
+            'process_cpu_seconds_total': 100.0,
+            'head_tracker_heads_received_total': 5.0,
+            'untyped_metric': 3.0,
+        }, actual_output)
+
+    def test_get_prometheus_metrics_data_raises_if_no_metrics_given(
+            self) -> None:
+        self.assertRaises(NoMetricsGivenException,
+                          get_prometheus_metrics_data, self.test_endpoint, {},
+                          self.dummy_logger)
+
+    @mock.patch('src.utils.data.get_prometheus_lines')
+    def test_get_prometheus_metrics_data_sets_missing_optional_metrics(
+            self, mock_get_prometheus_lines) -> None:
+        mock_get_prometheus_lines.return_value = iter(self.test_lines)
+
+        actual_output = get_prometheus_metrics_data(
+            self.test_endpoint, {
+                'process_cpu_seconds_total': 'strict',
+                'missing_metric': 'optional'
+            }, self.dummy_logger, False)
+
+        self.assertEqual({'process_cpu_seconds_total': 100.0,
+                          'missing_metric': None}, actual_output)
+        mock_get_prometheus_lines.assert_called_once_with(
+            self.test_endpoint, self.dummy_logger, False)
+
+    @mock.patch('src.utils.data.get_prometheus_lines')
+    def test_get_prometheus_metrics_data_raises_if_strict_metric_missing(
+            self, mock_get_prometheus_lines) -> None:
+        mock_get_prometheus_lines.return_value = iter(self.test_lines)
+
+        self.assertRaises(MetricNotFoundException,
+                          get_prometheus_metrics_data, self.test_endpoint,
+                          {'missing_metric': 'strict'}, self.dummy_logger)
+
+
+class _TestJsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        body = json.dumps({'result': 'test'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _TestUnavailableHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_received = 0
+
+    def _send_unavailable(self) -> None:
+        type(self).requests_received += 1
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        self._send_unavailable()
+
+    def do_POST(self) -> None:
+        self._send_unavailable()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestHttpSessionRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_pool_connections = 5
+        self.test_pool_maxsize = 3
+        self.test_max_retries = 2
+        self.test_backoff_factor = 0.5
+        self.test_registry = HttpSessionRegistry(
+            self.test_pool_connections, self.test_pool_maxsize,
+            self.test_max_retries, self.test_backoff_factor)
+        self.test_server = HTTPServer(('127.0.0.1', 0), _TestJsonHandler)
+        self.test_server_thread = threading.Thread(
+            target=self.test_server.serve_forever, daemon=True)
+        self.test_server_thread.start()
+        self.test_endpoint = 'http://127.0.0.1:{}/test'.format(
+            self.test_server.server_port)
+
+    def tearDown(self) -> None:
+        self.test_registry.close()
+        self.test_server.shutdown()
+        self.test_server.server_close()
+        self.dummy_logger = None
+        self.test_registry = None
+        self.test_server = None
+        self.test_server_thread = None
+
+    def test_get_session_returns_the_same_session_within_a_process(
+            self) -> None:
+        self.assertIs(self.test_registry.get_session(),
+                      self.test_registry.get_session())
+
+    @mock.patch('src.utils.data.os.getpid')
+    def test_get_session_creates_a_new_session_in_a_forked_process(
+            self, mock_getpid) -> None:
+        mock_getpid.return_value = 1
+        parent_session = self.test_registry.get_session()
+        mock_getpid.return_value = 2
+
+        self.assertIsNot(parent_session, self.test_registry.get_session())
+
+    def test_get_session_configures_pools_and_retries(self) -> None:
+        session = self.test_registry.get_session()
+
+        for prefix in ['http://', 'https://']:
+            adapter = session.get_adapter(prefix)
+            self.assertEqual(self.test_pool_connections,
+                             adapter._pool_connections)
+            self.assertEqual(self.test_pool_maxsize, adapter._pool_maxsize)
+            self.assertEqual(self.test_max_retries, adapter.max_retries.total)
+            self.assertEqual(self.test_backoff_factor,
+                             adapter.max_retries.backoff_factor)
+            self.assertEqual(0, adapter.max_retries.connect)
+            self.assertEqual(0, adapter.max_retries.read)
+
+    @parameterized.expand([
+        ('GET', 3,),
+        ('POST', 1,),
+    ])
+    def test_only_idempotent_requests_are_retried_on_gateway_errors(
+            self, method, expected_requests) -> None:
+        test_registry = HttpSessionRegistry(max_retries=2)
+        test_server = HTTPServer(('127.0.0.1', 0), _TestUnavailableHandler)
+        threading.Thread(target=test_server.serve_forever, daemon=True).start()
+        _TestUnavailableHandler.requests_received = 0
+        try:
+            response = test_registry.get_session().request(
+                method, 'http://127.0.0.1:{}/test'.format(
+                    test_server.server_port), json={}, timeout=5)
+        finally:
+            test_registry.close()
+            test_server.shutdown()
+            test_server.server_close()
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(expected_requests,
+                         _TestUnavailableHandler.requests_received)
+
+    def test_connection_errors_are_not_retried(self) -> None:
+        test_registry = HttpSessionRegistry(max_retries=2)
+        session = test_registry.get_session()
+
+        with mock.patch.object(
+                Retry, 'increment', autospec=True,
+                side_effect=Retry.increment) as mock_increment:
+            self.assertRaises(requests.exceptions.ConnectionError,
+                              session.get, 'http://127.0.0.1:1', timeout=5)
+
+        mock_increment.assert_called_once()
+        test_registry.close()
+
+    def _get_connection_pool(self, session: requests.Session):
+        return session.get_adapter(
+            self.test_endpoint).poolmanager.connection_from_url(
+            self.test_endpoint)
+
+    def test_connections_are_kept_alive_and_reused(self) -> None:
+        session = self.test_registry.get_session()
+        for _ in range(3):
+            self.assertEqual({'result': 'test'},
+                             session.get(self.test_endpoint).json())
+
+        connection_pool = self._get_connection_pool(session)
+        self.assertEqual(3, connection_pool.num_requests)
+        self.assertEqual(1, connection_pool.num_connections)
+
+    @mock.patch('src.utils.data.get_http_session')
+    def test_get_json_uses_the_session_of_the_process(
+            self, mock_get_http_session) -> None:
+        mock_get_http_session.return_value = self.test_registry.get_session()
+
+        actual_output = get_json(self.test_endpoint, self.dummy_logger)
+
+        self.assertEqual({'result': 'test'}, actual_output)
+        self.assertEqual(1, self._get_connection_pool(
+            self.test_registry.get_session()).num_requests)
+
+
+class _TestConditionalJsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    etag = '"test_etag"'
+
+    def do_GET(self) -> None:
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            body = b''
+        else:
+            self.send_response(200)
+            body = json.dumps({'result': 'test'}).encode()
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', self.etag)
+        self.send_header('X-RateLimit-Remaining', '10')
+        self.send_header('X-RateLimit-Reset', '1325376600')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_registry = HttpSessionRegistry()
+        self.test_cache = ConditionalRequestCache()
+        self.test_server = HTTPServer(('127.0.0.1', 0),
+                                      _TestConditionalJsonHandler)
+        self.test_server_thread = threading.Thread(
+            target=self.test_server.serve_forever, daemon=True)
+        self.test_server_thread.start()
+        self.test_endpoint = 'http://127.0.0.1:{}/test'.format(
+            self.test_server.server_port)
+
+    def tearDown(self) -> None:
+        self.test_registry.close()
+        self.test_server.shutdown()
+        self.test_server.server_close()
+        self.dummy_logger = None
+        self.test_registry = None
+        self.test_cache = None
+        self.test_server = None
+        self.test_server_thread = None
+
+    def test_get_request_headers_returns_the_stored_validators(self) -> None:
+        self.assertEqual({}, self.test_cache.get_request_headers('url'))
+
+        self.test_cache.store('url', {'ETag': 'etag',
+                                      'Last-Modified': 'last_modified'},
+                              {'result': 'test'})
+
+        self.assertEqual({'If-None-Match': 'etag',
+                          'If-Modified-Since': 'last_modified'},
+                         self.test_cache.get_request_headers('url'))
+        self.assertEqual({'result': 'test'},
+                         self.test_cache.get_content('url'))
+
+    def test_store_does_not_keep_responses_without_validators(self) -> None:
+        self.test_cache.store('url', {'ETag': 'etag'}, {'result': 'test'})
+        self.test_cache.store('url', {}, {'result': 'test_2'})
+
+        self.assertNotIn('url', self.test_cache)
+        self.assertEqual({}, self.test_cache.get_request_headers('url'))
+
+    @mock.patch('src.utils.data.get_http_session')
+    def test_get_json_conditionally_re_uses_content_if_not_modified(
+            self, mock_get_http_session) -> None:
+        mock_get_http_session.return_value = self.test_registry.get_session()
+
+        content, modified, _ = get_json_conditionally(
+            self.test_endpoint, self.dummy_logger, self.test_cache)
+        self.assertEqual(({'result': 'test'}, True), (content, modified))
+
+        content, modified, headers = get_json_conditionally(
+            self.test_endpoint, self.dummy_logger, self.test_cache)
+        self.assertEqual(({'result': 'test'}, False), (content, modified))
+        self.assertEqual('10', headers['x-ratelimit-remaining'])
+
+    @parameterized.expand([
+        ({}, 1, 0.0,),
+        ({'X-RateLimit-Remaining': 'invalid',
+          'X-RateLimit-Reset': '1325376600'}, 1, 0.0,),
+        ({'X-RateLimit-Remaining': '0',
+          'X-RateLimit-Reset': '1325376600'}, 1, 600.0,),
+        ({'X-RateLimit-Remaining': '2',
+          'X-RateLimit-Reset': '1325376600'}, 3, 600.0,),
+        ({'X-RateLimit-Remaining': '60',
+          'X-RateLimit-Reset': '1325376600'}, 1, 10.0,),
+        ({'X-RateLimit-Remaining': '30;w=21600',
+          'X-RateLimit-Reset': '1325376600'}, 2, 40.0,),
+        ({'X-RateLimit-Remaining': '0',
+          'X-RateLimit-Reset': '1325375000'}, 1, 0.0,),
+    ])
+    @freeze_time("2012-01-01")
+    def test_get_rate_limit_delay_returns_expected_delay(
+            self, headers, requests_per_round, expected_delay) -> None:
+        self.assertEqual(expected_delay,
+                         get_rate_limit_delay(headers, requests_per_round))
@@ -0,0 +1,196 @@
+import logging
+import unittest
+from typing import Any, List, Dict
+from unittest import mock
+
+from parameterized import parameterized
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from web3 import Web3
+from web3.contract import ContractFunction
+from web3.exceptions import ContractLogicError
+
+from src.utils.constants.abis.v4 import V4_AGGREGATOR
+from src.utils.evm import ContractCallBatcher
+
+
+class TestContractCallBatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_evm_node_url = 'http://test_evm_node:8545'
+        self.test_block_height = 1000
+        self.test_transmitter = Web3.toChecksumAddress(
+            '0x2607e6f021922a5483d64935f87e15ea797fe8d4')
+        self.test_round_data = [10, 200, 1600000000, 1600000001, 10]
+        self.w3_interface = Web3(Web3.HTTPProvider(self.test_evm_node_url))
+        self.test_contract = self.w3_interface.eth.contract(
+            address='0x05883D24a5712c04f1b843C4839dC93073A56Ef4',
+            abi=V4_AGGREGATOR)
+        self.test_functions = [
+            self.test_contract.functions.transmitters(),
+            self.test_contract.functions.latestRoundData(),
+            self.test_contract.functions.owedPayment(self.test_transmitter),
+        ]
+        self.test_outputs = [
+            [self.test_transmitter], self.test_round_data, 5,
+        ]
+        self.test_encoded_outputs = [
+            Web3.toHex(self.w3_interface.codec.encode_abi(
+                ['address[]'], [[self.test_transmitter]])),
+            Web3.toHex(self.w3_interface.codec.encode_abi(
+                ['uint80', 'int256', 'uint256', 'uint256', 'uint80'],
+                self.test_round_data)),
+            Web3.toHex(self.w3_interface.codec.encode_abi(['uint256'], [5])),
+        ]
+        self.test_batcher = ContractCallBatcher(self.w3_interface,
+                                                self.dummy_logger, 2)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.w3_interface = None
+        self.test_contract = None
+        self.test_functions = None
+        self.test_batcher = None
+
+    @staticmethod
+    def _create_response(batch_responses: Any) -> mock.MagicMock:
+        response = mock.MagicMock()
+        response.json.return_value = batch_responses
+        return response
+
+    @staticmethod
+    def _create_batch_responses(encoded_outputs: List[str]) -> List[Dict]:
+        return [{'jsonrpc': '2.0', 'id': index, 'result': output}
+                for index, output in enumerate(encoded_outputs)]
+
+    @mock.patch.object(ContractFunction, 'call')
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_batches_calls_and_decodes_outputs(
+            self, mock_get_http_session, mock_call) -> None:
+        mock_post = mock_get_http_session.return_value.post
+        mock_post.return_value = self._create_response(
+            self._create_batch_responses(self.test_encoded_outputs[:2]))
+        mock_call.return_value = self.test_outputs[2]
+
+        actual_output = self.test_batcher.call(self.test_functions,
+                                               self.test_block_height)
+
+        self.assertEqual(self.test_outputs, actual_output)
+        self.assertEqual(1, mock_post.call_count)
+        sent_batch = mock_post.call_args.kwargs['json']
+        self.assertEqual(self.test_evm_node_url, mock_post.call_args.args[0])
+        self.assertEqual(['eth_call', 'eth_call'],
+                         [request['method'] for request in sent_batch])
+        self.assertEqual(
+            [hex(self.test_block_height), hex(self.test_block_height)],
+            [request['params'][1] for request in sent_batch])
+        self.assertEqual(
+            [self.test_contract.encodeABI(fn_name='transmitters'),
+             self.test_contract.encodeABI(fn_name='latestRoundData')],
+            [request['params'][0]['data'] for request in sent_batch])
+        # A single call is not worth a batch request
+        mock_call.assert_called_once_with(
+            block_identifier=self.test_block_height)
+
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_returns_reverted_calls_if_not_raise_reverted(
+            self, mock_get_http_session) -> None:
+        batch_responses = self._create_batch_responses(
+            self.test_encoded_outputs[:2])
+        batch_responses[1] = {
+            'jsonrpc': '2.0', 'id': 1,
+            'error': {'code': 3, 'message': 'execution reverted'}
+        }
+        mock_get_http_session.return_value.post.return_value = \
+            self._create_response(batch_responses)
+
+        actual_output = self.test_batcher.call(self.test_functions[:2],
+                                               raise_reverted=False)
+
+        self.assertEqual(self.test_outputs[0], actual_output[0])
+        self.assertIsInstance(actual_output[1], ContractLogicError)
+
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_raises_reverted_calls_by_default(
+            self, mock_get_http_session) -> None:
+        batch_responses = self._create_batch_responses(
+            self.test_encoded_outputs[:2])
+        batch_responses[0] = {
+            'jsonrpc': '2.0', 'id': 0,
+            'error': {'code': -32000, 'message': 'execution reverted'}
+        }
+        mock_get_http_session.return_value.post.return_value = \
+            self._create_response(batch_responses)
+
+        self.assertRaises(ContractLogicError, self.test_batcher.call,
+                          self.test_functions[:2])
+
+    @mock.patch.object(ContractFunction, 'call')
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_falls_back_to_single_calls_if_batching_rejected(
+            self, mock_get_http_session, mock_call) -> None:
+        mock_post = mock_get_http_session.return_value.post
+        mock_post.return_value = self._create_response({
+            'jsonrpc': '2.0', 'id': None,
+            'error': {'code': -32600, 'message': 'batch not supported'}
+        })
+        mock_call.side_effect = self.test_outputs + self.test_outputs
+
+        first_output = self.test_batcher.call(self.test_functions)
+        second_output = self.test_batcher.call(self.test_functions)
+
+        self.assertEqual(self.test_outputs, first_output)
+        self.assertEqual(self.test_outputs, second_output)
+        self.assertFalse(self.test_batcher.batching_supported)
+        mock_post.assert_called_once()
+
+    @parameterized.expand([
+        (RequestsConnectionError('test'), None,),
+        (None, ValueError('test'),),
+        (None, [{'jsonrpc': '2.0', 'id': 0, 'result': '0x'}],),
+        (None, 'Bad Gateway',),
+    ])
+    @mock.patch.object(ContractFunction, 'call')
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_falls_back_to_single_calls_for_the_round_if_batch_fails(
+            self, post_error, batch_responses, mock_get_http_session,
+            mock_call) -> None:
+        mock_post = mock_get_http_session.return_value.post
+        response = self._create_response(batch_responses)
+        if isinstance(batch_responses, Exception):
+            response.json.side_effect = batch_responses
+        mock_post.return_value = response
+        mock_post.side_effect = post_error
+        mock_call.side_effect = self.test_outputs
+
+        actual_output = self.test_batcher.call(self.test_functions)
+
+        self.assertEqual(self.test_outputs, actual_output)
+        self.assertTrue(self.test_batcher.batching_supported)
+        # The second batch of the round is not attempted
+        mock_post.assert_called_once()
+
+        # Batching is attempted again in the next round
+        mock_post.side_effect = None
+        mock_post.return_value = self._create_response(
+            self._create_batch_responses(self.test_encoded_outputs[:2]))
+        mock_call.side_effect = None
+        mock_call.return_value = self.test_outputs[2]
+
+        self.assertEqual(self.test_outputs,
+                         self.test_batcher.call(self.test_functions))
+        self.assertEqual(2, mock_post.call_count)
+
+    @mock.patch.object(ContractFunction, 'call')
+    @mock.patch('src.utils.evm.get_http_session')
+    def test_call_does_not_batch_if_max_batch_size_is_one(
+            self, mock_get_http_session, mock_call) -> None:
+        test_batcher = ContractCallBatcher(self.w3_interface,
+                                           self.dummy_logger, 1)
+        mock_call.side_effect = self.test_outputs
+
+        actual_output = test_batcher.call(self.test_functions)
+
+        self.assertEqual(self.test_outputs, actual_output)
+        self.assertFalse(test_batcher.batching_supported)
+        mock_get_http_session.return_value.post.assert_not_called()
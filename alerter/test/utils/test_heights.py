@@ -0,0 +1,45 @@
+import unittest
+
+from src.utils.heights import ChainHeightIndex
+
+
+class TestChainHeightIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_index = ChainHeightIndex()
+
+    def tearDown(self) -> None:
+        self.test_index = None
+
+    def test_get_max_height_returns_none_if_no_heights_stored(self) -> None:
+        self.assertIsNone(self.test_index.get_max_height())
+
+    def test_get_max_height_returns_the_highest_height(self) -> None:
+        self.test_index.update('node_1', 100)
+        self.test_index.update('node_2', 105)
+        self.test_index.update('node_3', 95)
+
+        self.assertEqual(105, self.test_index.get_max_height())
+
+    def test_get_max_height_ignores_the_old_heights_of_a_node(self) -> None:
+        self.test_index.update('node_1', 100)
+        self.test_index.update('node_2', 110)
+        self.test_index.update('node_2', 90)
+
+        self.assertEqual(100, self.test_index.get_max_height())
+        self.assertEqual({'node_1': 100, 'node_2': 90},
+                         self.test_index.heights)
+
+    def test_update_does_not_let_stale_entries_accumulate(self) -> None:
+        for height in range(1000):
+            self.test_index.update('node_1', height)
+            self.test_index.update('node_2', height + 1)
+
+        self.assertEqual(1000, self.test_index.get_max_height())
+        self.assertLessEqual(len(self.test_index._heap), 16)
+
+    def test_get_max_height_matches_max_of_heights(self) -> None:
+        for height in range(50):
+            self.test_index.update('node_{}'.format(height % 7),
+                                   (height * 37) % 101)
+            self.assertEqual(max(self.test_index.heights.values()),
+                             self.test_index.get_max_height())
@@ -0,0 +1,130 @@
+import logging
+import unittest
+from unittest import mock
+
+import pika.frame
+import pika.spec
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.sharding import (
+    get_shard, get_shards, add_shard_suffix, get_shard_name,
+    get_sharded_routing_key, get_stale_shard_queues, remove_stale_shard_queues,
+    MAX_SHARDS)
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_keys = ['node_id_{}'.format(index) for index in range(1000)]
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = RabbitMQApi(self.dummy_logger)
+
+    def tearDown(self) -> None:
+        self.test_keys = None
+        self.dummy_logger = None
+        self.rabbitmq = None
+
+    @parameterized.expand([(1,), (2,), (7,), (16,)])
+    def test_get_shard_returns_a_shard_within_range(self, shards) -> None:
+        for key in self.test_keys:
+            self.assertIn(get_shard(key, shards), range(shards))
+
+    def test_get_shard_returns_the_same_shard_for_the_same_key(self) -> None:
+        self.assertEqual([get_shard(key, 8) for key in self.test_keys],
+                         [get_shard(key, 8) for key in self.test_keys])
+
+    def test_get_shard_spreads_the_keys_over_all_the_shards(self) -> None:
+        shards = [get_shard(key, 4) for key in self.test_keys]
+        for shard in range(4):
+            self.assertGreater(shards.count(shard), 150)
+
+    def test_get_shard_only_moves_keys_to_the_new_shard_on_resize(
+            self) -> None:
+        moved_keys = 0
+        for key in self.test_keys:
+            old_shard = get_shard(key, 4)
+            new_shard = get_shard(key, 5)
+            if old_shard != new_shard:
+                self.assertEqual(4, new_shard)
+                moved_keys += 1
+
+        # Around a fifth of the keys should move to the new shard
+        self.assertGreater(moved_keys, 120)
+        self.assertLess(moved_keys, 280)
+
+    @parameterized.expand([
+        (0, [None],),
+        (1, [None],),
+        (3, [0, 1, 2],),
+    ])
+    def test_get_shards_returns_the_shards_to_be_started(
+            self, shards, expected_shards) -> None:
+        self.assertEqual(expected_shards, get_shards(shards))
+
+    @parameterized.expand([
+        (None, 'test_queue', 'Test Component',),
+        (2, 'test_queue.2', 'Test Component (shard 2)',),
+    ])
+    def test_shard_suffix_and_name_are_only_added_if_sharded(
+            self, shard, expected_queue, expected_name) -> None:
+        self.assertEqual(expected_queue, add_shard_suffix('test_queue', shard))
+        self.assertEqual(expected_name,
+                         get_shard_name('Test Component', shard))
+
+    def test_get_sharded_routing_key_returns_routing_key_if_not_sharded(
+            self) -> None:
+        self.assertEqual('node.cosmos',
+                         get_sharded_routing_key('node.cosmos', 'node_id', 1))
+
+    def test_get_sharded_routing_key_returns_routing_key_of_shard_of_key(
+            self) -> None:
+        self.assertEqual(
+            'node.cosmos.{}'.format(get_shard('node_id', 3)),
+            get_sharded_routing_key('node.cosmos', 'node_id', 3))
+
+    @parameterized.expand([(1,), (3,)])
+    def test_get_stale_shard_queues_returns_queues_of_shards_not_started(
+            self, shards) -> None:
+        queues_in_use = [add_shard_suffix('test_queue', shard)
+                         for shard in get_shards(shards)]
+
+        stale_queues = get_stale_shard_queues('test_queue', shards)
+
+        self.assertEqual(MAX_SHARDS + 1 - len(queues_in_use),
+                         len(stale_queues))
+        for queue in queues_in_use:
+            self.assertNotIn(queue, stale_queues)
+        for queue in ['test_queue'] + ['test_queue.{}'.format(shard)
+                                       for shard in range(MAX_SHARDS)]:
+            if queue not in queues_in_use:
+                self.assertIn(queue, stale_queues)
+
+    @mock.patch.object(RabbitMQApi, "queue_delete")
+    def test_remove_stale_shard_queues_deletes_all_stale_queues(
+            self, mock_queue_delete) -> None:
+        mock_queue_delete.return_value = pika.frame.Method(
+            1, pika.spec.Queue.DeleteOk(message_count=0))
+
+        remove_stale_shard_queues(self.rabbitmq, self.dummy_logger,
+                                  'test_queue', 2)
+
+        self.assertEqual(
+            [mock.call(queue)
+             for queue in get_stale_shard_queues('test_queue', 2)],
+            mock_queue_delete.call_args_list)
+
+    @mock.patch.object(RabbitMQApi, "queue_delete")
+    def test_remove_stale_shard_queues_warns_if_messages_are_deleted(
+            self, mock_queue_delete) -> None:
+        mock_queue_delete.side_effect = lambda queue: pika.frame.Method(
+            1, pika.spec.Queue.DeleteOk(
+                message_count=5 if queue == 'test_queue' else 0))
+
+        with mock.patch.object(self.dummy_logger, "warning") as mock_warning:
+            remove_stale_shard_queues(self.rabbitmq, self.dummy_logger,
+                                      'test_queue', 2)
+
+        mock_warning.assert_called_once_with(
+            "Deleted stale shard queue '%s' together with %s unconsumed "
+            "messages", 'test_queue', 5)
@@ -0,0 +1,116 @@
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+
+from src.utils.source_health import DataSourceHealthRegistry
+
+
+class TestDataSourceHealthRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_failure_threshold = 2
+        self.test_open_period = timedelta(seconds=60)
+        self.test_registry = DataSourceHealthRegistry(
+            self.test_failure_threshold, self.test_open_period, 0.5)
+        self.test_urls = ['url_1', 'url_2', 'url_3']
+
+    def tearDown(self) -> None:
+        self.test_registry = None
+
+    def _rank(self):
+        return self.test_registry.rank(self.test_urls, lambda url: url)
+
+    def test_rank_keeps_the_given_order_of_sources_not_probed_yet(
+            self) -> None:
+        self.assertEqual(self.test_urls, self._rank())
+
+    def test_rank_ranks_sources_by_sync_status_failures_and_latency(
+            self) -> None:
+        self.test_registry.record_success('url_1', 0.5, True)
+        self.test_registry.record_success('url_2', 0.1, False)
+        self.test_registry.record_success('url_3', 0.2, True)
+
+        self.assertEqual(['url_3', 'url_1', 'url_2'], self._rank())
+
+        self.test_registry.record_failure('url_3')
+        self.assertEqual(['url_1', 'url_3', 'url_2'], self._rank())
+
+    def test_record_success_smooths_the_latency(self) -> None:
+        self.test_registry.record_success('url_1', 1.0, True)
+        self.test_registry.record_success('url_1', 3.0, True)
+
+        self.assertEqual({'url_1': 2.0}, self.test_registry.latencies)
+
+    def test_record_failure_opens_circuit_after_failure_threshold(
+            self) -> None:
+        self.test_registry.record_failure('url_1')
+        self.assertFalse(self.test_registry.is_circuit_open('url_1'))
+
+        self.test_registry.record_failure('url_1')
+        self.assertTrue(self.test_registry.is_circuit_open('url_1'))
+        self.assertEqual(['url_2', 'url_3'], self._rank())
+
+    def test_record_success_closes_circuit(self) -> None:
+        for _ in range(self.test_failure_threshold):
+            self.test_registry.record_failure('url_1')
+
+        self.test_registry.record_success('url_1', 0.1, True)
+
+        self.assertFalse(self.test_registry.is_circuit_open('url_1'))
+        self.assertEqual({}, self.test_registry.failures)
+
+    def test_probe_records_success_and_returns_sync_status(self) -> None:
+        self.assertFalse(self.test_registry.probe(
+            'url_1', lambda: False, (KeyError,)))
+        self.assertIn('url_1', self.test_registry.latencies)
+        self.assertEqual(['url_2', 'url_3', 'url_1'], self._rank())
+
+    def test_probe_records_expected_errors_as_failures_and_raises_them(
+            self) -> None:
+        is_synced = mock.MagicMock(side_effect=KeyError('test'))
+
+        self.assertRaises(KeyError, self.test_registry.probe, 'url_1',
+                          is_synced, (KeyError,))
+        self.assertEqual({'url_1': 1}, self.test_registry.failures)
+
+    def test_probe_does_not_record_unexpected_errors(self) -> None:
+        is_synced = mock.MagicMock(side_effect=ValueError('test'))
+
+        self.assertRaises(ValueError, self.test_registry.probe, 'url_1',
+                          is_synced, (KeyError,))
+        self.assertEqual({}, self.test_registry.failures)
+
+    def test_probe_in_background_if_due_probes_once_open_period_passes(
+            self) -> None:
+        is_synced = mock.MagicMock(return_value=True)
+        with freeze_time("2012-01-01") as frozen_time:
+            for _ in range(self.test_failure_threshold):
+                self.test_registry.record_failure('url_1')
+
+            self.assertIsNone(self.test_registry.probe_in_background_if_due(
+                'url_1', is_synced, (KeyError,)))
+            self.assertIsNone(self.test_registry.probe_in_background_if_due(
+                'url_2', is_synced, (KeyError,)))
+
+            frozen_time.tick(self.test_open_period)
+            self.test_registry.probe_in_background_if_due(
+                'url_1', is_synced, (KeyError,)).result()
+
+        is_synced.assert_called_once_with()
+        self.assertFalse(self.test_registry.is_circuit_open('url_1'))
+
+    def test_probe_in_background_if_due_re_opens_circuit_if_probe_fails(
+            self) -> None:
+        is_synced = mock.MagicMock(side_effect=KeyError('test'))
+        with freeze_time("2012-01-01") as frozen_time:
+            for _ in range(self.test_failure_threshold):
+                self.test_registry.record_failure('url_1')
+
+            frozen_time.tick(self.test_open_period)
+            self.test_registry.probe_in_background_if_due(
+                'url_1', is_synced, (KeyError,)).result()
+
+            self.assertTrue(self.test_registry.is_circuit_open('url_1'))
+            self.assertIsNone(self.test_registry.probe_in_background_if_due(
+                'url_1', is_synced, (KeyError,)))
@@ -1,14 +1,15 @@
 import {ApiPromise} from "@polkadot/api";
 import {getSystemEvents} from "./query";
+import {getChainGetBlockHash} from "./rpc";
 import express, {Express} from "express";
 import {parseReqAndExecuteAPICall} from "../utils/helpers";
 import {WsInterfacesManager} from "../utils/api_interface";
+import {MAX_BLOCKS_PER_BATCH_QUERY} from "../utils/constants";
 
-export const getSlashGetSlashedAmount = async (
-    api: ApiPromise, blockHash: string, accountId: string
-): Promise<number> => {
+const getSlashedAmountFromEvents = (
+    events: any, accountId: string
+): number => {
     let slashedAmount = 0;
-    let events = await getSystemEvents(api, blockHash);
     // Check if there are any slashing events corresponding to the given account
     // address. If yes, add the amount and return it.
     for (const record of events) {
@@ -30,10 +31,7 @@ export const getSlashGetSlashedAmount = async (
     return slashedAmount;
 };
 
-export const getOfflineIsOffline = async (
-    api: ApiPromise, blockHash: string, accountId: string
-): Promise<boolean> => {
-    let events = await getSystemEvents(api, blockHash);
+const getIsOfflineFromEvents = (events: any, accountId: string): boolean => {
     // Check if the accountId is listed in any SomeOffline event. If yes return
     // true, otherwise return false.
     for (const record of events) {
@@ -51,6 +49,62 @@ export const getOfflineIsOffline = async (
     return false;
 };
 
+export const getSlashGetSlashedAmount = async (
+    api: ApiPromise, blockHash: string, accountId: string
+): Promise<number> => {
+    let events = await getSystemEvents(api, blockHash);
+    return getSlashedAmountFromEvents(events, accountId);
+};
+
+export const getOfflineIsOffline = async (
+    api: ApiPromise, blockHash: string, accountId: string
+): Promise<boolean> => {
+    let events = await getSystemEvents(api, blockHash);
+    return getIsOfflineFromEvents(events, accountId);
+};
+
+export const getBlocksSlashedAndOffline = async (
+    api: ApiPromise, fromBlock: string, toBlock: string, accountIds: string
+): Promise<{ [height: number]: any }> => {
+    const firstHeight = parseInt(fromBlock);
+    const lastHeight = parseInt(toBlock);
+    const accounts = accountIds.split(',').filter(
+        (accountId: string) => accountId !== '');
+    if (isNaN(firstHeight) || isNaN(lastHeight) || firstHeight > lastHeight
+        || lastHeight - firstHeight >= MAX_BLOCKS_PER_BATCH_QUERY) {
+        throw new Error(`Invalid block range ${fromBlock}-${toBlock}. At `
+            + `most ${MAX_BLOCKS_PER_BATCH_QUERY} blocks can be queried at `
+            + 'once.');
+    }
+
+    // The blocks are queried concurrently over the same connection, and the
+    // events of each block are retrieved once for all the accounts.
+    const getBlockData = async (height: number) => {
+        const blockHash = (await getChainGetBlockHash(api, height)).toString();
+        const events = await getSystemEvents(api, blockHash);
+        let slashedAmount: { [accountId: string]: number } = {};
+        let isOffline: { [accountId: string]: boolean } = {};
+        for (const accountId of accounts) {
+            slashedAmount[accountId] = getSlashedAmountFromEvents(events,
+                accountId);
+            isOffline[accountId] = getIsOfflineFromEvents(events, accountId);
+        }
+        return {blockHash, slashedAmount, isOffline};
+    };
+
+    let heights: number[] = [];
+    for (let height = firstHeight; height <= lastHeight; height++) {
+        heights.push(height);
+    }
+    const blocksData = await Promise.all(heights.map(getBlockData));
+
+    let result: { [height: number]: any } = {};
+    heights.forEach((height: number, index: number) => {
+        result[height] = blocksData[index];
+    });
+    return result;
+};
+
 export const customInterface = (
     app: Express, wsInterfaces: WsInterfacesManager
 ) => {
@@ -72,4 +126,16 @@ export const customInterface = (
         return await parseReqAndExecuteAPICall(req, res, wsInterfaces,
             getOfflineIsOffline, ['blockHash', 'accountId'])
     });
+
+    // This endpoint requires the websocket url of the node to connect with, the
+    // first and last heights of the range of blocks to query, and a comma
+    // separated list of account Ids (stashes) to look out for. For each block
+    // it returns its hash, and the slashed amount and offline status of each
+    // account.
+    app.get('/api/custom/blocks/getSlashedAndOffline', async (
+        req: express.Request, res: express.Response
+    ) => {
+        return await parseReqAndExecuteAPICall(req, res, wsInterfaces,
+            getBlocksSlashedAndOffline, ['fromBlock', 'toBlock', 'accountIds'])
+    });
 };
@@ -3,3 +3,4 @@ export const BAD_REQ_STATUS: number = 400;
 export const SERVER_ERR_STATUS: number = 500;
 export const TIMEOUT_TIME_MS = 10000;
 export const HEAVY_TIMEOUT_TIME_MS = 30000;
+export const MAX_BLOCKS_PER_BATCH_QUERY = 100;
@@ -1,4 +1,5 @@
 import {
+    getBlocksSlashedAndOffline,
     getOfflineIsOffline,
     getSlashGetSlashedAmount
 } from "../../src/routes/custom";
@@ -6,6 +7,7 @@ import {TestApiPromise, TestWsProvider} from "../test-utils";
 import {ApiPromise} from "@polkadot/api";
 
 const query = require("../../src/routes/query");
+const rpc = require("../../src/routes/rpc");
 
 let testAccountId = 'testAccount1';
 let testBlockHash = 'testBlockHash';
@@ -214,3 +216,77 @@ describe('getOfflineIsOffline', () => {
         ).rejects.toThrow(Error);
     });
 });
+
+describe('getBlocksSlashedAndOffline', () => {
+    let testAccountId2 = 'testAccount2';
+    let testEvents = [
+        {
+            event: {
+                section: "Staking",
+                method: "Slashed",
+                data: [testAccountId, "0x05000000"]
+            }
+        },
+        {
+            event: {
+                section: "ImOnline",
+                method: "SomeOffline",
+                data: [[[testAccountId2, {total: 85746767, own: 34568}]]]
+            }
+        }
+    ];
+
+    it('Returns the data of every block in the range', async () => {
+        // In this test we will mock the returns of getChainGetBlockHash and
+        // getSystemEvents to make sure that the data of each block is
+        // retrieved once for all the accounts.
+        jest.spyOn(rpc, "getChainGetBlockHash").mockImplementation(
+            (_: ApiPromise, height: number) => `${testBlockHash}${height}`
+        );
+        const eventsSpy = jest.spyOn(query, "getSystemEvents")
+            .mockReturnValue(testEvents);
+
+        let actualRet = await getBlocksSlashedAndOffline(
+            apiPromiseInstance, '10', '11',
+            `${testAccountId},${testAccountId2}`
+        );
+
+        let expectedBlockData = {
+            slashedAmount: {[testAccountId]: 83886080, [testAccountId2]: 0},
+            isOffline: {[testAccountId]: false, [testAccountId2]: true}
+        };
+        expect(actualRet).toEqual({
+            10: {blockHash: `${testBlockHash}10`, ...expectedBlockData},
+            11: {blockHash: `${testBlockHash}11`, ...expectedBlockData},
+        });
+        expect(eventsSpy).toHaveBeenCalledTimes(2);
+    });
+    it.each([
+        ['11', '10'], ['10', '110'], ['abc', '10'],
+    ])('Raises exception if the range is %s-%s', async (
+        fromBlock: string, toBlock: string
+    ) => {
+        await expect(
+            async () => {
+                await getBlocksSlashedAndOffline(
+                    apiPromiseInstance, fromBlock, toBlock, testAccountId
+                );
+            }
+        ).rejects.toThrow(Error);
+    });
+    it('Raises exception if raised by getSystemEvents', async () => {
+        jest.spyOn(rpc, "getChainGetBlockHash").mockReturnValue(testBlockHash);
+        jest.spyOn(query, "getSystemEvents").mockImplementation(
+            () => {
+                throw new Error("API Call Error");
+            }
+        );
+        await expect(
+            async () => {
+                await getBlocksSlashedAndOffline(
+                    apiPromiseInstance, '10', '11', testAccountId
+                );
+            }
+        ).rejects.toThrow(Error);
+    });
+});
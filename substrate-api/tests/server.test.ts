@@ -197,6 +197,16 @@ describe('GET Routes', () => {
                 'accountId': 'Account1'
             }, true, custom, 'getOfflineIsOffline'
         ],
+        [
+            '/api/custom/blocks/getSlashedAndOffline',
+            {
+                'websocket': testEndpoint,
+                'fromBlock': 10,
+                'toBlock': 11,
+                'accountIds': 'Account1,Account2'
+            }, {'10': {'blockHash': '0xdf89df9ghsd90hsd80ht83240sdnm'}},
+            custom, 'getBlocksSlashedAndOffline'
+        ],
         [
             '/api/derive/democracy/proposals', {'websocket': testEndpoint},
             {'info1': 'val', 'info2': 56}, derive, 'getDemocracyProposals'
@@ -325,6 +335,14 @@ describe('GET Routes', () => {
                 'accountId': 'Account1'
             }
         ],
+        ['/api/custom/blocks/getSlashedAndOffline',
+            {
+                'websocket': testEndpoint,
+                'fromBlock': 10,
+                'toBlock': 11,
+                'accountIds': 'Account1,Account2'
+            }
+        ],
         ['/api/derive/democracy/proposals', {'websocket': testEndpoint}],
         ['/api/derive/democracy/referendums', {'websocket': testEndpoint}],
         ['/api/derive/staking/validators', {'websocket': testEndpoint}],
@@ -402,6 +420,9 @@ describe('GET Routes', () => {
             ['blockHash', 'accountId']],
         ['/api/custom/offline/isOffline', {'websocket': testEndpoint},
             ['blockHash', 'accountId']],
+        ['/api/custom/blocks/getSlashedAndOffline',
+            {'websocket': testEndpoint},
+            ['fromBlock', 'toBlock', 'accountIds']],
         ['/api/derive/democracy/proposals', {}, ['websocket']],
         ['/api/derive/democracy/referendums', {}, ['websocket']],
         ['/api/derive/staking/validators', {}, ['websocket']],
@@ -493,6 +514,14 @@ describe('GET Routes', () => {
                 'accountId': 'Account1'
             }
         ],
+        ['/api/custom/blocks/getSlashedAndOffline',
+            {
+                'websocket': testEndpoint,
+                'fromBlock': 10,
+                'toBlock': 11,
+                'accountIds': 'Account1,Account2'
+            }
+        ],
         ['/api/derive/democracy/proposals', {'websocket': testEndpoint}],
         ['/api/derive/democracy/referendums', {'websocket': testEndpoint}],
         ['/api/derive/staking/validators', {'websocket': testEndpoint}],
@@ -644,6 +673,15 @@ describe('GET Routes', () => {
                 'accountId': 'Account1'
             }, custom, 'getOfflineIsOffline'
         ],
+        [
+            '/api/custom/blocks/getSlashedAndOffline',
+            {
+                'websocket': testEndpoint,
+                'fromBlock': 10,
+                'toBlock': 11,
+                'accountIds': 'Account1,Account2'
+            }, custom, 'getBlocksSlashedAndOffline'
+        ],
         [
             '/api/derive/democracy/proposals', {'websocket': testEndpoint},
             derive, 'getDemocracyProposals'
@@ -829,6 +867,15 @@ describe('GET Routes', () => {
                 'accountId': 'Account1'
             }, custom, 'getOfflineIsOffline'
         ],
+        [
+            '/api/custom/blocks/getSlashedAndOffline',
+            {
+                'websocket': testEndpoint,
+                'fromBlock': 10,
+                'toBlock': 11,
+                'accountIds': 'Account1,Account2'
+            }, custom, 'getBlocksSlashedAndOffline'
+        ],
         [
             '/api/derive/democracy/proposals', {'websocket': testEndpoint},
             derive, 'getDemocracyProposals'